@@ -127,35 +127,67 @@ def benchmark_throughput(engine: RoughCutEngine, num_clips_list: List[int]) -> D
     return results
 
 
-def parameter_tuning(engine: RoughCutEngine, clips: List[ClipAnalysis]) -> Dict[str, Any]:
-    """Test different parameter combinations"""
-    results = {}
+def benchmark_selection(sizes: List[int], target_ratio: float = 0.4, seed: int = 1) -> Dict[str, Any]:
+    """Compare knapsack segment selection with the greedy fill by score"""
+    import random
+    from studioflow.core.segment_selection import greedy_fill, knapsack, select_by_section
     
-    # Test different importance thresholds
-    importance_thresholds = [50, 60, 70, 75, 80]
+    rng = random.Random(seed)
+    results = {}
     
-    for threshold in importance_thresholds:
-        # Note: This would require modifying the engine to accept threshold parameter
-        # For now, just test with default
-        engine.clips = clips.copy()
+    for n in sizes:
+        durations = [rng.uniform(2.0, 40.0) for _ in range(n)]
+        scores = [rng.uniform(0.3, 0.95) for _ in range(n)]
+        values = [d * s for d, s in zip(durations, scores)]  # score-seconds
+        target = sum(durations) * target_ratio
         
-        start_time = time.time()
-        plan = engine.create_rough_cut(
-            style=CutStyle.DOC,
-            target_duration=sum(c.duration for c in clips) * 0.6,
-            use_smart_features=True
-        )
-        elapsed = time.time() - start_time
+        start_time = time.perf_counter()
+        greedy = greedy_fill(durations, values, target,
+                             order=sorted(range(n), key=lambda i: scores[i], reverse=True))
+        greedy_time = time.perf_counter() - start_time
         
-        results[f"threshold_{threshold}"] = {
-            "time_seconds": elapsed,
-            "segments": len(plan.segments) if plan else 0,
-            "themes": len(plan.themes) if plan else 0
+        start_time = time.perf_counter()
+        best = knapsack(durations, values, target)
+        dp_time = time.perf_counter() - start_time
+        
+        # Three sections with 10% slack each, like the documentary acts
+        sections = [rng.randrange(3) for _ in range(n)]
+        shares = (0.25, 0.4, 0.15)
+        budgets = {k: target * share / sum(shares) * 1.1 for k, share in enumerate(shares)}
+        start_time = time.perf_counter()
+        by_section = select_by_section(durations, values, sections, budgets, target)
+        section_time = time.perf_counter() - start_time
+        
+        results[f"{n}_segments"] = {
+            "target_seconds": target,
+            "greedy": {"value": greedy.value, "fill": greedy.duration / target, "time_ms": greedy_time * 1000},
+            "knapsack": {"value": best.value, "fill": best.duration / target, "time_ms": dp_time * 1000,
+                         "method": best.method},
+            "sections": {"value": by_section.value, "fill": by_section.duration / target,
+                         "time_ms": section_time * 1000, "method": by_section.method},
         }
     
     return results
 
 
+def parameter_tuning(engine: RoughCutEngine, clips: List[ClipAnalysis]) -> Dict[str, Any]:
+    """Test different parameter combinations"""
+    from studioflow.core.rough_cut_optimizer import RoughCutOptimizer
+    
+    optimizer = RoughCutOptimizer(engine)
+    sweep = optimizer.tune_importance_threshold(clips, target_duration=sum(c.duration for c in clips) * 0.6)
+    
+    return {
+        f"threshold_{result.parameters['quote_min_importance']}": {
+            "time_seconds": result.metrics["processing_time"],
+            "segments": result.metrics["num_segments"],
+            "themes": result.metrics["num_themes"],
+            "stage_times": result.stage_times,
+        }
+        for result in sweep
+    }
+
+
 def main():
     parser = argparse.ArgumentParser(description="Benchmark rough cut generation performance")
     parser.add_argument("--clips", type=int, default=10, help="Number of test clips")
@@ -164,6 +196,7 @@ def main():
     parser.add_argument("--throughput", action="store_true", help="Test throughput with different clip counts")
     parser.add_argument("--memory", action="store_true", help="Test memory usage")
     parser.add_argument("--tuning", action="store_true", help="Test parameter tuning")
+    parser.add_argument("--selection", action="store_true", help="Compare knapsack and greedy segment selection")
     
     args = parser.parse_args()
     
@@ -217,6 +250,18 @@ def main():
         for key, value in tuning_results.items():
             print(f"  {key}: {value['segments']} segments, {value['time_seconds']:.2f}s")
     
+    # Segment selection
+    if args.selection:
+        print("\nComparing segment selection (knapsack vs greedy fill)...")
+        selection_results = benchmark_selection([50, 200, 1000, 5000])
+        results["selection"] = selection_results
+        
+        for key, value in selection_results.items():
+            greedy, best = value["greedy"], value["knapsack"]
+            print(f"  {key}: greedy {greedy['value']:.0f} ({greedy['fill']:.1%} of target), "
+                  f"knapsack {best['value']:.0f} ({best['fill']:.1%}) in {best['time_ms']:.1f}ms [{best['method']}], "
+                  f"sections {value['sections']['time_ms']:.1f}ms")
+    
     # Save results
     if args.output:
         args.output.write_text(json.dumps(results, indent=2))
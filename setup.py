@@ -72,8 +72,8 @@ setup(
     # Entry points for CLI commands
     entry_points={
         "console_scripts": [
-            "sf=studioflow.cli.main:run",
-            "studioflow=studioflow.cli.main:run",
+            "sf=studioflow.cli.daemon:main",
+            "studioflow=studioflow.cli.daemon:main",
         ],
     },
 
@@ -6,7 +6,15 @@ A Git-style CLI for automated video workflows
 __version__ = "2.0.0"
 __author__ = "StudioFlow Team"
 
-from .core.config import Config
-from .core.project import Project
+__all__ = ["Config", "Project", "__version__"]
 
-__all__ = ["Config", "Project", "__version__"]
\ No newline at end of file
+
+def __getattr__(name):
+    # Deferred so `import studioflow` (and every CLI startup) doesn't pay for pydantic
+    if name == "Config":
+        from .core.config import Config
+        return Config
+    if name == "Project":
+        from .core.project import Project
+        return Project
+    raise AttributeError(f"module 'studioflow' has no attribute {name!r}")
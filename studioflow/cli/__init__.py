@@ -1,5 +1,11 @@
 """StudioFlow CLI Package"""
 
-from .main import app, run
+__all__ = ["app", "run"]
 
-__all__ = ["app", "run"]
\ No newline at end of file
+
+def __getattr__(name):
+    # Deferred so the thin `sf` client (studioflow.cli.daemon) starts without typer/rich
+    if name in ("app", "run"):
+        from . import main
+        return getattr(main, name)
+    raise AttributeError(f"module 'studioflow.cli' has no attribute {name!r}")
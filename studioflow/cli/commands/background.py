@@ -15,7 +15,7 @@ from rich.table import Table
 from rich.live import Live
 from rich.layout import Layout
 
-from studioflow.core.background_services import BackgroundServices
+from studioflow.core.background_services import BackgroundServices, parse_styles
 from studioflow.core.state import StateManager
 from studioflow.core.project import ProjectManager
 
@@ -40,6 +40,7 @@ def _get_service() -> BackgroundServices:
 def start(
     project: Optional[str] = typer.Option(None, "-p", "--project", help="Project to watch (defaults to current)"),
     max_workers: int = typer.Option(4, "--workers", help="Number of parallel transcription workers"),
+    styles: str = typer.Option("doc", "--styles", help="Rough cut styles to generate (comma-separated, e.g. doc,episode,tutorial)"),
     daemon: bool = typer.Option(False, "--daemon", help="Run as daemon (background process)")
 ):
     """
@@ -49,7 +50,12 @@ def start(
     - Transcribes new video files
     - Generates rough cuts when all files are transcribed
     """
-    service = BackgroundServices(max_workers=max_workers)
+    try:
+        parse_styles(styles)
+    except ValueError as e:
+        console.print(f"[red]{e}[/red]")
+        raise typer.Exit(1)
+    service = BackgroundServices(max_workers=max_workers, rough_cut_styles=styles)
     
     # Get project to watch
     project_name = project or state.current_project
@@ -0,0 +1,88 @@
+"""
+Daemon CLI Commands
+Start, stop and inspect the warm sf daemon
+"""
+
+import time
+from typing import Optional
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from studioflow.cli import daemon as sf_daemon
+
+console = Console()
+app = typer.Typer()
+
+
+@app.command()
+def start(
+    foreground: bool = typer.Option(False, "--foreground", "-f", help="Run in this terminal instead of detaching"),
+    idle_timeout: Optional[float] = typer.Option(None, "--idle", help="Exit after this many idle seconds"),
+):
+    """
+    Start the warm sf daemon.
+
+    While it runs, `sf` forwards each invocation to it over a Unix socket,
+    skipping interpreter, config and cache startup. Set STUDIOFLOW_DAEMON=1
+    to start it automatically on first use, or STUDIOFLOW_DAEMON=0 to bypass it.
+    """
+    if not sf_daemon.daemon_supported():
+        console.print("[red]The sf daemon needs Unix sockets and fork (Linux/macOS)[/red]")
+        raise typer.Exit(1)
+
+    status = sf_daemon.send_command("status")
+    if status:
+        console.print(f"[yellow]Daemon already running (pid {status['pid']})[/yellow]")
+        return
+
+    if foreground:
+        console.print(f"Serving on [cyan]{sf_daemon.socket_path()}[/cyan] (Ctrl+C to stop)")
+        try:
+            sf_daemon.serve(idle_timeout=idle_timeout)
+        except KeyboardInterrupt:
+            pass
+        return
+
+    sf_daemon.spawn_server()
+    for _ in range(50):
+        time.sleep(0.1)
+        status = sf_daemon.send_command("status")
+        if status:
+            console.print(f"[green]✓[/green] Daemon started (pid {status['pid']})")
+            return
+    console.print(f"[red]Daemon did not come up. See {sf_daemon.log_path()}[/red]")
+    raise typer.Exit(1)
+
+
+@app.command()
+def stop():
+    """Stop the warm sf daemon"""
+    reply = sf_daemon.send_command("stop")
+    if reply is None:
+        console.print("No daemon running")
+        return
+    console.print(f"[green]✓[/green] Daemon stopping (pid {reply.get('stopping')})")
+
+
+@app.command()
+def status():
+    """Show daemon state and cache sizes"""
+    status = sf_daemon.send_command("status")
+    if status is None:
+        console.print("No daemon running")
+        return
+
+    table = Table(title="sf daemon", show_header=False)
+    table.add_column("Property", style="cyan")
+    table.add_column("Value")
+    table.add_row("PID", str(status["pid"]))
+    table.add_row("Socket", status["socket"])
+    table.add_row("Uptime", f"{status['uptime']:.0f}s")
+    table.add_row("Requests", str(status["requests"]))
+    table.add_row("Active", str(status["active"]))
+    table.add_row("Idle timeout", f"{status['idle_timeout']:.0f}s")
+    for name, stats in sorted(status.get("caches", {}).items()):
+        table.add_row(f"Cache: {name}", f"{stats['entries']} entries")
+    console.print(table)
@@ -12,6 +12,7 @@ from rich.tree import Tree
 
 from studioflow.core.resolve_api import ResolveDirectAPI, create_documentary_project, FX30ProjectSettings
 from studioflow.core.storage import StorageTierSystem
+from studioflow.core.file_index import get_file_index
 
 console = Console()
 app = typer.Typer()
@@ -50,11 +51,9 @@ def status(
         dir_path = library_path / dir_name
         if dir_path.exists():
             # Count items
-            files = list(dir_path.rglob("*"))
-            file_count = sum(1 for f in files if f.is_file())
-            dir_count = sum(1 for f in files if f.is_dir())
+            summary = get_file_index(dir_path).summary(under=dir_path)
             
-            status = f" [dim]({dir_count} dirs, {file_count} files)[/dim]"
+            status = f" [dim]({summary.dirs} dirs, {summary.files} files)[/dim]"
             
             # Color based on type
             if dir_name in ["PROJECTS", "EPISODES", "DOCS", "FILMS"]:
@@ -12,6 +12,7 @@ from rich.panel import Panel
 
 from studioflow.core.smart_organization import SmartMediaOrganizer
 from studioflow.core.media import MediaScanner
+from studioflow.cli.commands.search import format_timecode
 
 console = Console()
 app = typer.Typer()
@@ -105,16 +106,19 @@ def search(
     table.add_column("Match Score", style="yellow", width=12)
     table.add_column("Tags", style="white", width=25)
     table.add_column("Type", style="green", width=15)
+    table.add_column("First hit", style="magenta", width=12)
     
     for file in results[:20]:
         match_score = file.metadata.get("match_score", 0)
         tags_str = ", ".join([t.name for t in file.tags[:2]])
+        hits = sorted(file.metadata.get("hits", []))
         
         table.add_row(
             file.path.name,
             f"{match_score:.2f}",
             tags_str,
-            file.content_type
+            file.content_type,
+            format_timecode(hits[0][0]) if hits else ""
         )
     
     console.print(table)
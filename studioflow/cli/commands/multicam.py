@@ -361,19 +361,8 @@ def sync(
             border_style="green"
         ))
 
-        # Save sync data for Resolve
-        sync_data = {
-            "project": project_name,
-            "method": method,
-            "offset": result.get("offset", 0),
-            "cam_a": str(cam_a),
-            "cam_b": str(cam_b),
-            "synced_at": datetime.now().isoformat()
-        }
-
-        sync_file = multicam_dir / "sync_data.json"
-        with open(sync_file, 'w') as f:
-            json.dump(sync_data, f, indent=2)
+        # Save sync data for Resolve and create-sequence
+        _save_sync_data(multicam_dir, project_name, method, cam_a, cam_b, result.get("offset", 0))
 
     else:
         console.print("[red]Synchronization failed[/red]")
@@ -460,6 +449,32 @@ def color_match(
         console.print(f"[red]Color matching failed: {result.get('error', 'Unknown error')}[/red]")
 
 
+def _save_sync_data(multicam_dir: Path, project_name: str, method: str, cam_a: Path, cam_b: Path,
+                    offset: float, **extra) -> Path:
+    """
+    Write sync_data.json: both cameras with their start on the synced
+    timeline (positive offset: cam_b starts later), plus extra fields
+    """
+    offset = float(offset)
+    sync_data = {
+        "project": project_name,
+        "method": method,
+        "offset": offset,
+        "cam_a": str(cam_a),
+        "cam_b": str(cam_b),
+        "cameras": [{"path": str(cam_a), "offset": max(0.0, -offset)},
+                    {"path": str(cam_b), "offset": max(0.0, offset)}],
+        **extra,
+        "synced_at": datetime.now().isoformat()
+    }
+
+    multicam_dir.mkdir(exist_ok=True)
+    sync_file = multicam_dir / "sync_data.json"
+    with open(sync_file, 'w') as f:
+        json.dump(sync_data, f, indent=2)
+    return sync_file
+
+
 @app.command()
 def sync_three_source(
     project_name: Optional[str] = None,
@@ -587,6 +602,10 @@ def sync_three_source(
         except subprocess.CalledProcessError as e:
             console.print(f"[yellow]Warning: Failed to replace audio: {e}[/yellow]")
     
+    # The original camera files: the switch needs each camera's own audio
+    extra = {"audio": {"path": str(audio), "offset": audio_offset}} if audio else {}
+    _save_sync_data(project.path / "MULTICAM", project_name, "audio", cam1, cam2, cam2_offset, **extra)
+    
     console.print(Panel(
         f"[green]✓ 3-source sync complete![/green]\n\n"
         f"Output directory: {output_dir}\n"
@@ -602,7 +621,10 @@ def sync_three_source(
 @app.command()
 def create_sequence(
     project_name: Optional[str] = None,
-    layout: str = "side_by_side"  # side_by_side, pip, switch
+    layout: str = "side_by_side",  # side_by_side, pip, switch
+    min_shot: float = typer.Option(2.0, "--min-shot", help="Shortest shot for switch (seconds)"),
+    render: bool = typer.Option(True, "--render/--no-render", help="Render the switch (EDL/FCPXML are always written)"),
+    proxy_dir: Optional[Path] = typer.Option(None, "--proxy-dir", help="Render the switch from <stem>_proxy files here")
 ):
     """
     Create a multicam sequence from synchronized clips
@@ -610,7 +632,8 @@ def create_sequence(
     Layouts:
     - side_by_side: Both cameras visible
     - pip: Picture-in-picture
-    - switch: Cut between cameras
+    - switch: Cut to whoever is speaking (from each camera's audio);
+      the render keeps the audio of the camera that starts first
     """
     state = StateManager()
     project_name = project_name or state.current_project
@@ -649,6 +672,10 @@ def create_sequence(
 
     console.print(f"Creating {layout} multicam sequence...")
 
+    if layout == "switch":
+        _create_switch_sequence(sync_data, multicam_dir, output_path, min_shot, render, proxy_dir)
+        return
+
     # Build ffmpeg filter based on layout
     if layout == "side_by_side":
         # Scale both videos to half width and place side by side
@@ -668,12 +695,6 @@ def create_sequence(
         )
         map_opts = ["-map", "[v]", "-map", "0:a"]
 
-    elif layout == "switch":
-        # This would need an EDL or manual cut points
-        # For now, just concatenate
-        filter_complex = "[0:v][1:v]concat=n=2:v=1[v]"
-        map_opts = ["-map", "[v]", "-map", "0:a"]
-
     else:
         console.print(f"[red]Unknown layout: {layout}[/red]")
         return
@@ -703,18 +724,80 @@ def create_sequence(
     ]
 
     with console.status(f"Creating {layout} sequence..."):
-        try:
-            result = subprocess.run(cmd, capture_output=True, timeout=120)
+        result = subprocess.run(cmd, capture_output=True)
 
-            if result.returncode == 0:
-                size_mb = output_path.stat().st_size / (1024 * 1024)
-                console.print(f"[green]✓[/green] Created multicam sequence: {output_path.name} ({size_mb:.1f} MB)")
-            else:
-                console.print(f"[red]Failed to create sequence[/red]")
-                console.print(result.stderr.decode()[:500])
+        if result.returncode == 0:
+            size_mb = output_path.stat().st_size / (1024 * 1024)
+            console.print(f"[green]✓[/green] Created multicam sequence: {output_path.name} ({size_mb:.1f} MB)")
+        else:
+            console.print(f"[red]Failed to create sequence[/red]")
+            console.print(result.stderr.decode()[:500])
 
-        except subprocess.TimeoutExpired:
-            console.print("[red]Operation timed out[/red]")
+
+def _synced_cameras(sync_data: Dict) -> Tuple[List[Path], List[float]]:
+    """Camera files and where each starts on the synced timeline"""
+    if "cameras" in sync_data:
+        cameras = [(Path(cam["path"]), float(cam.get("offset", 0))) for cam in sync_data["cameras"]]
+    else:
+        # Written before sync recorded cameras; positive offset: cam_b starts later
+        offset = float(sync_data.get("offset", 0))
+        cameras = [(Path(sync_data["cam_a"]), max(0.0, -offset)),
+                   (Path(sync_data["cam_b"]), max(0.0, offset))]
+    earliest = min(start for _, start in cameras)
+    return [path for path, _ in cameras], [start - earliest for _, start in cameras]
+
+
+def _proxy_for(source: Path, proxy_dir: Optional[Path]) -> Path:
+    if proxy_dir:
+        for ext in (".mp4", ".mov"):
+            proxy = proxy_dir / f"{source.stem}_proxy{ext}"
+            if proxy.exists():
+                return proxy
+    return source
+
+
+def _create_switch_sequence(sync_data: Dict, multicam_dir: Path, output_path: Path,
+                            min_shot: float, render: bool, proxy_dir: Optional[Path]):
+    """Auto-switch between angles on speech energy, write EDL/FCPXML and render"""
+    from studioflow.core import multicam_switch
+
+    sources, offsets = _synced_cameras(sync_data)
+
+    with console.status("Analyzing who is speaking..."):
+        shots = multicam_switch.plan_switches(sources, offsets, min_shot=min_shot)
+
+    if not shots:
+        console.print("[red]Could not read audio from the cameras[/red]")
+        return
+
+    edl_path = multicam_switch.export_edl(shots, sources, offsets, multicam_dir / "multicam_switch.edl")
+    fcpxml_path = multicam_switch.export_fcpxml(shots, sources, offsets,
+                                                multicam_dir / "multicam_switch.fcpxml")
+
+    table = Table(show_header=True)
+    table.add_column("Camera", style="cyan")
+    table.add_column("Shots")
+    table.add_column("Screen time")
+    for i, source in enumerate(sources):
+        own = [shot for shot in shots if shot.camera == i]
+        table.add_row(source.name, str(len(own)), f"{sum(shot.duration for shot in own):.1f}s")
+    console.print(table)
+    console.print(f"[green]✓[/green] Switch list: {edl_path.name}, {fcpxml_path.name}")
+    audio = multicam_switch.audio_camera(offsets)
+    console.print(f"[dim]Audio: {sources[audio].name} (the camera that starts first)[/dim]")
+
+    if not render:
+        return
+
+    render_sources = [_proxy_for(source, proxy_dir) for source in sources]
+    with console.status("Rendering switch..."):
+        result = multicam_switch.render_switch(render_sources, offsets, shots, output_path)
+
+    if result.success:
+        console.print(f"[green]✓[/green] Created multicam sequence: {output_path.name} ({result.file_size_mb:.1f} MB)")
+    else:
+        console.print(f"[red]Failed to create sequence[/red]")
+        console.print(result.error_message)
 
 
 @app.command()
@@ -76,6 +76,20 @@ def list(include_archived: bool = False):
     console.print(table)
 
 
+@app.command()
+def reindex(
+    sizes: bool = typer.Option(False, "--sizes", help="Recompute media counts and sizes from disk")
+):
+    """Rebuild the project catalog from disk (repairs drift after manual moves/edits)"""
+    manager = ProjectManager()
+    report = manager.reindex(sizes=sizes)
+
+    console.print(
+        f"[green]✓[/green] Catalog reindexed: {report.added} added, {report.updated} updated, "
+        f"{report.removed} removed, {report.unchanged} unchanged"
+    )
+
+
 @app.command()
 def select(name: str):
     """Select project as current"""
@@ -216,7 +230,8 @@ def archive(
         destination=dest_path,
         cleanup=not no_cleanup,
         verify=True,
-        delete_source=delete_source
+        delete_source=delete_source,
+        analysis=analysis
     )
 
     if success:
@@ -294,7 +309,8 @@ def cleanup(
         remove_duplicates=not no_duplicates,
         remove_cache=not no_cache,
         remove_junk=True,
-        dry_run=dry_run
+        dry_run=dry_run,
+        analysis=analysis
     )
 
     if not dry_run:
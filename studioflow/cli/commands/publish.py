@@ -42,6 +42,7 @@ PLATFORM_SETTINGS = {
         "audio_bitrate": "128k",
         "format": "mp4",
         "aspect": "1:1",
+        "fit": "crop",  # fill the frame rather than letterbox
         "max_duration": 60  # seconds for feed posts
     },
     "instagram_reels": {
@@ -52,6 +53,7 @@ PLATFORM_SETTINGS = {
         "audio_bitrate": "128k",
         "format": "mp4",
         "aspect": "9:16",
+        "fit": "crop",
         "max_duration": 90
     },
     "tiktok": {
@@ -62,6 +64,7 @@ PLATFORM_SETTINGS = {
         "audio_bitrate": "192k",
         "format": "mp4",
         "aspect": "9:16",
+        "fit": "crop",
         "max_duration": 180  # 3 minutes
     },
     "twitter": {
@@ -77,24 +80,66 @@ PLATFORM_SETTINGS = {
 }
 
 
-def render_for_platform(project_path: Path, platform: str, output_path: Path) -> bool:
-    """
-    Render video with platform-specific settings using ffmpeg
-    """
-    settings = PLATFORM_SETTINGS.get(platform, PLATFORM_SETTINGS["youtube"])
-
+def _find_source_video(project_path: Path) -> Optional[Path]:
+    """Master to render from"""
     # Find the main timeline/edit file (this would come from Resolve export)
     # For now, we'll look for any video in the project
-    source_video = None
     media_dir = project_path / "01_MEDIA"
 
     if media_dir.exists():
         for ext in [".mp4", ".mov", ".mxf"]:
             videos = list(media_dir.rglob(f"*{ext}"))
             if videos:
-                source_video = videos[0]  # Use first video as source
-                break
+                return videos[0]  # Use first video as source
+    return None
+
 
+def platform_rendition(platform: str, output_path: Path):
+    """Ladder rendition (see FFmpegProcessor.platform_rendition) for PLATFORM_SETTINGS[platform]"""
+    from studioflow.core.ffmpeg import FFmpegProcessor
+
+    settings = PLATFORM_SETTINGS.get(platform, PLATFORM_SETTINGS["youtube"])
+    return FFmpegProcessor.platform_rendition(platform, output_path, preset={
+        "scale": settings["resolution"].replace("x", ":"),
+        "fit": settings.get("fit", "pad"),
+        "fps": settings["framerate"],
+        "vcodec": settings["codec"],
+        "vbitrate": settings["bitrate"],
+        "acodec": "aac",
+        "abitrate": settings["audio_bitrate"],
+        "max_duration": settings.get("max_duration"),
+    })
+
+
+def render_ladder(project_path: Path, outputs: Dict[str, Path]) -> Dict[str, bool]:
+    """
+    Render several platforms from one decode of the source video
+
+    outputs maps platform -> output path; returns platform -> success.
+    """
+    from studioflow.core.ffmpeg import FFmpegProcessor
+
+    source_video = _find_source_video(project_path)
+    if not source_video:
+        console.print("[red]No source video found in project[/red]")
+        return {platform: False for platform in outputs}
+
+    renditions = [platform_rendition(platform, path) for platform, path in outputs.items()]
+    results = FFmpegProcessor.export_ladder(source_video, renditions)
+
+    failed = next((r for r in results if not r.success and r.error_message), None)
+    if failed:
+        console.print(f"[red]Render error: {failed.error_message}[/red]")
+    return {platform: result.success for platform, result in zip(outputs, results)}
+
+
+def render_for_platform(project_path: Path, platform: str, output_path: Path) -> bool:
+    """
+    Render video with platform-specific settings using ffmpeg
+    """
+    settings = PLATFORM_SETTINGS.get(platform, PLATFORM_SETTINGS["youtube"])
+
+    source_video = _find_source_video(project_path)
     if not source_video:
         console.print("[red]No source video found in project[/red]")
         return False
@@ -330,32 +375,25 @@ def all(
 
     platforms = ["youtube", "instagram_reels", "tiktok", "twitter"]
 
-    console.print(f"Rendering for all platforms...")
-
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-        console=console
-    ) as progress:
-
-        task = progress.add_task("Rendering...", total=len(platforms))
+    manager = ProjectManager()
+    project = manager.get_project(project_name)
 
-        for platform in platforms:
-            progress.update(task, description=f"Rendering for {platform}...")
+    if not project:
+        console.print(f"[red]Project not found: {project_name}[/red]")
+        return
 
-            manager = ProjectManager()
-            project = manager.get_project(project_name)
-            output_path = project.path / "05_RENDERS" / f"{project_name}_{platform}.mp4"
-            output_path.parent.mkdir(exist_ok=True)
+    outputs = {platform: project.path / "05_RENDERS" / f"{project_name}_{platform}.mp4"
+               for platform in platforms}
 
-            if render_for_platform(project.path, platform, output_path):
-                console.print(f"  [green]✓[/green] {platform}")
-            else:
-                console.print(f"  [red]✗[/red] {platform}")
+    # One decode of the master feeds every platform's encoder
+    with console.status(f"Rendering for {', '.join(platforms)}..."):
+        results = render_ladder(project.path, outputs)
 
-            progress.advance(task)
+    for platform, ok in results.items():
+        if ok:
+            console.print(f"  [green]✓[/green] {platform}")
+        else:
+            console.print(f"  [red]✗[/red] {platform}")
 
     console.print(f"\n[green]✓[/green] Multi-platform render complete!")
     console.print(f"Check renders in: {project.path / '05_RENDERS'}")
\ No newline at end of file
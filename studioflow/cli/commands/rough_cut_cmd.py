@@ -21,11 +21,11 @@ app = typer.Typer()
 @app.command()
 def rough_cut(
     footage_dir: Optional[Path] = typer.Argument(None, help="Footage directory (auto-detects if not provided)"),
-    style: str = typer.Option("doc", "-s", "--style", help="Style: doc, interview, episode, tutorial, review, unboxing, comparison, setup, explainer"),
-    output: Optional[Path] = typer.Option(None, "-o", "--output", help="Output EDL/FCPXML path"),
+    style: str = typer.Option("doc", "-s", "--style", help="Style: doc, interview, episode, tutorial, review, unboxing, comparison, setup, explainer (comma-separated or 'all' to compare several)"),
+    output: Optional[Path] = typer.Option(None, "-o", "--output", help="Output EDL/FCPXML path (a folder when comparing styles)"),
     target_duration: Optional[float] = typer.Option(None, "-d", "--duration", help="Target duration in minutes"),
     preview: bool = typer.Option(True, "--preview/--no-preview", help="Show preview before generating"),
-    format: str = typer.Option("edl", "-f", "--format", help="Output format: edl, fcpxml"),
+    format: str = typer.Option("edl", "-f", "--format", help="Output format: edl, fcpxml (comma-separated for both)"),
     yes: bool = typer.Option(False, "-y", "--yes", help="Skip confirmation"),
     audio_markers: bool = typer.Option(False, "--audio-markers/--no-audio-markers", help="Use audio markers for segment extraction (if markers detected)"),
 ):
@@ -42,15 +42,28 @@ def rough_cut(
       comparison - Comparison: product switching, side-by-side analysis
       setup     - Setup guide: step detection, screen recording priority
       explainer - Explainer: concept detection, educational pacing
+
+    Compare styles with e.g. --style doc,episode,tutorial: the footage is
+    analyzed once and every style is planned in parallel.
     """
 
     # Validate style
     try:
-        cut_style = CutStyle(style)
+        if style.strip().lower() == "all":
+            cut_styles = list(CutStyle)
+        else:
+            cut_styles = list(dict.fromkeys(CutStyle(s.strip()) for s in style.split(",") if s.strip()))
     except ValueError:
         console.print(f"[red]Invalid style: {style}[/red]")
         console.print("Valid styles: doc, interview, episode, tutorial, review, unboxing, comparison, setup, explainer")
         raise typer.Exit(1)
+    if not cut_styles:
+        console.print("[red]No style given[/red]")
+        raise typer.Exit(1)
+    formats = [f.strip().lower() for f in format.split(",") if f.strip()]
+    if not formats or any(f not in ("edl", "fcpxml") for f in formats):
+        console.print(f"[red]Unknown format: {format}[/red]")
+        raise typer.Exit(1)
 
     # Smart context detection
     if footage_dir is None:
@@ -113,10 +126,26 @@ def rough_cut(
         console.print(table)
         console.print(f"\n[dim]Total: {total_duration/60:.1f} min, {clips_with_speech}/{len(clips)} with transcripts[/dim]")
 
+        target_mins = target_duration * 60 if target_duration else None
+
+    if len(cut_styles) > 1:
+        # Planned outside the live display: the styles run in forked workers
+        console.print(f"[cyan]Planning {len(cut_styles)} styles in parallel...[/cyan]")
+        plans = engine.create_rough_cuts(cut_styles, target_duration=target_mins,
+                                         use_audio_markers=audio_markers)
+        _export_style_comparison(engine, plans, footage_dir, output, formats)
+        return
+
+    cut_style = cut_styles[0]
+    style = cut_style.value
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console
+    ) as progress:
         # Create rough cut plan
         task = progress.add_task(f"Creating {style} rough cut...", total=None)
 
-        target_mins = target_duration * 60 if target_duration else None
         # Use smart features for documentaries (now optimized and tested!)
         use_smart = (cut_style == CutStyle.DOC)
         plan = engine.create_rough_cut(
@@ -148,43 +177,79 @@ def rough_cut(
                     console.print(f"    [dim]... and {len(segs) - 2} more[/dim]")
 
         if not yes:
-            confirm = typer.confirm(f"\nGenerate {format.upper()} file?")
+            confirm = typer.confirm(f"\nGenerate {'/'.join(f.upper() for f in formats)} file?")
             if not confirm:
                 console.print("[yellow]Cancelled[/yellow]")
                 raise typer.Exit(0)
 
-    # Generate output
+    # Generate output (one file per format; an explicit output path gets each format's suffix)
+    ctx = ProjectContextManager.detect_context()
     if output is None:
-        ctx = ProjectContextManager.detect_context()
-        if ctx.project_path:
-            output = ctx.project_path / f"rough_cut_{style}.{format}"
+        output = (ctx.project_path or footage_dir) / f"rough_cut_{style}.{formats[0]}"
+    outputs = [output if len(formats) == 1 else output.with_suffix(f".{fmt}") for fmt in formats]
+
+    for fmt, path in zip(formats, outputs):
+        if fmt == "edl":
+            engine.export_edl(plan, path)
         else:
-            output = footage_dir / f"rough_cut_{style}.{format}"
+            engine.export_fcpxml(plan, path)
 
-    if format == "edl":
-        engine.export_edl(plan, output)
-    elif format == "fcpxml":
-        engine.export_fcpxml(plan, output)
-    else:
-        console.print(f"[red]Unknown format: {format}[/red]")
-        raise typer.Exit(1)
+    if ctx.project_path:
+        from studioflow.core.catalog import record_pipeline_stage
+        record_pipeline_stage(ctx.project_path, "rough_cut", output=str(outputs[0]), style=style)
 
-    console.print(f"\n[green]✓ Rough cut saved to: {output}[/green]")
+    for path in outputs:
+        console.print(f"\n[green]✓ Rough cut saved to: {path}[/green]")
     console.print(f"[dim]Import this file into DaVinci Resolve to start editing[/dim]")
 
     # Show next steps
     console.print("\n[bold]Next steps:[/bold]")
     console.print("  1. Open DaVinci Resolve")
-    console.print(f"  2. File → Import → Timeline → {output.name}")
+    console.print(f"  2. File → Import → Timeline → {outputs[0].name}")
     console.print("  3. Refine the rough cut")
     console.print("  4. Add B-roll, music, graphics from Power Bins")
 
 
+def _export_style_comparison(engine: RoughCutEngine, plans, footage_dir: Path,
+                             output: Optional[Path], formats):
+    """Write every planned style and show them side by side"""
+    ctx = ProjectContextManager.detect_context()
+    output_dir = output or ctx.project_path or footage_dir
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    table = Table(title="Rough Cut Styles", show_header=True, header_style="cyan")
+    table.add_column("Style")
+    table.add_column("Duration", justify="right")
+    table.add_column("Segments", justify="right")
+    table.add_column("Files", style="dim")
+
+    for cut_style, plan in plans.items():
+        written = []
+        for fmt in formats:
+            path = output_dir / f"rough_cut_{cut_style.value}.{fmt}"
+            if fmt == "edl":
+                engine.export_edl(plan, path)
+            else:
+                engine.export_fcpxml(plan, path)
+            written.append(path.name)
+        if ctx.project_path:
+            from studioflow.core.catalog import record_pipeline_stage
+            record_pipeline_stage(ctx.project_path, "rough_cut", output=str(output_dir / written[0]),
+                                  style=cut_style.value)
+        table.add_row(cut_style.value, f"{plan.total_duration / 60:.1f} min",
+                      str(len(plan.segments)), ", ".join(written))
+
+    console.print(table)
+    console.print(f"\n[green]✓ {len(plans)} rough cuts saved to: {output_dir}[/green]")
+    console.print(f"[dim]Import them into DaVinci Resolve to compare[/dim]")
+
+
 @app.command()
 def hook_tests(
     footage_dir: Optional[Path] = typer.Argument(None, help="Footage directory (auto-detects if not provided)"),
     output_dir: Optional[Path] = typer.Option(None, "-o", "--output", help="Project root directory (defaults to detected project)"),
     max_hooks: int = typer.Option(5, "--max", "-m", help="Maximum number of hook candidates to generate"),
+    thumbnails: bool = typer.Option(False, "--thumbnails", help="Crop a thumbnail per hook (decodes each source clip once)"),
     yes: bool = typer.Option(False, "-y", "--yes", help="Skip confirmation"),
 ):
     """
@@ -244,7 +309,8 @@ def hook_tests(
         
         # Generate hook test timelines
         task = progress.add_task("Generating hook test timelines...", total=None)
-        exported_files = engine.generate_hook_test_timelines(clips, output_dir, max_hooks=max_hooks)
+        exported_files = engine.generate_hook_test_timelines(clips, output_dir, max_hooks=max_hooks,
+                                                             extract_thumbnails=thumbnails)
         progress.update(task, completed=True)
     
     if not exported_files:
@@ -0,0 +1,93 @@
+"""
+Global Search Command
+Find clips and spoken moments across every project
+"""
+
+import re
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+console = Console()
+
+_AGE_RE = re.compile(r"^(\d+(?:\.\d+)?)\s*([dwmy])$")
+_AGE_DAYS = {"d": 1, "w": 7, "m": 30.44, "y": 365.25}
+
+
+def format_timecode(seconds: float) -> str:
+    seconds = int(seconds)
+    return f"{seconds // 3600:02d}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+
+
+def parse_since(value: str) -> float:
+    """'2y', '6m', '3w', '30d' or an ISO date -> Unix time"""
+    match = _AGE_RE.match(value.strip().lower())
+    if match:
+        return time.time() - float(match.group(1)) * _AGE_DAYS[match.group(2)] * 86400
+    return datetime.fromisoformat(value).timestamp()
+
+
+def search(
+    query: str = typer.Argument(..., help='Words, "exact phrase" or prefix*'),
+    since: Optional[str] = typer.Option(None, "--since", "-s", help="Only clips recorded since (2y, 6m, 30d or a date)"),
+    project: Optional[str] = typer.Option(None, "--project", "-p", help="Only this project"),
+    path: Optional[Path] = typer.Option(None, "--in", help="Only clips below this folder"),
+    limit: int = typer.Option(25, "--limit", "-n", help="Maximum results"),
+    sync: Optional[Path] = typer.Option(None, "--sync", help="Index new/changed transcripts below this folder first"),
+    sync_all: bool = typer.Option(False, "--sync-all", help="Index new/changed transcripts of every project first"),
+):
+    """
+    Search transcripts, tags, camera metadata and filenames of all projects.
+
+    Transcripts are indexed as they are written; use --sync/--sync-all for
+    ones created before the index existed or by other tools.
+
+    Examples:
+        sf search "solar inverter" --since 2y
+        sf search interview --project my_doc
+    """
+    from studioflow.core.search_index import get_search_index
+
+    index = get_search_index()
+    if sync_all:
+        from studioflow.core.project import ProjectManager
+
+        with console.status("Indexing projects..."):
+            for proj in ProjectManager().list_projects():
+                index.sync(proj.path)
+    if sync:
+        with console.status(f"Indexing {sync}..."):
+            index.sync(sync)
+
+    try:
+        since_ts = parse_since(since) if since else None
+    except ValueError:
+        console.print(f"[red]Can't read --since {since!r} (use e.g. 2y, 6m, 30d or 2024-01-31)[/red]")
+        raise typer.Exit(1)
+
+    started = time.perf_counter()
+    hits = index.search(query, since=since_ts, under=path, project=project, limit=limit)[:limit]
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    if not hits:
+        console.print("[yellow]No results found[/yellow]")
+        return
+
+    table = Table(title=f"{len(hits)} result(s) for '{query}' ({elapsed_ms:.0f} ms)")
+    table.add_column("Clip", style="cyan")
+    table.add_column("Project", style="green")
+    table.add_column("At", style="magenta")
+    table.add_column("Match")
+    for hit in hits:
+        table.add_row(
+            hit.path.name,
+            hit.project or "",
+            format_timecode(hit.start) if hit.start is not None else "",
+            hit.text if len(hit.text) <= 80 else hit.text[:77] + "...",
+        )
+    console.print(table)
@@ -75,19 +75,12 @@ def import_media(
         dest = Path.cwd() / "01_MEDIA" / file.name
         dest.parent.mkdir(parents=True, exist_ok=True)
 
-        try:
-            import shutil
-            shutil.copy2(file, dest)
-
-            # Verify copy if requested
-            if verify and not FileVerifier.compare_files(file, dest):
-                failed.append((file, "Copy verification failed"))
-                dest.unlink()
-                continue
-
+        # Copy, hashing the source on the way and checking the copy once
+        result = FileVerifier.safe_copy(file, dest, verify=verify)
+        if result.valid:
             imported += 1
-        except Exception as e:
-            failed.append((file, str(e)))
+        else:
+            failed.append((file, result.error))
 
     # Report results
     console.print(f"\n[green]✓[/green] Imported {imported} files")
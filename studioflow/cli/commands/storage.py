@@ -0,0 +1,108 @@
+"""
+Storage Tier Commands
+Tier usage from the accounting ledger and reconciliation scans
+"""
+
+from datetime import datetime
+from typing import List, Optional
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from studioflow.core.storage import StorageTierSystem
+
+console = Console()
+app = typer.Typer()
+
+
+def _human(size: int) -> str:
+    for unit in ["B", "KB", "MB", "GB", "TB"]:
+        if size < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} PB"
+
+
+@app.command()
+def status():
+    """Show usage of every storage tier (instant; no tier is walked)"""
+    storage = StorageTierSystem()
+    table = Table(title="Storage Tiers")
+    table.add_column("Tier", style="cyan")
+    table.add_column("Path")
+    table.add_column("Files", justify="right")
+    table.add_column("Size", justify="right")
+    table.add_column("Disk free", justify="right")
+    table.add_column("Counted")
+
+    uncounted = []
+    for name, tier in storage.get_tier_status().items():
+        if not tier["exists"]:
+            table.add_row(name, tier["path"], "-", "-", "-", "[dim]missing[/dim]")
+            continue
+        if tier["counted"]:
+            counted = datetime.fromtimestamp(tier["reconciled_at"]).strftime("%Y-%m-%d %H:%M")
+        else:
+            counted = "[yellow]never[/yellow]"
+            uncounted.append(name)
+        table.add_row(
+            name, tier["path"], f"{tier['file_count']:,}", f"{tier['total_size_gb']:.2f} GB",
+            f"{tier['disk_free_gb']:.1f} GB ({100 - tier['disk_usage_percent']:.0f}%)", counted,
+        )
+
+    console.print(table)
+    if uncounted:
+        console.print(f"\n[dim]Count {', '.join(uncounted)} with:[/dim] [cyan]sf storage reconcile[/cyan]")
+
+
+@app.command()
+def projects(
+    tier: str = typer.Argument("active", help="Tier name"),
+    limit: int = typer.Option(20, "--limit", "-n", help="Number of entries to show"),
+):
+    """Show the largest projects of a tier"""
+    storage = StorageTierSystem()
+    if tier not in storage.tiers:
+        console.print(f"[red]Unknown tier: {tier}[/red]")
+        raise typer.Exit(1)
+
+    table = Table(title=f"{tier} tier")
+    table.add_column("Project", style="cyan")
+    table.add_column("Files", justify="right")
+    table.add_column("Size", justify="right")
+    for project, files, size in storage.ledger.projects(tier, limit=limit):
+        table.add_row(project, f"{files:,}", _human(size))
+    console.print(table)
+
+
+@app.command()
+def reconcile(
+    tiers: Optional[List[str]] = typer.Argument(None, help="Tiers to recount (default: all)"),
+    workers: int = typer.Option(4, "--workers", "-w", help="Parallel directory listing threads"),
+    max_age: Optional[float] = typer.Option(None, "--max-age", help="Only tiers not counted within this many hours"),
+    full_priority: bool = typer.Option(False, "--full-priority", help="Don't lower CPU/I/O priority"),
+):
+    """
+    Recount tiers from disk to correct the usage counters.
+
+    Runs at idle priority by default; suitable for a nightly timer
+    (e.g. sf storage reconcile --max-age 24).
+    """
+    storage = StorageTierSystem()
+    unknown = [name for name in tiers or [] if name not in storage.tiers]
+    if unknown:
+        console.print(f"[red]Unknown tier: {', '.join(unknown)}[/red]")
+        raise typer.Exit(1)
+
+    with console.status("Counting..."):
+        results = storage.reconcile(
+            tiers or None, workers=workers,
+            max_age=max_age * 3600 if max_age is not None else None,
+            low_priority=not full_priority,
+        )
+
+    if not results:
+        console.print("[dim]Nothing to reconcile[/dim]")
+    for name, usage in results.items():
+        console.print(f"[green]✓[/green] {name}: {usage.files:,} files, {_human(usage.size)}")
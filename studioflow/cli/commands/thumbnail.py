@@ -93,8 +93,8 @@ def extract_frame_from_video(video_path: Path, output_path: Path, time: str = "0
     """Extract a frame from video at specified time"""
     cmd = [
         "ffmpeg",
+        "-ss", time,  # Seek the input (before -i) instead of decoding up to it
         "-i", str(video_path),
-        "-ss", time,  # Seek to time
         "-frames:v", "1",  # Extract 1 frame
         "-q:v", "2",  # Quality
         "-y",  # Overwrite
@@ -108,6 +108,22 @@ def extract_frame_from_video(video_path: Path, output_path: Path, time: str = "0
         return False
 
 
+def _format_time(seconds: float) -> str:
+    return f"{int(seconds // 3600):02d}:{int(seconds % 3600 // 60):02d}:{seconds % 60:06.3f}"
+
+
+def _best_frame(videos: List[Path]) -> Tuple[Path, Optional[float]]:
+    """Video and time of the best-scoring sampled frame across videos"""
+    from studioflow.core.thumbnail import find_candidates
+
+    best = (videos[0], None, -1.0)
+    for video in videos:
+        candidates = find_candidates(video)
+        if candidates and candidates[0].score > best[2]:
+            best = (video, candidates[0].time, candidates[0].score)
+    return best[0], best[1]
+
+
 def apply_text_overlay(
     image_path: Path,
     output_path: Path,
@@ -205,12 +221,14 @@ def generate(
     text: Optional[str] = None,
     template: str = "modern",
     source: Optional[str] = None,
-    time: str = "00:00:05",
+    time: Optional[str] = None,
     position: str = "center"
 ):
     """
     Generate a thumbnail for your video
 
+    Without --time the best-scoring frame of the video is used.
+
     Templates: viral, modern, tutorial, gaming, minimal
     """
     state = StateManager()
@@ -238,8 +256,11 @@ def generate(
         videos = list(media_dir.rglob("*.mp4")) + list(media_dir.rglob("*.mov"))
 
         if videos:
-            source = videos[0]
+            with console.status("Finding the best frame..."):
+                source, best_time = _best_frame(videos)
             console.print(f"Using video: {source.name}")
+            if time is None and best_time is not None:
+                time = _format_time(best_time)
         else:
             console.print("[red]No video found. Specify --source[/red]")
             return
@@ -262,6 +283,13 @@ def generate(
     if source.suffix.lower() in [".mp4", ".mov", ".avi", ".mkv"]:
         frame_path = thumb_dir / "frame_temp.jpg"
 
+        if time is None:
+            from studioflow.core.thumbnail import best_thumbnail_time
+
+            with console.status("Finding the best frame..."):
+                best_time = best_thumbnail_time(source)
+            time = _format_time(best_time) if best_time is not None else "00:00:05"
+
         with console.status("Extracting frame..."):
             if not extract_frame_from_video(source, frame_path, time):
                 console.print("[red]Failed to extract frame[/red]")
@@ -324,7 +352,9 @@ def batch(
         console.print("[red]No video found in project[/red]")
         return
 
-    source = videos[0]
+    with console.status("Finding the best frame..."):
+        source, best_time = _best_frame(videos)
+    time = _format_time(best_time) if best_time is not None else "00:00:05"
 
     # Create thumbnails directory
     thumb_dir = project.path / "06_THUMBNAILS"
@@ -333,8 +363,8 @@ def batch(
     # Extract frame once
     frame_path = thumb_dir / "frame_temp.jpg"
 
-    console.print(f"Extracting frame from: {source.name}")
-    if not extract_frame_from_video(source, frame_path, "00:00:05"):
+    console.print(f"Extracting frame from: {source.name} at {time}")
+    if not extract_frame_from_video(source, frame_path, time):
         console.print("[red]Failed to extract frame[/red]")
         return
 
@@ -0,0 +1,91 @@
+"""
+Integrity Manifest Commands
+Create resumable checksum manifests and re-verify folders against them
+"""
+
+from pathlib import Path
+
+import typer
+from rich.console import Console
+from rich.progress import Progress, BarColumn, DownloadColumn, TimeRemainingColumn, TextColumn
+
+from studioflow.core.verify import FileVerifier, MANIFEST_NAME
+
+console = Console()
+
+
+def _progress() -> Progress:
+    return Progress(
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        DownloadColumn(),
+        TimeRemainingColumn(),
+        console=console,
+    )
+
+
+def manifest(
+    directory: Path = typer.Argument(..., help="Folder to checksum"),
+    update: bool = typer.Option(False, "--update", "-u", help="Keep hashes of files whose size/mtime are unchanged"),
+    workers: int = typer.Option(4, "--workers", "-w", help="Parallel hashing threads"),
+):
+    """
+    Create (or resume) an integrity manifest.
+
+    Hashes are checkpointed while they are computed, so an interrupted run
+    on a large drive picks up where it stopped when started again.
+    """
+    if not directory.is_dir():
+        console.print(f"[red]Not a directory: {directory}[/red]")
+        raise typer.Exit(1)
+
+    with _progress() as progress:
+        task = progress.add_task("Hashing...", total=None)
+        result = FileVerifier.create_manifest(
+            directory, workers=workers, update=update,
+            progress=lambda rel, size: progress.advance(task, size),
+        )
+
+    unreadable = [rel for rel, info in result["files"].items() if info["hash"] is None]
+    console.print(f"[green]✓[/green] {len(result['files'])} files in {directory / MANIFEST_NAME}")
+    if unreadable:
+        console.print(f"[yellow]⚠[/yellow] {len(unreadable)} files could not be read")
+
+
+def verify(
+    directory: Path = typer.Argument(..., help="Folder with a manifest"),
+    changed_only: bool = typer.Option(False, "--changed-only", help="Only rehash files whose size/mtime changed"),
+    workers: int = typer.Option(4, "--workers", "-w", help="Parallel hashing threads"),
+):
+    """
+    Verify a folder against its integrity manifest.
+
+    A full run rehashes everything to catch bit rot; --changed-only is a
+    quick check after copies and edits.
+    """
+    try:
+        with _progress() as progress:
+            task = progress.add_task("Verifying...", total=None)
+            report = FileVerifier.verify_manifest(
+                directory, changed_only=changed_only, workers=workers,
+                progress=lambda rel, size: progress.advance(task, size),
+            )
+    except FileNotFoundError:
+        console.print(f"[red]No manifest in {directory}[/red]")
+        console.print(f"Create one with: [cyan]sf manifest {directory}[/cyan]")
+        raise typer.Exit(1)
+
+    console.print(f"Checked {report.checked} files" +
+                  (f", {report.skipped} unchanged skipped" if report.skipped else ""))
+    for label, style, paths in (("Corrupted", "red", report.corrupted),
+                                ("Modified", "yellow", report.modified),
+                                ("Missing", "red", report.missing),
+                                ("New (not in manifest)", "dim", report.new)):
+        if paths:
+            console.print(f"[{style}]{label}: {len(paths)}[/{style}]")
+            for rel in paths[:10]:
+                console.print(f"  {rel}")
+
+    if not report.ok:
+        raise typer.Exit(1)
+    console.print("[green]✓ All files match the manifest[/green]")
@@ -0,0 +1,482 @@
+"""
+Warm sf daemon and thin client
+Keeps config, state, GPU detection and probe/analysis caches resident so
+each `sf` invocation skips interpreter and cache startup.
+
+The client half of this module is the `sf` entry point and must stay
+import-light: stdlib only at module level, nothing from typer/rich/pydantic.
+
+Protocol (Unix socket, one connection per invocation):
+    client -> server   4-byte length + SCM_RIGHTS(stdin, stdout, stderr)
+                       JSON request {"argv", "cwd", "env"} or {"command"}
+    server -> client   JSON lines: {"pid": N} then {"exit": code}
+
+Each request runs in a forked worker that inherits the warm process, so
+commands are isolated from each other. Cache entries a worker adds are
+piped back to the server and merged for the next invocation. The server
+is a single thread (one select loop over the socket and the workers'
+pipes), so no lock is ever held by another thread when it forks.
+"""
+
+import json
+import os
+import signal
+import socket
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+DEFAULT_IDLE_TIMEOUT = 1800  # seconds without requests before the server exits
+CONNECT_TIMEOUT = 0.5
+
+
+def socket_path() -> Path:
+    """Per-user socket location (private directory)"""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    base = Path(runtime_dir) / "studioflow" if runtime_dir else Path.home() / ".studioflow" / "run"
+    return base / "sf.sock"
+
+
+def log_path() -> Path:
+    return Path.home() / ".studioflow" / "daemon.log"
+
+
+def daemon_supported() -> bool:
+    return hasattr(socket, "AF_UNIX") and hasattr(os, "fork") and hasattr(socket, "send_fds")
+
+
+def daemon_enabled() -> bool:
+    """Opt-in via STUDIOFLOW_DAEMON=1; STUDIOFLOW_DAEMON=0 forces in-process runs"""
+    return os.environ.get("STUDIOFLOW_DAEMON", "").lower() in ("1", "true", "yes", "on")
+
+
+def daemon_disabled() -> bool:
+    return os.environ.get("STUDIOFLOW_DAEMON", "").lower() in ("0", "false", "no", "off")
+
+
+# ---------------------------------------------------------------------------
+# Wire helpers
+# ---------------------------------------------------------------------------
+
+def _send_json(sock: socket.socket, message: Dict) -> None:
+    sock.sendall(json.dumps(message).encode() + b"\n")
+
+
+def _read_lines(sock: socket.socket):
+    """Yield decoded JSON lines until the peer closes the connection"""
+    buffer = b""
+    while True:
+        chunk = sock.recv(4096)
+        if not chunk:
+            return
+        buffer += chunk
+        while b"\n" in buffer:
+            line, buffer = buffer.split(b"\n", 1)
+            if line:
+                yield json.loads(line)
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes:
+    data = b""
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            raise ConnectionError("client closed connection")
+        data += chunk
+    return data
+
+
+def _send_request(sock: socket.socket, request: Dict, fds: Optional[List[int]] = None) -> None:
+    payload = json.dumps(request).encode()
+    socket.send_fds(sock, [struct.pack("!I", len(payload))], fds or [])
+    sock.sendall(payload)
+
+
+def _connect(path: Path, timeout: Optional[float] = CONNECT_TIMEOUT) -> socket.socket:
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(str(path))
+    except OSError:
+        sock.close()
+        raise
+    sock.settimeout(None)
+    return sock
+
+
+# ---------------------------------------------------------------------------
+# Client
+# ---------------------------------------------------------------------------
+
+def send_command(command: str) -> Optional[Dict]:
+    """Send a control command (status, stop); None if no daemon is running"""
+    try:
+        sock = _connect(socket_path())
+    except OSError:
+        return None
+    with sock:
+        try:
+            _send_request(sock, {"command": command})
+            for message in _read_lines(sock):
+                return message
+        except OSError:
+            pass  # daemon shut down while we were connecting
+    return None
+
+
+def spawn_server() -> None:
+    """Start the daemon detached from this terminal"""
+    import subprocess
+
+    # Make this checkout importable even when sf runs from a source tree
+    package_root = str(Path(__file__).resolve().parents[2])
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (package_root, env.get("PYTHONPATH")) if p)
+
+    log_path().parent.mkdir(parents=True, exist_ok=True)
+    with open(log_path(), "ab") as log:
+        subprocess.Popen(
+            [sys.executable, "-c", "from studioflow.cli.daemon import serve; serve()"],
+            stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=log,
+            env=env, start_new_session=True, close_fds=True,
+        )
+
+
+def forward(argv: List[str], autostart: bool = True) -> Optional[int]:
+    """
+    Run `sf <argv>` in the daemon, streaming through this terminal.
+
+    Returns the exit code, or None if the command should run in-process
+    (no daemon reachable; one is started in the background if autostart).
+    """
+    path = socket_path()
+    try:
+        sock = _connect(path)
+    except OSError:
+        if autostart:
+            spawn_server()
+        return None
+
+    with sock:
+        request = {"argv": argv, "cwd": os.getcwd(), "env": dict(os.environ)}
+        try:
+            _send_request(sock, request, [0, 1, 2])
+        except OSError:
+            return None
+
+        worker_pid = None
+        previous_handlers = {}
+
+        def _relay(signum, frame):
+            if worker_pid:
+                try:
+                    os.kill(worker_pid, signum)
+                except ProcessLookupError:
+                    pass
+
+        try:
+            for message in _read_lines(sock):
+                if "pid" in message:
+                    worker_pid = message["pid"]
+                    for signum in (signal.SIGINT, signal.SIGTERM, signal.SIGHUP):
+                        previous_handlers[signum] = signal.signal(signum, _relay)
+                elif "exit" in message:
+                    return int(message["exit"])
+                elif "error" in message:
+                    # Server refused before forking: run in-process instead
+                    return None
+        finally:
+            for signum, handler in previous_handlers.items():
+                signal.signal(signum, handler)
+
+    # Connection dropped mid-command (daemon killed)
+    return None if worker_pid is None else 1
+
+
+def main() -> None:
+    """`sf` entry point: forward to a warm daemon when available"""
+    argv = sys.argv[1:]
+    if daemon_supported() and not daemon_disabled() and argv[:1] != ["daemon"]:
+        enabled = daemon_enabled()
+        if enabled or socket_path().exists():
+            code = forward(argv, autostart=enabled)
+            if code is not None:
+                sys.exit(code)
+
+    from studioflow.cli.main import run
+    run()
+
+
+# ---------------------------------------------------------------------------
+# Server
+# ---------------------------------------------------------------------------
+
+class DaemonServer:
+    """Resident process that forks a warm worker per sf invocation"""
+
+    def __init__(self, path: Optional[Path] = None, idle_timeout: Optional[float] = None):
+        self.path = path or socket_path()
+        if idle_timeout is None:
+            idle_timeout = float(os.environ.get("STUDIOFLOW_DAEMON_IDLE", DEFAULT_IDLE_TIMEOUT))
+        self.idle_timeout = idle_timeout
+        self.started_at = time.time()
+        self.last_activity = time.time()
+        self.requests_served = 0
+        self.active_workers = 0
+        self._stop = False
+        self._sock: Optional[socket.socket] = None
+        self._selector = None
+
+    def warm(self) -> None:
+        """Import command modules and build the caches every command needs"""
+        import importlib
+        from studioflow.cli import main as cli_main
+
+        for spec in cli_main.LAZY_COMMANDS.values():
+            try:
+                importlib.import_module(spec.import_path.split(":")[0])
+            except Exception:
+                pass  # The command reports its own import error when run
+
+        from studioflow.core.config import get_config
+        from studioflow.core.gpu_utils import get_gpu_detector
+        get_config()
+        get_gpu_detector()
+
+    def bind(self) -> bool:
+        """Bind the socket; False if another live daemon already owns it"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        os.chmod(self.path.parent, 0o700)
+        if self.path.exists():
+            try:
+                _connect(self.path).close()
+                return False
+            except OSError:
+                self.path.unlink()  # stale socket from a crashed daemon
+
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._sock.bind(str(self.path))
+        self._sock.listen(16)
+        self._sock.settimeout(1.0)
+        return True
+
+    def serve_forever(self) -> None:
+        import selectors
+
+        if not self.bind():
+            return
+        self.warm()
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self._sock, selectors.EVENT_READ)
+        try:
+            while not self._stop:
+                events = self._selector.select(timeout=1.0)
+                if not events:
+                    idle = time.time() - self.last_activity
+                    if self.active_workers == 0 and idle > self.idle_timeout:
+                        break
+                    continue
+                for key, _ in events:
+                    if key.fileobj is self._sock:
+                        self._accept()
+                    else:
+                        self._read_worker(key.fileobj, key.data)
+        finally:
+            self._selector.close()
+            self._selector = None
+            self.shutdown()
+
+    def _accept(self) -> None:
+        import selectors
+
+        try:
+            conn, _ = self._sock.accept()
+        except socket.timeout:
+            return
+        self.last_activity = time.time()
+        try:
+            request, fds = self._read_request(conn)
+        except (OSError, ValueError, ConnectionError):
+            conn.close()
+            return
+
+        if "command" in request:
+            self._handle_command(conn, request["command"])
+            return
+
+        worker = self._fork_worker(conn, request, fds)
+        if worker is not None:
+            pid, updates_r = worker
+            self._selector.register(updates_r, selectors.EVENT_READ, (conn, pid, []))
+
+    def shutdown(self) -> None:
+        # Unlink first so clients never see a socket file nobody answers on
+        try:
+            self.path.unlink()
+        except OSError:
+            pass
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+    def _read_request(self, conn: socket.socket):
+        conn.settimeout(5.0)
+        header, fds, _, _ = socket.recv_fds(conn, 4, 3)
+        if len(header) < 4:
+            header += _recv_exact(conn, 4 - len(header))
+        (length,) = struct.unpack("!I", header)
+        request = json.loads(_recv_exact(conn, length))
+        conn.settimeout(None)
+        return request, fds
+
+    def _handle_command(self, conn: socket.socket, command: str) -> None:
+        with conn:
+            if command == "status":
+                from studioflow.core.cache import cache_stats
+                _send_json(conn, {
+                    "pid": os.getpid(),
+                    "socket": str(self.path),
+                    "uptime": time.time() - self.started_at,
+                    "requests": self.requests_served,
+                    "active": self.active_workers,
+                    "idle_timeout": self.idle_timeout,
+                    "caches": cache_stats(),
+                })
+            elif command == "stop":
+                self._stop = True
+                _send_json(conn, {"stopping": os.getpid()})
+            else:
+                _send_json(conn, {"error": f"unknown command: {command}"})
+
+    def _fork_worker(self, conn: socket.socket, request: Dict, fds: List[int]):
+        if len(fds) != 3:
+            _send_json(conn, {"error": "expected stdin/stdout/stderr descriptors"})
+            conn.close()
+            return None
+
+        updates_r, updates_w = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(updates_r)
+            self._sock.close()
+            conn.close()
+            _run_worker(request, fds, updates_w)  # never returns
+
+        os.close(updates_w)
+        for fd in fds:
+            os.close(fd)
+        self.requests_served += 1
+        self.active_workers += 1
+        _send_json(conn, {"pid": pid})
+        return pid, updates_r
+
+    def _read_worker(self, updates_r: int, worker) -> None:
+        """Collect a worker's cache updates; once it closes the pipe, merge them and report its exit"""
+        chunk = os.read(updates_r, 1 << 16)
+        conn, pid, chunks = worker
+        if chunk:
+            chunks.append(chunk)
+            return
+        self._selector.unregister(updates_r)
+        os.close(updates_r)
+        self._finish_worker(conn, pid, b"".join(chunks))
+
+    def _finish_worker(self, conn: socket.socket, pid: int, data: bytes) -> None:
+        import pickle
+        from studioflow.core.cache import merge_all_updates
+
+        if data:
+            try:
+                merge_all_updates(pickle.loads(data))
+            except Exception:
+                pass
+
+        _, status = os.waitpid(pid, 0)
+        code = os.waitstatus_to_exitcode(status)
+        if code < 0:
+            code = 128 - code  # killed by signal, shell convention
+        try:
+            _send_json(conn, {"exit": code})
+        except OSError:
+            pass
+        finally:
+            conn.close()
+            self.active_workers -= 1
+            self.last_activity = time.time()
+
+
+def _rebind_consoles() -> None:
+    """Give modules fresh rich consoles for the client's terminal
+
+    Module-level Console objects were built while stdout was /dev/null and
+    have colour disabled. Each one that follows sys.stdout/sys.stderr is
+    replaced, in every module holding it, by a new Console on the worker's
+    stream, which detects the terminal's capabilities afresh.
+    """
+    try:
+        from rich.console import Console
+    except ImportError:
+        return
+    fresh: Dict[int, Console] = {}
+    for module in list(sys.modules.values()):
+        namespace = getattr(module, "__dict__", None)
+        if not isinstance(namespace, dict):
+            continue
+        for name, value in list(namespace.items()):
+            if not isinstance(value, Console) or value.file not in (sys.stdout, sys.stderr):
+                continue  # not a console, or one writing to a file of its own
+            if id(value) not in fresh:
+                fresh[id(value)] = Console(file=value.file)
+            namespace[name] = fresh[id(value)]
+
+
+def _run_worker(request: Dict, fds: List[int], updates_w: int) -> None:
+    """Body of a forked worker: become the client's sf process, then exit"""
+    import pickle
+
+    code = 1
+    try:
+        for target, fd in zip((0, 1, 2), fds):
+            os.dup2(fd, target)
+            os.close(fd)
+        sys.stdin = os.fdopen(0, "r", closefd=False)
+        sys.stdout = os.fdopen(1, "w", buffering=1, encoding="utf-8", closefd=False)
+        sys.stderr = os.fdopen(2, "w", buffering=1, encoding="utf-8", closefd=False)
+
+        os.environ.clear()
+        os.environ.update(request.get("env", {}))
+        os.chdir(request.get("cwd") or "/")
+        sys.argv = ["sf"] + list(request.get("argv", []))
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        _rebind_consoles()
+
+        from studioflow.cli.main import run
+        try:
+            run()
+            code = 0
+        except SystemExit as e:
+            code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        except BaseException as e:
+            # typer.Exit / click exceptions raised outside standalone mode
+            code = getattr(e, "exit_code", 1)
+    finally:
+        try:
+            sys.stdout.flush()
+            sys.stderr.flush()
+        except Exception:
+            pass
+        try:
+            from studioflow.core.cache import take_all_updates
+            with os.fdopen(updates_w, "wb") as updates:
+                updates.write(pickle.dumps(take_all_updates()))
+        except Exception:
+            pass
+        os._exit(code)
+
+
+def serve(idle_timeout: Optional[float] = None) -> None:
+    DaemonServer(idle_timeout=idle_timeout).serve_forever()
+
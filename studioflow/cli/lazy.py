@@ -0,0 +1,86 @@
+"""
+Lazy command registration for the sf CLI
+Command modules are imported only when their command is actually invoked
+"""
+
+import importlib
+from typing import Dict, List, NamedTuple
+
+import typer
+from typer.core import TyperCommand, TyperGroup
+
+
+class LazyCommand(NamedTuple):
+    """Where to find a command and what to show for it in help listings"""
+    import_path: str  # "package.module:attribute"
+    help: str
+    group: bool = False  # attribute is a typer.Typer sub-app rather than a function
+
+
+class LazyTyperGroup(TyperGroup):
+    """
+    TyperGroup that resolves commands from import paths on first use.
+
+    Subclasses set `lazy_commands`. Commands registered directly on the
+    Typer app always take precedence over lazy entries with the same name.
+    Help listings and shell completion of command names are served from
+    the stored help text, so `sf --help` never imports command modules.
+    """
+
+    lazy_commands: Dict[str, LazyCommand] = {}
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._resolved: Dict[str, object] = {}
+        self._listing = False
+
+    def list_commands(self, ctx) -> List[str]:
+        return sorted(set(self.commands) | set(self.lazy_commands))
+
+    def get_command(self, ctx, cmd_name: str):
+        if cmd_name in self.commands:
+            return self.commands[cmd_name]
+        spec = self.lazy_commands.get(cmd_name)
+        if spec is None:
+            return None
+        if cmd_name in self._resolved:
+            return self._resolved[cmd_name]
+        if self._listing:
+            # Help listing or completion of names only: no import needed
+            return TyperCommand(name=cmd_name, help=spec.help)
+        command = self._load(cmd_name, spec)
+        self._resolved[cmd_name] = command
+        return command
+
+    def format_help(self, ctx, formatter) -> None:
+        self._listing = True
+        try:
+            super().format_help(ctx, formatter)
+        finally:
+            self._listing = False
+
+    def shell_complete(self, ctx, incomplete: str):
+        self._listing = True
+        try:
+            return super().shell_complete(ctx, incomplete)
+        finally:
+            self._listing = False
+
+    def _load(self, cmd_name: str, spec: LazyCommand):
+        module_name, attr = spec.import_path.split(":")
+        target = getattr(importlib.import_module(module_name), attr)
+
+        if spec.group:
+            command = typer.main.get_group(target)
+            command.name = cmd_name
+            command.help = spec.help
+            return command
+
+        sub_app = typer.Typer(add_completion=False, rich_markup_mode=self.rich_markup_mode)
+        sub_app.command(name=cmd_name)(target)
+        return typer.main.get_command(sub_app)
+
+
+def lazy_group(commands: Dict[str, LazyCommand]) -> type:
+    """Create a LazyTyperGroup class bound to a command table (for typer.Typer(cls=...))"""
+    return type("SFLazyGroup", (LazyTyperGroup,), {"lazy_commands": commands})
@@ -10,42 +10,107 @@ import sys
 import os
 
 import typer
-from rich import print
 from rich.console import Console
 from rich.table import Table
-from rich.progress import track
 from rich.panel import Panel
-from rich.prompt import Confirm
 
 from studioflow import __version__
-from studioflow.cli.commands import simple
-from studioflow.cli.commands import professional
-from studioflow.cli.commands import user
-from studioflow.cli.commands import resolve_magic
-from studioflow.cli.commands import project
-from studioflow.cli.commands import library
-from studioflow.cli.commands import auto_edit
-from studioflow.cli.commands import workflow
-from studioflow.cli.commands import dashboard
-from studioflow.cli.commands import batch_ops
-from studioflow.cli.commands import quick_actions
-from studioflow.cli.commands import export as export_cmd
-from studioflow.cli.commands import media_org
-from studioflow.cli.commands import power_bins
-from studioflow.cli.commands import rough_cut_cmd
-from studioflow.cli.commands import normalize
-from studioflow.cli.commands import background
-from studioflow.cli.setup_wizard import run_setup
-from studioflow.cli.workflows import new_video
-from studioflow.core.config import Config, ConfigManager
+from studioflow.cli.lazy import LazyCommand, lazy_group
 from studioflow.core.state import StateManager
 
 # Initialize Rich console for beautiful output
 console = Console()
 
+_COMMANDS = "studioflow.cli.commands"
+
+# Command modules are resolved lazily: a module is imported only when one of
+# its commands runs, so `sf --help` and shell completion stay fast.
+# Commands defined in this file (new, import, status, ...) take precedence.
+LAZY_COMMANDS = {
+    # Simplified commands
+    "cut": LazyCommand(f"{_COMMANDS}.simple:cut", "Cut a segment from video"),
+    "concat": LazyCommand(f"{_COMMANDS}.simple:concat", "Concatenate multiple videos"),
+    "effect": LazyCommand(f"{_COMMANDS}.simple:effect", "Apply simple effect to video"),
+    "audio": LazyCommand(f"{_COMMANDS}.simple:audio", "Audio operations"),
+    "thumbnail": LazyCommand(f"{_COMMANDS}.simple:thumbnail", "Generate thumbnail from video"),
+    "transcribe": LazyCommand(f"{_COMMANDS}.simple:transcribe", "Transcribe audio using Whisper (auto-detects project footage if no file specified)"),
+    "upload": LazyCommand(f"{_COMMANDS}.simple:upload", "Upload video to platform"),
+    "info": LazyCommand(f"{_COMMANDS}.simple:info", "Show media file information"),
+    "episode": LazyCommand(f"{_COMMANDS}.simple:episode", "Create a new episode with full automation support"),
+    "doc": LazyCommand(f"{_COMMANDS}.simple:doc", "Create a new documentary project"),
+    "film": LazyCommand(f"{_COMMANDS}.simple:film", "Create a new film project (hobby/experimental)"),
+    "import-media": LazyCommand(f"{_COMMANDS}.simple:import_media", "Import media files with verification"),
+
+    # Integrity manifests
+    "manifest": LazyCommand(f"{_COMMANDS}.verify:manifest", "Create (or resume) an integrity manifest"),
+    "verify": LazyCommand(f"{_COMMANDS}.verify:verify", "Verify a folder against its integrity manifest"),
+
+    # Professional commands
+    "resolve-check": LazyCommand(f"{_COMMANDS}.professional:resolve_check", "Check DaVinci Resolve installation"),
+    "resolve-timeline": LazyCommand(f"{_COMMANDS}.professional:resolve_timeline", "Create Resolve timeline from clips"),
+    "resolve-proxy": LazyCommand(f"{_COMMANDS}.professional:resolve_proxy", "Generate proxy media for editing"),
+    "resolve-multicam": LazyCommand(f"{_COMMANDS}.professional:resolve_multicam", "Sync multiple camera angles"),
+    "resolve-grade": LazyCommand(f"{_COMMANDS}.professional:resolve_grade", "Apply professional color grade"),
+    "node-pipeline": LazyCommand(f"{_COMMANDS}.professional:node_pipeline", "Create effects pipeline"),
+    "node-composite": LazyCommand(f"{_COMMANDS}.professional:node_composite", "Composite two videos"),
+    "workflow-create": LazyCommand(f"{_COMMANDS}.professional:workflow_create", "Create new workflow"),
+    "workflow-run": LazyCommand(f"{_COMMANDS}.professional:workflow_run", "Run a workflow"),
+    "workflow-watch": LazyCommand(f"{_COMMANDS}.professional:workflow_watch", "Watch folder and trigger workflow"),
+    "workflow-list": LazyCommand(f"{_COMMANDS}.professional:workflow_list", "List available workflows"),
+    "workflow-status": LazyCommand(f"{_COMMANDS}.professional:workflow_status", "Show workflow execution status"),
+    "preset": LazyCommand(f"{_COMMANDS}.professional:preset", "Apply professional preset"),
+
+    # User-focused commands
+    "check": LazyCommand(f"{_COMMANDS}.user:check", "Check media quality and find issues"),
+    "fix": LazyCommand(f"{_COMMANDS}.user:fix", "Fix common media issues"),
+    "preview": LazyCommand(f"{_COMMANDS}.user:preview", "Generate quick preview"),
+    "snapshot": LazyCommand(f"{_COMMANDS}.user:snapshot", "Create backup snapshot"),
+    "undo": LazyCommand(f"{_COMMANDS}.user:undo", "Restore from last snapshot"),
+    "quick": LazyCommand(f"{_COMMANDS}.user:quick", "Quick processing with smart defaults"),
+    "typical": LazyCommand(f"{_COMMANDS}.user:typical", "Run your typical workflow"),
+    "recent": LazyCommand(f"{_COMMANDS}.user:recent", "Show recent work and continue where you left off"),
+    "estimate": LazyCommand(f"{_COMMANDS}.user:estimate", "Estimate processing time"),
+
+    # Note: Eric's commands have been moved:
+    # - check_lufs, fix_lufs -> normalize.check_lufs, normalize.fix_lufs
+    # - sanitize_names -> user_utils.sanitize_filename (utility function)
+    # - Other commands archived to archive/user-specific/eric_commands.py
+
+    # Resolve Magic commands
+    "magic": LazyCommand(f"{_COMMANDS}.resolve_magic:magic", "🎯 THE ULTIMATE COMMAND - Complete video production in one command"),
+    "auto-project": LazyCommand(f"{_COMMANDS}.resolve_magic:auto_project", "Automatically create optimized Resolve project from media"),
+    "smart-bins": LazyCommand(f"{_COMMANDS}.resolve_magic:smart_bins", "Create intelligent bin organization"),
+    "analyze": LazyCommand(f"{_COMMANDS}.resolve_magic:analyze", "Deep analysis of media for intelligent editing"),
+
+    # Smart rough-cut command (replaces old rough_cut with transcript-aware version)
+    "rough-cut": LazyCommand(f"{_COMMANDS}.rough_cut_cmd:rough_cut", "Create intelligent rough cut from footage + transcripts."),
+
+    # Global search across projects
+    "search": LazyCommand(f"{_COMMANDS}.search:search", "Search transcripts, tags and filenames of all projects"),
+
+    # Quick actions menu
+    "menu": LazyCommand(f"{_COMMANDS}.quick_actions:menu", "Interactive quick actions menu"),
+
+    # Subcommand groups
+    "project": LazyCommand(f"{_COMMANDS}.project:app", "Project management commands", group=True),
+    "library": LazyCommand(f"{_COMMANDS}.library:app", "Library workspace management", group=True),
+    "storage": LazyCommand(f"{_COMMANDS}.storage:app", "Storage tier usage and reconciliation", group=True),
+    "auto-edit": LazyCommand(f"{_COMMANDS}.auto_edit:app", "Auto-editing: smart bins, chapters, timeline automation", group=True),
+    "workflow": LazyCommand(f"{_COMMANDS}.workflow:app", "Complete workflows: episode, import, publish", group=True),
+    "dashboard": LazyCommand(f"{_COMMANDS}.dashboard:app", "Project health dashboard and status", group=True),
+    "batch": LazyCommand(f"{_COMMANDS}.batch_ops:app", "Batch processing: transcribe, trim, thumbnails", group=True),
+    "export": LazyCommand(f"{_COMMANDS}.export:app", "Export with validation", group=True),
+    "media-org": LazyCommand(f"{_COMMANDS}.media_org:app", "Smart media organization and search", group=True),
+    "power-bins": LazyCommand(f"{_COMMANDS}.power_bins:app", "Manage Power Bins structure and sync", group=True),
+    "normalize": LazyCommand(f"{_COMMANDS}.normalize:app", "Normalize footage: audio to -14 LUFS, PCM codec, clean filenames", group=True),
+    "background": LazyCommand(f"{_COMMANDS}.background:app", "Background services: auto-transcription, auto-rough-cut", group=True),
+    "daemon": LazyCommand(f"{_COMMANDS}.daemon:app", "Warm sf daemon for fast repeated invocations", group=True),
+}
+
 # Create main Typer app
 app = typer.Typer(
     name="sf",
+    cls=lazy_group(LAZY_COMMANDS),
     help="StudioFlow - Automated Video Production Pipeline",
     no_args_is_help=False,  # We'll handle help display ourselves
     rich_markup_mode="rich",
@@ -53,85 +118,6 @@ app = typer.Typer(
     context_settings={"help_option_names": ["-h", "--help"]},
 )
 
-# Add simplified commands directly to main app
-for command in [
-    simple.new, simple.import_media, simple.cut, simple.concat,
-    simple.export, simple.effect, simple.audio, simple.thumbnail,
-    simple.transcribe, simple.upload, simple.info,
-    simple.episode, simple.doc, simple.film
-]:
-    app.command()(command)
-
-# Add professional commands
-for command in [
-    professional.resolve_check, professional.resolve_timeline, professional.resolve_proxy,
-    professional.resolve_multicam, professional.resolve_grade,
-    professional.node_pipeline, professional.node_composite,
-    professional.workflow_create, professional.workflow_run, professional.workflow_watch,
-    professional.workflow_list, professional.workflow_status,
-    professional.preset
-]:
-    app.command()(command)
-
-# Add user-focused commands
-for command in [
-    user.status, user.check, user.fix, user.preview,
-    user.snapshot, user.undo, user.quick, user.typical,
-    user.recent, user.estimate, user.batch
-]:
-    app.command()(command)
-
-# Note: Eric's commands have been moved:
-# - check_lufs, fix_lufs -> normalize.check_lufs, normalize.fix_lufs
-# - sanitize_names -> user_utils.sanitize_filename (utility function)
-# - Other commands archived to archive/user-specific/eric_commands.py
-
-# Add Resolve Magic commands
-for command in [
-    resolve_magic.magic, resolve_magic.auto_project,
-    resolve_magic.smart_bins, resolve_magic.analyze
-]:
-    app.command()(command)
-
-# Add smart rough-cut command (replaces old rough_cut with transcript-aware version)
-app.command(name="rough-cut")(rough_cut_cmd.rough_cut)
-
-# Add project subcommand group (create, list, select, archive, cleanup)
-app.add_typer(project.app, name="project", help="Project management commands")
-
-# Add library workspace subcommand group
-app.add_typer(library.app, name="library", help="Library workspace management")
-
-# Add auto-editing subcommand group (intelligent automation for YouTube episodes)
-app.add_typer(auto_edit.app, name="auto-edit", help="Auto-editing: smart bins, chapters, timeline automation")
-
-# Add complete workflow subcommand group
-app.add_typer(workflow.app, name="workflow", help="Complete workflows: episode, import, publish")
-
-# Add dashboard subcommand group
-app.add_typer(dashboard.app, name="dashboard", help="Project health dashboard and status")
-
-# Add batch operations subcommand group
-app.add_typer(batch_ops.app, name="batch", help="Batch processing: transcribe, trim, thumbnails")
-
-# Add quick actions command
-app.command()(quick_actions.menu)
-
-# Add export commands
-app.add_typer(export_cmd.app, name="export", help="Export with validation")
-
-# Add media organization commands
-app.add_typer(media_org.app, name="media-org", help="Smart media organization and search")
-
-# Add power bins commands
-app.add_typer(power_bins.app, name="power-bins", help="Manage Power Bins structure and sync")
-
-# Add normalization commands
-app.add_typer(normalize.app, name="normalize", help="Normalize footage: audio to -14 LUFS, PCM codec, clean filenames")
-
-# Add background services commands
-app.add_typer(background.app, name="background", help="Background services: auto-transcription, auto-rough-cut")
-
 # State manager for tracking context
 state = StateManager()
 
@@ -158,6 +144,8 @@ def new(
         sf new "Product Review" --import /media/sdcard
         sf new "Vlog Episode 5" --template vlog --platform instagram
     """
+    from studioflow.cli.workflows import new_video
+
     with console.status(f"Creating project [bold cyan]{name}[/bold cyan]..."):
         result = new_video.create_workflow(
             name=name,
@@ -320,6 +308,8 @@ def config(
     edit: Annotated[bool, typer.Option("--edit", help="Edit config file")] = False,
 ):
     """Manage StudioFlow configuration."""
+    from studioflow.core.config import ConfigManager
+
     cfg = ConfigManager()
 
     if set_:
@@ -351,6 +341,7 @@ def config(
 @app.command()
 def setup():
     """Run interactive setup wizard"""
+    from studioflow.cli.setup_wizard import run_setup
     run_setup()
 
 
@@ -867,6 +858,9 @@ def run():
             console.print("\n[yellow]⚠ First-time setup required![/yellow]")
             console.print("StudioFlow needs to be configured before use.\n")
 
+            from rich.prompt import Confirm
+            from studioflow.cli.setup_wizard import run_setup
+
             if Confirm.ask("Run setup wizard now?", default=True):
                 run_setup()
                 console.print("\n[green]Setup complete! Now running your command...\n[/green]")
@@ -16,6 +16,10 @@ from rich.table import Table
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
 from rich.panel import Panel
 
+from studioflow.core.file_index import IndexEntry, get_file_index
+from studioflow.core.duplicates import DuplicateFinder, content_hash
+from studioflow.core.storage_usage import measure, record_usage
+
 console = Console()
 
 
@@ -30,6 +34,8 @@ class ArchiveAnalysis:
     cache_size: int = 0
     removable_files: List[Path] = field(default_factory=list)
     duplicate_files: List[Tuple[Path, List[Path]]] = field(default_factory=list)
+    duplicate_stamps: Dict[Path, Tuple[int, int]] = field(default_factory=dict)  # (size, mtime_ns) when found
+    near_duplicate_files: List[Tuple[Path, List[Path]]] = field(default_factory=list)  # reported only
     cache_dirs: List[Path] = field(default_factory=list)
 
     @property
@@ -54,6 +60,7 @@ class ArchiveAnalysis:
 # Directories that can be safely removed (regeneratable)
 REMOVABLE_DIRS = [
     "CacheClip",
+    "filmstrips",
     "OptimizedMedia",
     "ProxyMedia",
     "RenderCache",
@@ -73,15 +80,6 @@ REMOVABLE_FILES = [
 ]
 
 
-def check_jdupes() -> bool:
-    """Check if jdupes is installed"""
-    try:
-        subprocess.run(["jdupes", "--version"], capture_output=True, check=True)
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        return False
-
-
 def analyze_project(project_path: Path) -> ArchiveAnalysis:
     """
     Analyze a project for archiving
@@ -96,96 +94,84 @@ def analyze_project(project_path: Path) -> ArchiveAnalysis:
 
     console.print(f"[cyan]Analyzing:[/cyan] {project_path}")
 
-    # Step 1: Calculate total size and file count
+    # Step 1: Index the project once; every later step is a query
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         transient=True
     ) as progress:
         task = progress.add_task("Counting files...", total=None)
+        index = get_file_index(project_path)
 
-        for file in project_path.rglob("*"):
-            if file.is_file():
-                try:
-                    analysis.file_count += 1
-                    analysis.total_size += file.stat().st_size
-                except (OSError, PermissionError):
-                    pass
+    summary = index.summary(under=project_path)
+    analysis.file_count = summary.files
+    analysis.total_size = summary.size
 
     console.print(f"  Total: {analysis.human_size(analysis.total_size)} ({analysis.file_count} files)")
 
-    # Step 2: Find cache directories
+    # Step 2: Find cache directories (nested ones are covered by their parent)
     console.print("  Scanning for cache directories...")
-    for dir_name in REMOVABLE_DIRS:
-        for found_dir in project_path.rglob(dir_name):
-            if found_dir.is_dir():
-                dir_size = sum(f.stat().st_size for f in found_dir.rglob("*") if f.is_file())
-                analysis.cache_dirs.append(found_dir)
-                analysis.cache_size += dir_size
+    for found_dir in index.dirs(names=REMOVABLE_DIRS, under=project_path):
+        if any(parent in found_dir.path.parents for parent in analysis.cache_dirs):
+            continue
+        analysis.cache_dirs.append(found_dir.path)
+        analysis.cache_size += index.summary(under=found_dir.path).size
 
     if analysis.cache_dirs:
         console.print(f"  [yellow]Cache found:[/yellow] {analysis.human_size(analysis.cache_size)} in {len(analysis.cache_dirs)} directories")
 
     # Step 3: Find removable files
-    for file_name in REMOVABLE_FILES:
-        for found_file in project_path.rglob(file_name):
-            if found_file.is_file():
-                analysis.removable_files.append(found_file)
+    analysis.removable_files = [e.path for e in index.files(names=REMOVABLE_FILES, under=project_path)]
 
     if analysis.removable_files:
         console.print(f"  [yellow]Junk files:[/yellow] {len(analysis.removable_files)} files")
 
-    # Step 4: Find duplicates using jdupes
-    if check_jdupes():
-        console.print("  Scanning for duplicates...")
-        try:
-            result = subprocess.run(
-                ["jdupes", "-r", "-S", str(project_path)],
-                capture_output=True,
-                text=True,
-                timeout=300
-            )
-
-            # Parse jdupes output
-            current_size = 0
-            current_group = []
-
-            for line in result.stdout.split('\n'):
-                if 'bytes each' in line:
-                    # New duplicate group
-                    if current_group and len(current_group) > 1:
-                        # Store previous group (keep first, rest are duplicates)
-                        keep = Path(current_group[0])
-                        dupes = [Path(f) for f in current_group[1:]]
-                        analysis.duplicate_files.append((keep, dupes))
-                        analysis.duplicate_waste += current_size * len(dupes)
-
-                    # Parse size from line like "12345 bytes each:"
-                    try:
-                        current_size = int(line.split()[0])
-                    except (ValueError, IndexError):
-                        current_size = 0
-                    current_group = []
-                    analysis.duplicate_sets += 1
-                elif line.strip() and not line.startswith(' '):
-                    current_group.append(line.strip())
-
-            # Don't forget last group
-            if current_group and len(current_group) > 1:
-                keep = Path(current_group[0])
-                dupes = [Path(f) for f in current_group[1:]]
-                analysis.duplicate_files.append((keep, dupes))
-                analysis.duplicate_waste += current_size * len(dupes)
-
-            if analysis.duplicate_sets > 0:
-                console.print(f"  [yellow]Duplicates:[/yellow] {analysis.duplicate_sets} sets, {analysis.human_size(analysis.duplicate_waste)} wasted")
-
-        except subprocess.TimeoutExpired:
-            console.print("  [red]Duplicate scan timed out[/red]")
-        except Exception as e:
-            console.print(f"  [red]Duplicate scan failed:[/red] {e}")
-    else:
-        console.print("  [dim]Install jdupes for duplicate detection: sudo apt install jdupes[/dim]")
+    # Step 4: Find duplicates (hashes are cached in the file index)
+    console.print("  Scanning for duplicates...")
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        transient=True
+    ) as progress:
+        task = progress.add_task("Hashing candidates...", total=None)
+        finder = DuplicateFinder(project_path, index=index)
+        duplicate_sets = finder.find(progress=lambda n: progress.advance(task, n))
+
+    for dupe_set in duplicate_sets:
+        # Copies inside cache directories are already counted as cache
+        copies = [p for p in [dupe_set.keep] + dupe_set.duplicates
+                  if not any(cache in p.parents for cache in analysis.cache_dirs)]
+        if len(copies) < 2:
+            continue
+        analysis.duplicate_files.append((copies[0], copies[1:]))
+        for copy in copies:
+            try:
+                st = copy.stat()
+            except OSError:
+                continue
+            analysis.duplicate_stamps[copy] = (st.st_size, st.st_mtime_ns)
+        analysis.duplicate_sets += 1
+        analysis.duplicate_waste += dupe_set.size * (len(copies) - 1)
+
+    if analysis.duplicate_sets > 0:
+        console.print(f"  [yellow]Duplicates:[/yellow] {analysis.duplicate_sets} sets, {analysis.human_size(analysis.duplicate_waste)} wasted")
+
+    # Step 5: Re-encoded/renamed copies of the same footage (fingerprints taken at
+    # import). Not byte-identical, so they are reported but never removed.
+    exact = {p.resolve() for keep, dupes in analysis.duplicate_files for p in [keep] + dupes}
+    videos = [e.path for e in index.videos(under=project_path)
+              if not any(cache in e.path.parents for cache in analysis.cache_dirs)]
+    try:
+        from studioflow.core.fingerprint import get_fingerprint_index
+        groups = get_fingerprint_index().groups(videos) if len(videos) > 1 else []
+    except Exception:
+        groups = []
+    for group in groups:
+        if len(exact.intersection(group)) < len(group) - 1:
+            analysis.near_duplicate_files.append((group[0], group[1:]))
+
+    if analysis.near_duplicate_files:
+        console.print(f"  [yellow]Near-duplicates:[/yellow] {len(analysis.near_duplicate_files)} sets of the same footage (review manually)")
 
     return analysis
 
@@ -217,6 +203,15 @@ def display_analysis(analysis: ArchiveAnalysis):
             f"{analysis.duplicate_sets} duplicate sets"
         )
 
+    if analysis.near_duplicate_files:
+        near_size = sum(f.stat().st_size for _, copies in analysis.near_duplicate_files
+                        for f in copies if f.exists())
+        table.add_row(
+            "Near-duplicates (review)",
+            analysis.human_size(near_size),
+            f"{len(analysis.near_duplicate_files)} sets of re-encoded copies"
+        )
+
     if analysis.removable_files:
         junk_size = sum(f.stat().st_size for f in analysis.removable_files if f.exists())
         table.add_row(
@@ -234,12 +229,24 @@ def display_analysis(analysis: ArchiveAnalysis):
     console.print(table)
 
 
+def _unchanged_since(path: Path, stamp: Optional[Tuple[int, int]]) -> Optional[IndexEntry]:
+    """Index entry for path if its size and mtime still match stamp"""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    if stamp != (st.st_size, st.st_mtime_ns):
+        return None
+    return IndexEntry(path, st.st_size, st.st_mtime_ns, st.st_ino)
+
+
 def cleanup_project(
     project_path: Path,
     remove_duplicates: bool = True,
     remove_cache: bool = True,
     remove_junk: bool = True,
-    dry_run: bool = False
+    dry_run: bool = False,
+    analysis: Optional[ArchiveAnalysis] = None
 ) -> Dict[str, int]:
     """
     Clean up a project before archiving
@@ -250,6 +257,7 @@ def cleanup_project(
         remove_cache: Remove cache/proxy/optimized directories
         remove_junk: Remove .DS_Store, Thumbs.db, etc.
         dry_run: If True, don't actually delete anything
+        analysis: Results of analyze_project to act on (analyzed now if omitted)
 
     Returns:
         Dict with bytes_removed and files_removed counts
@@ -257,20 +265,23 @@ def cleanup_project(
     stats = {"bytes_removed": 0, "files_removed": 0, "dirs_removed": 0}
     action = "[dim]would remove[/dim]" if dry_run else "removed"
 
+    if analysis is None:
+        analysis = analyze_project(project_path)
+    index = get_file_index(project_path)
+
     # Step 1: Remove junk files
     if remove_junk:
         console.print("\n[bold]Removing junk files...[/bold]")
-        for file_name in REMOVABLE_FILES:
-            for found_file in project_path.rglob(file_name):
-                if found_file.is_file():
-                    try:
-                        size = found_file.stat().st_size
-                        if not dry_run:
-                            found_file.unlink()
-                        stats["bytes_removed"] += size
-                        stats["files_removed"] += 1
-                    except (OSError, PermissionError) as e:
-                        console.print(f"  [red]Error:[/red] {found_file}: {e}")
+        for found_file in analysis.removable_files:
+            if found_file.is_file():
+                try:
+                    size = found_file.stat().st_size
+                    if not dry_run:
+                        found_file.unlink()
+                    stats["bytes_removed"] += size
+                    stats["files_removed"] += 1
+                except (OSError, PermissionError) as e:
+                    console.print(f"  [red]Error:[/red] {found_file}: {e}")
 
         if stats["files_removed"] > 0:
             console.print(f"  {action} {stats['files_removed']} junk files")
@@ -278,50 +289,53 @@ def cleanup_project(
     # Step 2: Remove cache directories
     if remove_cache:
         console.print("\n[bold]Removing cache directories...[/bold]")
-        for dir_name in REMOVABLE_DIRS:
-            for found_dir in list(project_path.rglob(dir_name)):
-                if found_dir.is_dir() and found_dir.exists():
-                    try:
-                        dir_size = sum(f.stat().st_size for f in found_dir.rglob("*") if f.is_file())
-                        dir_files = sum(1 for f in found_dir.rglob("*") if f.is_file())
-
-                        if not dry_run:
-                            shutil.rmtree(found_dir)
-
-                        stats["bytes_removed"] += dir_size
-                        stats["files_removed"] += dir_files
-                        stats["dirs_removed"] += 1
-                        console.print(f"  {action}: {found_dir.relative_to(project_path)}")
-                    except (OSError, PermissionError) as e:
-                        console.print(f"  [red]Error:[/red] {found_dir}: {e}")
+        for found_dir in analysis.cache_dirs:
+            if found_dir.is_dir():
+                try:
+                    dir_summary = index.summary(under=found_dir)
+
+                    if not dry_run:
+                        shutil.rmtree(found_dir)
+
+                    stats["bytes_removed"] += dir_summary.size
+                    stats["files_removed"] += dir_summary.files
+                    stats["dirs_removed"] += 1
+                    console.print(f"  {action}: {found_dir.relative_to(index.root)}")
+                except (OSError, PermissionError) as e:
+                    console.print(f"  [red]Error:[/red] {found_dir}: {e}")
 
         if stats["dirs_removed"] > 0:
             console.print(f"  {action} {stats['dirs_removed']} cache directories")
 
-    # Step 3: Remove duplicates
-    if remove_duplicates and check_jdupes():
+    # Step 3: Remove duplicates (keep the first copy of each set)
+    if remove_duplicates and analysis.duplicate_files:
         console.print("\n[bold]Removing duplicates...[/bold]")
-        if dry_run:
-            # Just show what would be removed
-            result = subprocess.run(
-                ["jdupes", "-r", "-S", str(project_path)],
-                capture_output=True,
-                text=True
-            )
-            dupe_count = result.stdout.count("bytes each")
-            console.print(f"  {action} duplicates from {dupe_count} sets")
-        else:
-            # Actually remove duplicates (keep first occurrence)
-            result = subprocess.run(
-                ["jdupes", "-r", "-d", "-N", str(project_path)],
-                capture_output=True,
-                text=True
-            )
-            # Count removed files from output
-            removed = result.stdout.count("Deleted")
-            stats["files_removed"] += removed
-            if removed > 0:
-                console.print(f"  Removed {removed} duplicate files")
+        removed = 0
+        for keep, dupes in analysis.duplicate_files:
+            # Re-check contents: anything edited since the analysis, even at
+            # the same size, is kept
+            keep_entry = _unchanged_since(keep, analysis.duplicate_stamps.get(keep))
+            keep_hash = content_hash(keep_entry) if keep_entry else None
+            if keep_hash is None:
+                continue  # never delete copies of a file that can't be confirmed
+            for dupe in dupes:
+                entry = _unchanged_since(dupe, analysis.duplicate_stamps.get(dupe))
+                if entry is None or content_hash(entry) != keep_hash:
+                    continue  # gone or changed since the analysis
+                try:
+                    if not dry_run:
+                        dupe.unlink()
+                    stats["bytes_removed"] += entry.size
+                    stats["files_removed"] += 1
+                    removed += 1
+                except (OSError, PermissionError) as e:
+                    console.print(f"  [red]Error:[/red] {dupe}: {e}")
+
+        if removed > 0:
+            console.print(f"  {action} {removed} duplicates from {len(analysis.duplicate_files)} sets")
+
+    if not dry_run:
+        record_usage(project_path, -stats["files_removed"], -stats["bytes_removed"])
 
     return stats
 
@@ -331,7 +345,8 @@ def archive_project(
     destination: Path,
     cleanup: bool = True,
     verify: bool = True,
-    delete_source: bool = False
+    delete_source: bool = False,
+    analysis: Optional[ArchiveAnalysis] = None
 ) -> bool:
     """
     Archive a project to destination
@@ -342,6 +357,7 @@ def archive_project(
         cleanup: Run cleanup before archiving
         verify: Verify transfer with rsync checksum
         delete_source: Delete source after successful archive
+        analysis: Existing analyze_project results to clean up from
 
     Returns:
         True if successful
@@ -356,13 +372,14 @@ def archive_project(
     # Step 1: Cleanup if requested
     if cleanup:
         console.print("\n[bold cyan]Step 1: Cleanup[/bold cyan]")
-        analysis = analyze_project(project_path)
-        display_analysis(analysis)
+        if analysis is None:
+            analysis = analyze_project(project_path)
+            display_analysis(analysis)
 
         if analysis.potential_savings > 0:
-            cleanup_project(project_path)
+            cleanup_project(project_path, analysis=analysis)
             # Recalculate size
-            new_size = sum(f.stat().st_size for f in project_path.rglob("*") if f.is_file())
+            new_size = get_file_index(project_path).summary(under=project_path).size
             console.print(f"\n[green]Cleaned size: {analysis.human_size(new_size)}[/green]")
 
     # Step 2: Transfer
@@ -415,6 +432,7 @@ def archive_project(
     manifest_path = dest_path / "ARCHIVE_MANIFEST.json"
     with open(manifest_path, 'w') as f:
         json.dump(manifest, f, indent=2)
+    record_usage(dest_path, manifest["file_count"] + 1, manifest["total_size"] + manifest_path.stat().st_size)
 
     console.print(f"  Created manifest: {manifest_path.name}")
 
@@ -422,7 +440,9 @@ def archive_project(
     if delete_source:
         console.print("\n[bold cyan]Step 4: Cleanup source[/bold cyan]")
         try:
+            files, size = measure(project_path)
             shutil.rmtree(project_path)
+            record_usage(project_path, -files, -size)
             console.print(f"  [green]Deleted source: {project_path}[/green]")
         except Exception as e:
             console.print(f"  [red]Failed to delete source:[/red] {e}")
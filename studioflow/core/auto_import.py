@@ -17,6 +17,8 @@ from dataclasses import dataclass
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
 
+from studioflow.core.storage_usage import record_added
+
 console = Console()
 
 
@@ -31,6 +33,7 @@ class CameraProfile:
     fps: float
     proxy_codec: str = "DNxHD"
     proxy_resolution: str = "1920x1080"
+    metadata_index: Optional[str] = None  # Card index with per-clip metadata (read instead of probing)
 
 
 class AutoImportService:
@@ -46,7 +49,8 @@ class AutoImportService:
                 resolution="3840x2160",
                 fps=29.97,
                 proxy_codec="DNxHD",
-                proxy_resolution="1920x1080"
+                proxy_resolution="1920x1080",
+                metadata_index="PRIVATE/M4ROOT/MEDIAPRO.XML"
             ),
             "ZV-E10": CameraProfile(
                 name="Sony ZV-E10",
@@ -56,7 +60,8 @@ class AutoImportService:
                 resolution="1920x1080",
                 fps=29.97,
                 proxy_codec="ProRes",
-                proxy_resolution="1280x720"
+                proxy_resolution="1280x720",
+                metadata_index="PRIVATE/M4ROOT/MEDIAPRO.XML"
             ),
             "A7IV": CameraProfile(
                 name="Sony A7 IV",
@@ -64,7 +69,8 @@ class AutoImportService:
                 file_patterns=["C*.MP4", "DSC*.ARW"],
                 color_space="S-Log3",
                 resolution="3840x2160",
-                fps=29.97
+                fps=29.97,
+                metadata_index="PRIVATE/M4ROOT/MEDIAPRO.XML"
             )
         }
 
@@ -129,6 +135,13 @@ class AutoImportService:
 
         return sorted(media_files)
 
+    def read_card_metadata(self, mount_point: Path, profile: CameraProfile) -> Dict[Path, Dict]:
+        """Per-clip metadata from the card's index, in one pass ({} if the camera has none)"""
+        if not profile.metadata_index:
+            return {}
+        from .sony import SonyMediaHandler
+        return SonyMediaHandler.read_card_index(mount_point, (profile.metadata_index,))
+
     def get_active_project(self) -> Path:
         """Get or create today's active project"""
         today = datetime.now().strftime("%Y%m%d")
@@ -161,6 +174,21 @@ class AutoImportService:
                 md5.update(chunk)
         return md5.hexdigest()
 
+    def _find_imported_copy(self, media_file: Path, dest_path: Path) -> Optional[Path]:
+        """
+        An earlier import of the same footage under any name (e.g. the same
+        card dumped twice). Videos only; the fingerprint is recorded under
+        dest_path when there is none.
+        """
+        if media_file.suffix.lower() not in ['.mp4', '.mov', '.mxf']:
+            return None
+        from studioflow.core.fingerprint import compute_fingerprint, get_fingerprint_index
+
+        fingerprint = compute_fingerprint(media_file)
+        if fingerprint is None:
+            return None
+        return get_fingerprint_index().claim(fingerprint, dest_path)
+
     def copy_with_verification(self, source: Path, dest: Path) -> bool:
         """Copy file with checksum verification"""
         # Copy file
@@ -201,6 +229,10 @@ class AutoImportService:
 
         console.print(f"[cyan]Found {len(media_files)} media files[/cyan]")
 
+        # Duration, frame rate and timecode come from the card index, and are
+        # carried over to the copies so the media scanner needs no ffprobe for them
+        card_metadata = self.read_card_metadata(mount_point, profile)
+
         # Get active project
         project = self.get_active_project()
         media_dir = project / "01_MEDIA" / "Original" / camera_id
@@ -239,29 +271,44 @@ class AutoImportService:
                 dest_path = media_dir / organized_name
                 ingest_path = self.ingest_pool / organized_name
 
+                original = None if dest_path.exists() else self._find_imported_copy(media_file, dest_path)
+
                 if dest_path.exists():
                     console.print(f"[yellow]⊘ Skipping {media_file.name} (already imported)[/yellow]")
+                elif original is not None:
+                    console.print(f"[yellow]⊘ Skipping {media_file.name} (same footage as {original.name})[/yellow]")
                 else:
                     # Copy to ingest pool first
                     if not ingest_path.exists():
                         if self.copy_with_verification(media_file, ingest_path):
+                            record_added(ingest_path)
                             console.print(f"[green]✓ Imported to pool: {organized_name}[/green]")
 
                     # Then link to project
                     if ingest_path.exists():
                         shutil.copy2(ingest_path, dest_path)
+                        record_added(dest_path)
                         results["files_imported"] += 1
 
                         # Track video files for proxy generation
                         if media_file.suffix.lower() in ['.mp4', '.mov', '.mxf']:
                             imported_videos.append(dest_path)
 
-                        manifest["files"].append({
+                        entry = {
                             "original": str(media_file),
                             "imported": str(dest_path),
                             "checksum": self.calculate_checksum(dest_path),
                             "size": dest_path.stat().st_size
-                        })
+                        }
+                        clip_metadata = card_metadata.get(Path(os.path.normpath(media_file)))
+                        if clip_metadata:
+                            from .camera_metadata import remember
+                            remember(ingest_path, clip_metadata)
+                            remember(dest_path, clip_metadata)
+                            for key in ("duration", "framerate", "timecode", "codec", "camera_model"):
+                                if key in clip_metadata:
+                                    entry[key] = clip_metadata[key]
+                        manifest["files"].append(entry)
 
                 progress.update(import_task, advance=1)
 
@@ -18,6 +18,12 @@ from studioflow.core.transcription import TranscriptionService
 from studioflow.core.rough_cut import RoughCutEngine, CutStyle
 from studioflow.core.audio_markers import AudioMarkerDetector
 from studioflow.core.rough_cut_markers import detect_markers_in_clips
+from studioflow.core.file_index import get_file_index
+from studioflow.core.catalog import record_pipeline_stage
+from studioflow.core.storage_usage import RECONCILE_MAX_AGE, get_storage_ledger
+
+
+WATCHED_EXTENSIONS = ['.mov', '.mp4', '.mxf']
 
 
 class JobStatus(str, Enum):
@@ -54,12 +60,22 @@ class TranscriptionJob:
         return result
 
 
+def parse_styles(spec: str) -> List[CutStyle]:
+    """Cut styles named in a comma-separated list (doc if empty); ValueError on unknown names"""
+    names = [name.strip().lower() for name in spec.split(",") if name.strip()]
+    unknown = [name for name in names if name not in {style.value for style in CutStyle}]
+    if unknown:
+        raise ValueError(f"Unknown rough cut style: {', '.join(unknown)} "
+                         f"(valid: {', '.join(style.value for style in CutStyle)})")
+    return list(dict.fromkeys(CutStyle(name) for name in names)) or [CutStyle.DOC]
+
+
 @dataclass
 class RoughCutJob:
     """Rough cut generation job"""
     footage_dir: Path
     project_path: Path
-    style: str = "doc"
+    style: str = "doc"  # comma-separated to generate several styles from one analysis
     use_audio_markers: bool = True
     status: JobStatus = JobStatus.PENDING
     started_at: Optional[datetime] = None
@@ -85,12 +101,14 @@ class RoughCutJob:
 class BackgroundServices:
     """Background services for auto-transcription and rough-cut generation"""
     
-    def __init__(self, max_workers: int = 4):
+    def __init__(self, max_workers: int = 4, rough_cut_styles: str = "doc"):
         """
         Args:
             max_workers: Maximum number of parallel transcription jobs
+            rough_cut_styles: Rough cut style(s) to generate, comma-separated
         """
         self.max_workers = max_workers
+        self.rough_cut_styles = rough_cut_styles
         self.running = False
         
         # Queues
@@ -108,6 +126,7 @@ class BackgroundServices:
         self.watcher_thread: Optional[threading.Thread] = None
         self.transcription_executor: Optional[ThreadPoolExecutor] = None
         self.rough_cut_thread: Optional[threading.Thread] = None
+        self.storage_thread: Optional[threading.Thread] = None
         
         # Services
         self.transcription_service = TranscriptionService()
@@ -175,6 +194,14 @@ class BackgroundServices:
             daemon=True
         )
         self.watcher_thread.start()
+        
+        # Start storage usage reconciliation thread
+        self.storage_thread = threading.Thread(
+            target=self._storage_reconciler,
+            name="StorageReconciler",
+            daemon=True
+        )
+        self.storage_thread.start()
     
     def stop(self):
         """Stop background services"""
@@ -192,8 +219,6 @@ class BackgroundServices:
     
     def _directory_watcher(self):
         """Watch directories for new video files"""
-        last_scan: Dict[Path, Set[Path]] = {}
-        
         while self.running:
             try:
                 with self.lock:
@@ -203,28 +228,17 @@ class BackgroundServices:
                     if not footage_dir.exists():
                         continue
                     
-                    # Get all video files
-                    video_files = set()
-                    for ext in ['.mov', '.mp4', '.MOV', '.MP4', '.mxf', '.MXF']:
-                        video_files.update(footage_dir.rglob(f"*{ext}"))
-                    
-                    # Check for new files or missing transcripts
-                    last_files = last_scan.get(footage_dir, set())
-                    new_files = video_files - last_files
-                    
-                    # Queue transcriptions for new files or files without transcripts
-                    for video_file in video_files:
-                        if self._needs_transcription(video_file):
-                            job_key = str(video_file)
-                            if job_key not in self.transcription_jobs:
-                                job = TranscriptionJob(
-                                    video_file=video_file,
-                                    project_path=project_path
-                                )
-                                self.transcription_jobs[job_key] = job
-                                self.transcription_queue.put(job)
-                    
-                    last_scan[footage_dir] = video_files
+                    # Refresh the shared index and queue files without transcripts
+                    index = get_file_index(footage_dir)
+                    for entry in index.videos_without_transcript(under=footage_dir, exts=WATCHED_EXTENSIONS):
+                        job_key = str(entry.path)
+                        if job_key not in self.transcription_jobs:
+                            job = TranscriptionJob(
+                                video_file=entry.path,
+                                project_path=project_path
+                            )
+                            self.transcription_jobs[job_key] = job
+                            self.transcription_queue.put(job)
                 
                 # Sleep before next scan
                 time.sleep(10)  # Scan every 10 seconds
@@ -234,6 +248,24 @@ class BackgroundServices:
                 print(f"Error in directory watcher: {e}")
                 time.sleep(5)
     
+    def _storage_reconciler(self):
+        """Recount storage tiers whose usage counters are due (at idle priority)"""
+        while self.running:
+            try:
+                ledger = get_storage_ledger()
+                for tier in ledger.stale_tiers(RECONCILE_MAX_AGE):
+                    if not self.running:
+                        break
+                    ledger.reconcile(tier, workers=2)
+            except Exception as e:
+                print(f"Error in storage reconciler: {e}")
+            
+            # Check again in an hour, waking up regularly to notice stop()
+            for _ in range(360):
+                if not self.running:
+                    break
+                time.sleep(10)
+    
     def _needs_transcription(self, video_file: Path) -> bool:
         """Check if a video file needs transcription"""
         # Check if transcript already exists
@@ -313,9 +345,8 @@ class BackgroundServices:
     def _check_rough_cut_trigger(self, project_path: Path, footage_dir: Path):
         """Check if we should trigger rough cut generation"""
         # Check if all videos in directory have transcripts
-        video_files = []
-        for ext in ['.mov', '.mp4', '.MOV', '.MP4']:
-            video_files.extend(footage_dir.rglob(f"*{ext}"))
+        index = get_file_index(footage_dir)
+        video_files = [e.path for e in index.files(exts=['.mov', '.mp4'], under=footage_dir)]
         
         # Check if all have transcripts
         all_transcribed = True
@@ -353,7 +384,7 @@ class BackgroundServices:
                 job = RoughCutJob(
                     footage_dir=footage_dir,
                     project_path=project_path,
-                    style="doc",  # Default, can be configured
+                    style=self.rough_cut_styles,
                     use_audio_markers=has_markers
                 )
                 self.rough_cut_jobs[job_key] = job
@@ -377,15 +408,7 @@ class BackgroundServices:
                     job.started_at = datetime.now()
                 
                 try:
-                    # Map style string to CutStyle enum
-                    style_map = {
-                        "doc": CutStyle.DOC,
-                        "documentary": CutStyle.DOC,
-                        "episode": CutStyle.EPISODE,
-                        "interview": CutStyle.INTERVIEW,
-                        "tutorial": CutStyle.EPISODE,
-                    }
-                    cut_style = style_map.get(job.style, CutStyle.DOC)
+                    styles = parse_styles(job.style)
                     
                     # Generate rough cut
                     # Analyze clips first (transcripts already exist, skip auto-transcribe)
@@ -401,26 +424,32 @@ class BackgroundServices:
                     # Note: create_rough_cut expects clips to be set on self.clips
                     # Set clips on engine instance first (analyze_clips already did this, but ensure it's set)
                     self.rough_cut_engine.clips = clips
-                    use_smart = (cut_style == CutStyle.DOC)
-                    plan = self.rough_cut_engine.create_rough_cut(
-                        cut_style,
+                    # All styles share one candidate pool. Planned in this thread:
+                    # forking a process that runs other threads isn't safe
+                    plans = self.rough_cut_engine.create_rough_cuts(
+                        styles,
                         target_duration=None,  # Use default for style
-                        use_smart_features=use_smart,
-                        use_audio_markers=job.use_audio_markers
+                        use_audio_markers=job.use_audio_markers,
+                        workers=1
                     )
                     
                     # Export EDL
                     output_dir = job.project_path / "03_exports" / "rough_cuts"
                     output_dir.mkdir(parents=True, exist_ok=True)
                     
-                    edl_path = output_dir / f"rough_cut_auto_{job.style}.edl"
-                    # export_edl is an instance method
-                    self.rough_cut_engine.export_edl(plan, edl_path)
+                    edl_paths = []
+                    for cut_style, plan in plans.items():
+                        edl_path = output_dir / f"rough_cut_auto_{cut_style.value}.edl"
+                        # export_edl is an instance method
+                        self.rough_cut_engine.export_edl(plan, edl_path)
+                        record_pipeline_stage(job.project_path, "rough_cut", output=str(edl_path),
+                                              style=cut_style.value)
+                        edl_paths.append(edl_path)
                     
                     with self.lock:
                         job.status = JobStatus.COMPLETED
                         job.completed_at = datetime.now()
-                        job.edl_path = edl_path
+                        job.edl_path = edl_paths[0]
                 
                 except Exception as e:
                     with self.lock:
@@ -440,20 +469,16 @@ class BackgroundServices:
         if not footage_dir.exists():
             return
         
-        video_files = []
-        for ext in ['.mov', '.mp4', '.MOV', '.MP4', '.mxf', '.MXF']:
-            video_files.extend(footage_dir.rglob(f"*{ext}"))
-        
-        for video_file in video_files:
-            if self._needs_transcription(video_file):
-                job_key = str(video_file)
-                if job_key not in self.transcription_jobs:
-                    job = TranscriptionJob(
-                        video_file=video_file,
-                        project_path=project_path
-                    )
-                    self.transcription_jobs[job_key] = job
-                    self.transcription_queue.put(job)
+        index = get_file_index(footage_dir)
+        for entry in index.videos_without_transcript(under=footage_dir, exts=WATCHED_EXTENSIONS):
+            job_key = str(entry.path)
+            if job_key not in self.transcription_jobs:
+                job = TranscriptionJob(
+                    video_file=entry.path,
+                    project_path=project_path
+                )
+                self.transcription_jobs[job_key] = job
+                self.transcription_queue.put(job)
     
     def get_status(self) -> Dict:
         """Get status of all jobs"""
@@ -0,0 +1,153 @@
+"""
+B-roll index
+TF-IDF vectors of every B-roll clip's filename terms, tags and transcript,
+stored as an inverted index (term -> clips), so all interview segments are
+matched with one sparse product and a top-k pass instead of a scan of every
+clip per segment
+"""
+
+import math
+import re
+from collections import Counter
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+TOP_K = 2  # B-roll placements per interview segment
+MAX_USES = 3  # times one clip may be placed in a cut
+QUERY_BLOCK = 512  # segments scored per dense block (bounds memory with huge libraries)
+NAME_WEIGHT = 2  # filename and tag terms count this many times a transcript word
+
+_WORD_RE = re.compile(r"[A-Z]?[a-z]+|[A-Z]+(?![a-z])")
+_STOPWORDS = frozenset(
+    "the and for with that this from your you are was were have has had not but all can "
+    "will just into out about over they them then than there their what when where which "
+    "who how its our very more most some any clip broll roll footage take final copy".split()
+)
+
+
+def _stem(word: str) -> str:
+    # Plural folding is enough for filenames and tags ("mountains" ~ "mountain")
+    if len(word) > 4 and word.endswith("ies"):
+        return word[:-3] + "y"
+    if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+        return word[:-1]
+    return word
+
+
+def tokenize(text: str) -> List[str]:
+    """Index terms of free text or a filename (snake_case, kebab-case and camelCase are split)"""
+    words = (w.lower() for w in _WORD_RE.findall(text))
+    return [_stem(w) for w in words if len(w) > 2 and w not in _STOPWORDS]
+
+
+def clip_terms(clip) -> List[str]:
+    """Terms describing a B-roll clip (a rough_cut.ClipAnalysis)"""
+    described = [clip.file_path.stem, *clip.topics]
+    for tag in (clip.shot_type, clip.content_type, clip.topic_tag):
+        if tag:
+            described.append(tag)
+    terms = tokenize(" ".join(described)) * NAME_WEIGHT
+    for entry in clip.entries:
+        terms.extend(tokenize(entry.text))
+    return terms
+
+
+class BrollIndex:
+    """
+    Inverted TF-IDF index over B-roll clips.
+
+    Postings are kept column-major in flat arrays: the clips containing
+    term t are doc_ids[indptr[t]:indptr[t + 1]], with their l2-normalised
+    tf-idf weights alongside.
+    """
+
+    def __init__(self, clips: Sequence, documents: Optional[Iterable[List[str]]] = None):
+        self.clips = list(clips)
+        documents = [clip_terms(clip) for clip in self.clips] if documents is None else list(documents)
+        counts = [Counter(terms) for terms in documents]
+
+        df = Counter(term for count in counts for term in count)
+        self.vocabulary = {term: i for i, term in enumerate(sorted(df))}
+        n_docs = len(counts)
+        self.idf = np.array([math.log((1 + n_docs) / (1 + df[term])) + 1 for term in sorted(df)])
+
+        postings: List[List[Tuple[int, float]]] = [[] for _ in self.vocabulary]
+        for doc, count in enumerate(counts):
+            weights = {self.vocabulary[t]: c * self.idf[self.vocabulary[t]] for t, c in count.items()}
+            norm = math.sqrt(sum(w * w for w in weights.values())) or 1.0
+            for term_id, weight in weights.items():
+                postings[term_id].append((doc, weight / norm))
+
+        lengths = np.array([len(p) for p in postings], dtype=np.int64)
+        self.indptr = np.concatenate([[0], np.cumsum(lengths)]).astype(np.int64)
+        flat = [entry for posting in postings for entry in posting]
+        self.doc_ids = np.array([doc for doc, _ in flat], dtype=np.int64)
+        self.weights = np.array([weight for _, weight in flat], dtype=np.float64)
+
+    def __len__(self) -> int:
+        return len(self.clips)
+
+    def _query_vectors(self, queries: Sequence[List[str]]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Queries as sparse (row, term, weight) triplets, l2-normalised per row"""
+        rows, terms, weights = [], [], []
+        for row, query in enumerate(queries):
+            count = Counter(self.vocabulary[t] for t in query if t in self.vocabulary)
+            if not count:
+                continue
+            ids = np.fromiter(count.keys(), dtype=np.int64)
+            w = np.fromiter(count.values(), dtype=np.float64) * self.idf[ids]
+            rows.append(np.full(len(ids), row, dtype=np.int64))
+            terms.append(ids)
+            weights.append(w / np.linalg.norm(w))
+        if not rows:
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty, np.zeros(0)
+        return np.concatenate(rows), np.concatenate(terms), np.concatenate(weights)
+
+    def similarity(self, queries: Sequence[List[str]]) -> np.ndarray:
+        """Cosine similarity of each query (a term list) to each clip: (queries, clips)"""
+        n_queries, n_docs = len(queries), len(self.clips)
+        rows, terms, weights = self._query_vectors(queries)
+        if len(terms) == 0 or n_docs == 0:
+            return np.zeros((n_queries, n_docs))
+
+        # Sparse product: expand every query term into its posting list and
+        # accumulate query weight * clip weight per (query, clip)
+        starts = self.indptr[terms]
+        lengths = self.indptr[terms + 1] - starts
+        total = int(lengths.sum())
+        first = np.cumsum(lengths) - lengths
+        positions = np.repeat(starts - first, lengths) + np.arange(total)
+        cells = np.repeat(rows, lengths) * n_docs + self.doc_ids[positions]
+        products = np.repeat(weights, lengths) * self.weights[positions]
+        return np.bincount(cells, weights=products, minlength=n_queries * n_docs).reshape(n_queries, n_docs)
+
+    def match(self, queries: Sequence[List[str]], k: int = TOP_K, max_uses: int = MAX_USES,
+              fill: bool = True) -> List[List[Tuple[int, float]]]:
+        """
+        Up to k (clip index, similarity) per query, best first.
+
+        Queries are served in order and no clip is placed more than max_uses
+        times. With fill, a query short of matches is topped up with the
+        least-used remaining clips (similarity 0) so every segment still gets
+        cutaways.
+        """
+        uses = np.zeros(len(self.clips), dtype=np.int64)
+        results = []
+        for block_start in range(0, len(queries), QUERY_BLOCK):
+            scores = self.similarity(queries[block_start:block_start + QUERY_BLOCK])
+            for row in scores:
+                candidates = np.flatnonzero((row > 0) & (uses < max_uses))
+                if len(candidates) > k:
+                    candidates = candidates[np.argpartition(-row[candidates], k - 1)[:k]]
+                picks = candidates[np.argsort(-row[candidates], kind="stable")].tolist()
+                if fill and len(picks) < k:
+                    spare = np.flatnonzero(uses < max_uses)
+                    spare = spare[~np.isin(spare, picks)]
+                    spare = spare[np.argsort(uses[spare], kind="stable")]
+                    picks.extend(int(i) for i in spare[:k - len(picks)])
+                uses[picks] += 1
+                results.append([(i, float(row[i])) for i in picks])
+        return results
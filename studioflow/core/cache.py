@@ -0,0 +1,133 @@
+"""
+In-process caches keyed by file identity
+Probe and analysis results are reused until the underlying file changes
+"""
+
+import copy
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+
+FileKey = Tuple[str, int, int]  # (path, size, mtime_ns)
+
+
+def file_key(path: Path) -> Optional[FileKey]:
+    """Identity of a file's current contents (None if it doesn't exist)"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (str(path), st.st_size, st.st_mtime_ns)
+
+
+class FileCache:
+    """
+    Thread-safe cache of per-file results.
+
+    Entries are keyed by (path, size, mtime_ns) plus an optional tag, so a
+    re-encoded or touched file is simply a cache miss. New entries are
+    remembered as "updates" so a forked worker (see studioflow.cli.daemon)
+    can hand them back to the long-lived parent process.
+    """
+
+    def __init__(self, name: str, max_entries: int = 20000, copy_on_read: bool = False):
+        self.name = name
+        self.max_entries = max_entries
+        self.copy_on_read = copy_on_read
+        self._entries: Dict[Tuple, Any] = {}
+        self._updates: Dict[Tuple, Any] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, path: Path, tag: str = "") -> Optional[Any]:
+        key = file_key(path)
+        if key is None:
+            return None
+        with self._lock:
+            value = self._entries.get(key + (tag,))
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return copy.deepcopy(value) if self.copy_on_read else value
+
+    def put(self, path: Path, value: Any, tag: str = "") -> None:
+        key = file_key(path)
+        if key is None or value is None:
+            return
+        if self.copy_on_read:
+            value = copy.deepcopy(value)
+        with self._lock:
+            if len(self._entries) >= self.max_entries:
+                # Drop the oldest half; insertion order approximates age
+                for stale in list(self._entries)[: self.max_entries // 2]:
+                    del self._entries[stale]
+            self._entries[key + (tag,)] = value
+            self._updates[key + (tag,)] = value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._updates.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def take_updates(self) -> Dict[Tuple, Any]:
+        """Entries added since the last call"""
+        with self._lock:
+            updates, self._updates = self._updates, {}
+        return updates
+
+    def merge(self, entries: Dict[Tuple, Any]) -> None:
+        with self._lock:
+            self._entries.update(entries)
+
+
+_caches: Dict[str, FileCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_cache(name: str, **kwargs) -> FileCache:
+    """Get or create a named process-wide cache"""
+    with _caches_lock:
+        if name not in _caches:
+            _caches[name] = FileCache(name, **kwargs)
+        else:
+            # Caches created by merge_all_updates don't know their options yet
+            for option, value in kwargs.items():
+                setattr(_caches[name], option, value)
+        return _caches[name]
+
+
+def take_all_updates() -> Dict[str, Dict[Tuple, Any]]:
+    """Updates from every named cache (sent from daemon workers to the server)"""
+    with _caches_lock:
+        caches = list(_caches.values())
+    return {cache.name: cache.take_updates() for cache in caches}
+
+
+def merge_all_updates(updates: Dict[str, Dict[Tuple, Any]]) -> None:
+    for name, entries in updates.items():
+        get_cache(name).merge(entries)
+
+
+def _reset_locks_after_fork() -> None:
+    # A forked daemon worker may inherit a lock held by another server thread
+    global _caches_lock
+    _caches_lock = threading.Lock()
+    for cache in _caches.values():
+        cache._lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_locks_after_fork)
+
+
+def cache_stats() -> Dict[str, Dict[str, int]]:
+    with _caches_lock:
+        caches = list(_caches.values())
+    return {c.name: {"entries": len(c), "hits": c.hits, "misses": c.misses} for c in caches}
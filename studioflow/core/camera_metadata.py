@@ -0,0 +1,440 @@
+"""
+Camera metadata service
+Reads camera metadata from Sony card indexes (MEDIAPRO.XML) and XML sidecars
+(C0001M01.XML) when a clip has them, and otherwise from a single long-lived
+exiftool process (-stay_open) fed batches of files; results are cached in
+the probe cache
+"""
+
+import atexit
+import json
+import os
+import selectors
+import subprocess
+import threading
+import time
+import xml.etree.ElementTree as ET
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from studioflow.core.cache import get_cache
+
+
+BATCH_SIZE = 64  # files per exiftool request
+REQUEST_TIMEOUT = 5.0  # seconds per file before exiftool is considered hung
+CACHE_TAG = "camera"
+
+# exiftool tag -> our key (MediaScanner stores these in MediaFile.metadata)
+EXIFTOOL_FIELDS = {
+    "Make": "camera_make",
+    "Model": "camera_model",
+    "PictureProfile": "picture_profile",
+    "ColorMode": "color_mode",
+    "ISO": "iso",
+    "WhiteBalance": "white_balance",
+    "ShutterSpeed": "shutter_speed",
+    "FNumber": "aperture",
+    "LensModel": "lens",
+    "SteadyShot": "stabilization",
+    "FocusMode": "focus_mode",
+}
+
+# NonRealTimeMeta <Item name=...> -> our key
+SIDECAR_ITEMS = {
+    "CaptureGammaEquation": "gamma",
+    "CaptureColorPrimaries": "color_mode",
+    "ISOSensitivity": "iso",
+    "WhiteBalance": "white_balance",
+    "ShutterSpeedTime": "shutter_speed",
+    "IrisFNumber": "aperture",
+    "LensAttributes": "lens",
+    "ImageStabilizerMode": "stabilization",
+    "FocusMode": "focus_mode",
+}
+
+# Sony's nominal rates -> exact rates
+_SONY_FPS = {"23.98": 24000 / 1001, "29.97": 30000 / 1001, "59.94": 60000 / 1001, "119.88": 120000 / 1001}
+
+
+def sidecar_for(path: Path) -> Optional[Path]:
+    """A Sony clip's NonRealTimeMeta sidecar (C0001.MP4 -> C0001M01.XML), if present"""
+    for suffix in ("M01.XML", "M01.xml"):
+        sidecar = path.with_name(path.stem + suffix)
+        if sidecar.exists():
+            return sidecar
+    return None
+
+
+def _local(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def _fps(value: str) -> Optional[float]:
+    """'29.97p' / '25i' -> frames per second"""
+    nominal = value.rstrip("pPiI")
+    if nominal in _SONY_FPS:
+        return _SONY_FPS[nominal]
+    try:
+        return float(nominal)
+    except ValueError:
+        return None
+
+
+def _sony_timecode(value: str) -> Optional[str]:
+    """LtcChange value (BCD pairs FFSSMMHH, flag bits set) -> HH:MM:SS:FF"""
+    if len(value) != 8:
+        return None
+    try:
+        frames, seconds, minutes, hours = (int(value[i:i + 2], 16) for i in range(0, 8, 2))
+    except ValueError:
+        return None
+
+    def bcd(byte: int, tens_mask: int) -> str:
+        return f"{(byte >> 4) & tens_mask}{byte & 0xF}"
+
+    return f"{bcd(hours, 0x3)}:{bcd(minutes, 0x7)}:{bcd(seconds, 0x7)}:{bcd(frames, 0x3)}"
+
+
+def _codec(video_codec: str) -> str:
+    """Sony videoCodec ('AVC_3840_2160_HP@L51', 'HEVC_...') -> ffprobe codec name"""
+    family = video_codec.split("_", 1)[0].upper()
+    return {"AVC": "h264", "HEVC": "hevc", "MPEG2": "mpeg2video"}.get(family, video_codec.lower())
+
+
+def _pixel_format(video_codec: str) -> Optional[tuple]:
+    """
+    Sony videoCodec profile -> (ffprobe pix_fmt, bit depth), None if unknown.
+
+    'AVC_3840_2160_HP@L51' is 8-bit 4:2:0 (High), '..._H422@L51' 10-bit 4:2:2,
+    and HEVC's 'M10' / 'M422' are 10-bit 4:2:0 / 4:2:2.
+    """
+    profile = video_codec.split("@", 1)[0].rsplit("_", 1)[-1].upper()
+    if "422" in profile:
+        return "yuv422p10le", 10
+    if "10" in profile:
+        return "yuv420p10le", 10
+    if profile in ("HP", "MP", "M", "BP"):
+        return "yuv420p", 8
+    return None
+
+
+def _audio(audio_codec: str) -> Dict[str, Any]:
+    """Sony audioCodec/audioType ('LPCM16', 'LPCM24') -> audio_codec and sample_rate"""
+    codec = audio_codec.upper()
+    if codec.startswith("LPCM") and codec[4:].isdigit():
+        # XAVC S/HS record linear PCM big-endian, always at 48 kHz
+        return {"audio_codec": f"pcm_s{codec[4:]}be", "sample_rate": 48000}
+    return {}
+
+
+def _video(video_codec: str) -> Dict[str, Any]:
+    """codec, pixel_format and bit_depth from a Sony videoCodec/videoType"""
+    data: Dict[str, Any] = {"codec": _codec(video_codec)}
+    pixel = _pixel_format(video_codec)
+    if pixel:
+        data["pixel_format"], data["bit_depth"] = pixel
+    return data
+
+
+def parse_sony_sidecar(source) -> Dict[str, Any]:
+    """
+    Camera and format metadata from a Sony NonRealTimeMeta XML (path or file object).
+
+    Streams the document, so it stays cheap however long the change tables are.
+    """
+    data: Dict[str, Any] = {"source": "sidecar"}
+    frames = None
+    for _, element in ET.iterparse(source, events=("end",)):
+        tag = _local(element.tag)
+        attrib = element.attrib
+        if tag == "Duration":
+            frames = int(attrib.get("value", 0))
+        elif tag == "LtcChangeTable" and "timecode" not in data:
+            for change in element:
+                timecode = _sony_timecode(change.get("value", ""))
+                if timecode:
+                    data["timecode"] = timecode
+                    break
+        elif tag == "CreationDate":
+            try:
+                data["creation_time"] = datetime.fromisoformat(attrib.get("value", ""))
+            except ValueError:
+                pass
+        elif tag == "VideoFrame":
+            data.update(_video(attrib.get("videoCodec", "")))
+            fps = _fps(attrib.get("formatFps", "") or attrib.get("captureFps", ""))
+            if fps:
+                data["framerate"] = fps
+            capture = _fps(attrib.get("captureFps", ""))
+            if capture and fps and abs(capture - fps) > 0.01:
+                data["capture_fps"] = capture
+        elif tag == "VideoLayout":
+            try:
+                data["resolution"] = (int(attrib["pixel"]), int(attrib["numOfVerticalLine"]))
+            except (KeyError, ValueError):
+                pass
+        elif tag == "AudioFormat" and "numOfChannel" in attrib:
+            data["audio_channels"] = int(attrib["numOfChannel"])
+        elif tag == "AudioRecPort" and "audio_codec" not in data:
+            data.update(_audio(attrib.get("audioCodec", "")))
+        elif tag == "Device":
+            if attrib.get("manufacturer"):
+                data["camera_make"] = attrib["manufacturer"]
+            if attrib.get("modelName"):
+                data["camera_model"] = attrib["modelName"]
+            if attrib.get("serialNo"):
+                data["serial_number"] = attrib["serialNo"]
+        elif tag == "Item" and attrib.get("name") in SIDECAR_ITEMS:
+            data[SIDECAR_ITEMS[attrib["name"]]] = attrib.get("value")
+        elif tag in ("Group", "AcquisitionRecord"):
+            element.clear()
+    if frames is not None and data.get("framerate"):
+        data["duration"] = frames / data["framerate"]
+    return data
+
+
+def _layout(video_type: str) -> Optional[tuple]:
+    """Sony videoType ('AVC_3840_2160_HP@L51') -> (width, height)"""
+    parts = video_type.split("_")
+    if len(parts) >= 3 and parts[1].isdigit() and parts[2].isdigit():
+        return int(parts[1]), int(parts[2])
+    return None
+
+
+def parse_mediapro(source) -> List[Dict[str, Any]]:
+    """
+    Every clip listed in a Sony card index (MEDIAPRO.XML, path or file object).
+
+    Each entry has the clip's "uri" and its sidecar's "sidecar_uri" (both
+    relative to the index's folder) with whatever format metadata the index
+    carries. Streamed, so a full card is one cheap pass.
+    """
+    clips = []
+    for _, element in ET.iterparse(source, events=("end",)):
+        if _local(element.tag) != "Material":
+            continue
+        attrib = element.attrib
+        data: Dict[str, Any] = {"source": "card_index", "uri": attrib.get("uri", "")}
+        fps = _fps(attrib.get("fps", ""))
+        if fps:
+            data["framerate"] = fps
+            try:
+                data["duration"] = int(attrib["dur"]) / fps
+            except (KeyError, ValueError):
+                pass
+        video_type = attrib.get("videoType", "")
+        if video_type:
+            data.update(_video(video_type))
+            layout = _layout(video_type)
+            if layout:
+                data["resolution"] = layout
+        data.update(_audio(attrib.get("audioType", "")))
+        if attrib.get("ch", "").isdigit():
+            data["audio_channels"] = int(attrib["ch"])
+        for child in element:
+            if _local(child.tag) == "RelevantInfo" and child.get("type", "XML").upper() == "XML":
+                data["sidecar_uri"] = child.get("uri", "")
+        clips.append(data)
+        element.clear()
+    return clips
+
+
+def sidecar_metadata(path: Path) -> Optional[Dict[str, Any]]:
+    """
+    Format and camera metadata a clip's card index or sidecar provides,
+    without exiftool or ffprobe (None if it has neither).
+    """
+    probe_cache = get_cache("probe", copy_on_read=True)
+    cached = probe_cache.get(Path(path).resolve(), CACHE_TAG)
+    if cached is not None:
+        return cached if cached.get("source") != "exiftool" else None
+    sidecar = sidecar_for(path)
+    if sidecar is None:
+        return None
+    try:
+        data = parse_sony_sidecar(str(sidecar))
+    except (ET.ParseError, OSError, ValueError):
+        return None
+    remember(path, data)
+    return data
+
+
+def remember(path: Path, data: Dict[str, Any]) -> None:
+    """
+    Cache card/sidecar metadata for path under its own tag (it is never
+    passed off as an ffprobe result; see sidecar_metadata), keyed by the
+    resolved path so every spelling of it finds the entry.
+    """
+    get_cache("probe", copy_on_read=True).put(Path(path).resolve(), data, CACHE_TAG)
+
+
+def _from_exiftool(record: Dict[str, Any]) -> Dict[str, Any]:
+    data = {"source": "exiftool"}
+    for tag, key in EXIFTOOL_FIELDS.items():
+        if tag in record:
+            data[key] = record[tag]
+    return data
+
+
+class ExiftoolSession:
+    """
+    One exiftool process kept open (-stay_open True -@ -) and fed requests.
+
+    Perl start-up dominates a per-file exiftool call; here it is paid once.
+    Requests are serialised with a lock, so the session can be shared by
+    scanner threads; each has a deadline, so a file that hangs exiftool
+    can't stall them all.
+    """
+
+    def __init__(self, executable: str = "exiftool"):
+        self.executable = executable
+        self._process: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+        self._counter = 0
+
+    def _start(self) -> subprocess.Popen:
+        if self._process is None or self._process.poll() is not None:
+            self._process = subprocess.Popen(
+                [self.executable, "-stay_open", "True", "-@", "-"],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            )
+        return self._process
+
+    def _kill(self) -> None:
+        process, self._process = self._process, None
+        if process is not None:
+            process.kill()
+            process.wait()
+
+    def execute(self, args: Sequence[str], timeout: float = REQUEST_TIMEOUT) -> str:
+        """
+        Run one exiftool command in the session and return its stdout.
+
+        A request still unanswered after timeout seconds kills the process
+        (the next request starts a fresh one) and raises TimeoutError.
+        """
+        with self._lock:
+            process = self._start()
+            self._counter += 1
+            ready = f"{{ready{self._counter}}}".encode()
+            request = "\n".join(args) + f"\n-execute{self._counter}\n"
+            try:
+                process.stdin.write(request.encode("utf-8"))
+                process.stdin.flush()
+            except OSError:
+                self._kill()
+                raise
+
+            deadline = time.monotonic() + timeout
+            output = bytearray()
+            with selectors.DefaultSelector() as selector:
+                selector.register(process.stdout, selectors.EVENT_READ)
+                while True:
+                    # The ready marker is a line of its own
+                    marker = (b"\n" + output).find(b"\n" + ready)
+                    if marker >= 0 and output.find(b"\n", marker) >= 0:
+                        return output[:marker].decode("utf-8", errors="replace")
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0 or not selector.select(remaining):
+                        self._kill()
+                        raise TimeoutError(f"exiftool gave no answer within {timeout:g}s")
+                    chunk = os.read(process.stdout.fileno(), 65536)
+                    if not chunk:
+                        self._kill()
+                        raise OSError("exiftool exited mid-request")
+                    output += chunk
+
+    def metadata(self, paths: Sequence[Path]) -> Dict[Path, Dict[str, Any]]:
+        """Raw exiftool JSON records for a batch of files (one request)"""
+        if not paths:
+            return {}
+        output = self.execute(["-j", "-q", "-fast", "-charset", "filename=utf8", *map(str, paths)],
+                              timeout=REQUEST_TIMEOUT * len(paths))
+        try:
+            records = json.loads(output) if output.strip() else []
+        except json.JSONDecodeError:
+            return {}
+        by_name = {os.path.normpath(record.get("SourceFile", "")): record for record in records}
+        return {path: by_name[os.path.normpath(str(path))] for path in paths
+                if os.path.normpath(str(path)) in by_name}
+
+    def close(self) -> None:
+        with self._lock:
+            process, self._process = self._process, None
+        if process is None or process.poll() is not None:
+            return
+        try:
+            process.stdin.write(b"-stay_open\nFalse\n")
+            process.stdin.flush()
+            process.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            process.kill()
+
+
+_session: Optional[ExiftoolSession] = None
+_session_lock = threading.Lock()
+_exiftool_missing = False
+
+
+def get_exiftool() -> ExiftoolSession:
+    """Process-wide exiftool session (started on first request)"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = ExiftoolSession()
+        return _session
+
+
+@atexit.register
+def _close_session() -> None:
+    if _session is not None:
+        _session.close()
+
+
+def camera_metadata(paths: Iterable[Path]) -> Dict[Path, Dict[str, Any]]:
+    """
+    Camera metadata for many files: sidecar where there is one, otherwise
+    batched through the shared exiftool session. Files exiftool can't read
+    (or all of them, if it isn't installed) map to {}.
+    """
+    global _exiftool_missing
+    probe_cache = get_cache("probe", copy_on_read=True)
+    results: Dict[Path, Dict[str, Any]] = {}
+    pending: List[Path] = []
+    for path in paths:
+        path = Path(path)
+        cached = probe_cache.get(path, CACHE_TAG)
+        if cached is None:
+            cached = sidecar_metadata(path)
+        if cached is not None:
+            results[path] = cached
+            continue
+        pending.append(path)
+
+    for start in range(0, len(pending), BATCH_SIZE):
+        batch = pending[start:start + BATCH_SIZE]
+        records: Dict[Path, Dict[str, Any]] = {}
+        if not _exiftool_missing:
+            try:
+                records = get_exiftool().metadata(batch)
+            except FileNotFoundError:
+                _exiftool_missing = True
+            except OSError:
+                pass
+        for path in batch:
+            results[path] = _from_exiftool(records[path]) if path in records else {}
+            if path in records:
+                probe_cache.put(path, results[path], CACHE_TAG)
+    return results
+
+
+def _forget_session_after_fork() -> None:
+    # The child must not write into the parent's exiftool pipes
+    global _session, _session_lock
+    _session = None
+    _session_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_session_after_fork)
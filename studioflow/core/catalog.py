@@ -0,0 +1,302 @@
+"""
+Cross-project catalog
+SQLite mirror of project metadata, media totals and pipeline state, so listing
+hundreds of projects on a NAS doesn't open every project.json
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+
+SCHEMA_VERSION = 1
+METADATA_RELPATH = Path(".studioflow") / "project.json"
+
+
+def default_catalog_path() -> Path:
+    """~/.studioflow/catalog.db, or the file named by STUDIOFLOW_CATALOG"""
+    override = os.environ.get("STUDIOFLOW_CATALOG")
+    if override:
+        return Path(override).expanduser()
+    return Path.home() / ".studioflow" / "catalog.db"
+
+
+@dataclass
+class CatalogEntry:
+    """One project as recorded in the catalog"""
+    path: Path
+    name: str
+    tier: str  # active, archive or other
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    pipeline: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def modified_at(self) -> str:
+        return self.metadata.get("modified_at", "")
+
+
+@dataclass
+class ReindexReport:
+    added: int = 0
+    updated: int = 0
+    removed: int = 0
+    unchanged: int = 0
+
+
+class ProjectCatalog:
+    """
+    Catalog of projects across storage tiers.
+
+    Project.save_metadata and the import/rough-cut pipelines write through
+    to it. Listing a tier costs one stat of the tier directory: only when
+    its mtime moved (a project folder was added, removed or renamed) is
+    the tier rescanned, and even then only project.json files whose mtime
+    changed are parsed. `reindex` forces a full rescan to repair drift.
+    """
+
+    def __init__(self, db_path: Optional[Path] = None):
+        self.db_path = Path(db_path) if db_path else default_catalog_path()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.db_path), timeout=30, check_same_thread=False)
+        if self._conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            # Everything here can be rebuilt from the projects themselves
+            self._conn.executescript("DROP TABLE IF EXISTS projects; DROP TABLE IF EXISTS roots;")
+            self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS projects (
+                path TEXT PRIMARY KEY,
+                name TEXT NOT NULL,
+                tier TEXT NOT NULL,
+                status TEXT,
+                modified_at TEXT,
+                media_count INTEGER DEFAULT 0,
+                total_size_bytes INTEGER DEFAULT 0,
+                metadata TEXT NOT NULL DEFAULT '{}',
+                metadata_mtime_ns INTEGER DEFAULT 0,
+                pipeline TEXT NOT NULL DEFAULT '{}'
+            );
+            CREATE INDEX IF NOT EXISTS projects_tier ON projects(tier, modified_at);
+            CREATE INDEX IF NOT EXISTS projects_name ON projects(name);
+            CREATE TABLE IF NOT EXISTS roots (
+                path TEXT PRIMARY KEY,
+                tier TEXT NOT NULL,
+                mtime_ns INTEGER NOT NULL
+            );
+        """)
+        self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # -- write-through -------------------------------------------------------
+
+    def upsert(self, project_path: Path, metadata: Dict[str, Any], tier: str = "other",
+               metadata_mtime_ns: Optional[int] = None) -> None:
+        """Record a project's metadata (pipeline state is kept)"""
+        project_path = Path(project_path)
+        if metadata_mtime_ns is None:
+            metadata_mtime_ns = _mtime_ns(project_path / METADATA_RELPATH)
+        data = json.dumps(metadata, default=str)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO projects (path, name, tier, status, modified_at, media_count, "
+                "total_size_bytes, metadata, metadata_mtime_ns) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(path) DO UPDATE SET name = excluded.name, tier = excluded.tier, "
+                "status = excluded.status, modified_at = excluded.modified_at, "
+                "media_count = excluded.media_count, total_size_bytes = excluded.total_size_bytes, "
+                "metadata = excluded.metadata, metadata_mtime_ns = excluded.metadata_mtime_ns",
+                (str(project_path), metadata.get("name") or project_path.name, tier,
+                 metadata.get("status"), str(metadata.get("modified_at", "")),
+                 metadata.get("media_count", 0), metadata.get("total_size_bytes", 0),
+                 data, metadata_mtime_ns))
+
+    def record_stage(self, project_path: Path, stage: str, status: str = "completed", **details) -> None:
+        """Record pipeline progress (import, transcription, rough_cut, ...) for a project"""
+        project_path = Path(project_path)
+        state = {"status": status, "at": datetime.now().isoformat(timespec="seconds"), **details}
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT pipeline FROM projects WHERE path = ?", (str(project_path),)).fetchone()
+            if row is None:
+                self._conn.execute(
+                    "INSERT INTO projects (path, name, tier, pipeline) VALUES (?, ?, 'other', ?)",
+                    (str(project_path), project_path.name, json.dumps({stage: state}, default=str)))
+            else:
+                pipeline = json.loads(row[0])
+                pipeline[stage] = state
+                self._conn.execute("UPDATE projects SET pipeline = ? WHERE path = ?",
+                                   (json.dumps(pipeline, default=str), str(project_path)))
+
+    def remove(self, project_path: Path) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM projects WHERE path = ?", (str(project_path),))
+
+    # -- queries -------------------------------------------------------------
+
+    def _entry(self, row: tuple) -> CatalogEntry:
+        path, name, tier, metadata, pipeline = row
+        return CatalogEntry(Path(path), name, tier, json.loads(metadata), json.loads(pipeline))
+
+    def entries(self, tiers: Optional[Iterable[str]] = None) -> List[CatalogEntry]:
+        """Catalogued projects with metadata, most recently modified first"""
+        sql = "SELECT path, name, tier, metadata, pipeline FROM projects WHERE metadata != '{}'"
+        params: List[str] = []
+        if tiers is not None:
+            tiers = list(tiers)
+            sql += f" AND tier IN ({','.join('?' * len(tiers))})"
+            params += tiers
+        with self._lock:
+            rows = self._conn.execute(sql + " ORDER BY modified_at DESC", params).fetchall()
+        return [self._entry(row) for row in rows]
+
+    def get(self, project_path: Path) -> Optional[CatalogEntry]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT path, name, tier, metadata, pipeline FROM projects WHERE path = ?",
+                (str(project_path),)).fetchone()
+        return self._entry(row) if row else None
+
+    def find(self, name: str) -> List[CatalogEntry]:
+        """Projects whose folder or metadata name matches"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT path, name, tier, metadata, pipeline FROM projects "
+                "WHERE name = ? OR path LIKE ? ORDER BY modified_at DESC",
+                (name, f"%{os.sep}{name}")).fetchall()
+        return [self._entry(row) for row in rows]
+
+    # -- drift repair --------------------------------------------------------
+
+    def sync_root(self, root: Path, tier: str, force: bool = False) -> ReindexReport:
+        """Bring one tier directory's projects up to date (skipped if the directory is unchanged)"""
+        report = ReindexReport()
+        root_mtime = _mtime_ns(root)
+        if not root_mtime:
+            return report
+
+        with self._lock:
+            row = self._conn.execute("SELECT mtime_ns FROM roots WHERE path = ?", (str(root),)).fetchone()
+            if row and row[0] == root_mtime and not force:
+                return report
+            known = dict(self._conn.execute(
+                "SELECT path, metadata_mtime_ns FROM projects WHERE tier = ? AND metadata != '{}'",
+                (tier,)).fetchall())
+
+        seen = set()
+        for child in _list_dirs(root):
+            meta_mtime = _mtime_ns(child / METADATA_RELPATH)
+            if not meta_mtime:
+                continue
+            seen.add(str(child))
+            if known.get(str(child)) == meta_mtime and not force:
+                report.unchanged += 1
+                continue
+            try:
+                with open(child / METADATA_RELPATH) as f:
+                    metadata = json.load(f)
+            except (OSError, ValueError):
+                continue
+            self.upsert(child, metadata, tier=tier, metadata_mtime_ns=meta_mtime)
+            if str(child) in known:
+                report.updated += 1
+            else:
+                report.added += 1
+
+        gone = [path for path in known if Path(path).parent == root and path not in seen]
+        with self._lock, self._conn:
+            self._conn.executemany("DELETE FROM projects WHERE path = ?", ((p,) for p in gone))
+            self._conn.execute("INSERT OR REPLACE INTO roots (path, tier, mtime_ns) VALUES (?, ?, ?)",
+                               (str(root), tier, root_mtime))
+        report.removed = len(gone)
+        return report
+
+    def reindex(self, roots: Dict[str, Path], sizes: bool = False) -> ReindexReport:
+        """
+        Rescan every tier root and drop entries whose project no longer exists.
+
+        With sizes=True media counts and sizes are recomputed from disk
+        (through the file index) instead of taken from project.json.
+        """
+        total = ReindexReport()
+        for tier, root in roots.items():
+            if root is None:
+                continue
+            report = self.sync_root(Path(root), tier, force=True)
+            total.added += report.added
+            total.updated += report.updated
+            total.unchanged += report.unchanged
+            total.removed += report.removed
+
+        with self._lock:
+            paths = [row[0] for row in self._conn.execute("SELECT path FROM projects")]
+        stale = [p for p in paths if not Path(p).is_dir()]
+        with self._lock, self._conn:
+            self._conn.executemany("DELETE FROM projects WHERE path = ?", ((p,) for p in stale))
+        total.removed += len(stale)
+
+        if sizes:
+            from studioflow.core.file_index import get_file_index
+
+            for path in paths:
+                if path in stale:
+                    continue
+                summary = get_file_index(Path(path)).summary(under=Path(path))
+                with self._lock, self._conn:
+                    self._conn.execute(
+                        "UPDATE projects SET media_count = ?, total_size_bytes = ? WHERE path = ?",
+                        (summary.files, summary.size, path))
+        return total
+
+
+def _mtime_ns(path: Path) -> int:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return 0
+
+
+def _list_dirs(root: Path) -> List[Path]:
+    try:
+        with os.scandir(root) as it:
+            return [Path(e.path) for e in it if e.is_dir()]
+    except OSError:
+        return []
+
+
+_catalog: Optional[ProjectCatalog] = None
+_catalog_lock = threading.Lock()
+
+
+def get_catalog() -> ProjectCatalog:
+    """Process-wide catalog at default_catalog_path()"""
+    global _catalog
+    with _catalog_lock:
+        if _catalog is None or _catalog.db_path != default_catalog_path():
+            _catalog = ProjectCatalog()
+        return _catalog
+
+
+def record_pipeline_stage(project_path: Path, stage: str, status: str = "completed", **details) -> None:
+    """Write-through hook for pipelines; catalog problems never fail the pipeline"""
+    try:
+        get_catalog().record_stage(project_path, stage, status, **details)
+    except Exception:
+        pass
+
+
+def _forget_catalog_after_fork() -> None:
+    # SQLite connections must not be shared with a forked daemon worker
+    global _catalog, _catalog_lock
+    _catalog = None
+    _catalog_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_catalog_after_fork)
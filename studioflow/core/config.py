@@ -312,18 +312,33 @@ class ConfigManager:
 
 # Singleton instance
 _config_instance: Optional[ConfigManager] = None
+_config_mtime: Optional[int] = None
+
+
+def _config_file_mtime(manager: ConfigManager) -> Optional[int]:
+    try:
+        return manager.config_file.stat().st_mtime_ns
+    except OSError:
+        return None
 
 
 def get_config() -> Config:
-    """Get the global configuration instance"""
-    global _config_instance
+    """Get the global configuration instance
+
+    Reloaded when config.yaml changes on disk, so long-lived processes
+    (the sf daemon) see edits without re-parsing on every call.
+    """
+    global _config_instance, _config_mtime
     if _config_instance is None:
-        _config_instance = ConfigManager()
+        return reload_config()
+    if _config_file_mtime(_config_instance) != _config_mtime:
+        return reload_config()
     return _config_instance.config
 
 
 def reload_config():
     """Reload configuration from disk"""
-    global _config_instance
+    global _config_instance, _config_mtime
     _config_instance = ConfigManager()
+    _config_mtime = _config_file_mtime(_config_instance)
     return _config_instance.config
\ No newline at end of file
@@ -0,0 +1,168 @@
+"""
+Native duplicate file finder
+Buckets files by size, narrows candidates with head/tail sample hashes and only
+fully hashes the survivors; hashes are cached in the project file index
+"""
+
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from studioflow.core.file_index import FileIndex, IndexEntry, get_file_index
+
+
+SAMPLE_SIZE = 64 * 1024        # bytes hashed from each end of a file
+READ_SIZE = 4 * 1024 * 1024    # block size for full-content hashing
+BATCH_FILES = 2048             # candidates hashed per batch (bounds memory)
+
+
+@dataclass
+class DuplicateSet:
+    """Files with identical contents; `keep` is the copy cleanup leaves in place"""
+    size: int
+    keep: Path
+    duplicates: List[Path] = field(default_factory=list)
+
+    @property
+    def waste(self) -> int:
+        return self.size * len(self.duplicates)
+
+
+def _unchanged(path: Path, entry: IndexEntry) -> bool:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False
+    return st.st_size == entry.size and st.st_mtime_ns == entry.mtime_ns
+
+
+def sample_hash(entry: IndexEntry, sample_size: int = SAMPLE_SIZE) -> Optional[str]:
+    """
+    Hash of the first and last `sample_size` bytes (the whole file if it is
+    no larger than two samples). None if the file can't be read or changed
+    since it was indexed.
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    try:
+        with open(entry.path, "rb") as f:
+            if entry.size <= 2 * sample_size:
+                digest.update(f.read())
+            else:
+                digest.update(f.read(sample_size))
+                f.seek(-sample_size, os.SEEK_END)
+                digest.update(f.read(sample_size))
+    except OSError:
+        return None
+    return digest.hexdigest() if _unchanged(entry.path, entry) else None
+
+
+def content_hash(entry: IndexEntry, read_size: int = READ_SIZE) -> Optional[str]:
+    """Hash of the full contents, read in large blocks into one reused buffer"""
+    digest = hashlib.blake2b(digest_size=20)
+    buffer = bytearray(read_size)
+    view = memoryview(buffer)
+    try:
+        with open(entry.path, "rb", buffering=0) as f:
+            while True:
+                n = f.readinto(buffer)
+                if not n:
+                    break
+                digest.update(view[:n])
+    except OSError:
+        return None
+    return digest.hexdigest() if _unchanged(entry.path, entry) else None
+
+
+def _group(entries: List[IndexEntry], key: Callable[[IndexEntry], Optional[str]]) -> List[List[IndexEntry]]:
+    groups: Dict[str, List[IndexEntry]] = {}
+    for entry in entries:
+        value = key(entry)
+        if value is not None:
+            groups.setdefault(value, []).append(entry)
+    return [group for group in groups.values() if len(group) > 1]
+
+
+class DuplicateFinder:
+    """
+    Finds duplicate files below a root using the shared file index.
+
+    Hard links (same inode) are one file, not duplicates. Hashing runs on a
+    thread pool; file reads and hashlib both release the GIL. Work is done
+    in batches of BATCH_FILES candidates so memory stays bounded on
+    multi-terabyte projects.
+    """
+
+    def __init__(self, root: Path, workers: int = 8, min_size: int = 1,
+                 index: Optional[FileIndex] = None):
+        self.root = Path(root)
+        self.workers = workers
+        self.min_size = max(1, min_size)  # empty files are never reported
+        self.index = index or get_file_index(self.root)
+        self.hashed_bytes = 0
+
+    def find(self, progress: Optional[Callable[[int], None]] = None) -> List[DuplicateSet]:
+        """Return duplicate sets, largest waste first"""
+        results: List[DuplicateSet] = []
+        batch: List[List[IndexEntry]] = []
+        pending = 0
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            for _, entries in self.index.size_buckets(under=self.root, min_size=self.min_size):
+                # Hard links share an inode; the first path wins
+                by_inode = {e.inode or str(e.path): e for e in reversed(entries)}
+                if len(by_inode) < 2:
+                    continue
+                batch.append(sorted(by_inode.values(), key=lambda e: str(e.path)))
+                pending += len(by_inode)
+                if pending >= BATCH_FILES:
+                    results.extend(self._resolve(batch, pool))
+                    if progress:
+                        progress(pending)
+                    batch, pending = [], 0
+            if batch:
+                results.extend(self._resolve(batch, pool))
+                if progress:
+                    progress(pending)
+
+        results.sort(key=lambda d: d.waste, reverse=True)
+        return results
+
+    def _hash_missing(self, entries: List[IndexEntry], attr: str, pool: ThreadPoolExecutor) -> Dict[Path, str]:
+        """Hashes for entries, computing (and caching) the ones the index doesn't have yet"""
+        known = {e.path: getattr(e, attr) for e in entries if getattr(e, attr)}
+        todo = [e for e in entries if e.path not in known]
+        hasher = sample_hash if attr == "sample_hash" else content_hash
+        computed = list(zip(todo, pool.map(hasher, todo)))
+
+        if attr == "sample_hash":
+            self.index.store_hashes((e, h, None) for e, h in computed if h)
+            self.hashed_bytes += sum(min(e.size, 2 * SAMPLE_SIZE) for e, _ in computed)
+        else:
+            self.index.store_hashes((e, None, h) for e, h in computed if h)
+            self.hashed_bytes += sum(e.size for e, _ in computed)
+        known.update((e.path, h) for e, h in computed if h)
+        return known
+
+    def _resolve(self, buckets: List[List[IndexEntry]], pool: ThreadPoolExecutor) -> List[DuplicateSet]:
+        samples = self._hash_missing([e for b in buckets for e in b], "sample_hash", pool)
+        candidates = [g for b in buckets for g in _group(b, lambda e: samples.get(e.path))]
+
+        # Small files were hashed whole by the sample pass
+        confirmed = [g for g in candidates if g[0].size <= 2 * SAMPLE_SIZE]
+        large = [g for g in candidates if g[0].size > 2 * SAMPLE_SIZE]
+        if large:
+            contents = self._hash_missing([e for g in large for e in g], "content_hash", pool)
+            confirmed.extend(sub for g in large for sub in _group(g, lambda e: contents.get(e.path)))
+
+        return [
+            DuplicateSet(size=g[0].size, keep=g[0].path, duplicates=[e.path for e in g[1:]])
+            for g in confirmed
+        ]
+
+
+def find_duplicates(root: Path, workers: int = 8, min_size: int = 1) -> List[DuplicateSet]:
+    """Duplicate sets below root (see DuplicateFinder)"""
+    return DuplicateFinder(root, workers=workers, min_size=min_size).find()
@@ -49,6 +49,7 @@ class ExportJob:
     completed_at: Optional[datetime] = None
     error: Optional[str] = None
     progress: float = 0.0  # 0.0 - 100.0
+    outputs: Dict[str, Path] = field(default_factory=dict)  # platform -> file, for ladder jobs
     
     def __lt__(self, other):
         """Enable PriorityQueue sorting by priority (lower number = higher priority)"""
@@ -153,6 +154,47 @@ class ExportQueue:
         
         return job_id
     
+    def add_ladder_job(
+        self,
+        input_file: Path,
+        outputs: Dict[str, Path],
+        quality: str = "HIGH",
+        priority: ExportPriority = ExportPriority.MEDIUM,
+        gpu_required: bool = True
+    ) -> str:
+        """
+        Add a job exporting one input for several platforms from a single decode
+        
+        Args:
+            input_file: Input video file
+            outputs: Target platform -> output video file (at least one)
+            quality: Quality level (HIGH, MEDIUM, LOW)
+            priority: Job priority
+            gpu_required: Whether GPU is required for this job
+        
+        Returns:
+            Job ID (string)
+        """
+        if not outputs:
+            raise ValueError("A ladder job needs at least one output")
+        job_id = f"{input_file.stem}_ladder_{int(time.time())}"
+        
+        job = ExportJob(
+            input_file=input_file,
+            output_file=next(iter(outputs.values())),
+            platform=",".join(outputs),
+            quality=quality,
+            priority=priority,
+            gpu_required=gpu_required and self.gpu_available,
+            status=ExportStatus.PENDING,
+            outputs=dict(outputs)
+        )
+        
+        with self.lock:
+            self.queue.put((job.priority.value, job_id, job))
+        
+        return job_id
+    
     def start(self):
         """Start the export queue worker thread"""
         if self.running:
@@ -217,13 +259,22 @@ class ExportQueue:
             job.progress = 5.0
             
             # Export using FFmpegProcessor
-            result = FFmpegProcessor.export_for_platform(
-                input_file=job.input_file,
-                platform=job.platform,
-                output_file=job.output_file,
-                quality=video_quality,
-                two_pass=False  # Single pass for queue (faster)
-            )
+            if job.outputs:
+                renditions = [FFmpegProcessor.platform_rendition(platform, output_file, video_quality)
+                              for platform, output_file in job.outputs.items()]
+                results = FFmpegProcessor.export_ladder(job.input_file, renditions)
+                failed = [platform for platform, r in zip(job.outputs, results) if not r.success]
+                result = next((r for r in results if not r.success), results[0])
+                if failed:
+                    result.error_message = f"{', '.join(failed)}: {result.error_message or 'export failed'}"
+            else:
+                result = FFmpegProcessor.export_for_platform(
+                    input_file=job.input_file,
+                    platform=job.platform,
+                    output_file=job.output_file,
+                    quality=video_quality,
+                    two_pass=False  # Single pass for queue (faster)
+                )
             
             if result.success:
                 job.status = ExportStatus.COMPLETED
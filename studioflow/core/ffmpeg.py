@@ -3,15 +3,21 @@ Robust FFmpeg processor with quality of life features
 Handles errors gracefully, provides helpful feedback, and includes smart defaults
 """
 
+import os
+import re
 import subprocess
 import json
+import functools
 import shutil
+import tempfile
 import time
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from enum import Enum
 
+from studioflow.core.cache import get_cache
+
 # Import GPU utils (lazy import to avoid circular dependencies)
 try:
     from studioflow.core.gpu_utils import get_gpu_detector
@@ -24,6 +30,31 @@ except ImportError:
         return DummyGPU()
 
 
+_VERSION_RE = re.compile(r"ffmpeg version n?(\d+)\.(\d+)")
+
+
+@functools.lru_cache(maxsize=None)
+def ffmpeg_version() -> Tuple[int, ...]:
+    """Installed ffmpeg's (major, minor), checked once; () if unknown (git builds, no ffmpeg)"""
+    try:
+        result = subprocess.run(["ffmpeg", "-version"], capture_output=True, text=True, timeout=10)
+        match = _VERSION_RE.search(result.stdout)
+    except Exception:  # missing or unusable binary: assume a current release
+        return ()
+    return tuple(int(part) for part in match.groups()) if match else ()
+
+
+def passthrough_args() -> List[str]:
+    """
+    Output option passing decoded frames through as they are (no duplicated
+    or dropped frames): -fps_mode from ffmpeg 5.1, -vsync 0 before it
+    """
+    version = ffmpeg_version()
+    if version and version < (5, 1):
+        return ["-vsync", "0"]
+    return ["-fps_mode", "passthrough"]
+
+
 class VideoQuality(Enum):
     """Common quality presets for quick selection"""
     ULTRA = {"crf": "16", "preset": "slower"}  # Best quality, slow
@@ -44,6 +75,26 @@ class ProcessResult:
     file_size_mb: float = 0.0
 
 
+@dataclass
+class Rendition:
+    """One output of a ladder export (see FFmpegProcessor.export_ladder)"""
+    output_file: Path
+    width: Optional[int] = None  # None keeps the master's frame size
+    height: Optional[int] = None
+    fit: str = "pad"  # "pad" letterboxes into width x height, "crop" fills it
+    fps: Optional[float] = None  # None keeps the master's frame rate
+    vcodec: str = "libx264"
+    preset: str = "medium"
+    crf: Optional[str] = "23"
+    vbitrate: Optional[str] = None  # used instead of crf when crf is None
+    acodec: str = "aac"
+    abitrate: str = "128k"
+    pix_fmt: Optional[str] = "yuv420p"
+    movflags: Optional[str] = "+faststart"
+    max_duration: Optional[float] = None
+    max_size_mb: Optional[float] = None
+
+
 class FFmpegProcessor:
     """Robust video operations with error recovery and smart defaults"""
 
@@ -64,6 +115,11 @@ class FFmpegProcessor:
         if not file_path.exists():
             return {"error": f"File not found: {file_path}"}
 
+        probe_cache = get_cache("probe", copy_on_read=True)
+        cached = probe_cache.get(file_path)
+        if cached is not None:
+            return cached
+
         cmd = [
             "ffprobe",
             "-v", "quiet",
@@ -95,6 +151,7 @@ class FFmpegProcessor:
                     info["sample_rate"] = stream.get("sample_rate", 0)
                     info["channels"] = stream.get("channels", 0)
 
+            probe_cache.put(file_path, info)
             return info
         except (subprocess.CalledProcessError, json.JSONDecodeError) as e:
             return {"error": str(e), "suggestion": "File may be corrupted. Try: ffmpeg -i file.mp4 -c copy fixed.mp4"}
@@ -265,17 +322,9 @@ class FFmpegProcessor:
             return ProcessResult(success=False, error_message=str(e))
 
     @staticmethod
-    def export_for_platform(input_file: Path, platform: str, output_file: Path,
-                          quality: VideoQuality = VideoQuality.HIGH,
-                          two_pass: bool = False) -> ProcessResult:
-        """Export video optimized for platform with smart compression"""
-        start = time.time()
-
-        if not input_file.exists():
-            return ProcessResult(False, error_message=f"Input file not found: {input_file}")
-
-        # Enhanced platform presets with quality options
-        presets = {
+    def platform_presets(quality: VideoQuality = VideoQuality.HIGH) -> Dict[str, Dict[str, Any]]:
+        """Encoding presets per platform (YouTube follows the requested quality)"""
+        return {
             "youtube": {
                 "vcodec": "libx264",
                 "preset": quality.value["preset"],
@@ -329,6 +378,18 @@ class FFmpegProcessor:
             }
         }
 
+    @staticmethod
+    def export_for_platform(input_file: Path, platform: str, output_file: Path,
+                          quality: VideoQuality = VideoQuality.HIGH,
+                          two_pass: bool = False) -> ProcessResult:
+        """Export video optimized for platform with smart compression"""
+        start = time.time()
+
+        if not input_file.exists():
+            return ProcessResult(False, error_message=f"Input file not found: {input_file}")
+
+        presets = FFmpegProcessor.platform_presets(quality)
+
         if platform not in presets:
             return ProcessResult(
                 False,
@@ -337,6 +398,19 @@ class FFmpegProcessor:
             )
 
         preset = presets[platform]
+        vf = None
+        if "scale" in preset:
+            vf = f"scale={preset['scale']}:force_original_aspect_ratio=decrease,pad={preset['scale']}:(ow-iw)/2:(oh-ih)/2"
+
+        # Size-capped outputs get their CRF (or bitrate) from a prediction up
+        # front rather than being encoded, measured and re-encoded
+        size_plan = None
+        if "max_size_mb" in preset and "crf" in preset:
+            size_plan = FFmpegProcessor.plan_for_size(
+                input_file, preset["max_size_mb"], preset["vcodec"], preset.get("preset", "medium"),
+                preset["crf"], preset["abitrate"], vf=vf, max_duration=preset.get("max_duration")
+            )
+        bitrate_mode = size_plan is not None and size_plan.method == "bitrate"
 
         # Build command
         cmd = ["ffmpeg", "-i", str(input_file)]
@@ -347,14 +421,16 @@ class FFmpegProcessor:
         if "preset" in preset:
             cmd.extend(["-preset", preset["preset"]])
 
-        if "crf" in preset:
-            cmd.extend(["-crf", preset["crf"]])
+        if bitrate_mode:
+            cmd.extend(["-b:v", size_plan.bitrate_arg])
+        elif "crf" in preset:
+            cmd.extend(["-crf", size_plan.crf_arg if size_plan else preset["crf"]])
         elif "vbitrate" in preset:
             cmd.extend(["-b:v", preset["vbitrate"]])
 
         # Scale/crop for platform
-        if "scale" in preset:
-            cmd.extend(["-vf", f"scale={preset['scale']}:force_original_aspect_ratio=decrease,pad={preset['scale']}:(ow-iw)/2:(oh-ih)/2"])
+        if vf:
+            cmd.extend(["-vf", vf])
 
         # Audio settings
         cmd.extend(["-c:a", preset["acodec"], "-b:a", preset["abitrate"]])
@@ -370,10 +446,13 @@ class FFmpegProcessor:
         if "max_duration" in preset:
             cmd.extend(["-t", str(preset["max_duration"])])
 
-        # Two-pass encoding for better quality/size ratio
-        if two_pass and "crf" not in preset:
+        # Two-pass encoding for better quality/size ratio (always when
+        # hitting a size by bitrate)
+        if bitrate_mode or (two_pass and "crf" not in preset):
+            cmd.extend(["-passlogfile", str(output_file.parent / f".{output_file.stem}_pass")])
+
             # First pass
-            cmd_pass1 = cmd + ["-pass", "1", "-f", "null", "/dev/null"]
+            cmd_pass1 = cmd + ["-pass", "1", "-f", "null", os.devnull]
             subprocess.run(cmd_pass1, capture_output=True, check=False)
 
             # Second pass
@@ -388,7 +467,8 @@ class FFmpegProcessor:
             if output_file.exists():
                 size_mb = output_file.stat().st_size / (1024 * 1024)
 
-                # Auto-compress if too large
+                # Auto-compress if too large (the size plan missed by more
+                # than its tolerance)
                 if "max_size_mb" in preset and size_mb > preset["max_size_mb"]:
                     compressed = FFmpegProcessor._smart_compress(
                         output_file, preset["max_size_mb"]
@@ -410,6 +490,223 @@ class FFmpegProcessor:
                 suggestion="Try with different quality setting or check input format"
             )
 
+    @staticmethod
+    def platform_rendition(platform: str, output_file: Path,
+                           quality: VideoQuality = VideoQuality.HIGH,
+                           preset: Optional[Dict[str, Any]] = None) -> Rendition:
+        """
+        Rendition using the export_for_platform preset of a platform
+
+        preset replaces the built-in one (same keys as platform_presets, plus
+        optional "fit" and "fps").
+        """
+        if preset is None:
+            presets = FFmpegProcessor.platform_presets(quality)
+            if platform not in presets:
+                raise ValueError(f"Unknown platform: {platform} (available: {', '.join(presets)})")
+            preset = presets[platform]
+
+        width = height = None
+        if "scale" in preset:
+            width, height = (int(v) for v in preset["scale"].split(":"))
+        return Rendition(
+            output_file=output_file,
+            width=width,
+            height=height,
+            fit=preset.get("fit", "pad"),
+            fps=preset.get("fps"),
+            vcodec=preset["vcodec"],
+            preset=preset.get("preset", "medium"),
+            crf=preset.get("crf"),
+            vbitrate=preset.get("vbitrate"),
+            acodec=preset["acodec"],
+            abitrate=preset["abitrate"],
+            pix_fmt=preset.get("pix_fmt", "yuv420p"),
+            movflags=preset.get("movflags", "+faststart"),
+            max_duration=preset.get("max_duration"),
+            max_size_mb=preset.get("max_size_mb"),
+        )
+
+    @staticmethod
+    def _rendition_filters(r: Rendition) -> str:
+        """Video filter chain of a rendition ("" if it keeps the master's frames)"""
+        filters = []
+        if r.width and r.height:
+            if r.fit == "crop":
+                filters.append(f"scale={r.width}:{r.height}:force_original_aspect_ratio=increase")
+                filters.append(f"crop={r.width}:{r.height}")
+            else:
+                filters.append(f"scale={r.width}:{r.height}:force_original_aspect_ratio=decrease")
+                filters.append(f"pad={r.width}:{r.height}:(ow-iw)/2:(oh-ih)/2")
+            filters.append("setsar=1")
+        if r.fps:
+            filters.append(f"fps={r.fps:g}")
+        return ",".join(filters)
+
+    @staticmethod
+    def build_ladder_command(input_file: Path, renditions: List[Rendition]) -> List[str]:
+        """
+        One ffmpeg command writing every rendition from a single decode.
+
+        The master's video is decoded once and split into one branch per
+        rendition, each with its own scale/pad-or-crop and fps filters; the
+        audio stream is mapped into every output. Duration caps are applied
+        per output with -t, so a short cap doesn't truncate the others.
+        """
+        chains = [FFmpegProcessor._rendition_filters(r) or "null" for r in renditions]
+
+        if len(renditions) == 1:
+            graph = f"[0:v]{chains[0]}[o0]"
+        else:
+            graph = f"[0:v]split={len(renditions)}" + "".join(f"[v{i}]" for i in range(len(renditions)))
+            graph += "".join(f";[v{i}]{chain}[o{i}]" for i, chain in enumerate(chains))
+
+        cmd = ["ffmpeg", "-hide_banner", "-y", "-i", str(input_file), "-filter_complex", graph]
+        for i, r in enumerate(renditions):
+            cmd.extend(["-map", f"[o{i}]", "-map", "0:a?"])
+            cmd.extend(["-c:v", r.vcodec, "-preset", r.preset])
+            if r.crf is not None:
+                cmd.extend(["-crf", str(r.crf)])
+            elif r.vbitrate:
+                cmd.extend(["-b:v", r.vbitrate])
+            if r.pix_fmt:
+                cmd.extend(["-pix_fmt", r.pix_fmt])
+            cmd.extend(["-c:a", r.acodec, "-b:a", r.abitrate])
+            if r.movflags:
+                cmd.extend(["-movflags", r.movflags])
+            if r.max_duration:
+                cmd.extend(["-t", f"{r.max_duration:g}"])
+            cmd.append(str(r.output_file))
+        return cmd
+
+    @staticmethod
+    def export_ladder(input_file: Path, renditions: List[Rendition]) -> List[ProcessResult]:
+        """
+        Export several renditions of a master in one ffmpeg run.
+
+        Returns one result per rendition, in order. Renditions with a
+        max_size_mb are encoded at a predicted CRF or bitrate (see
+        plan_for_size) and only compressed afterwards if that still misses.
+        """
+        start = time.time()
+
+        if not input_file.exists():
+            return [ProcessResult(False, error_message=f"Input file not found: {input_file}")
+                    for _ in renditions]
+        if not renditions:
+            return []
+
+        for r in renditions:
+            r.output_file.parent.mkdir(parents=True, exist_ok=True)
+
+        # Size-capped renditions get their CRF or (single-pass, as the
+        # encoders share one run) bitrate up front
+        planned = []
+        for r in renditions:
+            if r.max_size_mb and r.crf is not None:
+                plan = FFmpegProcessor.plan_for_size(
+                    input_file, r.max_size_mb, r.vcodec, r.preset, r.crf, r.abitrate,
+                    vf=FFmpegProcessor._rendition_filters(r) or None, max_duration=r.max_duration
+                )
+                if plan and plan.method == "bitrate":
+                    r = replace(r, crf=None, vbitrate=plan.bitrate_arg)
+                elif plan:
+                    r = replace(r, crf=plan.crf_arg)
+            planned.append(r)
+
+        cmd = FFmpegProcessor.build_ladder_command(input_file, planned)
+        try:
+            subprocess.run(cmd, capture_output=True, text=True, check=True)
+        except subprocess.CalledProcessError as e:
+            return [ProcessResult(
+                success=False,
+                error_message=e.stderr[-200:] if e.stderr else str(e),
+                suggestion="Try exporting the platforms one at a time to find the failing one"
+            ) for _ in renditions]
+        except FileNotFoundError:
+            return [ProcessResult(False, error_message="FFmpeg not found",
+                                  suggestion="Install with: sudo apt install ffmpeg")
+                    for _ in renditions]
+
+        elapsed = time.time() - start
+        results = []
+        for r in renditions:
+            if not r.output_file.exists():
+                results.append(ProcessResult(False, error_message=f"No output written: {r.output_file}"))
+                continue
+
+            size_mb = r.output_file.stat().st_size / (1024 * 1024)
+            if r.max_size_mb and size_mb > r.max_size_mb:
+                compressed = FFmpegProcessor._smart_compress(r.output_file, r.max_size_mb)
+                if compressed.success:
+                    results.append(compressed)
+                    continue
+
+            results.append(ProcessResult(
+                success=True,
+                output_path=r.output_file,
+                duration=elapsed,
+                file_size_mb=size_mb
+            ))
+        return results
+
+    @staticmethod
+    def plan_for_size(input_file: Path, max_size_mb: float, vcodec: str, preset: str,
+                      crf: str, abitrate: str, vf: Optional[str] = None,
+                      max_duration: Optional[float] = None):
+        """
+        Predict the encode settings that fit max_size_mb (a size_target.SizePlan)
+
+        A few short chunks of the input are encoded at probe CRFs around crf
+        with the same codec, preset and filters, and the output's size is
+        extrapolated from their bitrates. None if the input's duration
+        can't be read.
+        """
+        from studioflow.core.size_target import (
+            PROBE_STEPS, parse_bitrate, plan_size_target, sample_windows,
+        )
+
+        info = FFmpegProcessor.get_media_info(input_file)
+        duration = info.get("duration_seconds", 0)
+        if not duration:
+            return None
+        if max_duration:
+            duration = min(duration, max_duration)
+
+        probe_crfs = [float(crf) + step for step in PROBE_STEPS]
+        probes = FFmpegProcessor._probe_bitrates(input_file, sample_windows(duration), probe_crfs,
+                                                 vcodec, preset, vf)
+        return plan_size_target(probes, duration, max_size_mb, parse_bitrate(abitrate), float(crf))
+
+    @staticmethod
+    def _probe_bitrates(input_file: Path, windows: List[Tuple[float, float]], crfs: List[float],
+                        vcodec: str, preset: str, vf: Optional[str]) -> Dict[float, float]:
+        """Video bits per second at each CRF over the sampled windows ({} on failure)"""
+        sizes = {c: 0 for c in crfs}
+        seconds = sum(length for _, length in windows)
+        with tempfile.TemporaryDirectory(prefix="sf_probe_") as tmp:
+            for w, (start, length) in enumerate(windows):
+                # One decode per window, encoded at every probe CRF
+                cmd = ["ffmpeg", "-hide_banner", "-y", "-ss", f"{start:.3f}", "-t", f"{length:.3f}",
+                       "-i", str(input_file)]
+                outputs = []
+                for c in crfs:
+                    out = Path(tmp) / f"{w}_{c:g}.mp4"
+                    cmd.extend(["-map", "0:v:0", "-an"])
+                    if vf:
+                        cmd.extend(["-vf", vf])
+                    cmd.extend(["-c:v", vcodec, "-preset", preset, "-crf", f"{c:g}", str(out)])
+                    outputs.append((c, out))
+                try:
+                    subprocess.run(cmd, capture_output=True, check=True)
+                except (subprocess.CalledProcessError, FileNotFoundError):
+                    return {}
+                for c, out in outputs:
+                    if not out.exists():
+                        return {}
+                    sizes[c] += out.stat().st_size
+        return {c: size * 8 / seconds for c, size in sizes.items()}
+
     @staticmethod
     def _smart_compress(file_path: Path, target_mb: float) -> ProcessResult:
         """Smart compression to reach target size"""
@@ -583,23 +880,22 @@ class FFmpegProcessor:
             timestamp = min(duration * 0.1, 5.0)
 
         if best_frame:
-            # Use scene detection to find best frame
-            cmd = [
-                "ffmpeg", "-i", str(video_file),
-                "-vf", f"select='gte(scene,0.4)',scale=1920:-1",
-                "-frames:v", "1",
-                "-y", str(output_file)
-            ]
-        else:
-            # Extract specific frame
-            cmd = [
-                "ffmpeg", "-i", str(video_file),
-                "-ss", str(timestamp),
-                "-vframes", "1",
-                "-vf", "scale=1920:-1",  # HD width, maintain aspect
-                "-q:v", "2",  # High quality JPEG
-                "-y", str(output_file)
-            ]
+            # Best-scoring sampled frame (see studioflow.core.thumbnail)
+            from studioflow.core.thumbnail import best_thumbnail_time
+
+            best = best_thumbnail_time(video_file)
+            if best is not None:
+                timestamp = best
+
+        # Extract the frame, seeking the input rather than decoding up to it
+        cmd = [
+            "ffmpeg", "-ss", str(timestamp),
+            "-i", str(video_file),
+            "-vframes", "1",
+            "-vf", "scale=1920:-1",  # HD width, maintain aspect
+            "-q:v", "2",  # High quality JPEG
+            "-y", str(output_file)
+        ]
 
         try:
             subprocess.run(cmd, check=True, capture_output=True)
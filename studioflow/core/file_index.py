@@ -0,0 +1,566 @@
+"""
+Unified project file index
+One parallel os.scandir walk feeds an incrementally refreshed SQLite store that
+every "find the media in this folder" caller queries instead of re-walking the tree
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+
+VIDEO_EXTENSIONS = {".mov", ".mp4", ".mxf", ".avi", ".mkv", ".m4v"}
+AUDIO_EXTENSIONS = {".wav", ".mp3", ".aac", ".m4a", ".flac"}
+IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".tiff", ".tif", ".bmp"}
+TRANSCRIPT_SUFFIXES = (".srt", "_transcript.json")
+
+INDEX_FILENAME = "file_index.db"
+SCHEMA_VERSION = 2
+
+# (is_dir, size, mtime_ns, inode)
+_Stat = Tuple[bool, int, int, int]
+
+
+@dataclass(frozen=True)
+class IndexEntry:
+    """A file or directory as recorded by the last refresh"""
+    path: Path
+    size: int
+    mtime_ns: int
+    inode: int
+    is_dir: bool = False
+    sample_hash: Optional[str] = None  # head/tail sample, see studioflow.core.duplicates
+    content_hash: Optional[str] = None
+
+    @property
+    def ext(self) -> str:
+        return self.path.suffix.lower()
+
+
+@dataclass
+class IndexDelta:
+    """What changed between two refreshes"""
+    added: List[Path] = field(default_factory=list)
+    changed: List[Path] = field(default_factory=list)
+    removed: List[Path] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.changed or self.removed)
+
+
+@dataclass
+class IndexSummary:
+    """File/directory counts and total file size below a folder"""
+    files: int = 0
+    dirs: int = 0
+    size: int = 0
+
+
+def find_project_root(path: Path) -> Optional[Path]:
+    """Closest ancestor (or path itself) that is a StudioFlow project"""
+    path = Path(path).resolve()
+    for candidate in (path, *path.parents):
+        if (candidate / ".studioflow" / "project.json").exists():
+            return candidate
+    return None
+
+
+def _scan_dir(path: str) -> Tuple[List[Tuple[str, Tuple[int, int]]], Dict[str, _Stat]]:
+    """
+    List one directory: (subdirectories to walk with their (st_dev, st_ino),
+    {path: stat} for every entry)
+    """
+    subdirs: List[Tuple[str, Tuple[int, int]]] = []
+    entries: Dict[str, _Stat] = {}
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir():
+                        st = entry.stat()
+                        subdirs.append((entry.path, (st.st_dev, st.st_ino)))
+                        entries[entry.path] = (True, 0, st.st_mtime_ns, st.st_ino)
+                    elif entry.is_file():
+                        st = entry.stat()
+                        entries[entry.path] = (False, st.st_size, st.st_mtime_ns, st.st_ino)
+                except OSError:
+                    continue  # vanished or unreadable mid-walk
+    except OSError:
+        pass
+    return subdirs, entries
+
+
+def walk_tree(root: Path, workers: int = 8) -> Dict[str, _Stat]:
+    """
+    Stat every file and directory below root with parallel os.scandir calls.
+
+    Each directory is listed by one worker and its subdirectories are queued
+    as soon as they are seen, so wide trees on network or USB storage keep
+    several requests in flight. Symlinked directories are followed (linked
+    media folders are common), but each directory is walked once, so links
+    back up the tree can't loop.
+    """
+    results: Dict[str, _Stat] = {}
+    try:
+        st = os.stat(root)
+        visited = {(st.st_dev, st.st_ino)}
+    except OSError:
+        visited = set()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = {executor.submit(_scan_dir, str(root))}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                subdirs, entries = future.result()
+                results.update(entries)
+                for subdir, identity in subdirs:
+                    if identity in visited:
+                        continue
+                    visited.add(identity)
+                    pending.add(executor.submit(_scan_dir, subdir))
+    return results
+
+
+class FileIndex:
+    """
+    Incrementally refreshed index of one directory tree.
+
+    Project roots keep the store in .studioflow/file_index.db so later
+    commands (and other tools such as the duplicate finder) can reuse it;
+    any other root gets an in-memory store. Paths are stored relative to
+    the root; queries take and return absolute paths.
+    """
+
+    def __init__(self, root: Path, db_path: Optional[Path] = None, workers: int = 8):
+        self.root = Path(root).resolve()
+        self.workers = workers
+        if db_path is None and (self.root / ".studioflow").is_dir():
+            db_path = self.root / ".studioflow" / INDEX_FILENAME
+        self.db_path = db_path
+        self._lock = threading.RLock()
+        self._conn = self._connect()
+        self._known: Optional[Dict[str, _Stat]] = None
+        self.refreshed_at = 0.0
+
+    # -- storage -------------------------------------------------------------
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = None
+        if self.db_path is not None:
+            try:
+                conn = sqlite3.connect(str(self.db_path), timeout=30, check_same_thread=False)
+                if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+                    # Only a cache of the filesystem: rebuild rather than migrate
+                    conn.execute("DROP TABLE IF EXISTS files")
+                    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            except sqlite3.Error:
+                conn = None  # read-only or locked project: fall back to memory
+        if conn is None:
+            self.db_path = None
+            conn = sqlite3.connect(":memory:", check_same_thread=False)
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS files (
+                path TEXT PRIMARY KEY,
+                parent TEXT NOT NULL,
+                name TEXT NOT NULL,
+                ext TEXT NOT NULL,
+                is_dir INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                inode INTEGER NOT NULL,
+                sample_hash TEXT,
+                content_hash TEXT
+            );
+            CREATE INDEX IF NOT EXISTS files_ext ON files(ext);
+            CREATE INDEX IF NOT EXISTS files_name ON files(name);
+            CREATE INDEX IF NOT EXISTS files_size ON files(size);
+        """)
+        conn.commit()
+        return conn
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _rel(self, path: str) -> str:
+        rel = os.path.relpath(path, self.root)
+        return "" if rel == "." else rel.replace(os.sep, "/")
+
+    def _is_own_store(self, rel: str) -> bool:
+        return rel.startswith(".studioflow/" + INDEX_FILENAME)
+
+    # -- refresh -------------------------------------------------------------
+
+    def refresh(self, max_age: float = 0.0) -> IndexDelta:
+        """
+        Re-walk the tree and store what changed.
+
+        Unchanged rows are left alone (so cached hashes survive); new and
+        modified rows are replaced, which clears their hashes. New, modified
+        and deleted paths are returned as a delta. With
+        max_age > 0 a refresh younger than that many seconds is reused.
+        """
+        with self._lock:
+            if max_age and self._known is not None and time.time() - self.refreshed_at < max_age:
+                return IndexDelta()
+
+            if self._known is None:
+                self._known = {
+                    row[0]: (bool(row[1]), row[2], row[3], row[4])
+                    for row in self._conn.execute(
+                        "SELECT path, is_dir, size, mtime_ns, inode FROM files")
+                }
+
+            current: Dict[str, _Stat] = {}
+            if self.root.is_dir():
+                for path, stat in walk_tree(self.root, self.workers).items():
+                    rel = self._rel(path)
+                    if not self._is_own_store(rel):
+                        current[rel] = stat
+
+            delta = IndexDelta()
+            upserts = []
+            for rel, stat in current.items():
+                old = self._known.get(rel)
+                if old == stat:
+                    continue
+                if old is None:
+                    delta.added.append(self.root / rel)
+                elif not stat[0]:
+                    # A directory's mtime only says its listing changed; those
+                    # entries are reported themselves
+                    delta.changed.append(self.root / rel)
+                parent, _, name = rel.rpartition("/")
+                upserts.append((rel, parent, name, os.path.splitext(name)[1].lower(), *stat))
+            removed = [rel for rel in self._known if rel not in current]
+            delta.removed = [self.root / rel for rel in removed]
+
+            if upserts or removed:
+                with self._conn:
+                    self._conn.executemany("DELETE FROM files WHERE path = ?", ((r,) for r in removed))
+                    self._conn.executemany(
+                        "INSERT OR REPLACE INTO files "
+                        "(path, parent, name, ext, is_dir, size, mtime_ns, inode) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?, ?)", upserts)
+
+            self._known = current
+            self.refreshed_at = time.time()
+            return delta
+
+    # -- queries -------------------------------------------------------------
+
+    _COLUMNS = "path, size, mtime_ns, inode, is_dir, sample_hash, content_hash"
+
+    def _entry(self, row: tuple) -> IndexEntry:
+        path, size, mtime_ns, inode, is_dir, sample_hash, content_hash = row
+        return IndexEntry(self.root / path, size, mtime_ns, inode, bool(is_dir), sample_hash, content_hash)
+
+    def _under_clause(self, under: Optional[Path], recursive: bool = True) -> Tuple[str, list]:
+        rel = ""
+        if under is not None:
+            rel = self._rel(str(Path(under).resolve()))
+            if rel.startswith(".."):
+                raise ValueError(f"{under} is outside the indexed tree {self.root}")
+        if not recursive:
+            return " AND parent = ?", [rel]
+        if not rel:
+            return "", []
+        # Everything strictly below rel: '0' is the character after '/'
+        return " AND path > ? AND path < ?", [rel + "/", rel + "0"]
+
+    @staticmethod
+    def _filters(exts: Optional[Iterable[str]], names: Optional[Iterable[str]],
+                 pattern: Optional[str]) -> Tuple[str, list]:
+        where, params = "", []
+        if exts is not None:
+            exts = sorted({e.lower() for e in exts})
+            where += f" AND ext IN ({','.join('?' * len(exts))})"
+            params += exts
+        if names is not None:
+            names = sorted(set(names))
+            where += f" AND name IN ({','.join('?' * len(names))})"
+            params += names
+        if pattern is not None:
+            where += " AND name GLOB ?"  # case-sensitive, like Path.glob on Linux
+            params.append(pattern)
+        return where, params
+
+    def _select(self, is_dir: bool, filters: Tuple[str, list], under: Optional[Path],
+                recursive: bool = True, limit: Optional[int] = None) -> List[IndexEntry]:
+        where, params = filters
+        clause, extra = self._under_clause(under, recursive)
+        sql = (f"SELECT {self._COLUMNS} FROM files "
+               f"WHERE is_dir = ?{where}{clause} ORDER BY path")
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+        with self._lock:
+            rows = self._conn.execute(sql, [int(is_dir)] + params + extra).fetchall()
+        return [self._entry(row) for row in rows]
+
+    def files(self, exts: Optional[Iterable[str]] = None, under: Optional[Path] = None,
+              names: Optional[Iterable[str]] = None, pattern: Optional[str] = None,
+              recursive: bool = True) -> List[IndexEntry]:
+        """
+        Files below `under` (the whole tree by default).
+
+        exts match case-insensitively, names exactly and pattern as a glob on
+        the file name. recursive=False keeps only files directly in `under`.
+        """
+        return self._select(False, self._filters(exts, names, pattern), under, recursive)
+
+    def dirs(self, names: Optional[Iterable[str]] = None, under: Optional[Path] = None,
+             recursive: bool = True) -> List[IndexEntry]:
+        """Directories below `under`, optionally limited to exact names"""
+        return self._select(True, self._filters(None, names, None), under, recursive)
+
+    def videos(self, under: Optional[Path] = None,
+               exts: Iterable[str] = VIDEO_EXTENSIONS) -> List[IndexEntry]:
+        return self.files(exts=exts, under=under)
+
+    def has_files(self, exts: Optional[Iterable[str]] = None, under: Optional[Path] = None,
+                  pattern: Optional[str] = None, recursive: bool = True) -> bool:
+        filters = self._filters(exts, None, pattern)
+        return bool(self._select(False, filters, under, recursive, limit=1))
+
+    def videos_without_transcript(self, under: Optional[Path] = None,
+                                  exts: Iterable[str] = VIDEO_EXTENSIONS) -> List[IndexEntry]:
+        """Videos with neither <stem>.srt nor <stem>_transcript.json next to them"""
+        clause, extra = self._under_clause(under)
+        with self._lock:
+            existing = {row[0] for row in self._conn.execute(
+                "SELECT path FROM files WHERE is_dir = 0 AND (ext = '.srt' OR name GLOB '*_transcript.json')"
+                f"{clause}", extra)}
+        missing = []
+        for entry in self.videos(under=under, exts=exts):
+            stem = self._rel(str(entry.path.with_suffix("")))
+            if not any(stem + suffix in existing for suffix in TRANSCRIPT_SUFFIXES):
+                missing.append(entry)
+        return missing
+
+    def size_buckets(self, under: Optional[Path] = None,
+                     min_size: int = 1) -> Iterator[Tuple[int, List[IndexEntry]]]:
+        """
+        Groups of two or more files with the same size, largest sizes first.
+
+        Buckets are fetched one at a time so memory stays bounded by the
+        largest bucket rather than the size of the tree.
+        """
+        clause, extra = self._under_clause(under)
+        with self._lock:
+            sizes = [row[0] for row in self._conn.execute(
+                f"SELECT size FROM files WHERE is_dir = 0 AND size >= ?{clause} "
+                "GROUP BY size HAVING COUNT(*) > 1 ORDER BY size DESC", [min_size] + extra)]
+        for size in sizes:
+            with self._lock:
+                rows = self._conn.execute(
+                    f"SELECT {self._COLUMNS} FROM files WHERE is_dir = 0 AND size = ?{clause} "
+                    "ORDER BY path", [size] + extra).fetchall()
+            yield size, [self._entry(row) for row in rows]
+
+    def store_hashes(self, updates: Iterable[Tuple[IndexEntry, Optional[str], Optional[str]]]) -> None:
+        """
+        Cache (entry, sample_hash, content_hash) results; None leaves a hash as is.
+
+        A row is only updated if it still has the entry's size and mtime, so
+        a hash of contents that changed since the last refresh is never kept.
+        """
+        params = [
+            (sample, content, self._rel(str(entry.path)), entry.size, entry.mtime_ns)
+            for entry, sample, content in updates
+        ]
+        if not params:
+            return
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "UPDATE files SET sample_hash = COALESCE(?, sample_hash), "
+                "content_hash = COALESCE(?, content_hash) "
+                "WHERE path = ? AND size = ? AND mtime_ns = ?", params)
+
+    def summary(self, under: Optional[Path] = None) -> IndexSummary:
+        """Counts and total size of everything below `under`"""
+        clause, extra = self._under_clause(under)
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT is_dir, COUNT(*), SUM(size) FROM files WHERE 1{clause} GROUP BY is_dir",
+                extra).fetchall()
+        summary = IndexSummary()
+        for is_dir, count, size in rows:
+            if is_dir:
+                summary.dirs = count
+            else:
+                summary.files = count
+                summary.size = size or 0
+        return summary
+
+    def size_by_folder(self, under: Optional[Path] = None, depth: int = 1) -> Dict[Path, int]:
+        """Total file size grouped by the folder `depth` levels below `under`"""
+        base = Path(under).resolve() if under is not None else self.root
+        clause, extra = self._under_clause(under)
+        prefix_parts = len(self._rel(str(base)).split("/")) if base != self.root else 0
+        totals: Dict[Path, int] = {}
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT path, size FROM files WHERE is_dir = 0{clause}", extra).fetchall()
+        for rel, size in rows:
+            parts = rel.split("/")[prefix_parts:]
+            if len(parts) <= depth:
+                folder = base  # files directly inside the top levels count towards base
+            else:
+                folder = base.joinpath(*parts[:depth])
+            totals[folder] = totals.get(folder, 0) + size
+        return totals
+
+
+class FileIndexView:
+    """
+    A shared FileIndex seen from a folder inside its tree.
+
+    Queries default to under=root, so a caller that asked for a subfolder
+    never gets files from the rest of the enclosing tree. Paths come back
+    below `alias` when given, i.e. in the (relative or symlinked) form the
+    caller asked for rather than the resolved one the index stores.
+    """
+
+    def __init__(self, index: FileIndex, root: Path, alias: Optional[Path] = None):
+        self.index = index
+        self.root = Path(root).resolve()
+        self.alias = Path(alias) if alias is not None and Path(alias) != self.root else None
+
+    @property
+    def db_path(self) -> Optional[Path]:
+        return self.index.db_path
+
+    def _out(self, path: Path) -> Path:
+        if self.alias is None:
+            return path
+        try:
+            return self.alias / path.relative_to(self.root)
+        except ValueError:
+            return path
+
+    def _in(self, path: Path) -> Path:
+        if self.alias is None:
+            return path
+        try:
+            return self.root / path.relative_to(self.alias)
+        except ValueError:
+            return path
+
+    def _entries(self, entries: List[IndexEntry]) -> List[IndexEntry]:
+        if self.alias is None:
+            return entries
+        return [replace(entry, path=self._out(entry.path)) for entry in entries]
+
+    def refresh(self, max_age: float = 0.0) -> IndexDelta:
+        delta = self.index.refresh(max_age=max_age)
+        if self.alias is None:
+            return delta
+        return IndexDelta(added=[self._out(p) for p in delta.added],
+                          changed=[self._out(p) for p in delta.changed],
+                          removed=[self._out(p) for p in delta.removed])
+
+    def files(self, exts: Optional[Iterable[str]] = None, under: Optional[Path] = None,
+              names: Optional[Iterable[str]] = None, pattern: Optional[str] = None,
+              recursive: bool = True) -> List[IndexEntry]:
+        return self._entries(self.index.files(exts, under or self.root, names, pattern, recursive))
+
+    def dirs(self, names: Optional[Iterable[str]] = None, under: Optional[Path] = None,
+             recursive: bool = True) -> List[IndexEntry]:
+        return self._entries(self.index.dirs(names, under or self.root, recursive))
+
+    def videos(self, under: Optional[Path] = None,
+               exts: Iterable[str] = VIDEO_EXTENSIONS) -> List[IndexEntry]:
+        return self._entries(self.index.videos(under or self.root, exts))
+
+    def has_files(self, exts: Optional[Iterable[str]] = None, under: Optional[Path] = None,
+                  pattern: Optional[str] = None, recursive: bool = True) -> bool:
+        return self.index.has_files(exts, under or self.root, pattern, recursive)
+
+    def videos_without_transcript(self, under: Optional[Path] = None,
+                                  exts: Iterable[str] = VIDEO_EXTENSIONS) -> List[IndexEntry]:
+        return self._entries(self.index.videos_without_transcript(under or self.root, exts))
+
+    def size_buckets(self, under: Optional[Path] = None,
+                     min_size: int = 1) -> Iterator[Tuple[int, List[IndexEntry]]]:
+        for size, entries in self.index.size_buckets(under or self.root, min_size):
+            yield size, self._entries(entries)
+
+    def store_hashes(self, updates: Iterable[Tuple[IndexEntry, Optional[str], Optional[str]]]) -> None:
+        if self.alias is not None:
+            updates = ((replace(entry, path=self._in(entry.path)), sample, content)
+                       for entry, sample, content in updates)
+        self.index.store_hashes(updates)
+
+    def summary(self, under: Optional[Path] = None) -> IndexSummary:
+        return self.index.summary(under or self.root)
+
+    def size_by_folder(self, under: Optional[Path] = None, depth: int = 1) -> Dict[Path, int]:
+        totals = self.index.size_by_folder(under or self.root, depth)
+        return {self._out(folder): size for folder, size in totals.items()}
+
+
+# Indexes kept alive between calls, least recently used first. Evicted
+# indexes are only dropped, never closed, as callers may still hold them.
+MAX_INDEXES = 8
+_indexes: "OrderedDict[Path, FileIndex]" = OrderedDict()
+_indexes_lock = threading.Lock()
+
+
+def _cached_index(root: Path) -> Optional[FileIndex]:
+    """The index for `root` or the nearest indexed folder enclosing it"""
+    for candidate in (root, *root.parents):
+        index = _indexes.get(candidate)
+        if index is not None:
+            _indexes.move_to_end(candidate)
+            return index
+    return None
+
+
+def get_file_index(path: Path, refresh: bool = True,
+                   max_age: float = 0.0) -> Union[FileIndex, FileIndexView]:
+    """
+    Shared index covering `path`.
+
+    Paths inside a StudioFlow project share the project's persistent index;
+    anything else (camera cards, loose folders) is indexed in memory, reusing
+    an index already built for an enclosing folder. When the index covers
+    more than `path`, or `path` is not in resolved form, a FileIndexView
+    scoped to `path` is returned so results keep the caller's path form.
+    At most MAX_INDEXES indexes are cached.
+    """
+    given = Path(path)
+    path = given.resolve()
+    root = find_project_root(path) or path
+    with _indexes_lock:
+        index = _cached_index(root)
+        if index is None:
+            index = _indexes[root] = FileIndex(root)
+            # In-memory indexes of folders inside the new root are served by it
+            # from now on; nested projects keep their own persistent index
+            for nested in [r for r, idx in _indexes.items()
+                           if root in r.parents and idx.db_path is None]:
+                del _indexes[nested]
+            while len(_indexes) > MAX_INDEXES:
+                _indexes.popitem(last=False)
+    if refresh:
+        index.refresh(max_age=max_age)
+    if index.root == path and given == path:
+        return index
+    return FileIndexView(index, path, alias=given)
+
+
+def _forget_indexes_after_fork() -> None:
+    # SQLite connections must not be shared with a forked daemon worker
+    global _indexes_lock
+    _indexes_lock = threading.Lock()
+    _indexes.clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_indexes_after_fork)
@@ -0,0 +1,280 @@
+"""
+Filmstrip sprites
+One decode per clip samples a frame every few seconds into tiled JPEG pages
+(fps + scale + tile) with a JSON offset map beside them, so reports can crop
+any number of thumbnails from the sprite instead of seeking the source.
+Sprites live in one cache per project, <project>/.studioflow/filmstrips
+"""
+
+import hashlib
+import json
+import math
+import os
+import subprocess
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from studioflow.core.cache import get_cache
+from studioflow.core.file_index import find_project_root
+
+
+INTERVAL = 2.0  # seconds between tiles
+MAX_TILES = 1800  # longer clips get a wider interval
+TILE_WIDTH = 256
+TILE_HEIGHT = 144
+COLUMNS = 10
+ROWS = 10
+INDEX_NAME = "filmstrip.json"
+PAGE_PATTERN = "sprite_%03d.jpg"
+
+
+@dataclass
+class Filmstrip:
+    """A clip's sprite pages and where each sampled frame sits in them"""
+    source: Path
+    directory: Path
+    interval: float
+    count: int
+    pages: List[str]
+    tile_width: int = TILE_WIDTH
+    tile_height: int = TILE_HEIGHT
+    columns: int = COLUMNS
+    rows: int = ROWS
+    source_size: int = 0
+    source_mtime_ns: int = 0
+
+    @property
+    def per_page(self) -> int:
+        return self.columns * self.rows
+
+    @property
+    def times(self) -> List[float]:
+        return [round(i * self.interval, 3) for i in range(self.count)]
+
+    def index_at(self, time: float) -> int:
+        """Tile nearest to a source time"""
+        return min(max(int(round(time / self.interval)), 0), self.count - 1)
+
+    def offset(self, index: int) -> Dict:
+        """Page and pixel box of a tile"""
+        page, slot = divmod(index, self.per_page)
+        row, column = divmod(slot, self.columns)
+        return {
+            "time": round(index * self.interval, 3),
+            "page": self.pages[page],
+            "x": column * self.tile_width,
+            "y": row * self.tile_height,
+            "width": self.tile_width,
+            "height": self.tile_height,
+        }
+
+    def to_dict(self) -> Dict:
+        """The JSON offset map"""
+        return {
+            "source": str(self.source),
+            "source_size": self.source_size,
+            "source_mtime_ns": self.source_mtime_ns,
+            "interval": self.interval,
+            "count": self.count,
+            "tile": {"width": self.tile_width, "height": self.tile_height},
+            "columns": self.columns,
+            "rows": self.rows,
+            "pages": self.pages,
+            "frames": [self.offset(i) for i in range(self.count)],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict, directory: Path) -> "Filmstrip":
+        return cls(
+            source=Path(data["source"]),
+            directory=directory,
+            interval=data["interval"],
+            count=data["count"],
+            pages=data["pages"],
+            tile_width=data["tile"]["width"],
+            tile_height=data["tile"]["height"],
+            columns=data["columns"],
+            rows=data["rows"],
+            source_size=data.get("source_size", 0),
+            source_mtime_ns=data.get("source_mtime_ns", 0),
+        )
+
+    def read_page(self, page: int) -> np.ndarray:
+        """A sprite page as (rows * tile_height, columns * tile_width, 3) uint8"""
+        height, width = self.rows * self.tile_height, self.columns * self.tile_width
+        cmd = ["ffmpeg", "-v", "error", "-i", str(self.directory / self.pages[page]),
+               "-f", "rawvideo", "-pix_fmt", "rgb24", "-"]
+        result = subprocess.run(cmd, capture_output=True, check=True)
+        return np.frombuffer(result.stdout[:height * width * 3], dtype=np.uint8).reshape(height, width, 3)
+
+    def tiles(self, indices: Sequence[int], pages: Optional[Dict[int, np.ndarray]] = None) -> np.ndarray:
+        """
+        Tiles as (n, tile_height, tile_width, 3) uint8.
+
+        Each page is decoded once; pass the same pages dict across calls to
+        share them (a whole clip's pages can be hundreds of MB, so nothing is
+        kept on the filmstrip itself).
+        """
+        pages = {} if pages is None else pages
+        out = np.empty((len(indices), self.tile_height, self.tile_width, 3), dtype=np.uint8)
+        for n, index in enumerate(indices):
+            page, slot = divmod(index, self.per_page)
+            if page not in pages:
+                pages[page] = self.read_page(page)
+            row, column = divmod(slot, self.columns)
+            y, x = row * self.tile_height, column * self.tile_width
+            out[n] = pages[page][y:y + self.tile_height, x:x + self.tile_width]
+        return out
+
+    def best_index(self, start: float, end: float,
+                   pages: Optional[Dict[int, np.ndarray]] = None) -> int:
+        """Best-scoring tile inside [start, end] (the nearest tile if none falls inside)"""
+        from studioflow.core.thumbnail import score_frames
+
+        first = max(int(math.ceil(start / self.interval - 1e-9)), 0)
+        last = min(int(math.floor(end / self.interval + 1e-9)), self.count - 1)
+        if first > last:
+            return self.index_at((start + end) / 2)
+        if first == last:
+            return first
+        indices = list(range(first, last + 1))
+        candidates = score_frames(self.tiles(indices, pages), [i * self.interval for i in indices])
+        return first + max(range(len(candidates)), key=lambda i: candidates[i].score)
+
+    def write_tiles(self, indices: Sequence[int], output_paths: Sequence[Path],
+                    pages: Optional[Dict[int, np.ndarray]] = None) -> List[Path]:
+        """Save tiles as JPEGs with one encoder run (paths that couldn't be written are skipped)"""
+        if not indices:
+            return []
+        tiles = self.tiles(indices, pages)
+        output_dir = Path(output_paths[0]).parent
+        output_dir.mkdir(parents=True, exist_ok=True)
+        written = []
+        with tempfile.TemporaryDirectory(dir=output_dir) as tmp:
+            cmd = ["ffmpeg", "-v", "error", "-y",
+                   "-f", "rawvideo", "-pix_fmt", "rgb24",
+                   "-s", f"{self.tile_width}x{self.tile_height}", "-framerate", "1", "-i", "-",
+                   "-q:v", "2", "-start_number", "0", str(Path(tmp) / "%06d.jpg")]
+            subprocess.run(cmd, input=tiles.tobytes(), capture_output=True, check=True)
+            for i, output_path in enumerate(output_paths):
+                frame = Path(tmp) / f"{i:06d}.jpg"
+                if frame.exists():
+                    os.replace(frame, output_path)
+                    written.append(Path(output_path))
+        return written
+
+
+def filmstrip_root(project_dir: Path) -> Path:
+    """A project's sprite cache, shared by every report that crops thumbnails"""
+    return Path(project_dir) / ".studioflow" / "filmstrips"
+
+
+def filmstrip_dir(video_path: Path, project_dir: Path) -> Path:
+    """Where a clip's sprite lives in project_dir (the path hash keeps same-named clips apart)"""
+    digest = hashlib.sha1(str(Path(video_path).resolve()).encode()).hexdigest()[:8]
+    return filmstrip_root(project_dir) / f"{Path(video_path).stem}_{digest}"
+
+
+def build_command(video_path: Path, directory: Path, interval: float,
+                  tile_width: int = TILE_WIDTH, tile_height: int = TILE_HEIGHT,
+                  columns: int = COLUMNS, rows: int = ROWS) -> List[str]:
+    """ffmpeg command sampling the whole clip into sprite pages in one decode"""
+    from studioflow.core.ffmpeg import passthrough_args
+
+    vf = (f"fps=1/{interval:g},"
+          f"scale={tile_width}:{tile_height}:force_original_aspect_ratio=decrease:flags=area,"
+          f"pad={tile_width}:{tile_height}:(ow-iw)/2:(oh-ih)/2,setsar=1,"
+          f"tile={columns}x{rows}")
+    return ["ffmpeg", "-v", "error", "-y", "-i", str(video_path),
+            "-an", "-vf", vf, *passthrough_args(),
+            "-q:v", "3", "-start_number", "0", str(directory / PAGE_PATTERN)]
+
+
+def _load_index(directory: Path, size: int, mtime_ns: int) -> Optional[Filmstrip]:
+    try:
+        data = json.loads((directory / INDEX_NAME).read_text())
+    except (OSError, ValueError):
+        return None
+    if data.get("source_size") != size or data.get("source_mtime_ns") != mtime_ns:
+        return None
+    filmstrip = Filmstrip.from_dict(data, directory)
+    if not all((directory / page).exists() for page in filmstrip.pages):
+        return None
+    return filmstrip
+
+
+def build_filmstrip(video_path: Path, project_dir: Path, interval: float = INTERVAL) -> Optional[Filmstrip]:
+    """
+    A clip's filmstrip in project_dir's sprite cache, built on first use.
+
+    The sprite and its offset map are reused (also across runs) until the
+    source changes. None if the clip can't be decoded.
+    """
+    try:
+        st = os.stat(video_path)
+    except OSError:
+        return None
+    directory = filmstrip_dir(video_path, project_dir)
+    tag = f"{directory}:{interval:g}"
+    filmstrip_cache = get_cache("filmstrips")
+    cached = filmstrip_cache.get(video_path, tag)
+    if cached is not None:
+        return cached
+
+    filmstrip = _load_index(directory, st.st_size, st.st_mtime_ns)
+    if filmstrip is None or filmstrip.interval < interval:
+        from studioflow.core.ffmpeg import FFmpegProcessor
+
+        duration = FFmpegProcessor.get_media_info(video_path).get("duration_seconds", 0)
+        interval = max(interval, duration / MAX_TILES)
+        directory.mkdir(parents=True, exist_ok=True)
+        for stale in directory.glob("sprite_*.jpg"):
+            stale.unlink()
+        try:
+            subprocess.run(build_command(video_path, directory, interval, TILE_WIDTH, TILE_HEIGHT, COLUMNS, ROWS),
+                           capture_output=True, check=True)
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            return None
+        pages = sorted(page.name for page in directory.glob("sprite_*.jpg"))
+        if not pages:
+            return None
+        capacity = len(pages) * COLUMNS * ROWS
+        count = min(math.ceil(duration / interval), capacity) if duration > 0 else capacity
+        filmstrip = Filmstrip(Path(video_path), directory, interval, count, pages,
+                              TILE_WIDTH, TILE_HEIGHT, COLUMNS, ROWS, st.st_size, st.st_mtime_ns)
+        (directory / INDEX_NAME).write_text(json.dumps(filmstrip.to_dict(), indent=2))
+
+    filmstrip_cache.put(video_path, filmstrip, tag)
+    return filmstrip
+
+
+def segment_thumbnails(video_path: Path, ranges: Sequence[Tuple[float, float]],
+                       output_dir: Path, project_dir: Optional[Path] = None) -> List[Optional[Path]]:
+    """
+    One thumbnail per (start, end) range of a clip, cropped from its filmstrip.
+
+    Each range gets its best-scoring tile; all crops are written with a
+    single encoder run. Entries are None where no thumbnail could be made.
+    The sprite is cached in project_dir, by default the project holding
+    output_dir (or else the clip), falling back to output_dir itself.
+    """
+    if not ranges:
+        return []
+    if project_dir is None:
+        project_dir = find_project_root(output_dir) or find_project_root(Path(video_path).parent) or output_dir
+    filmstrip = build_filmstrip(video_path, project_dir)
+    if filmstrip is None:
+        return [None] * len(ranges)
+    try:
+        pages: Dict[int, np.ndarray] = {}
+        indices = [filmstrip.best_index(start, end, pages) for start, end in ranges]
+        paths = [output_dir / f"{Path(video_path).stem}_{index * filmstrip.interval:.1f}s.jpg"
+                 for index in indices]
+        written = set(filmstrip.write_tiles(indices, paths, pages))
+    except (subprocess.CalledProcessError, FileNotFoundError, OSError, ValueError):
+        return [None] * len(ranges)
+    return [path if path in written else None for path in paths]
@@ -0,0 +1,378 @@
+"""
+Perceptual clip fingerprints
+Keyframe luminance hashes plus an audio band-energy envelope per clip, with an
+LSH index so re-encoded or renamed copies are found without comparing every
+clip to every other
+"""
+
+import os
+import re
+import sqlite3
+import subprocess
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+
+SCHEMA_VERSION = 1
+
+FRAME_POSITIONS = 16  # keyframes sampled at evenly spaced points of the clip
+THUMB_W, THUMB_H = 9, 8  # dHash thumbnail -> 64 bits per frame
+AUDIO_RATE = 4000
+AUDIO_WINDOW = 2000  # samples (0.5 s)
+AUDIO_BANDS = 17  # -> 16 bits per window
+AUDIO_MAX_SECONDS = 600
+BAND_BITS = 16  # LSH key: top bits of each frame hash
+
+# Verification thresholds (fractions of differing bits)
+MAX_FRAME_DISTANCE = 0.15
+MAX_AUDIO_DISTANCE = 0.30
+AUDIO_MAX_SHIFT = 4  # windows of offset tolerated between copies
+
+_PTS_RE = re.compile(r"pts_time:\s*([\d.]+)")
+_DURATION_RE = re.compile(r"Duration:\s*(\d+):(\d+):([\d.]+)")
+
+
+def default_index_path() -> Path:
+    return Path.home() / ".studioflow" / "fingerprints.db"
+
+
+@dataclass
+class Fingerprint:
+    """Compact perceptual summary of one clip"""
+    path: Path
+    duration: float
+    frames: np.ndarray  # uint64 dHash per sampled position
+    audio: np.ndarray  # uint16 bit pattern per audio window (empty: no audio)
+    size: int = 0
+    mtime_ns: int = 0
+
+    def bands(self) -> List[Tuple[int, int]]:
+        """(position, key) LSH buckets"""
+        keys = (self.frames >> np.uint64(64 - BAND_BITS)).astype(np.int64)
+        return [(i, int(key)) for i, key in enumerate(keys)]
+
+    def frame_distance(self, other: "Fingerprint") -> float:
+        n = min(len(self.frames), len(other.frames))
+        if n == 0:
+            return 1.0
+        return _popcount(self.frames[:n] ^ other.frames[:n]) / (64 * n)
+
+    def audio_distance(self, other: "Fingerprint") -> Optional[float]:
+        """Lowest bit error rate over small offsets; None if either clip has no audio"""
+        if len(self.audio) == 0 or len(other.audio) == 0:
+            return None
+        best = 1.0
+        for shift in range(-AUDIO_MAX_SHIFT, AUDIO_MAX_SHIFT + 1):
+            a = self.audio[max(shift, 0):]
+            b = other.audio[max(-shift, 0):]
+            n = min(len(a), len(b))
+            if n:
+                best = min(best, _popcount(a[:n] ^ b[:n]) / (16 * n))
+        return best
+
+    def matches(self, other: "Fingerprint") -> bool:
+        """Same footage: durations agree, pictures and (when present) sound agree"""
+        if abs(self.duration - other.duration) > max(1.0, 0.02 * max(self.duration, other.duration)):
+            return False
+        if self.frame_distance(other) > MAX_FRAME_DISTANCE:
+            return False
+        audio = self.audio_distance(other)
+        return audio is None or audio <= MAX_AUDIO_DISTANCE
+
+
+def _popcount(values: np.ndarray) -> int:
+    as_bytes = np.ascontiguousarray(values).view(np.uint8)
+    return int(np.unpackbits(as_bytes).sum())
+
+
+def frame_hashes(thumbs: np.ndarray) -> np.ndarray:
+    """dHash of (n, THUMB_H, THUMB_W) luminance thumbnails -> uint64 per frame"""
+    bits = thumbs[:, :, 1:] > thumbs[:, :, :-1]
+    packed = np.packbits(bits.reshape(len(thumbs), -1), axis=1)
+    return packed.view(">u8").astype(np.uint64).ravel()
+
+
+def audio_bits(samples: np.ndarray) -> np.ndarray:
+    """
+    Band-energy envelope bits of mono audio at AUDIO_RATE.
+
+    Each bit is the sign of how the energy difference between two adjacent
+    bands changes from one window to the next, which survives re-encoding
+    and level normalization.
+    """
+    windows = len(samples) // AUDIO_WINDOW
+    if windows < 2:
+        return np.zeros(0, dtype=np.uint16)
+    frames = samples[:windows * AUDIO_WINDOW].astype(np.float32).reshape(windows, AUDIO_WINDOW)
+    spectrum = np.abs(np.fft.rfft(frames * np.hanning(AUDIO_WINDOW), axis=1)) ** 2
+    freqs = np.fft.rfftfreq(AUDIO_WINDOW, 1 / AUDIO_RATE)
+    edges = np.geomspace(60, AUDIO_RATE / 2, AUDIO_BANDS + 1)
+    energy = np.stack([spectrum[:, (freqs >= lo) & (freqs < hi)].sum(axis=1)
+                       for lo, hi in zip(edges[:-1], edges[1:])], axis=1)
+    diff = np.diff(energy, axis=1)  # (windows, 16)
+    bits = (diff[1:] - diff[:-1]) > 0
+    return np.packbits(bits, axis=1).view(">u2").astype(np.uint16).ravel()
+
+
+def build_fingerprint(path: Path, duration: float, times: np.ndarray, thumbs: np.ndarray,
+                      samples: np.ndarray) -> Optional[Fingerprint]:
+    """Fingerprint from decoded keyframe thumbnails (with their times) and audio"""
+    if len(thumbs) == 0:
+        return None
+    hashes = frame_hashes(thumbs)
+    # Keyframe placement differs between encodes; take the keyframe nearest
+    # to each evenly spaced point of the clip
+    targets = (np.arange(FRAME_POSITIONS) + 0.5) * (duration or float(times[-1]) or 1.0) / FRAME_POSITIONS
+    nearest = np.clip(np.searchsorted(times, targets), 0, len(times) - 1)
+    earlier = np.clip(nearest - 1, 0, len(times) - 1)
+    pick = np.where(np.abs(times[earlier] - targets) < np.abs(times[nearest] - targets), earlier, nearest)
+    return Fingerprint(Path(path), duration, hashes[pick], audio_bits(samples))
+
+
+def _decode(path: Path) -> Optional[Tuple[float, np.ndarray, np.ndarray, np.ndarray]]:
+    """(duration, keyframe times, thumbnails, audio samples) via ffmpeg"""
+    from studioflow.core.ffmpeg import passthrough_args
+
+    try:
+        video = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-nostdin", "-skip_frame", "nokey", "-i", str(path), "-an",
+             "-vf", f"scale={THUMB_W}:{THUMB_H}:flags=area,format=gray,showinfo",
+             *passthrough_args(), "-f", "rawvideo", "-"],
+            capture_output=True, timeout=600)
+        audio = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-nostdin", "-i", str(path), "-vn", "-ac", "1",
+             "-ar", str(AUDIO_RATE), "-t", str(AUDIO_MAX_SECONDS), "-f", "s16le", "-"],
+            capture_output=True, timeout=600)
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+    stderr = video.stderr.decode(errors="replace")
+    match = _DURATION_RE.search(stderr)
+    duration = (int(match.group(1)) * 3600 + int(match.group(2)) * 60 + float(match.group(3))) if match else 0.0
+    frame_size = THUMB_W * THUMB_H
+    count = len(video.stdout) // frame_size
+    times = np.array([float(t) for t in _PTS_RE.findall(stderr)][:count])
+    if count == 0 or len(times) != count:
+        return None
+    thumbs = np.frombuffer(video.stdout[:count * frame_size], dtype=np.uint8).reshape(count, THUMB_H, THUMB_W)
+    samples = np.frombuffer(audio.stdout[:len(audio.stdout) // 2 * 2], dtype="<i2")
+    return duration, times, thumbs, samples
+
+
+def compute_fingerprint(path: Path) -> Optional[Fingerprint]:
+    """Fingerprint a clip; None if it can't be decoded (or ffmpeg is missing)"""
+    path = Path(path)
+    decoded = _decode(path)
+    if decoded is None:
+        return None
+    fp = build_fingerprint(path, *decoded)
+    if fp is not None:
+        st = path.stat()
+        fp.size, fp.mtime_ns = st.st_size, st.st_mtime_ns
+    return fp
+
+
+class FingerprintIndex:
+    """
+    Persistent fingerprints with an LSH lookup.
+
+    Every sampled frame contributes one bucket (its position and the top
+    BAND_BITS of its hash); clips sharing a bucket are candidates and are
+    confirmed with Fingerprint.matches. A lookup touches only the rows in
+    its buckets, not the whole library.
+    """
+
+    def __init__(self, db_path: Optional[Path] = None):
+        self.db_path = Path(db_path) if db_path else default_index_path()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.db_path), timeout=30, check_same_thread=False)
+        if self._conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            self._conn.executescript("DROP TABLE IF EXISTS fingerprints; DROP TABLE IF EXISTS bands;")
+            self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS fingerprints (
+                path TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                duration REAL NOT NULL,
+                frames BLOB NOT NULL,
+                audio BLOB NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS bands (
+                band INTEGER NOT NULL,
+                key INTEGER NOT NULL,
+                path TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS bands_lookup ON bands(band, key);
+            CREATE INDEX IF NOT EXISTS bands_path ON bands(path);
+        """)
+        self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _row(self, row: tuple) -> Fingerprint:
+        path, size, mtime_ns, duration, frames, audio = row
+        return Fingerprint(Path(path), duration, np.frombuffer(frames, dtype=np.uint64),
+                           np.frombuffer(audio, dtype=np.uint16), size, mtime_ns)
+
+    def get(self, path: Path) -> Optional[Fingerprint]:
+        """Stored fingerprint, if the file hasn't changed since it was taken"""
+        key = str(Path(path).resolve())
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT path, size, mtime_ns, duration, frames, audio FROM fingerprints WHERE path = ?",
+                (key,)).fetchone()
+        if row is None:
+            return None
+        try:
+            st = os.stat(key)
+        except OSError:
+            return None
+        fp = self._row(row)
+        return fp if (st.st_size, st.st_mtime_ns) == (fp.size, fp.mtime_ns) else None
+
+    def add(self, fp: Fingerprint, path: Optional[Path] = None) -> None:
+        """Store a fingerprint (under `path` if given, e.g. the imported copy)"""
+        key = str(Path(path or fp.path).resolve())
+        if path is not None:
+            try:
+                st = os.stat(key)
+                size, mtime_ns = st.st_size, st.st_mtime_ns
+            except OSError:
+                size, mtime_ns = fp.size, fp.mtime_ns
+        else:
+            size, mtime_ns = fp.size, fp.mtime_ns
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM bands WHERE path = ?", (key,))
+            self._conn.execute(
+                "INSERT OR REPLACE INTO fingerprints (path, size, mtime_ns, duration, frames, audio) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, size, mtime_ns, fp.duration,
+                 np.ascontiguousarray(fp.frames, dtype=np.uint64).tobytes(),
+                 np.ascontiguousarray(fp.audio, dtype=np.uint16).tobytes()))
+            self._conn.executemany("INSERT INTO bands (band, key, path) VALUES (?, ?, ?)",
+                                   ((band, bkey, key) for band, bkey in fp.bands()))
+
+    def remove(self, path: Path) -> None:
+        key = str(Path(path).resolve())
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM bands WHERE path = ?", (key,))
+            self._conn.execute("DELETE FROM fingerprints WHERE path = ?", (key,))
+
+    def fingerprint(self, path: Path, compute: bool = True) -> Optional[Fingerprint]:
+        """Stored fingerprint, or a freshly computed (and stored) one"""
+        fp = self.get(path)
+        if fp is None and compute:
+            fp = compute_fingerprint(Path(path).resolve())
+            if fp is not None:
+                self.add(fp)
+        return fp
+
+    def find_matches(self, fp: Fingerprint, limit: int = 10) -> List[Path]:
+        """Stored clips that are near-duplicates of fp (excluding fp's own path)"""
+        buckets = fp.bands()
+        if not buckets:
+            return []
+        own = str(Path(fp.path).resolve())
+        where = " OR ".join("(band = ? AND key = ?)" for _ in buckets)
+        params = [v for bucket in buckets for v in bucket]
+        with self._lock:
+            candidates = [row[0] for row in self._conn.execute(
+                f"SELECT path FROM bands WHERE {where} GROUP BY path ORDER BY COUNT(*) DESC", params)]
+            rows = [self._conn.execute(
+                "SELECT path, size, mtime_ns, duration, frames, audio FROM fingerprints WHERE path = ?",
+                (path,)).fetchone() for path in candidates if path != own]
+        matches = []
+        for row in rows:
+            if row is None or not os.path.exists(row[0]):
+                continue  # deleted since, or an import that never completed
+            if fp.matches(self._row(row)):
+                matches.append(Path(row[0]))
+                if len(matches) >= limit:
+                    break
+        return matches
+
+    def claim(self, fp: Fingerprint, destination: Path) -> Optional[Path]:
+        """
+        Import check: the stored clip fp duplicates, else None after
+        recording fp under destination, all under one lock.
+        """
+        with self._lock:
+            matches = self.find_matches(fp, limit=1)
+            if matches:
+                return matches[0]
+            self.add(fp, destination)
+        return None
+
+    def groups(self, paths: Iterable[Path], compute: bool = False) -> List[List[Path]]:
+        """
+        Near-duplicate groups (2+ clips) among paths.
+
+        Uses stored fingerprints; with compute=True missing ones are taken
+        (and stored) first.
+        """
+        fps: Dict[str, Fingerprint] = {}
+        for path in paths:
+            fp = self.fingerprint(path, compute=compute)
+            if fp is not None:
+                fps[str(Path(path).resolve())] = fp
+
+        parent = {key: key for key in fps}
+
+        def find(key: str) -> str:
+            while parent[key] != key:
+                parent[key] = parent[parent[key]]
+                key = parent[key]
+            return key
+
+        # Bucket in memory: only clips sharing an LSH bucket are compared
+        buckets: Dict[Tuple[int, int], List[str]] = {}
+        for key, fp in fps.items():
+            for bucket in fp.bands():
+                buckets.setdefault(bucket, []).append(key)
+        compared = set()
+        for members in buckets.values():
+            for i, a in enumerate(members):
+                for b in members[i + 1:]:
+                    pair = (a, b) if a < b else (b, a)
+                    if pair in compared:
+                        continue
+                    compared.add(pair)
+                    if find(a) != find(b) and fps[a].matches(fps[b]):
+                        parent[find(a)] = find(b)
+
+        grouped: Dict[str, List[Path]] = {}
+        for key in fps:
+            grouped.setdefault(find(key), []).append(Path(key))
+        return [sorted(group) for group in grouped.values() if len(group) > 1]
+
+
+_index: Optional[FingerprintIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_fingerprint_index() -> FingerprintIndex:
+    """Process-wide index at ~/.studioflow/fingerprints.db"""
+    global _index
+    with _index_lock:
+        if _index is None or _index.db_path != default_index_path():
+            _index = FingerprintIndex()
+        return _index
+
+
+def _forget_index_after_fork() -> None:
+    # SQLite connections must not be shared with a forked daemon worker
+    global _index, _index_lock
+    _index = None
+    _index_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_index_after_fork)
@@ -11,8 +11,10 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from collections import defaultdict
 
+from .camera_metadata import sidecar_metadata
 from .ffmpeg import FFmpegProcessor
 from .safe_marking import SafeMarkingAnalysis, SafeMarkingDetector
+from .sony import SonyMediaHandler
 
 
 @dataclass
@@ -88,6 +90,9 @@ class FolderIntelligence:
         if not dcim_folders:
             raise ValueError("No DCIM folder structure found")
 
+        # Clip durations from the card index, read in one pass
+        SonyMediaHandler.read_card_index(card_path)
+
         # Analyze each folder
         folder_analyses = []
         for folder_path in dcim_folders:
@@ -168,9 +173,12 @@ class FolderIntelligence:
             # Check protection
             clip_analysis.is_protected = self.marking_detector._is_file_protected(file_path)
 
-            # Get basic file info
-            info = FFmpegProcessor.get_media_info(file_path)
-            duration = info.get("duration_seconds", 0)
+            # Get basic file info (card index/sidecar first; ffprobe only without one)
+            sidecar = sidecar_metadata(file_path)
+            if sidecar and sidecar.get("duration"):
+                duration = sidecar["duration"]
+            else:
+                duration = FFmpegProcessor.get_media_info(file_path).get("duration_seconds", 0)
 
             clip_analysis.duration = duration
             clip_analyses.append(clip_analysis)
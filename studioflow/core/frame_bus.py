@@ -0,0 +1,463 @@
+"""
+Frame bus for visual analysis
+Decodes a clip at low resolution (optionally keyframes only, or several
+stretches of it in one ffmpeg run) into a shared-memory ring of raw RGB
+frames that several analyzers read concurrently, instead of every
+heuristic running its own ffmpeg pass
+"""
+
+import re
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from studioflow.core.cache import get_cache
+
+
+WIDTH = 160  # analysis frame size; heuristics need shapes and levels, not detail
+HEIGHT = 90
+BATCH = 32  # frames per ring chunk (one hand-off to the analyzers)
+CHUNKS = 4  # chunks in the ring: the decoder runs this far ahead of the slowest analyzer
+
+BLACK_LUMA = 16.0  # mean luma of a black frame (video levels)
+FLASH_JUMP = 60.0  # luma jump from both neighbours that marks a flash frame
+MOTION_THRESHOLD = 6.0  # mean abs luma change between frames for "has motion"
+SHAKE_JITTER = 1.5  # std of frame-to-frame camera acceleration (pixels at WIDTH) for "shaky"
+
+# Motion needs consecutive frames (keyframes are seconds apart and would
+# measure cuts and pans, not shake): short windows decoded at a fixed rate
+MOTION_FPS = 12.0
+MOTION_WINDOW = 4.0  # seconds per window
+MOTION_WINDOWS = 3
+
+# Sections of a multi-section bus are placed this far apart on its timeline
+# (longer than any clip), so interleaving them yields one section after another.
+# Its timestamps are read as integer ticks: showinfo's pts_time has 6 digits
+SECTION_SPAN = 1_000_000.0  # seconds
+PTS_TICKS = 1000  # per second
+
+_PTS_RE = re.compile(rb"(?:pts:\s*(-?\d+)\s+)?pts_time:\s*([-0-9.]+)")
+_LUMA = np.array([0.299, 0.587, 0.114], dtype=np.float32)
+
+
+def _luma(frames: np.ndarray) -> np.ndarray:
+    return frames.astype(np.float32) @ _LUMA
+
+
+class FrameRing:
+    """
+    Ring of frame chunks, shape (chunks, batch, height, width, 3) uint8, in
+    shared memory. Another process can attach with FrameRing(..., name=ring.name).
+    """
+
+    def __init__(self, chunks: int, batch: int, height: int, width: int, name: Optional[str] = None):
+        self.shape = (chunks, batch, height, width, 3)
+        self._owner = name is None
+        if self._owner:
+            self.shm = shared_memory.SharedMemory(create=True, size=int(np.prod(self.shape)))
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+        self.frames = np.ndarray(self.shape, dtype=np.uint8, buffer=self.shm.buf)
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    def close(self) -> None:
+        self.frames = None  # drop the view before releasing the buffer
+        self.shm.close()
+        if self._owner:
+            self.shm.unlink()
+
+
+class FrameAnalyzer:
+    """
+    Consumer of decoded frames.
+
+    consume() gets each chunk in decode order, always from the same thread;
+    frames is a view into the ring, valid only until consume returns, so
+    anything kept must be copied.
+    """
+    name = "frames"
+
+    def consume(self, frames: np.ndarray, times: np.ndarray) -> None:
+        raise NotImplementedError
+
+    def result(self) -> Dict[str, Any]:
+        raise NotImplementedError
+
+
+class ExposureAnalyzer(FrameAnalyzer):
+    """Luma histogram -> under / normal / over"""
+    name = "exposure"
+
+    def __init__(self):
+        self.histogram = np.zeros(256, dtype=np.int64)
+
+    def consume(self, frames, times):
+        luma = np.clip(_luma(frames), 0, 255).astype(np.uint8)
+        self.histogram += np.bincount(luma.ravel(), minlength=256)
+
+    def result(self):
+        total = self.histogram.sum()
+        if not total:
+            return {}
+        mean = float((self.histogram * np.arange(256)).sum() / total)
+        shadows = float(self.histogram[:8].sum() / total)
+        highlights = float(self.histogram[248:].sum() / total)
+        if mean < 60 or shadows > 0.3:
+            rating = "under"
+        elif mean > 190 or highlights > 0.1:
+            rating = "over"
+        else:
+            rating = "normal"
+        return {"rating": rating, "mean_luma": mean, "clipped_shadows": shadows,
+                "clipped_highlights": highlights}
+
+
+class SharpnessAnalyzer(FrameAnalyzer):
+    """Variance of the luma Laplacian per frame (higher is sharper)"""
+    name = "sharpness"
+
+    def __init__(self):
+        self.values: List[np.ndarray] = []
+
+    def consume(self, frames, times):
+        luma = _luma(frames)
+        laplacian = (4 * luma[:, 1:-1, 1:-1] - luma[:, :-2, 1:-1] - luma[:, 2:, 1:-1]
+                     - luma[:, 1:-1, :-2] - luma[:, 1:-1, 2:])
+        self.values.append(laplacian.reshape(len(frames), -1).var(axis=1))
+
+    def result(self):
+        if not self.values:
+            return {}
+        values = np.concatenate(self.values)
+        return {"mean": float(values.mean()), "min": float(values.min()), "per_frame": values.tolist()}
+
+
+class MotionAnalyzer(FrameAnalyzer):
+    """
+    Motion energy (mean abs luma change) and camera shift (phase
+    correlation) between consecutive frames; jitter in the shift is shake.
+    """
+    name = "motion"
+
+    def __init__(self):
+        self.previous: Optional[np.ndarray] = None
+        self.energy: List[np.ndarray] = []
+        self.shifts: List[np.ndarray] = []
+
+    def consume(self, frames, times):
+        luma = _luma(frames)
+        if self.previous is not None:
+            luma = np.concatenate([self.previous[None], luma])
+        self.previous = luma[-1].copy()
+        if len(luma) < 2:
+            return
+        self.energy.append(np.abs(np.diff(luma, axis=0)).mean(axis=(1, 2)))
+
+        spectra = np.fft.rfft2(luma - luma.mean(axis=(1, 2), keepdims=True))
+        cross = spectra[1:] * np.conj(spectra[:-1])
+        surface = np.fft.irfft2(cross / (np.abs(cross) + 1e-9), s=luma.shape[1:])
+        peaks = surface.reshape(len(surface), -1).argmax(axis=1)
+        dy, dx = np.unravel_index(peaks, luma.shape[1:])
+        height, width = luma.shape[1:]
+        dy = np.where(dy > height // 2, dy - height, dy)
+        dx = np.where(dx > width // 2, dx - width, dx)
+        self.shifts.append(np.stack([dy, dx], axis=1).astype(np.float64))
+
+    def result(self):
+        if not self.energy:
+            return {}
+        energy = np.concatenate(self.energy)
+        shifts = np.concatenate(self.shifts)
+        jitter = float(np.linalg.norm(np.diff(shifts, axis=0), axis=1).std()) if len(shifts) > 2 else 0.0
+        return {"mean": float(energy.mean()), "per_frame": energy.tolist(), "jitter": jitter,
+                "has_motion": bool(energy.mean() > MOTION_THRESHOLD),
+                "shaky": bool(jitter > SHAKE_JITTER)}
+
+
+class BlackFlashAnalyzer(FrameAnalyzer):
+    """Black frames and single-frame flashes from per-frame mean luma"""
+    name = "black_flash"
+
+    def __init__(self):
+        self.levels: List[np.ndarray] = []
+        self.times: List[np.ndarray] = []
+
+    def consume(self, frames, times):
+        self.levels.append(_luma(frames).mean(axis=(1, 2)))
+        self.times.append(np.asarray(times, dtype=np.float64).copy())
+
+    def result(self):
+        if not self.levels:
+            return {}
+        levels, times = np.concatenate(self.levels), np.concatenate(self.times)
+        black = levels < BLACK_LUMA
+        flash = np.zeros(len(levels), dtype=bool)
+        if len(levels) > 2:
+            flash[1:-1] = ((levels[1:-1] - levels[:-2] > FLASH_JUMP)
+                           & (levels[1:-1] - levels[2:] > FLASH_JUMP))
+        return {"black_times": times[black].tolist(), "flash_times": times[flash].tolist(),
+                "black_at_start": bool(black[0]), "black_at_end": bool(black[-1])}
+
+
+class ColorStatsAnalyzer(FrameAnalyzer):
+    """Per-channel mean and spread, for exposure / white balance matching"""
+    name = "color"
+
+    def __init__(self):
+        self.count = 0
+        self.sums = np.zeros(3)
+        self.squares = np.zeros(3)
+
+    def consume(self, frames, times):
+        pixels = frames.reshape(-1, 3).astype(np.float64)
+        self.count += len(pixels)
+        self.sums += pixels.sum(axis=0)
+        self.squares += (pixels ** 2).sum(axis=0)
+
+    def result(self):
+        if not self.count:
+            return {}
+        mean = self.sums / self.count
+        std = np.sqrt(np.maximum(self.squares / self.count - mean ** 2, 0.0))
+        return {"mean": mean.tolist(), "std": std.tolist(),
+                "luma_mean": float(mean @ _LUMA), "luma_std": float(std @ _LUMA)}
+
+
+@dataclass
+class Section:
+    """A stretch of the clip a FrameBus decodes, and analyzers fed only its frames"""
+    keyframes_only: bool = False
+    fps: Optional[float] = None
+    start: Optional[float] = None
+    duration: Optional[float] = None
+    analyzers: List[FrameAnalyzer] = field(default_factory=list)
+
+    def input_args(self, path: Path) -> List[str]:
+        args = []
+        if self.keyframes_only:
+            args.extend(["-skip_frame", "nokey"])  # the decoder never touches other frames
+        if self.start:
+            args.extend(["-ss", f"{self.start:.3f}"])
+        if self.duration:
+            args.extend(["-t", f"{self.duration:.3f}"])
+        return args + ["-i", str(path)]
+
+
+class FrameBus:
+    """
+    One low-resolution decode of a clip, fanned out to analyzers.
+
+    The clip is decoded as one section (keyframes_only/fps/start/duration)
+    or as several given as sections, all in a single ffmpeg run.
+    """
+
+    def __init__(self, path: Path, width: int = WIDTH, height: int = HEIGHT,
+                 keyframes_only: bool = False, fps: Optional[float] = None,
+                 start: Optional[float] = None, duration: Optional[float] = None,
+                 batch: int = BATCH, chunks: int = CHUNKS, sections: Optional[Sequence[Section]] = None):
+        self.path = Path(path)
+        self.width = width
+        self.height = height
+        self.sections = list(sections) if sections else [Section(keyframes_only, fps, start, duration)]
+        self.batch = batch
+        self.chunks = chunks
+
+    def command(self) -> List[str]:
+        from studioflow.core.ffmpeg import passthrough_args
+
+        cmd = ["ffmpeg", "-hide_banner", "-nostats"]
+        for section in self.sections:
+            cmd.extend(section.input_args(self.path))
+
+        def chain(section: Section) -> List[str]:
+            filters = [f"fps={section.fps:g}"] if section.fps else []
+            return filters + [f"scale={self.width}:{self.height}:flags=area"]
+
+        # showinfo logs every frame's timestamp, which rawvideo doesn't carry
+        if len(self.sections) == 1:
+            cmd.extend(["-map", "0:v:0", "-an", "-sn", "-vf", ",".join(chain(self.sections[0]) + ["showinfo"])])
+        else:
+            # Each section shifted to its own SECTION_SPAN, interleaved by timestamp
+            chains = [f"[{i}:v:0]" + ",".join(chain(section) + ["setsar=1", f"setpts=PTS+{i * SECTION_SPAN:.0f}/TB"])
+                      + f"[s{i}]" for i, section in enumerate(self.sections)]
+            chains.append("".join(f"[s{i}]" for i in range(len(self.sections)))
+                          + f"interleave=nb_inputs={len(self.sections)},settb=1/{PTS_TICKS},showinfo[out]")
+            cmd.extend(["-filter_complex", ";".join(chains), "-map", "[out]"])
+        cmd.extend([*passthrough_args(), "-f", "rawvideo", "-pix_fmt", "rgb24", "-"])
+        return cmd
+
+    def _split(self, times: np.ndarray, current: int) -> List[Tuple[int, int, int]]:
+        """
+        (section, first, end) runs of a chunk's frames, the chunk starting
+        in section current; times are turned from bus into clip time in place
+        """
+        index = np.clip(np.floor(times / SECTION_SPAN + 0.5), 0, len(self.sections) - 1)
+        index = np.where(np.isnan(times), -1, index).astype(int)
+        # Sections arrive in order; an untimed frame belongs to the one before it
+        index = np.maximum.accumulate(np.concatenate([[current], index]))[1:]
+        starts = np.array([section.start or 0.0 for section in self.sections])
+        times += starts[index] - index * SECTION_SPAN
+        bounds = np.flatnonzero(np.diff(index)) + 1
+        edges = [0, *bounds.tolist(), len(index)]
+        return [(int(index[a]), a, b) for a, b in zip(edges, edges[1:])]
+
+    def run(self, analyzers: Sequence[FrameAnalyzer] = ()) -> Dict[str, Dict[str, Any]]:
+        """
+        Decode the clip and feed every frame to every analyzer.
+
+        analyzers see the frames of every section, a section's own
+        analyzers only its frames; times are clip times. Each analyzer has
+        its own thread, so they work on a chunk at the same time (numpy
+        releases the GIL) while the decoder fills the next one; a chunk is
+        reused once all analyzers are done with it. Returns analyzer name ->
+        result for analyzers (read section analyzers' results from them).
+        Raises FileNotFoundError without ffmpeg.
+        """
+        every = list(analyzers) + [a for section in self.sections for a in section.analyzers]
+        ring = FrameRing(self.chunks, self.batch, self.height, self.width)
+        frame_bytes = self.height * self.width * 3
+        pts: List[float] = []
+        pts_ready = threading.Condition()
+        reader_done = threading.Event()
+
+        proc = subprocess.Popen(self.command(), stdout=subprocess.PIPE, stderr=subprocess.PIPE, bufsize=0)
+        ticks = len(self.sections) > 1
+
+        def read_timestamps():
+            for line in proc.stderr:
+                match = _PTS_RE.search(line)
+                if match:
+                    with pts_ready:
+                        pts.append(int(match.group(1)) / PTS_TICKS if ticks and match.group(1)
+                                   else float(match.group(2)))
+                        pts_ready.notify_all()
+            with pts_ready:
+                reader_done.set()
+                pts_ready.notify_all()
+
+        reader = threading.Thread(target=read_timestamps, daemon=True)
+        reader.start()
+        executors = {id(analyzer): ThreadPoolExecutor(max_workers=1) for analyzer in every}
+        pending: List[list] = [[] for _ in range(self.chunks)]
+        view = frames = None
+        try:
+            chunk, decoded, section = 0, 0, 0
+            while True:
+                for future in wait(pending[chunk]).done:
+                    future.result()
+                view = memoryview(ring.frames[chunk].reshape(-1))
+                filled = 0
+                while filled < len(view):
+                    n = proc.stdout.readinto(view[filled:])
+                    if not n:
+                        break
+                    filled += n
+                count = filled // frame_bytes
+                if count == 0:
+                    break
+
+                with pts_ready:
+                    pts_ready.wait_for(lambda: len(pts) >= decoded + count or reader_done.is_set(), timeout=5.0)
+                    times = np.array(pts[decoded:decoded + count] + [np.nan] * max(0, decoded + count - len(pts)))
+
+                pending[chunk] = []
+                for section, first, end in self._split(times, section):
+                    frames = ring.frames[chunk, first:end]
+                    pending[chunk].extend(executors[id(analyzer)].submit(analyzer.consume, frames, times[first:end])
+                                          for analyzer in [*analyzers, *self.sections[section].analyzers])
+                decoded += count
+                chunk = (chunk + 1) % self.chunks
+                if count < self.batch:
+                    break
+
+            for futures in pending:
+                for future in wait(futures).done:
+                    future.result()
+        finally:
+            proc.stdout.close()
+            proc.wait()
+            reader.join(timeout=5.0)
+            for executor in executors.values():
+                executor.shutdown(wait=True)
+            view = frames = None
+            ring.close()
+
+        return {analyzer.name: analyzer.result() for analyzer in analyzers}
+
+
+def default_analyzers() -> List[FrameAnalyzer]:
+    """Analyzers that only need a sparse sample of frames (keyframes are enough)"""
+    return [ExposureAnalyzer(), SharpnessAnalyzer(), BlackFlashAnalyzer(), ColorStatsAnalyzer()]
+
+
+def motion_windows(duration: float) -> List[Tuple[float, Optional[float]]]:
+    """(start, length) of the windows motion is measured in, spread over the clip"""
+    if duration <= MOTION_WINDOW * MOTION_WINDOWS:
+        return [(0.0, None)]  # short clip: all of it
+    spacing = duration / (MOTION_WINDOWS + 1)
+    return [(spacing * (i + 1) - MOTION_WINDOW / 2, MOTION_WINDOW) for i in range(MOTION_WINDOWS)]
+
+
+def motion_sections(duration: float) -> List[Section]:
+    """Sections of consecutive frames at MOTION_FPS (see motion_windows), one MotionAnalyzer each"""
+    return [Section(fps=MOTION_FPS, start=start, duration=length, analyzers=[MotionAnalyzer()])
+            for start, length in motion_windows(duration)]
+
+
+def motion_stats(sections: Sequence[Section]) -> Dict[str, Any]:
+    """
+    Pooled MotionAnalyzer results of decoded motion_sections. Energy is
+    pooled; jitter is the median window's, so one bumped moment doesn't
+    make a tripod shot "shaky".
+    """
+    results = [r for r in (section.analyzers[0].result() for section in sections) if r]
+    if not results:
+        return {}
+    energy = np.concatenate([r["per_frame"] for r in results])
+    jitter = float(np.median([r["jitter"] for r in results]))
+    return {"mean": float(energy.mean()), "per_frame": energy.tolist(), "jitter": jitter,
+            "has_motion": bool(energy.mean() > MOTION_THRESHOLD),
+            "shaky": bool(jitter > SHAKE_JITTER)}
+
+
+def clip_stats(path: Path, keyframes_only: bool = True) -> Optional[Dict[str, Dict[str, Any]]]:
+    """
+    Visual statistics of a clip, cached per file.
+
+    Exposure, sharpness, black frames and colour come from the keyframes
+    by default: a second or so apart on camera footage, which is plenty
+    for them and decodes a 1-hour clip in a fraction of real time. Motion
+    and shake come from consecutive frames in a few short windows
+    (motion_sections). Both are decoded by one ffmpeg run. None if the
+    clip can't be decoded.
+    """
+    stats_cache = get_cache("frame_stats")
+    tag = "keyframes" if keyframes_only else "all"
+    cached = stats_cache.get(path, tag)
+    if cached is not None:
+        return cached
+
+    from studioflow.core.ffmpeg import FFmpegProcessor
+
+    try:
+        duration = FFmpegProcessor.get_media_info(Path(path)).get("duration_seconds", 0)
+        motion = motion_sections(duration)
+        bus = FrameBus(path, sections=[Section(keyframes_only=keyframes_only, analyzers=default_analyzers()), *motion])
+        bus.run()
+        stats = {analyzer.name: analyzer.result() for analyzer in bus.sections[0].analyzers}
+        if not stats.get("exposure"):
+            return None
+        stats["motion"] = motion_stats(motion)
+    except OSError:
+        return None
+    stats_cache.put(path, stats, tag)
+    return stats
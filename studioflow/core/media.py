@@ -7,7 +7,6 @@ from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 from datetime import datetime
 from dataclasses import dataclass, field
-import hashlib
 import shutil
 import subprocess
 import concurrent.futures
@@ -133,20 +132,32 @@ class MediaScanner:
         if not path.exists():
             return []
 
-        # First pass: discover all media files (fast, no metadata extraction)
+        # First pass: discover all media files from the file index (no metadata extraction)
+        from studioflow.core.file_index import get_file_index
+
         files = []
-        pattern = "**/*" if recursive else "*"
+        extensions = self.video_extensions | self.audio_extensions | self.image_extensions
+        index = get_file_index(path)
 
-        for file_path in path.glob(pattern):
-            if file_path.is_file():
-                # Don't extract metadata yet - will do in parallel or sequential pass
-                media_file = self._analyze_file(file_path, extract_metadata=False)
-                if media_file:
-                    files.append(media_file)
+        for entry in index.files(exts=extensions, under=path, recursive=recursive):
+            # Don't extract metadata yet - will do in parallel or sequential pass
+            media_file = self._analyze_file(entry.path, extract_metadata=False, size=entry.size)
+            if media_file:
+                files.append(media_file)
 
         # Second pass: extract metadata in parallel (for video files)
         video_files = [f for f in files if f.type == MediaType.VIDEO]
         
+        if video_files:
+            # Sony cards describe every clip in MEDIAPRO.XML: read it once so
+            # those clips skip ffprobe and exiftool entirely
+            from studioflow.core.sony import SonyMediaHandler
+            SonyMediaHandler.read_card_index(path)
+
+            # Camera metadata for the whole batch: sidecars, then one exiftool session
+            from studioflow.core.camera_metadata import camera_metadata
+            camera_metadata([f.path for f in video_files])
+        
         if parallel and video_files and len(video_files) > 1:
             # Use ThreadPoolExecutor for parallel metadata extraction
             with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
@@ -174,13 +185,15 @@ class MediaScanner:
 
         return files
 
-    def _analyze_file(self, path: Path, extract_metadata: bool = False) -> Optional[MediaFile]:
+    def _analyze_file(self, path: Path, extract_metadata: bool = False,
+                      size: Optional[int] = None) -> Optional[MediaFile]:
         """
         Analyze a single file
         
         Args:
             path: File path to analyze
             extract_metadata: If True, extract metadata immediately (for sequential mode)
+            size: File size if already known (e.g. from the file index)
         """
         ext = path.suffix.lower()
 
@@ -197,7 +210,7 @@ class MediaScanner:
         # Create basic media file
         media_file = MediaFile(
             path=path,
-            size=path.stat().st_size,
+            size=path.stat().st_size if size is None else size,
             type=media_type
         )
 
@@ -210,8 +223,15 @@ class MediaScanner:
         return media_file
 
     def _get_video_metadata(self, media_file: MediaFile):
-        """Get comprehensive video metadata using ffprobe"""
+        """Get comprehensive video metadata (card index/sidecar when present, else ffprobe)"""
         try:
+            if self._get_sidecar_metadata(media_file):
+                # A card scan stays free of per-clip decodes: speech is left
+                # unknown (None) for clips described by their sidecar
+                self._get_camera_metadata(media_file)
+                self._analyze_content_fast(media_file, detect_speech=False)
+                return
+
             cmd = [
                 'ffprobe',
                 '-v', 'error',
@@ -375,13 +395,48 @@ class MediaScanner:
         except Exception:
             pass  # Metadata extraction is optional
 
-    def _analyze_content_fast(self, media_file: MediaFile):
-        """Fast content analysis during scan"""
+    def _get_sidecar_metadata(self, media_file: MediaFile) -> bool:
+        """
+        Fill format fields from the clip's Sony card index or M01.XML sidecar.
+
+        False if it has none (or one without duration and frame rate), in
+        which case the caller probes the file.
+        """
+        from studioflow.core.camera_metadata import sidecar_metadata
+
+        data = sidecar_metadata(media_file.path)
+        if not data or not data.get('duration') or not data.get('framerate'):
+            return False
+
+        media_file.duration = data['duration']
+        media_file.framerate = data['framerate']
+        media_file.codec = data.get('codec')
+        media_file.pixel_format = data.get('pixel_format')
+        media_file.bit_depth = data.get('bit_depth')
+        if data.get('resolution'):
+            width, height = data['resolution']
+            media_file.resolution = (width, height)
+            if width > 0 and height > 0:
+                media_file.aspect_ratio = width / height
+        media_file.timecode = data.get('timecode')
+        media_file.creation_time = data.get('creation_time')
+        media_file.audio_codec = data.get('audio_codec')
+        media_file.audio_sample_rate = data.get('sample_rate')
+        media_file.audio_channels = data.get('audio_channels')
+        media_file.total_bitrate = int(media_file.size * 8 / media_file.duration)
+
+        # No ffprobe output to keep: record where the fields came from instead
+        media_file.metadata = {'source': data.get('source', 'sidecar')}
+        return True
+
+    def _analyze_content_fast(self, media_file: MediaFile, detect_speech: bool = True):
+        """Fast content analysis during scan (detect_speech=False skips the ffmpeg pass)"""
         if media_file.type != MediaType.VIDEO:
             return
         
         # Speech detection (fast)
-        media_file.has_speech = self._detect_speech_fast(media_file.path)
+        if detect_speech:
+            media_file.has_speech = self._detect_speech_fast(media_file.path)
         
         # Basic exposure check
         media_file.exposure_rating = self._check_exposure_fast(media_file.path)
@@ -395,6 +450,7 @@ class MediaScanner:
             cmd = [
                 "ffmpeg",
                 "-i", str(file_path),
+                "-vn",  # audio only: don't decode the picture
                 "-af", "silencedetect=n=-30dB:d=0.5",
                 "-f", "null",
                 "-"
@@ -421,49 +477,25 @@ class MediaScanner:
         return 0
 
     def _get_camera_metadata(self, media_file: MediaFile):
-        """Get camera-specific metadata using exiftool (if available)"""
+        """Get camera-specific metadata (Sony sidecar XML or exiftool, if available)"""
         if media_file.type != MediaType.VIDEO:
             return
 
-        try:
-            # Check if exiftool is available
-            subprocess.run(['exiftool', '-ver'], capture_output=True, check=True, timeout=2)
+        from studioflow.core.camera_metadata import camera_metadata
 
-            cmd = ['exiftool', '-j', '-q', str(media_file.path)]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=5)
+        # scan() prefetches the whole batch, so this is normally a cache hit
+        camera = camera_metadata([media_file.path]).get(media_file.path, {})
 
-            if result.returncode == 0:
-                exif_data = json.loads(result.stdout)[0] if result.stdout else {}
-
-                # Camera metadata
-                if 'Make' in exif_data:
-                    media_file.camera_make = exif_data['Make']
-                if 'Model' in exif_data:
-                    media_file.camera_model = exif_data['Model']
-
-                # Sony-specific (FX30/ZV-E10)
-                if 'PictureProfile' in exif_data:
-                    media_file.metadata['picture_profile'] = exif_data['PictureProfile']
-                if 'ColorMode' in exif_data:
-                    media_file.metadata['color_mode'] = exif_data['ColorMode']
-                if 'ISO' in exif_data:
-                    media_file.metadata['iso'] = exif_data['ISO']
-                if 'WhiteBalance' in exif_data:
-                    media_file.metadata['white_balance'] = exif_data['WhiteBalance']
-                if 'ShutterSpeed' in exif_data:
-                    media_file.metadata['shutter_speed'] = exif_data['ShutterSpeed']
-                if 'FNumber' in exif_data:
-                    media_file.metadata['aperture'] = exif_data['FNumber']
-                if 'LensModel' in exif_data:
-                    media_file.metadata['lens'] = exif_data['LensModel']
-                if 'SteadyShot' in exif_data:
-                    media_file.metadata['stabilization'] = exif_data['SteadyShot']
-
-        except (FileNotFoundError, subprocess.TimeoutExpired, subprocess.CalledProcessError):
-            # exiftool not available, skip
-            pass
-        except Exception:
-            pass
+        if camera.get('camera_make'):
+            media_file.camera_make = camera['camera_make']
+        if camera.get('camera_model'):
+            media_file.camera_model = camera['camera_model']
+
+        # Sony-specific (FX30/ZV-E10)
+        for key in ('picture_profile', 'color_mode', 'gamma', 'iso', 'white_balance',
+                    'shutter_speed', 'aperture', 'lens', 'stabilization'):
+            if camera.get(key) is not None:
+                media_file.metadata[key] = camera[key]
 
     def _categorize_clip(self, media_file: MediaFile) -> ClipCategory:
         """Categorize video clip based on metadata"""
@@ -511,10 +543,11 @@ class MediaScanner:
 class MediaImporter:
     """Handles media import with deduplication and organization"""
 
-    def __init__(self, project):
+    def __init__(self, project, fingerprints: bool = True):
         self.project = project
         self.config = get_config()
         self.imported_files = set()
+        self.fingerprints = fingerprints
         self._load_import_history()
 
     def _load_import_history(self):
@@ -599,6 +632,11 @@ class MediaImporter:
         """
         # Check for duplicates
         checksum = self._get_checksum(media_file.path)
+        if checksum is None:
+            return {"imported": False, "reason": "unreadable"}
+        if checksum not in self.imported_files and \
+                self._legacy_checksum(media_file.path) in self.imported_files:
+            self.imported_files.add(checksum)  # history from before content checksums
 
         if checksum in self.imported_files:
             return {"imported": False, "reason": "duplicate"}
@@ -609,6 +647,13 @@ class MediaImporter:
         else:
             dest_path = self.project.path / "01_MEDIA" / media_file.path.name
 
+        # Same footage imported before under another name or re-encoded
+        fingerprint = None
+        if self.fingerprints and media_file.type == MediaType.VIDEO:
+            fingerprint, original = self._claim_fingerprint(media_file.path, dest_path)
+            if original is not None:
+                return {"imported": False, "reason": f"near-duplicate of {original}"}
+
         # Create destination directory
         dest_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -631,6 +676,7 @@ class MediaImporter:
                 if result.success:
                     # Record import
                     self.imported_files.add(checksum)
+                    self._record_fingerprint(fingerprint, dest_path, result.output_file or dest_path)
                     return {
                         "imported": True,
                         "destination": result.output_file,
@@ -653,6 +699,7 @@ class MediaImporter:
 
             # Record import
             self.imported_files.add(checksum)
+            self._record_fingerprint(fingerprint, dest_path, dest_path)
 
             return {
                 "imported": True,
@@ -662,14 +709,55 @@ class MediaImporter:
             }
 
         except Exception as e:
+            if fingerprint is not None:
+                from studioflow.core.fingerprint import get_fingerprint_index
+                get_fingerprint_index().remove(dest_path)
             return {
                 "imported": False,
                 "reason": str(e)
             }
 
-    def _get_checksum(self, path: Path) -> str:
-        """Calculate file checksum for deduplication"""
-        # Use size + name for quick check (full hash is slow for large files)
+    def _claim_fingerprint(self, source: Path, dest_path: Path):
+        """(fingerprint, path of an earlier import of the same footage or None)"""
+        from studioflow.core.fingerprint import compute_fingerprint, get_fingerprint_index
+
+        fingerprint = compute_fingerprint(source)
+        if fingerprint is None:
+            return None, None  # not decodable here; the checksum still applies
+        return fingerprint, get_fingerprint_index().claim(fingerprint, dest_path)
+
+    def _record_fingerprint(self, fingerprint, reserved: Path, destination: Path):
+        """Store the fingerprint under the file that was actually written"""
+        if fingerprint is None:
+            return
+        from studioflow.core.fingerprint import get_fingerprint_index
+
+        index = get_fingerprint_index()
+        if Path(destination) != reserved:
+            index.remove(reserved)
+        index.add(fingerprint, destination)
+
+    def _get_checksum(self, path: Path) -> Optional[str]:
+        """Content checksum for deduplication
+
+        Size plus a hash of the first and last 64 KiB: renamed copies are
+        caught and different clips that happen to share a name are not.
+        None if the file can't be read (or is still being written).
+        """
+        from studioflow.core.duplicates import sample_hash
+        from studioflow.core.file_index import IndexEntry
+
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        sample = sample_hash(IndexEntry(path, stat.st_size, stat.st_mtime_ns, stat.st_ino))
+        return f"{stat.st_size}_{sample}" if sample is not None else None
+
+    def _legacy_checksum(self, path: Path) -> str:
+        """Checksum import history used before _get_checksum (name, size and mtime)"""
+        import hashlib
+
         stat = path.stat()
         unique_str = f"{path.name}_{stat.st_size}_{stat.st_mtime}"
         return hashlib.md5(unique_str.encode()).hexdigest()
@@ -251,10 +251,10 @@ class MediaNormalizer:
             original_dir.mkdir(parents=True, exist_ok=True)
         
         # Find all video files
-        video_extensions = ['.mp4', '.mov', '.MP4', '.MOV', '.mxf', '.MXF', '.avi', '.AVI']
-        video_files = []
-        for ext in video_extensions:
-            video_files.extend(input_dir.rglob(f"*{ext}"))
+        from studioflow.core.file_index import get_file_index
+        video_extensions = ['.mp4', '.mov', '.mxf', '.avi']
+        index = get_file_index(input_dir)
+        video_files = [e.path for e in index.files(exts=video_extensions, under=input_dir)]
         
         results = {
             'success': [],
@@ -8,7 +8,6 @@ from pathlib import Path
 from typing import Dict, Optional, Any, Tuple
 import subprocess
 import json
-import tempfile
 
 from studioflow.core.media import MediaFile, MediaScanner
 
@@ -103,16 +102,16 @@ class MulticamColorMatcher:
         }
         
         try:
-            # Extract sample frames for analysis
-            ref_frame = self._extract_sample_frame(reference_clip)
-            target_frame = self._extract_sample_frame(target_clip)
+            # Color statistics of a few seconds of each clip
+            ref_stats = self._sample_color_stats(reference_clip)
+            target_stats = self._sample_color_stats(target_clip)
             
-            if not ref_frame or not target_frame:
+            if not ref_stats or not target_stats:
                 result["error"] = "Failed to extract sample frames"
                 return result
             
             # Calculate exposure and WB corrections
-            correction = self._calculate_exposure_wb_correction(ref_frame, target_frame)
+            correction = self._calculate_exposure_wb_correction(ref_stats, target_stats)
             
             # Apply correction via FFmpeg (keep in S-Log3)
             success = self._apply_exposure_wb_correction(
@@ -129,60 +128,50 @@ class MulticamColorMatcher:
         
         return result
     
-    def _extract_sample_frame(self, video_path: Path, timestamp: float = 5.0) -> Optional[Path]:
-        """Extract sample frame for color analysis"""
+    def _sample_color_stats(self, video_path: Path, timestamp: float = 5.0,
+                            seconds: float = 2.0) -> Optional[Dict[str, Any]]:
+        """Color statistics of the frames from timestamp on, decoded straight to memory"""
+        from studioflow.core.frame_bus import ColorStatsAnalyzer, FrameBus
+
         try:
-            with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp:
-                frame_path = Path(tmp.name)
-            
-            cmd = [
-                "ffmpeg",
-                "-i", str(video_path),
-                "-ss", str(timestamp),
-                "-vframes", "1",
-                "-y",
-                str(frame_path)
-            ]
-            
-            result = subprocess.run(cmd, capture_output=True, timeout=10)
-            if result.returncode == 0 and frame_path.exists():
-                return frame_path
-            return None
+            bus = FrameBus(video_path, width=320, height=180, start=timestamp, duration=seconds)
+            return bus.run([ColorStatsAnalyzer()])["color"] or None
         except Exception:
             return None
     
     def _calculate_exposure_wb_correction(
         self,
-        ref_frame: Path,
-        target_frame: Path
+        ref_stats: Dict[str, Any],
+        target_stats: Dict[str, Any]
     ) -> Dict[str, float]:
         """
         Calculate exposure and white balance correction parameters.
         
-        This is a simplified implementation. In practice, would analyze
-        histograms and calculate precise adjustments.
+        Brightness and contrast move the target's luma mean and spread onto
+        the reference's; the midtone color balance moves each channel's
+        offset from luma (its cast) onto the reference's.
         
         Returns:
             Dict with correction parameters (brightness, contrast, colorbalance)
         """
-        # TODO: Implement proper histogram analysis
-        # For now, return minimal corrections
-        # In production, would:
-        # 1. Extract RGB histograms from both frames
-        # 2. Calculate brightness/contrast differences
-        # 3. Calculate color temperature/tint differences
-        # 4. Return adjustment values
+        brightness = (ref_stats["luma_mean"] - target_stats["luma_mean"]) / 255.0
+        contrast = ref_stats["luma_std"] / target_stats["luma_std"] if target_stats["luma_std"] else 1.0
+        cast = [((ref - ref_stats["luma_mean"]) - (target - target_stats["luma_mean"])) / 255.0
+                for ref, target in zip(ref_stats["mean"], target_stats["mean"])]
+        
+        def clamp(value: float, low: float, high: float) -> float:
+            return round(max(low, min(high, value)), 3)
         
         return {
-            "brightness": 0.0,  # -1.0 to 1.0
-            "contrast": 1.0,    # 0.0 to 2.0
+            "brightness": clamp(brightness, -1.0, 1.0),  # -1.0 to 1.0
+            "contrast": clamp(contrast, 0.0, 2.0),        # 0.0 to 2.0
             "saturation": 1.0,  # 0.0 to 2.0
             "rs": 0.0,          # Red shadows adjustment
             "gs": 0.0,          # Green shadows adjustment
             "bs": 0.0,          # Blue shadows adjustment
-            "rm": 0.0,          # Red midtones adjustment
-            "gm": 0.0,          # Green midtones adjustment
-            "bm": 0.0,          # Blue midtones adjustment
+            "rm": clamp(cast[0], -1.0, 1.0),  # Red midtones adjustment
+            "gm": clamp(cast[1], -1.0, 1.0),  # Green midtones adjustment
+            "bm": clamp(cast[2], -1.0, 1.0),  # Blue midtones adjustment
             "rh": 0.0,          # Red highlights adjustment
             "gh": 0.0,          # Green highlights adjustment
             "bh": 0.0           # Blue highlights adjustment
@@ -0,0 +1,304 @@
+"""
+Automatic multicam angle switching
+Cuts to the camera whose speaker is talking, judged from per-camera speech
+energy envelopes on the synced timeline, with a minimum shot length and
+hysteresis so the edit doesn't flicker between angles
+"""
+
+import subprocess
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+
+SAMPLE_RATE = 16000  # analysis rate; speech energy needs nothing higher
+HOP_SECONDS = 0.1  # envelope resolution
+SPEECH_BAND = (300.0, 3400.0)  # Hz, where voice energy sits (ignores rumble and hiss)
+SMOOTHING_SECONDS = 0.5
+MIN_SHOT_SECONDS = 2.0
+HYSTERESIS_DB = 4.0  # how much louder another angle must be to take over
+CHUNK_HOPS = 600  # hops decoded per streamed chunk (a minute of audio, ~2 MB)
+
+
+@dataclass
+class Shot:
+    """One angle on the synced timeline (seconds)"""
+    camera: int
+    start: float
+    end: float
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+
+def audio_envelope(path: Path, sample_rate: int = SAMPLE_RATE, hop: float = HOP_SECONDS,
+                   chunk_hops: int = CHUNK_HOPS) -> np.ndarray:
+    """
+    Speech envelope of a media file's audio (see speech_envelope), streamed.
+
+    ffmpeg's output is read chunk_hops hops at a time and each chunk reduced
+    to its envelope, so memory stays at one chunk however long the
+    recording. Empty if the audio can't be read.
+    """
+    hop_samples = int(round(sample_rate * hop))
+    chunk_bytes = chunk_hops * hop_samples * 2  # s16le
+    cmd = ["ffmpeg", "-v", "error", "-i", str(path), "-vn", "-ac", "1", "-ar", str(sample_rate),
+           "-f", "s16le", "-"]
+    try:
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    except FileNotFoundError:
+        return np.zeros(0)
+
+    envelopes = []
+    buffer = bytearray(chunk_bytes)
+    view = memoryview(buffer)
+    try:
+        while True:
+            filled = 0
+            while filled < chunk_bytes:
+                n = proc.stdout.readinto(view[filled:])
+                if not n:
+                    break
+                filled += n
+            usable = filled - filled % (hop_samples * 2)  # whole hops; a partial tail is dropped
+            if usable:
+                samples = np.frombuffer(buffer, dtype=np.int16, count=usable // 2).astype(np.float32) / 32768.0
+                envelopes.append(speech_envelope(samples, sample_rate, hop))
+            if filled < chunk_bytes:
+                break
+    finally:
+        view.release()
+        proc.stdout.close()
+        returncode = proc.wait()
+    if returncode != 0 and not envelopes:
+        return np.zeros(0)
+    return np.concatenate(envelopes) if envelopes else np.zeros(0)
+
+
+def speech_envelope(samples: np.ndarray, sample_rate: int = SAMPLE_RATE,
+                    hop: float = HOP_SECONDS) -> np.ndarray:
+    """Speech-band energy in dB per hop of the samples"""
+    hop_samples = int(round(sample_rate * hop))
+    count = len(samples) // hop_samples
+    if count == 0:
+        return np.zeros(0)
+    frames = samples[:count * hop_samples].astype(np.float64).reshape(count, hop_samples)
+    spectrum = np.abs(np.fft.rfft(frames * np.hanning(hop_samples), axis=1)) ** 2
+    freqs = np.fft.rfftfreq(hop_samples, 1.0 / sample_rate)
+    band = (freqs >= SPEECH_BAND[0]) & (freqs <= SPEECH_BAND[1])
+    return 10 * np.log10(spectrum[:, band].sum(axis=1) / hop_samples + 1e-12)
+
+
+def align_envelopes(envelopes: Sequence[np.ndarray], offsets: Sequence[float],
+                    hop: float = HOP_SECONDS) -> np.ndarray:
+    """
+    Envelopes placed on the synced timeline, one row per camera.
+
+    offsets[i] is where camera i starts on the timeline; frames a camera
+    has no media for are -inf.
+    """
+    starts = [int(round(offset / hop)) for offset in offsets]
+    length = max((start + len(env) for start, env in zip(starts, envelopes)), default=0)
+    energy = np.full((len(envelopes), length), -np.inf)
+    for row, (start, env) in enumerate(zip(starts, envelopes)):
+        energy[row, start:start + len(env)] = env
+    return energy
+
+
+def _smooth(energy: np.ndarray, frames: int) -> np.ndarray:
+    """Moving average in the power domain (dB in, dB out; -inf stays -inf)"""
+    if frames <= 1:
+        return energy
+    kernel = np.ones(frames) / frames
+    power = np.where(np.isfinite(energy), 10 ** (energy / 10), 0.0)
+    smoothed = np.array([np.convolve(row, kernel, mode='same') for row in power])
+    return np.where(np.isfinite(energy), 10 * np.log10(smoothed + 1e-12), -np.inf)
+
+
+def choose_angles(energy: np.ndarray, hop: float = HOP_SECONDS,
+                  min_shot: float = MIN_SHOT_SECONDS, hysteresis_db: float = HYSTERESIS_DB,
+                  smoothing: float = SMOOTHING_SECONDS) -> List[Shot]:
+    """
+    Angle per stretch of timeline from aligned envelopes (align_envelopes).
+
+    The loudest camera takes over once it is hysteresis_db above the current
+    one and the current shot has lasted min_shot; a camera that runs out of
+    media is cut away from immediately.
+    """
+    if energy.size == 0:
+        return []
+    level = _smooth(energy, int(round(smoothing / hop)))
+    available = np.isfinite(level)
+    loudest = level.argmax(axis=0)
+    min_frames = int(round(min_shot / hop))
+
+    current, cut = int(loudest[0]), 0
+    shots = []
+    for frame in range(1, level.shape[1]):
+        candidate = int(loudest[frame])
+        if candidate == current or not available[candidate, frame]:
+            continue
+        if available[current, frame] and (
+                frame - cut < min_frames
+                or level[candidate, frame] < level[current, frame] + hysteresis_db):
+            continue
+        shots.append(Shot(current, cut * hop, frame * hop))
+        current, cut = candidate, frame
+    shots.append(Shot(current, cut * hop, level.shape[1] * hop))
+    return shots
+
+
+def plan_switches(sources: Sequence[Path], offsets: Sequence[float],
+                  min_shot: float = MIN_SHOT_SECONDS,
+                  hysteresis_db: float = HYSTERESIS_DB) -> List[Shot]:
+    """Shots for synced camera files, from their own audio"""
+    envelopes = [audio_envelope(path) for path in sources]
+    return choose_angles(align_envelopes(envelopes, offsets),
+                         min_shot=min_shot, hysteresis_db=hysteresis_db)
+
+
+def _timecode(seconds: float, fps: float) -> str:
+    """Format seconds as timecode HH:MM:SS:FF"""
+    hours = int(seconds // 3600)
+    minutes = int((seconds % 3600) // 60)
+    secs = int(seconds % 60)
+    frames = int((seconds % 1) * fps)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}:{frames:02d}"
+
+
+def export_edl(shots: Sequence[Shot], sources: Sequence[Path], offsets: Sequence[float],
+               output_path: Path, fps: float = 30.0) -> Path:
+    """Switch list as a CMX3600 EDL (record times follow the synced timeline)"""
+    lines = ["TITLE: StudioFlow Multicam Switch", "FCM: NON-DROP FRAME", ""]
+    for i, shot in enumerate(shots, 1):
+        source = sources[shot.camera]
+        src_in = shot.start - offsets[shot.camera]
+        lines.append(f"{i:03d}  {source.stem[:8]}  V  C  "
+                     f"{_timecode(src_in, fps)} {_timecode(src_in + shot.duration, fps)} "
+                     f"{_timecode(shot.start, fps)} {_timecode(shot.end, fps)}")
+        lines.append(f"* FROM CLIP NAME: {source.name}")
+        lines.append("")
+    output_path.write_text('\n'.join(lines))
+    return output_path
+
+
+def export_fcpxml(shots: Sequence[Shot], sources: Sequence[Path], offsets: Sequence[float],
+                  output_path: Path) -> Path:
+    """Switch list as FCPXML for Resolve/FCP"""
+    def rational(seconds: float) -> str:
+        return f'{int(round(seconds * 30000))}/30000s'
+
+    fcpxml = ET.Element('fcpxml', version='1.9')
+    resources = ET.SubElement(fcpxml, 'resources')
+    ET.SubElement(resources, 'format', {
+        'id': 'r1',
+        'name': 'FFVideoFormat1080p30',
+        'frameDuration': '1001/30000s',
+        'width': '1920',
+        'height': '1080'
+    })
+    for i, source in enumerate(sources):
+        ET.SubElement(resources, 'asset', {
+            'id': f'asset{i}',
+            'name': source.stem,
+            'src': f'file://{source}',
+            'format': 'r1'
+        })
+
+    library = ET.SubElement(fcpxml, 'library')
+    event = ET.SubElement(library, 'event', name='StudioFlow Multicam')
+    project = ET.SubElement(event, 'project', name='Multicam Switch')
+    sequence = ET.SubElement(project, 'sequence', format='r1')
+    spine = ET.SubElement(sequence, 'spine')
+    for shot in shots:
+        ET.SubElement(spine, 'asset-clip', {
+            'ref': f'asset{shot.camera}',
+            'offset': rational(shot.start),
+            'duration': rational(shot.duration),
+            'start': rational(shot.start - offsets[shot.camera])
+        })
+
+    ET.ElementTree(fcpxml).write(str(output_path), encoding='UTF-8', xml_declaration=True)
+    return output_path
+
+
+def sendcmd_script(shots: Sequence[Shot]) -> str:
+    """sendcmd commands flipping the switch's streamselect at each cut"""
+    return "".join(f"{shot.start:.3f} streamselect@switch map {shot.camera};\n" for shot in shots[1:])
+
+
+def audio_camera(offsets: Sequence[float]) -> int:
+    """The camera whose audio the render keeps: the one that starts first"""
+    return min(range(len(offsets)), key=lambda i: offsets[i])
+
+
+def build_switch_command(sources: Sequence[Path], offsets: Sequence[float], shots: Sequence[Shot],
+                         output_path: Path, commands_path: Path, width: int = 1280,
+                         height: int = 720, fps: float = 30.0) -> List[str]:
+    """
+    One ffmpeg pass rendering the switch.
+
+    Every angle is decoded in step, conformed to one size and frame rate,
+    and padded at the head by its timeline offset; a streamselect changes
+    angle at each cut (driven by sendcmd from commands_path), so no angle is
+    buffered or decoded twice. Audio comes from the camera that starts first.
+    """
+    chains = []
+    for i, offset in enumerate(offsets):
+        chain = (f"[{i}:v]scale={width}:{height}:force_original_aspect_ratio=decrease,"
+                 f"pad={width}:{height}:(ow-iw)/2:(oh-ih)/2,setsar=1,fps={fps:g}")
+        if offset > 0:
+            chain += f",tpad=start_duration={offset:.3f}:color=black"
+        chains.append(chain + f"[c{i}]")
+
+    script = str(commands_path).replace("\\", "/").replace(":", "\\:").replace("'", "\\'")
+    chains.append(f"[c0]sendcmd=f='{script}'[s0]")
+    labels = "[s0]" + "".join(f"[c{i}]" for i in range(1, len(sources)))
+    chains.append(f"{labels}streamselect@switch=inputs={len(sources)}:map={shots[0].camera}[v]")
+
+    audio = audio_camera(offsets)
+    cmd = ["ffmpeg", "-hide_banner", "-y"]
+    for source in sources:
+        cmd.extend(["-i", str(source)])
+    cmd.extend([
+        "-filter_complex", ";".join(chains),
+        "-map", "[v]", "-map", f"{audio}:a?",
+        "-c:v", "libx264", "-preset", "fast", "-crf", "23",
+        "-c:a", "aac",
+        "-t", f"{shots[-1].end:.3f}",
+        str(output_path)
+    ])
+    return cmd
+
+
+def render_switch(sources: Sequence[Path], offsets: Sequence[float], shots: Sequence[Shot],
+                  output_path: Path, width: int = 1280, height: int = 720,
+                  fps: float = 30.0, timeout: Optional[float] = None):
+    """Render the switch in one pass (an ffmpeg.ProcessResult)"""
+    from studioflow.core.ffmpeg import ProcessResult
+
+    if not shots:
+        return ProcessResult(False, error_message="No shots to render")
+
+    commands_path = output_path.parent / f".{output_path.stem}_switch.cmd"
+    commands_path.write_text(sendcmd_script(shots))
+    cmd = build_switch_command(sources, offsets, shots, output_path, commands_path, width, height, fps)
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
+    except FileNotFoundError:
+        return ProcessResult(False, error_message="FFmpeg not found",
+                             suggestion="Install with: sudo apt install ffmpeg")
+    except subprocess.TimeoutExpired:
+        return ProcessResult(False, error_message="Render timed out")
+    finally:
+        commands_path.unlink(missing_ok=True)
+
+    if result.returncode != 0 or not output_path.exists():
+        return ProcessResult(False, error_message=result.stderr[-500:])
+    return ProcessResult(True, output_path=output_path,
+                         duration=shots[-1].end,
+                         file_size_mb=output_path.stat().st_size / (1024 * 1024))
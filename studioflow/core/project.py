@@ -106,13 +106,45 @@ class Project:
         else:
             return ProjectMetadata(name=self.name)
 
+    @classmethod
+    def from_metadata(cls, path: Path, metadata: Dict[str, Any]) -> "Project":
+        """Build a Project from already-known metadata (e.g. the catalog) without reading project.json"""
+        project = cls.__new__(cls)
+        project.name = path.name
+        project.config = get_config()
+        project.path = Path(path)
+        project.metadata_file = project.path / ".studioflow" / "project.json"
+        project.metadata = ProjectMetadata(**metadata)
+        return project
+
     def save_metadata(self):
         """Save project metadata"""
         self.metadata.modified_at = datetime.now()
         self.metadata_file.parent.mkdir(parents=True, exist_ok=True)
 
+        data = self.metadata.dict()
         with open(self.metadata_file, 'w') as f:
-            json.dump(self.metadata.dict(), f, indent=2, default=str)
+            json.dump(data, f, indent=2, default=str)
+
+        self._update_catalog(data)
+
+    def _catalog_tier(self) -> str:
+        storage = self.config.storage
+        if self.path.parent == storage.active:
+            return "active"
+        if storage.archive and self.path.parent == storage.archive:
+            return "archive"
+        return "other"
+
+    def _update_catalog(self, data: Dict[str, Any]):
+        """Write-through to the cross-project catalog (never fails the save)"""
+        try:
+            from studioflow.core.catalog import get_catalog
+            # Round-trip through JSON so the catalog holds exactly what project.json holds
+            get_catalog().upsert(self.path, json.loads(json.dumps(data, default=str)),
+                                 tier=self._catalog_tier())
+        except Exception:
+            pass
 
     def create(self,
                template: str = "youtube",
@@ -230,8 +262,11 @@ In this video...
         """Import media with smart organization"""
         from studioflow.core.media import MediaImporter
 
+        from studioflow.core.storage_usage import record_usage
+
         importer = MediaImporter(self)
         result = importer.import_from_path(source_path, organize=organize)
+        record_usage(self.path, result['total_files'], result['total_size'])
 
         # Update metadata
         self.metadata.media_count = result['total_files']
@@ -270,11 +305,16 @@ In this video...
 
     def archive(self) -> ProjectResult:
         """Archive project to storage"""
+        from studioflow.core.storage_usage import measure, record_move
+
         try:
             archive_path = self.config.storage.archive / self.name
 
             # Move project to archive
+            files, size = measure(self.path)
             shutil.move(str(self.path), str(archive_path))
+            record_move(self.path, archive_path, files, size)
+            self._remove_from_catalog()
 
             # Update metadata
             self.path = archive_path
@@ -292,6 +332,13 @@ In this video...
                 error=str(e)
             )
 
+    def _remove_from_catalog(self):
+        try:
+            from studioflow.core.catalog import get_catalog
+            get_catalog().remove(self.path)
+        except Exception:
+            pass
+
     def delete(self, confirm: bool = True) -> ProjectResult:
         """Delete project (with confirmation)"""
         if confirm:
@@ -299,8 +346,13 @@ In this video...
             if not Confirm.ask(f"Delete project '{self.name}'?"):
                 return ProjectResult(success=False, error="Cancelled by user")
 
+        from studioflow.core.storage_usage import measure, record_usage
+
         try:
+            files, size = measure(self.path)
             shutil.rmtree(self.path)
+            record_usage(self.path, -files, -size)
+            self._remove_from_catalog()
             return ProjectResult(success=True)
         except Exception as e:
             return ProjectResult(success=False, error=str(e))
@@ -313,25 +365,35 @@ class ProjectManager:
         self.config = get_config()
         self.projects_dir = self.config.storage.active
 
+    def catalog_roots(self) -> Dict[str, Optional[Path]]:
+        """Tier directories mirrored by the project catalog"""
+        return {"active": self.projects_dir, "archive": self.config.storage.archive}
+
     def list_projects(self, include_archived: bool = False) -> List[Project]:
-        """List all projects"""
-        projects = []
+        """List all projects (served from the catalog; tiers are rescanned only when they change)"""
+        from studioflow.core.catalog import get_catalog
+
+        catalog = get_catalog()
+        tiers = ["active"] + (["archive"] if include_archived else [])
+        roots = self.catalog_roots()
+        for tier in tiers:
+            if roots[tier]:
+                catalog.sync_root(roots[tier], tier)
 
-        # Active projects
-        if self.projects_dir.exists():
-            for path in self.projects_dir.iterdir():
-                if path.is_dir() and (path / ".studioflow" / "project.json").exists():
-                    projects.append(Project(path.name, path))
-
-        # Archived projects
-        if include_archived and self.config.storage.archive:
-            archive_dir = self.config.storage.archive
-            if archive_dir.exists():
-                for path in archive_dir.iterdir():
-                    if path.is_dir() and (path / ".studioflow" / "project.json").exists():
-                        projects.append(Project(path.name, path))
-
-        return sorted(projects, key=lambda p: p.metadata.modified_at, reverse=True)
+        projects = []
+        for entry in catalog.entries(tiers):
+            if entry.path.parent != roots[entry.tier]:
+                continue  # catalogued under a previously configured tier directory
+            try:
+                projects.append(Project.from_metadata(entry.path, entry.metadata))
+            except Exception:
+                continue  # metadata from an incompatible version; reindex repairs it
+        return projects
+
+    def reindex(self, sizes: bool = False):
+        """Rebuild the project catalog from disk (see ProjectCatalog.reindex)"""
+        from studioflow.core.catalog import get_catalog
+        return get_catalog().reindex(self.catalog_roots(), sizes=sizes)
 
     def get_project(self, name: str) -> Optional[Project]:
         """Get project by name"""
@@ -7,6 +7,8 @@ from pathlib import Path
 from typing import Optional, List, Dict, Tuple
 from dataclasses import dataclass
 
+from studioflow.core.file_index import get_file_index
+
 
 @dataclass
 class ProjectContext:
@@ -51,6 +53,9 @@ class ProjectContextManager:
 
     FOOTAGE_SUBFOLDERS = ["00_UNSORTED", "A_ROLL", "B_ROLL", "INTERVIEWS", "ARCHIVAL"]
 
+    # Seconds a file index walk is reused for the quick "has media?" checks
+    INDEX_MAX_AGE = 2.0
+
     @classmethod
     def detect_context(cls, from_path: Optional[Path] = None) -> ProjectContext:
         """Detect project context from current directory or given path"""
@@ -82,7 +87,8 @@ class ProjectContextManager:
         ctx.audio = project_path / cls.FOLDER_STRUCTURE["audio"]
         ctx.exports = project_path / cls.FOLDER_STRUCTURE["exports"]
 
-        # Check workflow state
+        # Check workflow state (one index walk of the project answers every check)
+        get_file_index(project_path)
         ctx.has_footage = cls._has_media_files(ctx.unsorted_footage) or cls._has_media_files(ctx.a_roll)
         ctx.has_normalized = cls._has_files_matching(ctx.a_roll, "*_normalized.*")
         ctx.has_transcripts = cls._has_files_matching(project_path, "*.srt") or cls._has_files_matching(project_path, "*.vtt")
@@ -118,17 +124,16 @@ class ProjectContextManager:
             return False
 
         media_exts = {'.mov', '.mp4', '.mxf', '.avi', '.mkv', '.wav', '.mp3'}
-        for f in path.iterdir():
-            if f.suffix.lower() in media_exts:
-                return True
-        return False
+        index = get_file_index(path, max_age=cls.INDEX_MAX_AGE)
+        return index.has_files(exts=media_exts, under=path, recursive=False)
 
     @classmethod
     def _has_files_matching(cls, path: Optional[Path], pattern: str) -> bool:
         """Check if path contains files matching pattern"""
         if not path or not path.exists():
             return False
-        return len(list(path.rglob(pattern))) > 0
+        index = get_file_index(path, max_age=cls.INDEX_MAX_AGE)
+        return index.has_files(under=path, pattern=pattern)
 
     @classmethod
     def get_files_for_command(cls, command: str, ctx: Optional[ProjectContext] = None) -> Tuple[List[Path], str]:
@@ -115,10 +115,10 @@ class ResolveProjectAI:
         """Deep analysis of all media files"""
 
         analyses = []
-        # Match both uppercase and lowercase extensions
-        media_files = []
-        for ext in ["*.mp4", "*.MP4", "*.mov", "*.MOV", "*.mxf", "*.MXF", "*.avi", "*.AVI"]:
-            media_files.extend(media_dir.rglob(ext))
+        # Extensions are matched case-insensitively by the index
+        from studioflow.core.file_index import get_file_index
+        index = get_file_index(media_dir)
+        media_files = [e.path for e in index.files(exts=[".mp4", ".mov", ".mxf", ".avi"], under=media_dir)]
 
         for file in media_files:
             print(f"  Analyzing: {file.name}")
@@ -288,14 +288,23 @@ class ResolveProjectAI:
             return 1
         return 0
 
+    def _visual_stats(self, file: Path) -> Optional[Dict]:
+        """Frame bus statistics (keyframes, plus consecutive frames for motion; cached per file); None if undecodable"""
+        from studioflow.core.frame_bus import clip_stats
+        return clip_stats(file) if file.exists() else None
+
     def detect_shake(self, file: Path) -> bool:
         """Detect if footage is shaky"""
-        # Would use motion vector analysis in production
+        visual = self._visual_stats(file)
+        if visual and visual.get("motion"):
+            return visual["motion"]["shaky"]
         return "handheld" in file.name.lower()
 
     def analyze_exposure(self, file: Path) -> str:
         """Analyze exposure levels"""
-        # Simplified - would analyze histogram in production
+        visual = self._visual_stats(file)
+        if visual and visual.get("exposure"):
+            return visual["exposure"]["rating"]
         return "normal"
 
     def analyze_audio_level(self, file: Path) -> str:
@@ -326,11 +335,16 @@ class ResolveProjectAI:
 
     def find_best_thumbnail_moment(self, file: Path) -> Optional[float]:
         """Find best moment for thumbnail"""
-        # Would use scene detection and composition analysis
+        from studioflow.core.thumbnail import best_thumbnail_time
+
+        best = best_thumbnail_time(file) if file.exists() else None
+        if best is not None:
+            return best
+
+        # Can't sample frames: fall back to the golden ratio
         info = FFmpegProcessor.get_media_info(file)
         duration = info.get("duration_seconds", 10)
 
-        # Use golden ratio for now
         return duration * 0.382
 
     def get_duration(self, file: Path) -> float:
@@ -340,11 +354,16 @@ class ResolveProjectAI:
 
     def detect_motion(self, file: Path) -> bool:
         """Detect if video has significant motion"""
+        visual = self._visual_stats(file)
+        if visual and visual.get("motion"):
+            return visual["motion"]["has_motion"]
         return "action" in file.name.lower() or "move" in file.name.lower()
 
     def has_black_frames(self, file: Path) -> bool:
         """Check for black frames at start/end"""
-        # Simplified check
+        visual = self._visual_stats(file)
+        if visual and visual.get("black_flash"):
+            return visual["black_flash"]["black_at_start"] or visual["black_flash"]["black_at_end"]
         return False
 
     def determine_project_settings(self) -> Dict:
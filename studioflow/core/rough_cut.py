@@ -6,10 +6,14 @@ Smart documentary features: NLP analysis, quote extraction, thematic grouping, B
 
 import re
 import json
+import bisect
+import os
 import subprocess
 import logging
+import time
+import functools
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple, Set
+from typing import List, Dict, Iterable, Optional, Sequence, Tuple, Set
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -17,6 +21,20 @@ from enum import Enum
 logger = logging.getLogger(__name__)
 
 
+def _timed(stage: str):
+    """Add the wall time of each call of an engine method to self.stage_times[stage]"""
+    def decorate(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                self.stage_times[stage] = self.stage_times.get(stage, 0.0) + time.perf_counter() - start
+        return wrapper
+    return decorate
+
+
 class CutStyle(Enum):
     DOC = "doc"
     INTERVIEW = "interview"
@@ -29,7 +47,7 @@ class CutStyle(Enum):
     EXPLAINER = "explainer"     # NEW: Concept explainers
 
 
-@dataclass
+@dataclass(slots=True)
 class Segment:
     """A segment of a clip to include in rough cut"""
     source_file: Path
@@ -42,15 +60,38 @@ class Segment:
     segment_type: str = "content"  # content, intro, outro, broll_point
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SRTEntry:
-    """Parsed SRT subtitle entry"""
+    """Parsed SRT subtitle entry (immutable: replace an entry to change its times)"""
     index: int
     start_time: float
     end_time: float
     text: str
 
 
+class EntryList(list):
+    """
+    List of SRTEntry that counts its changes, so ClipAnalysis can tell
+    when its time index went stale
+    """
+    version = 0
+
+
+def _counted(name: str):
+    method = getattr(list, name)
+    
+    @functools.wraps(method)
+    def mutate(self, *args, **kwargs):
+        self.version += 1
+        return method(self, *args, **kwargs)
+    return mutate
+
+
+for _name in ("__setitem__", "__delitem__", "__iadd__", "__imul__", "append", "extend",
+              "insert", "pop", "remove", "clear", "sort", "reverse"):
+    setattr(EntryList, _name, _counted(_name))
+
+
 @dataclass
 class ClipAnalysis:
     """Analysis of a single clip"""
@@ -87,9 +128,111 @@ class ClipAnalysis:
     # Audio marker metadata
     markers: List = field(default_factory=list)  # AudioMarker objects detected in transcript
     transcript_json_path: Optional[Path] = None  # Path to JSON transcript (for marker detection)
+    
+    # Time index over entries - built on first lookup, rebuilt when entries change
+    _entry_index: Optional[Tuple] = field(default=None, init=False, repr=False, compare=False)
+    _pause_index: Optional[Tuple] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __setattr__(self, name, value):
+        # A plain entries list is copied into an EntryList, which tells the
+        # time index about every change made through clip.entries
+        if name == "entries" and type(value) is list:
+            value = EntryList(value)
+        object.__setattr__(self, name, value)
+    
+    def _entry_times(self) -> Tuple[Sequence[float], Sequence[float]]:
+        """(start times, running maximum of end times) of the time-ordered entries"""
+        entries = self.entries
+        version = getattr(entries, "version", None)
+        index = self._entry_index
+        if index is None or index[0] is not entries or index[1] != (version, len(entries)):
+            if hasattr(entries, 'start'):
+                # EntryTable: immutable and already time-ordered, use its arrays
+                import numpy as np
+                index = (entries, (version, len(entries)), entries.start, entries.end,
+                         np.maximum.accumulate(entries.end), entries)
+            else:
+                ordered = entries
+                if any(a.start_time > b.start_time for a, b in zip(ordered, ordered[1:])):
+                    ordered = sorted(ordered, key=lambda e: e.start_time)  # self.entries stays as given
+                else:
+                    ordered = list(ordered)
+                ends = [e.end_time for e in ordered]
+                max_ends = []
+                latest = float("-inf")
+                for end in ends:
+                    latest = max(latest, end)
+                    max_ends.append(latest)
+                index = (entries, (version, len(entries)), [e.start_time for e in ordered], ends,
+                         max_ends, ordered)
+            self._entry_index = index
+        return index[2], index[4]
+    
+    def entries_by_time(self) -> Sequence[SRTEntry]:
+        """The entries in time order"""
+        self._entry_times()
+        return self._entry_index[5]
+    
+    def compact(self) -> 'ClipAnalysis':
+        """Move entries and best moments into array-backed tables (read-only from then on)
+        
+        See studioflow.core.timeline_tables; rows are still SRTEntry/Segment
+        objects when read, built on access.
+        """
+        from .timeline_tables import EntryTable, SegmentTable
+        
+        if isinstance(self.entries, list):
+            self.entries = EntryTable(self.entries)
+            self._entry_index = None
+        if isinstance(self.best_moments, list):
+            self.best_moments = SegmentTable(self.best_moments, sources=[self.file_path])
+        return self
+    
+    def entry_span(self, start: float, end: float) -> Tuple[int, int]:
+        """Index range of entries_by_time() that may overlap [start, end) (check end_time for overlapping entries)"""
+        starts, max_ends = self._entry_times()
+        if isinstance(starts, list):
+            return bisect.bisect_right(max_ends, start), bisect.bisect_left(starts, end)
+        return int(max_ends.searchsorted(start, "right")), int(starts.searchsorted(end, "left"))
+    
+    def entries_in(self, start: float, end: float) -> List[SRTEntry]:
+        """Entries overlapping [start, end), in time order"""
+        lo, hi = self.entry_span(start, end)
+        return [e for e in self.entries_by_time()[lo:hi] if e.end_time > start]
+    
+    def entry_at(self, t: float) -> Optional[SRTEntry]:
+        """Entry being spoken at time t"""
+        starts, max_ends = self._entry_times()
+        ends, entries = self._entry_index[3], self._entry_index[5]
+        if isinstance(starts, list):
+            i = bisect.bisect_right(starts, t) - 1
+        else:
+            i = int(starts.searchsorted(t, "right")) - 1
+        while i >= 0:
+            if ends[i] > t:
+                return entries[i]
+            if max_ends[i] <= t:
+                return None
+            i -= 1
+        return None
+    
+    def nearest_pause(self, t: float, min_confidence: float = 0.5) -> Optional['NaturalEditPoint']:
+        """Natural edit point closest to t (from find_natural_edit_points, cached by _find_best_moments)"""
+        pauses = getattr(self, '_cached_natural_pauses', None) or []
+        index = self._pause_index
+        if index is None or index[0] is not pauses or index[1] != (len(pauses), min_confidence):
+            confident = sorted((p for p in pauses if p.confidence > min_confidence), key=lambda p: p.timecode)
+            index = self._pause_index = (pauses, (len(pauses), min_confidence),
+                                         [p.timecode for p in confident], confident)
+        times, confident = index[2], index[3]
+        if not times:
+            return None
+        i = bisect.bisect_left(times, t)
+        candidates = [j for j in (i - 1, i) if 0 <= j < len(times)]
+        return confident[min(candidates, key=lambda j: abs(times[j] - t))]
 
 
-@dataclass
+@dataclass(slots=True)
 class Quote:
     """Extracted quote with importance scoring"""
     text: str
@@ -102,7 +245,7 @@ class Quote:
     clip: Optional['ClipAnalysis'] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class NaturalEditPoint:
     """Natural edit point (pause, sentence end, breath)"""
     timecode: float
@@ -136,7 +279,7 @@ class Theme:
     description: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class RemovedSegment:
     """Segment that was removed from rough cut"""
     segment: Segment
@@ -152,13 +295,24 @@ class ScoringConfig:
     """Centralized scoring thresholds for rough cut generation"""
     segment_threshold: float = 0.15  # Minimum score for segment inclusion
     quote_min_importance: float = 50.0  # Minimum importance for quote extraction
+    theme_min_importance: float = 60.0  # Minimum importance for quotes grouped into topics
     duplicate_overlap_pct: float = 0.3  # Overlap percentage threshold for duplicates
     merge_gap_threshold_doc: float = 2.0  # Gap threshold for merging (documentary)
     merge_gap_threshold_episode: float = 1.0  # Gap threshold for merging (episode)
     merge_gap_threshold_tutorial: float = 0.5  # Gap threshold for merging (tutorial - aggressive)
+    merge_gap_threshold_review: float = 1.0
+    merge_gap_threshold_unboxing: float = 0.5
+    merge_gap_threshold_comparison: float = 2.0
+    merge_gap_threshold_setup: float = 1.0
+    merge_gap_threshold_explainer: float = 2.0  # More aggressive for explainers
+    handle_scale: float = 1.0  # Multiplier on each style's pre/post handles
 
+    def merge_gap(self, style: CutStyle) -> float:
+        """Gap threshold for merging segments of a style"""
+        return getattr(self, f"merge_gap_threshold_{style.value}", 2.0)
 
-@dataclass
+
+@dataclass(slots=True)
 class HookCandidate:
     """Candidate hook segment for YouTube retention optimization"""
     segment: Segment
@@ -185,10 +339,33 @@ class RoughCutPlan:
     removed_segments: List[RemovedSegment] = field(default_factory=list)  # Footage that was cut
 
 
+@dataclass
+class CandidatePool:
+    """Analysis shared by every cut style, built once by RoughCutEngine.build_candidate_pool"""
+    clips: List[ClipAnalysis]
+    clip_count: int
+    moments: Optional[List[Segment]] = None  # deduplicated best moments (quality-based styles)
+    interview_segments: Optional[List[InterviewSegment]] = None
+    quotes_by_topic: Optional[Dict[str, List[Quote]]] = None
+    themes: Optional[List[Theme]] = None
+    extended_moments: Optional[List[Segment]] = None  # moments extended to sentence boundaries
+    hook_candidates: Optional[List[HookCandidate]] = None  # all, best first
+    detections: Dict[Tuple[str, Path], object] = field(default_factory=dict)  # (detector, clip) -> result
+
+
+# Clips this close in length may be copies of each other (a re-encode keeps the duration)
+SOURCE_DURATION_TOLERANCE = 0.5  # seconds
+
+
+# Styles planned by _create_quality_based_cut from the shared best moments
+QUALITY_STYLES = {CutStyle.INTERVIEW, CutStyle.EPISODE, CutStyle.TUTORIAL}
+
+
 class TranscriptAnalyzer:
     """Deep transcript analysis with NLP for smart documentary editing"""
     
-    def __init__(self):
+    def __init__(self, scoring_config: Optional[ScoringConfig] = None):
+        self.scoring_config = scoring_config or ScoringConfig()
         self._spacy_available = self._check_spacy()
         self._textblob_available = self._check_textblob()
         self._vader_available = self._check_vader()
@@ -239,8 +416,7 @@ class TranscriptAnalyzer:
             min_importance: Minimum importance score (uses scoring_config if None)
         """
         if min_importance is None:
-            # Get from engine's scoring config if available
-            min_importance = 50.0  # Default fallback
+            min_importance = self.scoring_config.quote_min_importance
         """Extract key quotes from clip transcript with importance scoring"""
         quotes = []
         
@@ -434,7 +610,7 @@ class TranscriptAnalyzer:
         # Extract quotes from all clips
         for clip in clips:
             if clip.entries:
-                quotes = self.extract_quotes(clip, min_importance=60.0)
+                quotes = self.extract_quotes(clip, min_importance=self.scoring_config.theme_min_importance)
                 all_quotes.extend(quotes)
         
         # Group by topic
@@ -517,7 +693,7 @@ class TranscriptAnalyzer:
         transcript = ' '.join(e.text for e in clip.entries) if clip.entries else ""
         
         # Extract quotes with lower threshold for better coverage
-        quotes = self.extract_quotes(clip, min_importance=50.0)  # Lowered from 70.0
+        quotes = self.extract_quotes(clip)
         
         # Extract topics
         topics = self._extract_topics_nlp(transcript) if transcript else []
@@ -806,6 +982,10 @@ class RoughCutEngine:
             'target_ratio': 0.8,  # Keep 80% of raw footage - documentary style
             'pre_handle': 1.0,   # 1 second before speech (see speaker)
             'post_handle': 0.5,  # 0.5 seconds after (breathing room)
+            # Smart documentary narrative arc: share of the target per part
+            'arc_budgets': {'hook': 0.05, 'setup': 0.10, 'act_1': 0.25, 'act_2': 0.40,
+                            'act_3': 0.15, 'conclusion': 0.05},
+            'arc_overflow': 1.1,  # an act may run 10% over its share if another runs short
         },
         CutStyle.INTERVIEW: {
             'sections': ['intro', 'q1', 'q2', 'q3', 'highlight', 'closing'],
@@ -907,11 +1087,29 @@ class RoughCutEngine:
 
     def __init__(self, scoring_config: Optional[ScoringConfig] = None):
         self.clips: List[ClipAnalysis] = []
-        self.transcript_analyzer = TranscriptAnalyzer()
+        self.scoring_config = scoring_config or ScoringConfig()
+        self.transcript_analyzer = TranscriptAnalyzer(self.scoring_config)
         self.interview_segments: List[InterviewSegment] = []
         self.themes: List[Theme] = []
-        self.scoring_config = scoring_config or ScoringConfig()
-
+        self.stage_times: Dict[str, float] = {}  # seconds per stage, see _timed
+        self._source_keys: Dict[Path, str] = {}
+        self.take_clusters: List[List[Segment]] = []  # retakes seen by the last deduplication
+        self._clips_by_path: Optional[Tuple] = None
+        self.pool: Optional[CandidatePool] = None  # see build_candidate_pool
+        self._segment_scores: Dict[str, float] = {}
+        self._broll_index_for: Optional[Tuple] = None  # (clip ids, BrollIndex), see _broll_index
+
+    def _clip_for(self, file_path: Path, clips: Optional[List[ClipAnalysis]] = None) -> Optional[ClipAnalysis]:
+        """Clip analysis of a source file (from self.clips unless given)"""
+        clips = self.clips if clips is None else clips
+        cached = self._clips_by_path
+        if cached is None or cached[0] is not clips or cached[1] != len(clips):
+            by_path = {}
+            for clip in clips:
+                by_path.setdefault(clip.file_path, clip)
+            cached = self._clips_by_path = (clips, len(clips), by_path)
+        return cached[2].get(file_path)
+    
     def _get_base_filename(self, file_path: Path) -> str:
         """Get base filename without normalized/duplicate suffixes
         
@@ -928,6 +1126,75 @@ class RoughCutEngine:
         name = re.sub(r'\s*\(\d+\)\s*$', '', name)
         return name.lower()
     
+    def _source_key(self, file_path: Path) -> str:
+        """Identity of the footage in a file: copies of the same footage share a key
+        
+        Uses perceptual fingerprints (see studioflow.core.fingerprint), so
+        re-encoded or renamed copies match and different clips that happen
+        to share a base name don't. Falls back to _get_base_filename for
+        files that can't be fingerprinted. Call _group_sources first.
+        """
+        return self._source_keys.get(file_path) or self._get_base_filename(file_path)
+    
+    def _group_sources(self, files: Set[Path]):
+        """Assign fingerprint-based source keys to files not seen before
+        
+        Stored fingerprints are used as they are. Missing ones (an ffmpeg
+        decode each) are computed for files that could be a copy of another:
+        the same size or base name, or the same duration, which re-encoded
+        and renamed copies keep.
+        """
+        new_files = [f for f in files if f not in self._source_keys]
+        if not new_files:
+            return
+        try:
+            from studioflow.core.fingerprint import get_fingerprint_index
+            index = get_fingerprint_index()
+            known = [f for f in self._source_keys if not self._source_keys[f].startswith("name:")]
+            for f in self._possible_copies(known + new_files):
+                index.fingerprint(f)
+            groups = index.groups(known + new_files)
+            fingerprinted = {f.resolve() for f in new_files if index.get(f) is not None}
+        except Exception as e:
+            logger.debug(f"Fingerprint grouping unavailable: {e}")
+            groups, fingerprinted = [], set()
+        
+        group_of = {path: f"fp:{group[0]}" for group in groups for path in group}
+        for f in new_files:
+            resolved = f.resolve()
+            if resolved in group_of:
+                self._source_keys[f] = group_of[resolved]
+            elif resolved in fingerprinted:
+                self._source_keys[f] = f"fp:{resolved}"
+            else:
+                self._source_keys[f] = f"name:{self._get_base_filename(f)}"
+        # Earlier files that joined a group with a new one
+        for f in list(self._source_keys):
+            resolved = f.resolve()
+            if resolved in group_of:
+                self._source_keys[f] = group_of[resolved]
+    
+    def _possible_copies(self, files: List[Path]) -> List[Path]:
+        """Files sharing a size, base name or duration (within SOURCE_DURATION_TOLERANCE) with another"""
+        from collections import Counter
+        
+        keys = {}
+        for f in files:
+            try:
+                keys[f] = (f.stat().st_size, self._get_base_filename(f))
+            except OSError:
+                continue  # missing files can't be fingerprinted
+        sizes = Counter(size for size, _ in keys.values())
+        names = Counter(name for _, name in keys.values())
+        found = {f for f, (size, name) in keys.items() if sizes[size] > 1 or names[name] > 1}
+        
+        timed = sorted((clip.duration, f) for f in keys
+                       if (clip := self._clip_for(f)) is not None and clip.duration > 0)
+        for (a, fa), (b, fb) in zip(timed, timed[1:]):
+            if b - a <= SOURCE_DURATION_TOLERANCE:
+                found.update((fa, fb))
+        return [f for f in keys if f in found]
+    
     def analyze_clips(self, footage_dir: Path, auto_transcribe: bool = True) -> List[ClipAnalysis]:
         """Analyze all clips and their transcripts
         
@@ -941,9 +1208,9 @@ class RoughCutEngine:
         self.clips = []
 
         # Find all video files (recursively search subdirectories)
-        video_files = []
-        for ext in ['*.mov', '*.mp4', '*.MOV', '*.MP4', '*.mxf', '*.MXF']:
-            video_files.extend(footage_dir.rglob(ext))  # Use rglob for recursive search
+        from studioflow.core.file_index import get_file_index
+        index = get_file_index(footage_dir)
+        video_files = [e.path for e in index.files(exts=['.mov', '.mp4', '.mxf'], under=footage_dir)]
         
         # Filter out ONLY normalized versions if original exists
         # Keep ALL numbered versions (1), (2), etc. - they're different takes!
@@ -1022,6 +1289,7 @@ class RoughCutEngine:
 
         return self.clips
     
+    @_timed('transcription')
     def _generate_transcript(self, video_path: Path, include_json: bool = False) -> Optional[Path]:
         """Generate transcript using Whisper if available
         
@@ -1043,6 +1311,7 @@ class RoughCutEngine:
         
         return None
     
+    @_timed('audio_normalization')
     def _ensure_normalized_audio(self, video_file: Path, target_lufs: float = -14.0) -> Optional[Path]:
         """Ensure audio is normalized to target LUFS (YouTube standard: -14 LUFS)
         
@@ -1085,7 +1354,13 @@ class RoughCutEngine:
         import subprocess
         import re
         import json
-        
+        from .cache import get_cache
+
+        loudness_cache = get_cache("loudness")
+        cached = loudness_cache.get(video_file)
+        if cached is not None:
+            return cached
+
         try:
             cmd = [
                 "ffmpeg", "-i", str(video_file),
@@ -1098,14 +1373,31 @@ class RoughCutEngine:
             json_match = re.search(r'\{[^}]+\}', result.stderr[::-1])
             if json_match:
                 stats = json.loads(json_match.group()[::-1])
-                return float(stats.get('input_i', -70))
+                lufs = float(stats.get('input_i', -70))
+                loudness_cache.put(video_file, lufs)
+                return lufs
         except:
             pass
         
         return None
 
+    @_timed('clip_analysis')
     def _analyze_single_clip(self, video_path: Path) -> ClipAnalysis:
-        """Analyze a single clip"""
+        """Analyze a single clip (cached until the clip or its transcript changes)"""
+        from .cache import get_cache, file_key
+
+        analysis_cache = get_cache("clip_analysis", copy_on_read=True)
+        srt_candidate = video_path.with_suffix('.srt')
+        cache_tag = repr((file_key(srt_candidate), self.scoring_config))
+        cached = analysis_cache.get(video_path, tag=cache_tag)
+        if cached is not None:
+            return cached
+
+        analysis = self._analyze_single_clip_uncached(video_path)
+        analysis_cache.put(video_path, analysis, tag=cache_tag)
+        return analysis
+
+    def _analyze_single_clip_uncached(self, video_path: Path) -> ClipAnalysis:
         import subprocess
 
         # Get duration
@@ -1128,8 +1420,9 @@ class RoughCutEngine:
         shot_type = self._infer_shot_type(video_path, duration)
         content_type = self._infer_content_type(video_path)
         quality_score = self._estimate_quality_score(video_path, duration)
-        is_shaky = self._detect_shake(video_path)
-        exposure_rating = self._analyze_exposure(video_path)
+        visual = self._visual_stats(video_path)
+        is_shaky = self._detect_shake(video_path, visual)
+        exposure_rating = self._analyze_exposure(video_path, visual)
         audio_level = self._analyze_audio_level(video_path)
         
         # Parse filename convention metadata
@@ -1168,7 +1461,8 @@ class RoughCutEngine:
                 analysis.filler_regions = self._find_filler_regions(analysis.entries)
                 analysis.best_moments = self._find_best_moments(analysis)
 
-        return analysis
+        # Clips stay alive (and cached) for the whole plan: keep them compact
+        return analysis.compact()
     
     def _infer_shot_type(self, video_path: Path, duration: float) -> Optional[str]:
         """Infer shot type from filename and duration"""
@@ -1261,15 +1555,24 @@ class RoughCutEngine:
         
         return min(100.0, max(0.0, score))
     
-    def _detect_shake(self, video_path: Path) -> bool:
-        """Detect if footage is shaky (simplified heuristic)"""
+    def _visual_stats(self, video_path: Path) -> Optional[Dict]:
+        """Frame bus statistics (keyframes, plus consecutive frames for motion; cached per file); None if undecodable"""
+        if not video_path.exists():
+            return None
+        from studioflow.core.frame_bus import clip_stats
+        return clip_stats(video_path)
+
+    def _detect_shake(self, video_path: Path, visual: Optional[Dict] = None) -> bool:
+        """Detect if footage is shaky (camera jitter between frames, else the filename)"""
+        if visual and visual.get("motion"):
+            return visual["motion"]["shaky"]
         name_lower = video_path.stem.lower()
-        # Would use motion vector analysis in production
         return "handheld" in name_lower or "shaky" in name_lower
     
-    def _analyze_exposure(self, video_path: Path) -> Optional[str]:
-        """Analyze exposure levels (simplified - would use histogram in production)"""
-        # For now, return None (unknown) - can be enhanced with FFmpeg histogram analysis
+    def _analyze_exposure(self, video_path: Path, visual: Optional[Dict] = None) -> Optional[str]:
+        """Analyze exposure levels from the luma histogram (None if unknown)"""
+        if visual and visual.get("exposure"):
+            return visual["exposure"]["rating"]
         return None
     
     def _analyze_audio_level(self, video_path: Path) -> Optional[str]:
@@ -1474,8 +1777,6 @@ class RoughCutEngine:
             else:
                 clip._cached_natural_pauses = []
         
-        pause_times = {p.timecode for p in clip._cached_natural_pauses if p.confidence > 0.5}
-        
         # Build continuous segments, ONLY breaking at:
         # 1. Natural pauses (>3 seconds) AND
         # 2. Complete sentence boundaries (ends with . ! ?)
@@ -1522,10 +1823,8 @@ class RoughCutEngine:
                         has_pause_before = True
                     else:
                         # Check if there's a pause marker near this gap (within 1s)
-                        for pause_time in pause_times:
-                            if abs(pause_time - prev_entry.end_time) < 1.0:
-                                has_pause_before = True
-                                break
+                        pause = clip.nearest_pause(prev_entry.end_time)
+                        has_pause_before = pause is not None and abs(pause.timecode - prev_entry.end_time) < 1.0
                 
                 # CRITICAL: Only break segment if:
                 # 1. Previous entry ended a complete sentence AND
@@ -1604,7 +1903,13 @@ class RoughCutEngine:
         return sorted(moments, key=lambda x: x.score, reverse=True)
 
     def _score_segment(self, text: str) -> float:
-        """Score a segment for quality/interest"""
+        """Score a segment for quality/interest (memoized per text)"""
+        score = self._segment_scores.get(text)
+        if score is None:
+            score = self._segment_scores[text] = self._score_segment_uncached(text)
+        return score
+    
+    def _score_segment_uncached(self, text: str) -> float:
         # Base score: all speech has value
         score = 0.2
         text_lower = text.lower()
@@ -1685,10 +1990,41 @@ class RoughCutEngine:
 
         return merged
     
+    def _take_score(self, seg: Segment, clip: Optional[ClipAnalysis]) -> Tuple:
+        """Rank takes of the same line: content score, then completeness, then latest take"""
+        score = self._score_segment(seg.text)
+        if clip is not None and clip.is_mistake:
+            score -= 1.0
+        complete = seg.text.strip()[-1:] in ('.', '!', '?')
+        take = clip.take_number if clip is not None and clip.take_number else 0
+        # Retakes usually fix the earlier attempt: later takes win ties
+        return (score, complete, seg.score, take, seg.start_time)
+    
+    def _pick_takes(self, segments: List[Segment]) -> List[Segment]:
+        """Keep the best take of every line that was recorded more than once
+        
+        Retakes are found across all clips by MinHash/LSH over the segment
+        text (see studioflow.core.takes); segments without a retake pass
+        through unchanged.
+        """
+        from studioflow.core.takes import cluster_takes
+        
+        picked = []
+        self.take_clusters = []
+        for cluster in cluster_takes([seg.text or "" for seg in segments]):
+            takes = [segments[i] for i in cluster]
+            best = max(takes, key=lambda seg: self._take_score(seg, self._clip_for(seg.source_file)))
+            picked.append(best)
+            if len(takes) > 1:
+                self.take_clusters.append(takes)
+        return picked
+    
+    @_timed('deduplication')
     def _deduplicate_segments(self, segments: List[Segment]) -> List[Segment]:
         """Remove duplicate or heavily overlapping segments - AGGRESSIVE
         
         Now removes:
+        - Retakes of the same line, in any clip (best take kept, see _pick_takes)
         - Exact duplicates (same file, same time range)
         - Segments with >30% overlap (was 50%)
         - Segments that are subsets of existing segments
@@ -1697,9 +2033,13 @@ class RoughCutEngine:
         if not segments:
             return []
         
+        segments = self._pick_takes(segments)
+        
         # Sort by score (descending) and start time
         sorted_segs = sorted(segments, key=lambda x: (-x.score, str(x.source_file), x.start_time))
+        self._group_sources({seg.source_file for seg in segments})
         unique = []
+        unique_by_source: Dict[str, List[Segment]] = {}
         seen_ranges = set()
         
         for seg in sorted_segs:
@@ -1710,17 +2050,17 @@ class RoughCutEngine:
             if range_key in seen_ranges:
                 continue
             
-            # Get base filename for normalized duplicate detection
-            seg_base = self._get_base_filename(seg.source_file)
+            # Footage identity for normalized/renamed/re-encoded duplicate detection
+            seg_base = self._source_key(seg.source_file)
             
             # Check for significant overlap with existing segments from same file OR same base file
             overlaps = False
             is_subset = False
             seg_duration = seg.end_time - seg.start_time
             
-            # Check against all existing segments
-            for existing in unique:
-                existing_base = self._get_base_filename(existing.source_file)
+            # Only segments of the same footage can overlap
+            for existing in unique_by_source.get(seg_base, []):
+                existing_base = self._source_key(existing.source_file)
                 
                 # Check if same file OR same base file (normalized/duplicate version)
                 same_source = (
@@ -1785,22 +2125,22 @@ class RoughCutEngine:
                                 if similarity > 0.5:  # More than 50% word overlap
                                     overlaps = True
                                     break
-                
-                # Early exit: if we've passed this file's segments, no need to check further
-                if existing.source_file > seg.source_file:
-                    break
             
             if not overlaps and not is_subset:
                 unique.append(seg)
+                unique_by_source.setdefault(seg_base, []).append(seg)
                 seen_ranges.add(range_key)
         
         # Post-process: Remove any segments that are subsets of others
         # (This handles cases where we couldn't remove during iteration safely)
+        by_file: Dict[Path, List[Segment]] = {}
+        for seg in unique:
+            by_file.setdefault(seg.source_file, []).append(seg)
         final_unique = []
         for seg in unique:
             is_subset_of_any = False
-            for other in unique:
-                if seg != other and seg.source_file == other.source_file:
+            for other in by_file[seg.source_file]:
+                if seg is not other:
                     if (seg.start_time >= other.start_time and seg.end_time <= other.end_time):
                         is_subset_of_any = True
                         break
@@ -1809,6 +2149,7 @@ class RoughCutEngine:
         
         return final_unique
 
+    @_timed('planning')
     def create_rough_cut(self, style: CutStyle, target_duration: Optional[float] = None, 
                         use_smart_features: bool = True, use_audio_markers: bool = False) -> RoughCutPlan:
         """Create a rough cut plan based on style
@@ -1854,6 +2195,104 @@ class RoughCutEngine:
         # Original quality-based approach for other styles (INTERVIEW, EPISODE, TUTORIAL)
         return self._create_quality_based_cut(style, target_duration, style_config)
     
+    def _shared_pool(self, clips: Optional[List[ClipAnalysis]] = None) -> Optional[CandidatePool]:
+        """The candidate pool, if it was built for these clips (self.clips by default)"""
+        clips = self.clips if clips is None else clips
+        pool = self.pool
+        if pool is not None and pool.clips is clips and pool.clip_count == len(clips):
+            return pool
+        return None
+    
+    @_timed('candidate_pool')
+    def build_candidate_pool(self, styles: Optional[Iterable[CutStyle]] = None) -> CandidatePool:
+        """Compute the analysis every requested style draws from, once
+        
+        Natural edit points, deduplicated best moments, interview segments,
+        topic quotes, themes and hook candidates. create_rough_cut uses the
+        pool while it matches self.clips; style-specific detections are
+        memoized into it as they are made.
+        """
+        if not self.clips:
+            raise ValueError("No clips analyzed. Call analyze_clips() first.")
+        styles = set(styles) if styles is not None else set(CutStyle)
+        pool = CandidatePool(clips=self.clips, clip_count=len(self.clips))
+        self.pool = None
+        
+        for clip in self.clips:
+            if clip.entries:
+                if not hasattr(clip, '_cached_natural_pauses'):
+                    clip._cached_natural_pauses = self.transcript_analyzer.find_natural_edit_points(clip)
+                clip._cached_edit_points = clip._cached_natural_pauses
+        
+        if styles & QUALITY_STYLES:
+            pool.moments = self._deduplicate_segments([m for c in self.clips for m in c.best_moments])
+        if CutStyle.DOC in styles:
+            pool.interview_segments = self._analyze_interviews([c for c in self.clips if c.has_speech])
+            pool.quotes_by_topic = self.transcript_analyzer.extract_topics(self.clips)
+            self._broll_index([c for c in self.clips if not c.has_speech])
+        pool.hook_candidates = self._generate_hook_candidates(self.clips, max_hooks=None)
+        
+        self.pool = pool
+        if CutStyle.DOC in styles:
+            pool.themes = self._organize_by_themes()
+        return pool
+    
+    def _detect(self, detector: str, clip: ClipAnalysis):
+        """TranscriptAnalyzer detector result for a clip, memoized in the candidate pool"""
+        pool = self._shared_pool()
+        if pool is None:
+            return getattr(self.transcript_analyzer, detector)(clip)
+        key = (detector, clip.file_path)
+        if key not in pool.detections:
+            pool.detections[key] = getattr(self.transcript_analyzer, detector)(clip)
+        return pool.detections[key]
+    
+    def create_rough_cuts(self, styles: Iterable[CutStyle], target_duration: Optional[float] = None,
+                          use_audio_markers: bool = False, workers: Optional[int] = None) -> Dict[CutStyle, RoughCutPlan]:
+        """Plan several styles from one candidate pool
+        
+        The pool is built once, then the styles are planned in parallel
+        worker processes forked from this one (they inherit the pool without
+        copying it). workers=1, or a platform without fork, plans them one
+        after another.
+        
+        Args:
+            styles: Styles to plan (DOC uses the smart documentary features)
+            target_duration: Target duration in seconds (style default if None)
+            use_audio_markers: Use audio markers for segment extraction (if markers detected)
+            workers: Worker processes (default: one per style, up to the CPU count)
+        """
+        styles = list(dict.fromkeys(styles))
+        self.build_candidate_pool(styles)
+        
+        if workers is None:
+            workers = min(len(styles), os.cpu_count() or 1)
+        if workers <= 1 or len(styles) <= 1 or not hasattr(os, 'fork'):
+            return {style: self._plan_style(style, target_duration, use_audio_markers) for style in styles}
+        
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+        
+        global _forked_engine
+        _forked_engine = self
+        try:
+            with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('fork')) as executor:
+                futures = {style: executor.submit(_plan_style_in_worker, style, target_duration, use_audio_markers)
+                           for style in styles}
+                plans = {style: future.result() for style, future in futures.items()}
+        finally:
+            _forked_engine = None
+        
+        for plan in plans.values():
+            plan.clips = self.clips  # not sent back from the worker
+        return plans
+    
+    def _plan_style(self, style: CutStyle, target_duration: Optional[float],
+                    use_audio_markers: bool) -> RoughCutPlan:
+        return self.create_rough_cut(style, target_duration=target_duration,
+                                     use_smart_features=(style == CutStyle.DOC),
+                                     use_audio_markers=use_audio_markers)
+    
     def _create_marker_based_cut(self, style: CutStyle, target_duration: Optional[float],
                                  clips_with_markers: List[ClipAnalysis]) -> RoughCutPlan:
         """Create rough cut from audio markers"""
@@ -1899,42 +2338,23 @@ class RoughCutEngine:
             removed_segments=[]
         )
     
-    def _create_quality_based_cut(self, style: CutStyle, target_duration: Optional[float],
-                                  style_config: Dict) -> RoughCutPlan:
-        """Original quality-based rough cut with removed segments tracking"""
-        # Collect all good segments
-        all_segments = []
-        for clip in self.clips:
-            all_segments.extend(clip.best_moments)
-        
-        # Remove duplicates and overlapping segments (merge happens at final output)
-        all_segments = self._deduplicate_segments(all_segments)
-
-        # Sort by score
-        all_segments.sort(key=lambda x: x.score, reverse=True)
-
-        # Calculate target duration
-        total_raw = sum(c.duration for c in self.clips)
-        if target_duration is None:
-            target_duration = total_raw * style_config['target_ratio']
-
-        # CRITICAL: Extend segments to complete sentence boundaries before selection
-        # This ensures we never cut mid-sentence or cut off speech
+    @_timed('sentence_extension')
+    def _extend_to_sentences(self, segments: List[Segment]) -> List[Segment]:
+        """Extend segments (in order) to complete sentence boundaries of their clip's entries"""
         extended_segments = []
-        for seg in all_segments:
+        for seg in segments:
             # Find the clip this segment belongs to
-            clip = next((c for c in self.clips if c.file_path == seg.source_file), None)
+            clip = self._clip_for(seg.source_file)
             if clip and clip.entries and seg.text:
                 # Find entries that overlap with this segment
-                overlapping_entries = [
-                    e for e in clip.entries
-                    if not (e.end_time <= seg.start_time or e.start_time >= seg.end_time)
-                ]
+                lo, hi = clip.entry_span(seg.start_time, seg.end_time)
+                entries = clip.entries_by_time()
+                overlapping = [i for i in range(lo, hi) if entries[i].end_time > seg.start_time]
                 
-                if overlapping_entries:
+                if overlapping:
                     # Find the first entry that overlaps
-                    first_entry = overlapping_entries[0]
-                    first_entry_idx = clip.entries.index(first_entry)
+                    first_entry_idx = overlapping[0]
+                    first_entry = entries[first_entry_idx]
                     actual_start = first_entry.start_time
                     
                     # Check if segment text starts mid-sentence
@@ -1949,7 +2369,7 @@ class RoughCutEngine:
                         # Look backwards to find where sentence actually starts
                         found_sentence_start = False
                         for j in range(first_entry_idx - 1, -1, -1):
-                            prev_entry = clip.entries[j]
+                            prev_entry = entries[j]
                             prev_text = prev_entry.text.strip()
                             
                             # If previous entry ends with sentence punctuation, we found the start
@@ -1981,17 +2401,17 @@ class RoughCutEngine:
                                 actual_start = max(0.0, first_entry.start_time - 1.0)  # 1s padding at start
                     
                     # Find the last entry that overlaps
-                    last_entry = overlapping_entries[-1]
-                    last_entry_idx = clip.entries.index(last_entry)
+                    last_entry_idx = overlapping[-1]
+                    last_entry = entries[last_entry_idx]
                     actual_end = last_entry.end_time
                     
                     # Check if segment text ends mid-sentence
                     ends_mid_sentence = seg_text and seg_text[-1] not in '.!?'
                     
-                    if ends_mid_sentence and last_entry_idx < len(clip.entries) - 1:
+                    if ends_mid_sentence and last_entry_idx < len(entries) - 1:
                         # Look forwards to find where sentence actually ends
-                        for j in range(last_entry_idx + 1, len(clip.entries)):
-                            next_entry = clip.entries[j]
+                        for j in range(last_entry_idx + 1, len(entries)):
+                            next_entry = entries[j]
                             next_text = next_entry.text.strip()
                             
                             # Extend to include this entry
@@ -2027,13 +2447,72 @@ class RoughCutEngine:
                 # No clip or entries - use segment as-is
                 extended_segments.append(seg)
         
-        # Use extended segments for selection
-        all_segments = extended_segments
+        return extended_segments
+    
+    def _handles(self, style: CutStyle, pre_default: float = 0.0,
+                 post_default: float = 0.0) -> Tuple[float, float]:
+        """Pre/post handles of a style, scaled by scoring_config.handle_scale"""
+        style_config = self.STYLE_STRUCTURES.get(style, {})
+        scale = self.scoring_config.handle_scale
+        return (style_config.get('pre_handle', pre_default) * scale,
+                style_config.get('post_handle', post_default) * scale)
+    
+    @_timed('selection')
+    def _fill_target_duration(self, segments: List[Segment], target_duration: float, handles: float = 0.0,
+                              weight=None) -> Tuple[List[Segment], List[Segment]]:
+        """
+        Split segments into (selected, rejected), both in input order.
+
+        Selects the set with the most score-seconds (weight(seg), default
+        seg.score, times its duration) whose durations plus handles fit in
+        target_duration, instead of filling greedily by score.
+        """
+        from studioflow.core.segment_selection import knapsack
+        
+        weight = weight or (lambda seg: seg.score)
+        durations = [seg.end_time - seg.start_time for seg in segments]
+        selection = knapsack([d + handles for d in durations],
+                             [max(0.0, weight(seg)) * d for seg, d in zip(segments, durations)],
+                             target_duration)
+        chosen = set(selection.indices)
+        return ([seg for i, seg in enumerate(segments) if i in chosen],
+                [seg for i, seg in enumerate(segments) if i not in chosen])
+    
+    def _create_quality_based_cut(self, style: CutStyle, target_duration: Optional[float],
+                                  style_config: Dict) -> RoughCutPlan:
+        """Original quality-based rough cut with removed segments tracking"""
+        # Collect all good segments
+        all_segments = []
+        for clip in self.clips:
+            all_segments.extend(clip.best_moments)
         
-        # Select segments to fit target duration (optimized to keep good footage)
-        selected = []
+        # Remove duplicates and overlapping segments (merge happens at final output)
+        pool = self._shared_pool()
+        if pool is not None and pool.moments is not None:
+            all_segments = list(pool.moments)
+        else:
+            all_segments = self._deduplicate_segments(all_segments)
+
+        # Sort by score
+        all_segments.sort(key=lambda x: x.score, reverse=True)
+
+        # Calculate target duration
+        total_raw = sum(c.duration for c in self.clips)
+        if target_duration is None:
+            target_duration = total_raw * style_config['target_ratio']
+
+        # CRITICAL: Extend segments to complete sentence boundaries before selection
+        # This ensures we never cut mid-sentence or cut off speech
+        if pool is not None and pool.moments is not None:
+            if pool.extended_moments is None:
+                pool.extended_moments = self._extend_to_sentences(all_segments)
+            all_segments = list(pool.extended_moments)
+        else:
+            all_segments = self._extend_to_sentences(all_segments)
+        
+        # Filter segments, then fit the rest to the target duration
+        candidates = []
         removed = []
-        current_duration = 0
         
         # Use scoring config threshold (Phase 3: Unify scoring thresholds)
         min_score_threshold = self.scoring_config.segment_threshold
@@ -2082,9 +2561,9 @@ class RoughCutEngine:
                 ))
                 continue
 
-            # Check for duplicates before adding
+            # Check for duplicates of better candidates before adding
             is_duplicate = False
-            for existing in selected:
+            for existing in candidates:
                 if seg.source_file == existing.source_file:
                     # Check if this segment overlaps significantly with existing
                     overlap_start = max(seg.start_time, existing.start_time)
@@ -2109,33 +2588,23 @@ class RoughCutEngine:
             if is_duplicate:
                 continue
             
-            # Phase 6: Include handles in duration calculation
-            pre_handle = style_config.get('pre_handle', 0.0)
-            post_handle = style_config.get('post_handle', 0.0)
-            seg_duration_with_handles = seg_duration + pre_handle + post_handle
-            
-            if current_duration + seg_duration_with_handles <= target_duration:
-                selected.append(seg)
-                current_duration += seg_duration_with_handles
-            else:
-                # Exceeds target duration - but check if it's high quality
-                # More aggressive: keep high-quality segments even if slightly over
-                # Phase 6: Include handles in duration calculation
-                if seg.score > 0.7:  # Very high quality - keep it anyway
-                    selected.append(seg)
-                    current_duration += seg_duration_with_handles
-                elif seg.score > 0.6 and (current_duration + seg_duration_with_handles) <= target_duration * 1.1:
-                    # Good quality, allow 10% overflow
-                    selected.append(seg)
-                    current_duration += seg_duration_with_handles
-                else:
-                    removed.append(RemovedSegment(
-                        segment=seg,
-                        reason=f"duration_limit (would exceed {target_duration:.1f}s)",
-                        score=seg.score
-                    ))
+            candidates.append(seg)
+        
+        # Pick the candidates that best fill the target (Phase 6: handles count toward it)
+        handles = sum(self._handles(style))
+        selected, over = self._fill_target_duration(candidates, target_duration, handles)
+        for seg in over:
+            removed.append(RemovedSegment(
+                segment=seg,
+                reason=f"duration_limit (would exceed {target_duration:.1f}s)",
+                score=seg.score
+            ))
+
+        # Episodes and tutorials join picks split by a short pause
+        if style in (CutStyle.EPISODE, CutStyle.TUTORIAL):
+            selected = self._merge_adjacent_segments(selected, gap_threshold=self.scoring_config.merge_gap(style))
         
-        # Organize into structure (merge happens at final output)
+        # Organize into structure
         structure = self._organize_by_structure(selected, style)
 
         # Flatten structure back to ordered segments
@@ -2216,13 +2685,17 @@ class RoughCutEngine:
         # B-roll clips are those without speech (or with minimal speech)
         broll_clips = [c for c in self.clips if not c.has_speech]
         
-        self.interview_segments = []
-        for clip in interview_clips:
-            segment = self.transcript_analyzer.analyze_interview_segment(clip)
-            self.interview_segments.append(segment)
+        pool = self._shared_pool()
+        if pool is not None and pool.interview_segments is not None:
+            self.interview_segments = list(pool.interview_segments)
+        else:
+            self.interview_segments = self._analyze_interviews(interview_clips)
         
         # 2. Organize by themes
-        self.themes = self._organize_by_themes()
+        if pool is not None and pool.themes is not None:
+            self.themes = list(pool.themes)
+        else:
+            self.themes = self._organize_by_themes()
         
         # 3. Build narrative arc
         narrative_arc = self._build_narrative_arc(target_duration)
@@ -2300,10 +2773,19 @@ class RoughCutEngine:
         
         return removed
     
+    @_timed('interview_analysis')
+    def _analyze_interviews(self, clips: List[ClipAnalysis]) -> List[InterviewSegment]:
+        return [self.transcript_analyzer.analyze_interview_segment(clip) for clip in clips]
+    
+    @_timed('themes')
     def _organize_by_themes(self) -> List[Theme]:
         """Organize interview segments by topics/themes"""
         # Extract all quotes grouped by topic
-        topics_dict = self.transcript_analyzer.extract_topics(self.clips)
+        pool = self._shared_pool()
+        if pool is not None and pool.quotes_by_topic is not None:
+            topics_dict = pool.quotes_by_topic
+        else:
+            topics_dict = self.transcript_analyzer.extract_topics(self.clips)
         
         themes = []
         theme_order = {
@@ -2345,6 +2827,7 @@ class RoughCutEngine:
         themes.sort(key=lambda t: t.order)
         return themes
     
+    @_timed('narrative_arc')
     def _build_narrative_arc(self, target_duration: Optional[float]) -> Dict[str, List[Segment]]:
         """Build documentary narrative arc: hook → setup → act1 → act2 → act3 → conclusion"""
         arc = {
@@ -2363,14 +2846,8 @@ class RoughCutEngine:
         if target_duration is None:
             target_duration = sum(s.duration for s in self.interview_segments) * 0.6
         
-        act_durations = {
-            'hook': target_duration * 0.05,      # 5%
-            'setup': target_duration * 0.10,     # 10%
-            'act_1': target_duration * 0.25,      # 25%
-            'act_2': target_duration * 0.40,      # 40%
-            'act_3': target_duration * 0.15,      # 15%
-            'conclusion': target_duration * 0.05  # 5%
-        }
+        doc_config = self.STYLE_STRUCTURES[CutStyle.DOC]
+        act_durations = {part: target_duration * share for part, share in doc_config['arc_budgets'].items()}
         
         # Hook: Best emotional moment or most compelling question
         # Pre-compute all quotes with their segment references for efficiency
@@ -2400,17 +2877,20 @@ class RoughCutEngine:
             if seg:
                 arc['setup'].append(seg)
         
-        # Act 1: Problem/conflict (thematic sections)
-        problem_themes = [t for t in self.themes if 'problem' in t.name.lower() or t.order == 2]
-        arc['act_1'] = self._themes_to_segments(problem_themes, act_durations['act_1'])
-        
-        # Act 2: Deep dive (personal stories, expert opinions)
-        deep_themes = [t for t in self.themes if t.order in [3, 4]]
-        arc['act_2'] = self._themes_to_segments(deep_themes, act_durations['act_2'])
-        
-        # Act 3: Resolution/solutions
-        solution_themes = [t for t in self.themes if 'solution' in t.name.lower() or t.order == 5]
-        arc['act_3'] = self._themes_to_segments(solution_themes, act_durations['act_3'])
+        # Acts, chosen together so an act that runs short leaves room for the others
+        act_themes = {
+            # Act 1: Problem/conflict (thematic sections)
+            'act_1': [t for t in self.themes if 'problem' in t.name.lower() or t.order == 2],
+            # Act 2: Deep dive (personal stories, expert opinions)
+            'act_2': [t for t in self.themes if t.order in [3, 4]],
+            # Act 3: Resolution/solutions
+            'act_3': [t for t in self.themes if 'solution' in t.name.lower() or t.order == 5],
+        }
+        arc.update(self._acts_to_segments(
+            act_themes,
+            {act: act_durations[act] * doc_config['arc_overflow'] for act in act_themes},
+            sum(act_durations[act] for act in act_themes)
+        ))
         
         # Conclusion: Wrap up
         conclusion_quotes = [(q, s) for q, s in all_quotes_with_segments if q.topic == 'conclusion']
@@ -2470,37 +2950,53 @@ class RoughCutEngine:
         )
     
     def _themes_to_segments(self, themes: List[Theme], target_duration: float) -> List[Segment]:
-        """Convert themes to segments, selecting best quotes - optimized for quality"""
-        segments = []
-        current_duration = 0.0
-        
-        # Sort themes by order (narrative importance)
-        themes_sorted = sorted(themes, key=lambda t: t.order)
+        """Convert themes to segments, selecting the quotes that best fill target_duration"""
+        return self._acts_to_segments({'act': themes}, {'act': target_duration}, target_duration)['act']
+    
+    @_timed('selection')
+    def _acts_to_segments(self, act_themes: Dict[str, List[Theme]], budgets: Dict[str, float],
+                          target_duration: float) -> Dict[str, List[Segment]]:
+        """
+        Convert each act's themes to segments.
         
-        for theme in themes_sorted:
-            # Quotes are already sorted by importance_score in theme
-            for quote in theme.key_quotes:
-                if current_duration >= target_duration:
-                    break
-                
-                seg = self._quote_to_segment(quote)
-                if seg:
-                    seg_duration = seg.end_time - seg.start_time
-                    
-                    # Allow slight overflow for high-quality quotes
-                    if current_duration + seg_duration <= target_duration * 1.1:  # 10% tolerance
-                        segments.append(seg)
-                        current_duration += seg_duration
-                    elif quote.importance_score > 85.0:  # Very high quality - include anyway
+        Quotes are chosen together to maximize importance-seconds with every
+        act within its budget and all acts within target_duration. Each act
+        keeps narrative order: themes by order, then quotes by importance.
+        """
+        from studioflow.core.segment_selection import select_by_section
+        
+        segments, values, acts = [], [], []
+        for act, themes in act_themes.items():
+            for theme in sorted(themes, key=lambda t: t.order):
+                for quote in theme.key_quotes:
+                    seg = self._quote_to_segment(quote)
+                    if seg:
                         segments.append(seg)
-                        current_duration += seg_duration
-        
-        return segments
+                        values.append(quote.importance_score / 100.0 * (seg.end_time - seg.start_time))
+                        acts.append(act)
+        
+        selection = select_by_section([seg.end_time - seg.start_time for seg in segments], values,
+                                      acts, budgets, target_duration)
+        result = {act: [] for act in act_themes}
+        for i in selection.indices:
+            result[acts[i]].append(segments[i])
+        return result
     
+    @_timed('broll_matching')
     def _add_broll_to_segments(self, narrative_arc: Dict[str, List[Segment]], 
                                broll_clips: List[ClipAnalysis]) -> Dict[str, List[Segment]]:
-        """Match and insert B-roll clips into interview segments"""
+        """Match and insert B-roll clips into interview segments
+        
+        Every segment with a transcript is matched in one pass against a
+        TF-IDF index of the B-roll (see studioflow.core.broll_index).
+        """
+        index = self._broll_index(broll_clips)
+        spoken = [seg for segments in narrative_arc.values() for seg in segments if seg.text]
+        matches = index.match([self._broll_query(seg) for seg in spoken]) if broll_clips else []
+        matches_by_segment = {id(seg): found for seg, found in zip(spoken, matches)}
+        
         enhanced_arc = {}
+        broll_shots: Dict[Path, List[Tuple[float, float]]] = {}
         
         for section_name, segments in narrative_arc.items():
             enhanced_segments = []
@@ -2509,66 +3005,80 @@ class RoughCutEngine:
                 # Add interview segment
                 enhanced_segments.append(seg)
                 
-                # Find matching B-roll
-                if seg.text:  # Has transcript
-                    # Extract keywords from segment text
-                    keywords = self.transcript_analyzer._extract_keywords(seg.text)
-                    topic = seg.topic or "general"
-                    
-                    # Match B-roll
-                    matches = self._match_broll_to_interview(seg, keywords, topic, broll_clips)
-                    
-                    # Insert B-roll after segment (or at natural points)
-                    for broll, score in matches[:2]:  # Top 2 matches
-                        broll_seg = Segment(
-                            source_file=broll.file_path,
-                            start_time=0.0,
-                            end_time=min(10.0, broll.duration),  # Max 10 seconds of B-roll
-                            text="",
-                            topic=topic,
-                            score=score,
-                            segment_type="broll"
-                        )
-                        enhanced_segments.append(broll_seg)
+                # Insert B-roll after segment (top matches first)
+                for clip_index, score in matches_by_segment.get(id(seg), []):
+                    broll = broll_clips[clip_index]
+                    start, end = self._next_broll_shot(broll, broll_shots)
+                    broll_seg = Segment(
+                        source_file=broll.file_path,
+                        start_time=start,
+                        end_time=end,
+                        text="",
+                        topic=seg.topic or "general",
+                        score=score,
+                        segment_type="broll"
+                    )
+                    enhanced_segments.append(broll_seg)
             
             enhanced_arc[section_name] = enhanced_segments
         
         return enhanced_arc
     
-    def _match_broll_to_interview(self, interview_seg: Segment, keywords: List[str], 
-                                  topic: str, broll_clips: List[ClipAnalysis]) -> List[Tuple[ClipAnalysis, float]]:
-        """Match B-roll clips to interview segment based on content/emotion - optimized"""
-        matches = []
-        
-        # Pre-process keywords for faster matching
-        keywords_lower = [k.lower() for k in keywords]
-        topic_lower = topic.lower() if topic else ""
-        
-        for broll in broll_clips:
-            # Content match score (simplified - would use visual analysis in production)
-            content_score = 0.5  # Default neutral
-            
-            # Check if B-roll filename or metadata suggests match
-            broll_name_lower = broll.file_path.stem.lower()
+    def _broll_index(self, broll_clips: List[ClipAnalysis]):
+        """TF-IDF index of the B-roll clips, built once per clip set and reused"""
+        key = tuple(id(clip) for clip in broll_clips)
+        if self._broll_index_for is None or self._broll_index_for[0] != key:
+            from studioflow.core.broll_index import BrollIndex
             
-            # Optimized keyword matching
-            keyword_matches = sum(1 for kw in keywords_lower if kw in broll_name_lower)
-            content_score += min(0.6, keyword_matches * 0.2)  # Cap at 0.6
-            
-            # Topic match
-            if topic_lower and topic_lower in broll_name_lower:
-                content_score += 0.3  # Strong topic match
-            
-            # Visual quality (would use MediaAnalysis in production)
-            quality_score = 0.8  # Assume good quality
-            
-            # Combined score (weighted)
-            total_score = (content_score * 0.6 + quality_score * 0.4)
+            self._broll_index_for = (key, BrollIndex(broll_clips))
+        return self._broll_index_for[1]
+    
+    def _broll_query(self, seg: Segment, keywords: Optional[List[str]] = None) -> List[str]:
+        """B-roll index terms for an interview segment: its keywords, topic weighted up"""
+        from studioflow.core.broll_index import tokenize
+        
+        if keywords is None:
+            keywords = self.transcript_analyzer._extract_keywords(seg.text)
+        terms = tokenize(" ".join(keywords))
+        if seg.topic and seg.topic != "general":
+            terms.extend(tokenize(seg.topic) * 2)
+        return terms
+    
+    def _next_broll_shot(self, broll: ClipAnalysis,
+                         broll_shots: Dict[Path, List[Tuple[float, float]]]) -> Tuple[float, float]:
+        """In/out of the B-roll clip's next unused shot (max 10 seconds)
+        
+        Shots come from the clip's shot-boundary index, so a B-roll reel is
+        used one real shot at a time and repeat placements show different
+        footage. Clips without detectable cuts play from the head.
+        """
+        shots = broll_shots.get(broll.file_path)
+        if shots is None:
+            from studioflow.core.shot_index import shot_index
             
-            if total_score > 0.5:  # Threshold
-                matches.append((broll, total_score))
+            index = shot_index(broll.file_path, duration=broll.duration or None) if broll.file_path.exists() else None
+            shots = index.shots(min_length=2.0) if index is not None and len(index) > 1 else []
+            shots = [(start, min(end, start + 10.0)) for start, end in shots]
+            broll_shots[broll.file_path] = shots
+        if not shots:
+            return 0.0, min(10.0, broll.duration)
+        # Rotate so the next placement takes the following shot
+        shots.append(shots.pop(0))
+        return shots[-1]
+    
+    def _match_broll_to_interview(self, interview_seg: Segment, keywords: List[str], 
+                                  topic: str, broll_clips: List[ClipAnalysis]) -> List[Tuple[ClipAnalysis, float]]:
+        """B-roll clips matching one interview segment, best first (TF-IDF cosine similarity)
         
-        # Sort by score (descending)
+        Uses the same index as _add_broll_to_segments; for many segments use
+        its BrollIndex.match, which scores them all at once.
+        """
+        index = self._broll_index(broll_clips)
+        query = self._broll_query(Segment(interview_seg.source_file, interview_seg.start_time,
+                                          interview_seg.end_time, interview_seg.text, topic=topic),
+                                  keywords)
+        similarity = index.similarity([query])[0]
+        matches = [(broll, float(score)) for broll, score in zip(broll_clips, similarity) if score > 0]
         matches.sort(key=lambda x: -x[1])
         return matches
     
@@ -2748,12 +3258,12 @@ class RoughCutEngine:
             
             # Detect feature mentions
             if style_config.get('feature_detection', False):
-                features = self.transcript_analyzer.detect_feature_mentions(clip)
+                features = self._detect('detect_feature_mentions', clip)
                 all_segments.extend(features)
             
             # Detect pros/cons
             if style_config.get('pros_cons_detection', False):
-                pros, cons = self.transcript_analyzer.detect_pros_cons(clip)
+                pros, cons = self._detect('detect_pros_cons', clip)
                 all_segments.extend(pros)
                 all_segments.extend(cons)
         
@@ -2767,28 +3277,12 @@ class RoughCutEngine:
             target_duration = total_raw * style_config['target_ratio']
         
         # Select segments
-        selected = []
-        removed = []
-        current_duration = 0.0
-        pre_handle = style_config.get('pre_handle', 0.4)
-        post_handle = style_config.get('post_handle', 0.3)
-        
-        for seg in all_segments:
-            seg_duration = seg.end_time - seg.start_time
-            seg_duration_with_handles = seg_duration + pre_handle + post_handle
-            
-            if current_duration + seg_duration_with_handles <= target_duration:
-                selected.append(seg)
-                current_duration += seg_duration_with_handles
-            else:
-                removed.append(RemovedSegment(
-                    segment=seg,
-                    reason="duration_limit",
-                    score=seg.score
-                ))
+        pre_handle, post_handle = self._handles(CutStyle.REVIEW, 0.4, 0.3)
+        selected, over = self._fill_target_duration(all_segments, target_duration, pre_handle + post_handle)
+        removed = [RemovedSegment(segment=seg, reason="duration_limit", score=seg.score) for seg in over]
         
         # Merge adjacent segments
-        selected = self._merge_adjacent_segments(selected, gap_threshold=1.0)
+        selected = self._merge_adjacent_segments(selected, gap_threshold=self.scoring_config.merge_gap(CutStyle.REVIEW))
         
         # Organize by structure
         structure = self._organize_by_structure(selected, CutStyle.REVIEW)
@@ -2819,15 +3313,18 @@ class RoughCutEngine:
             
             # Detect reveals
             if style_config.get('reveal_detection', False):
-                reveals = self.transcript_analyzer.detect_reveals(clip)
+                reveals = self._detect('detect_reveals', clip)
                 all_segments.extend(reveals)
         
         # Remove duplicates
         all_segments = self._deduplicate_segments(all_segments)
         
         # Prioritize reveals and reactions
+        weight = None
         if style_config.get('reaction_prioritization', False):
             all_segments.sort(key=lambda x: (x.segment_type == "reveal", x.score), reverse=True)
+            # Any reveal second outweighs any other second
+            weight = lambda seg: seg.score + (1.0 if seg.segment_type == "reveal" else 0.0)
         else:
             all_segments.sort(key=lambda x: x.score, reverse=True)
         
@@ -2837,28 +3334,13 @@ class RoughCutEngine:
             target_duration = total_raw * style_config['target_ratio']
         
         # Select segments
-        selected = []
-        removed = []
-        current_duration = 0.0
-        pre_handle = style_config.get('pre_handle', 0.2)
-        post_handle = style_config.get('post_handle', 0.2)
-        
-        for seg in all_segments:
-            seg_duration = seg.end_time - seg.start_time
-            seg_duration_with_handles = seg_duration + pre_handle + post_handle
-            
-            if current_duration + seg_duration_with_handles <= target_duration:
-                selected.append(seg)
-                current_duration += seg_duration_with_handles
-            else:
-                removed.append(RemovedSegment(
-                    segment=seg,
-                    reason="duration_limit",
-                    score=seg.score
-                ))
+        pre_handle, post_handle = self._handles(CutStyle.UNBOXING, 0.2, 0.2)
+        selected, over = self._fill_target_duration(all_segments, target_duration, pre_handle + post_handle,
+                                                    weight=weight)
+        removed = [RemovedSegment(segment=seg, reason="duration_limit", score=seg.score) for seg in over]
         
         # Merge adjacent segments
-        selected = self._merge_adjacent_segments(selected, gap_threshold=0.5)
+        selected = self._merge_adjacent_segments(selected, gap_threshold=self.scoring_config.merge_gap(CutStyle.UNBOXING))
         
         # Organize by structure
         structure = self._organize_by_structure(selected, CutStyle.UNBOXING)
@@ -2889,7 +3371,7 @@ class RoughCutEngine:
             
             # Detect comparisons
             if style_config.get('comparison_detection', False):
-                comparisons = self.transcript_analyzer.detect_comparisons(clip)
+                comparisons = self._detect('detect_comparisons', clip)
                 all_segments.extend(comparisons)
         
         # Remove duplicates
@@ -2902,28 +3384,12 @@ class RoughCutEngine:
             target_duration = total_raw * style_config['target_ratio']
         
         # Select segments
-        selected = []
-        removed = []
-        current_duration = 0.0
-        pre_handle = style_config.get('pre_handle', 0.5)
-        post_handle = style_config.get('post_handle', 0.4)
-        
-        for seg in all_segments:
-            seg_duration = seg.end_time - seg.start_time
-            seg_duration_with_handles = seg_duration + pre_handle + post_handle
-            
-            if current_duration + seg_duration_with_handles <= target_duration:
-                selected.append(seg)
-                current_duration += seg_duration_with_handles
-            else:
-                removed.append(RemovedSegment(
-                    segment=seg,
-                    reason="duration_limit",
-                    score=seg.score
-                ))
+        pre_handle, post_handle = self._handles(CutStyle.COMPARISON, 0.5, 0.4)
+        selected, over = self._fill_target_duration(all_segments, target_duration, pre_handle + post_handle)
+        removed = [RemovedSegment(segment=seg, reason="duration_limit", score=seg.score) for seg in over]
         
         # Merge adjacent segments
-        selected = self._merge_adjacent_segments(selected, gap_threshold=2.0)
+        selected = self._merge_adjacent_segments(selected, gap_threshold=self.scoring_config.merge_gap(CutStyle.COMPARISON))
         
         # Organize by structure (alternate between products if detected)
         structure = self._organize_by_structure(selected, CutStyle.COMPARISON)
@@ -2971,28 +3437,12 @@ class RoughCutEngine:
             target_duration = total_raw * style_config['target_ratio']
         
         # Select segments
-        selected = []
-        removed = []
-        current_duration = 0.0
-        pre_handle = style_config.get('pre_handle', 0.3)
-        post_handle = style_config.get('post_handle', 0.3)
-        
-        for seg in all_segments:
-            seg_duration = seg.end_time - seg.start_time
-            seg_duration_with_handles = seg_duration + pre_handle + post_handle
-            
-            if current_duration + seg_duration_with_handles <= target_duration:
-                selected.append(seg)
-                current_duration += seg_duration_with_handles
-            else:
-                removed.append(RemovedSegment(
-                    segment=seg,
-                    reason="duration_limit",
-                    score=seg.score
-                ))
+        pre_handle, post_handle = self._handles(CutStyle.SETUP, 0.3, 0.3)
+        selected, over = self._fill_target_duration(all_segments, target_duration, pre_handle + post_handle)
+        removed = [RemovedSegment(segment=seg, reason="duration_limit", score=seg.score) for seg in over]
         
         # Merge adjacent segments
-        selected = self._merge_adjacent_segments(selected, gap_threshold=1.0)
+        selected = self._merge_adjacent_segments(selected, gap_threshold=self.scoring_config.merge_gap(CutStyle.SETUP))
         
         # Organize by structure
         structure = self._organize_by_structure(selected, CutStyle.SETUP)
@@ -3023,7 +3473,7 @@ class RoughCutEngine:
             
             # Detect concepts
             if style_config.get('concept_detection', False):
-                concepts = self.transcript_analyzer.detect_concepts(clip)
+                concepts = self._detect('detect_concepts', clip)
                 all_segments.extend(concepts)
         
         # Remove duplicates
@@ -3036,29 +3486,13 @@ class RoughCutEngine:
             target_duration = total_raw * style_config['target_ratio']
         
         # Select segments (more lenient for explainers - keep more content)
-        selected = []
-        removed = []
-        current_duration = 0.0
-        pre_handle = style_config.get('pre_handle', 0.6)
-        post_handle = style_config.get('post_handle', 0.5)
-        
-        for seg in all_segments:
-            seg_duration = seg.end_time - seg.start_time
-            seg_duration_with_handles = seg_duration + pre_handle + post_handle
-            
-            # Allow 10% overflow for high-quality explainer segments
-            if current_duration + seg_duration_with_handles <= target_duration * 1.1:
-                selected.append(seg)
-                current_duration += seg_duration_with_handles
-            else:
-                removed.append(RemovedSegment(
-                    segment=seg,
-                    reason="duration_limit",
-                    score=seg.score
-                ))
+        pre_handle, post_handle = self._handles(CutStyle.EXPLAINER, 0.6, 0.5)
+        # Allow 10% overflow for high-quality explainer segments
+        selected, over = self._fill_target_duration(all_segments, target_duration * 1.1, pre_handle + post_handle)
+        removed = [RemovedSegment(segment=seg, reason="duration_limit", score=seg.score) for seg in over]
         
         # Merge adjacent segments (more aggressive for explainers)
-        selected = self._merge_adjacent_segments(selected, gap_threshold=2.0)
+        selected = self._merge_adjacent_segments(selected, gap_threshold=self.scoring_config.merge_gap(CutStyle.EXPLAINER))
         
         # Organize by structure
         structure = self._organize_by_structure(selected, CutStyle.EXPLAINER)
@@ -3086,10 +3520,8 @@ class RoughCutEngine:
             ""
         ]
 
-        # Get handles from style config
-        style_config = self.STYLE_STRUCTURES.get(plan.style, {})
-        pre_handle = style_config.get('pre_handle', 0.5)   # Default 0.5s before
-        post_handle = style_config.get('post_handle', 0.3)  # Default 0.3s after
+        # Get handles from style config (default 0.5s before, 0.3s after)
+        pre_handle, post_handle = self._handles(plan.style, 0.5, 0.3)
 
         # Build clip duration cache for bounds checking
         clip_durations = {c.file_path: c.duration for c in plan.clips}
@@ -3161,13 +3593,12 @@ class RoughCutEngine:
         spine = ET.SubElement(sequence, 'spine')
 
         # Add clips to timeline
+        asset_ids = {}
+        for i, clip in enumerate(plan.clips):
+            asset_ids.setdefault(clip.file_path, f'asset{i}')
         for seg in plan.segments:
             # Find asset id
-            asset_id = None
-            for i, clip in enumerate(plan.clips):
-                if clip.file_path == seg.source_file:
-                    asset_id = f'asset{i}'
-                    break
+            asset_id = asset_ids.get(seg.source_file)
 
             if asset_id:
                 duration = seg.end_time - seg.start_time
@@ -3337,11 +3768,22 @@ class RoughCutEngine:
             # Get clip analysis for metadata
             clip_analysis = next((c for c in plan.clips if c.file_path == clip_path), None)
             
-            for removed in sorted(removed_list, key=lambda r: r.segment.start_time):
+            removed_list = sorted(removed_list, key=lambda r: r.segment.start_time)
+            thumbnails = [None] * len(removed_list)
+            if extract_thumbnails:
+                # Cropped from the clip's filmstrip: one decode however many segments
+                from studioflow.core.filmstrip import segment_thumbnails
+                
+                thumbnails = segment_thumbnails(
+                    clip_path,
+                    [(r.segment.start_time, r.segment.end_time) for r in removed_list],
+                    output_path.parent
+                )
+            
+            for removed, thumbnail_path in zip(removed_list, thumbnails):
                 seg = removed.segment
                 timecode = self._format_timecode(seg.start_time)
                 duration = seg.end_time - seg.start_time
-                midpoint = seg.start_time + (duration / 2)
                 
                 lines.append(f"### {timecode} ({duration:.1f}s)")
                 lines.append(f"**Reason:** {removed.reason}")
@@ -3373,12 +3815,9 @@ class RoughCutEngine:
                 
                 lines.append("")
                 
-                # Thumbnail extraction
-                if extract_thumbnails:
-                    thumbnail_path = self._extract_thumbnail_for_segment(seg, midpoint, output_path.parent)
-                    if thumbnail_path:
-                        lines.append(f"**Thumbnail:** `{thumbnail_path.name}`")
-                        lines.append("")
+                if thumbnail_path:
+                    lines.append(f"**Thumbnail:** `{thumbnail_path.name}`")
+                    lines.append("")
             
             lines.append("---")
             lines.append("")
@@ -3386,28 +3825,6 @@ class RoughCutEngine:
         output_path.write_text('\n'.join(lines))
         return output_path
     
-    def _extract_thumbnail_for_segment(self, segment: Segment, timecode: float, 
-                                       output_dir: Path) -> Optional[Path]:
-        """Extract thumbnail frame from segment"""
-        try:
-            from studioflow.core.ffmpeg import FFmpegProcessor
-            
-            thumbnail_name = f"{segment.source_file.stem}_{timecode:.1f}s.jpg"
-            thumbnail_path = output_dir / thumbnail_name
-            
-            result = FFmpegProcessor.generate_thumbnail(
-                segment.source_file,
-                thumbnail_path,
-                timestamp=timecode
-            )
-            
-            if result.success:
-                return thumbnail_path
-        except Exception:
-            pass
-        
-        return None
-    
     def create_source_tape_video(self, plan: RoughCutPlan, output_path: Path) -> Optional[Path]:
         """Create concatenated video of all removed footage (source tape)"""
         if not plan.removed_segments:
@@ -3458,7 +3875,7 @@ class RoughCutEngine:
         return None
     
     def generate_hook_test_timelines(self, clips: List[ClipAnalysis], output_dir: Path, 
-                                     max_hooks: int = 5) -> List[Path]:
+                                     max_hooks: int = 5, extract_thumbnails: bool = False) -> List[Path]:
         """Generate multiple hook test timelines for A/B testing on YouTube
         
         Creates multiple hook candidates and exports each as a separate timeline
@@ -3468,6 +3885,8 @@ class RoughCutEngine:
             clips: List of analyzed clips
             output_dir: Base output directory (should be project root)
             max_hooks: Maximum number of hook candidates to generate (default: 5)
+            extract_thumbnails: Also crop a thumbnail per hook (decodes each source clip
+                into the project's filmstrip cache unless already there)
         
         Returns:
             List of exported timeline file paths (EDL and FCPXML)
@@ -3484,6 +3903,9 @@ class RoughCutEngine:
             return []
         
         exported_files = []
+        thumbnails = [None] * len(hook_candidates)
+        if extract_thumbnails:
+            thumbnails = self._hook_thumbnails(hook_candidates, hook_tests_dir, output_dir)
         
         # Export each hook candidate as a separate timeline
         for i, candidate in enumerate(hook_candidates, 1):
@@ -3492,7 +3914,7 @@ class RoughCutEngine:
             hook_name = f"HOOK_TEST_{i:02d}_{flow_tag}"
             
             # Find the clip that contains this segment
-            source_clip = next((c for c in clips if c.file_path == candidate.segment.source_file), None)
+            source_clip = self._clip_for(candidate.segment.source_file, clips)
             if not source_clip:
                 logger.warning(f"Could not find source clip for {candidate.segment.source_file}")
                 continue
@@ -3537,6 +3959,7 @@ Hook Phrase Present: {candidate.hook_phrase_present}
 Source Clip: {candidate.segment.source_file.name}
 Start Time: {candidate.segment.start_time:.2f}s
 End Time: {candidate.segment.end_time:.2f}s
+Thumbnail: {thumbnails[i - 1].name if thumbnails[i - 1] else "none"}
 
 Transcript:
 {candidate.segment.text}
@@ -3596,6 +4019,22 @@ Best Hook Recommendation:
         logger.info(f"Generated {len(hook_candidates)} hook test timelines in {hook_tests_dir}")
         return exported_files
     
+    def _hook_thumbnails(self, hook_candidates: List[HookCandidate], output_dir: Path,
+                         project_dir: Path) -> List[Optional[Path]]:
+        """One thumbnail per hook candidate, cropped from each source clip's filmstrip"""
+        from studioflow.core.filmstrip import segment_thumbnails
+        
+        thumbnails: List[Optional[Path]] = [None] * len(hook_candidates)
+        by_file: Dict[Path, List[int]] = {}
+        for i, candidate in enumerate(hook_candidates):
+            by_file.setdefault(candidate.segment.source_file, []).append(i)
+        for source_file, positions in by_file.items():
+            ranges = [(hook_candidates[i].segment.start_time, hook_candidates[i].segment.end_time)
+                      for i in positions]
+            for i, path in zip(positions, segment_thumbnails(source_file, ranges, output_dir, project_dir)):
+                thumbnails[i] = path
+        return thumbnails
+    
     def _calculate_audio_energy(self, clip: ClipAnalysis, start_time: float, end_time: float) -> float:
         """Calculate audio energy level (0-1) for hook optimization"""
         # Simplified: check if clip has good audio level
@@ -3643,15 +4082,25 @@ Best Hook Recommendation:
         'PROMISE': 1.15,    # Promise Hook - Value
     }
     
-    def _generate_hook_candidates(self, clips: List[ClipAnalysis], max_hooks: int = 5) -> List[HookCandidate]:
+    @_timed('hooks')
+    def _generate_hook_candidates(self, clips: List[ClipAnalysis],
+                                  max_hooks: Optional[int] = 5) -> List[HookCandidate]:
         """Generate multiple hook candidates for A/B testing
         
         Prioritizes clips with named hook flow types (CH, AH, PSH, etc.)
         and applies performance multipliers based on proven YouTube patterns.
         
+        Args:
+            clips: Clips to draw hooks from
+            max_hooks: Number of candidates to return (None for all of them)
+        
         Returns:
             List of HookCandidate objects, sorted by retention score (best first)
         """
+        pool = self._shared_pool(clips)
+        if pool is not None and pool.hook_candidates is not None:
+            return pool.hook_candidates[:max_hooks]
+
         candidates = []
         
         # Priority 1: Clips with named hook flow types (highest priority)
@@ -3666,7 +4115,7 @@ Best Hook Recommendation:
                 continue
             
             # Analyze first 60 seconds for hook candidates
-            first_60_seconds = [e for e in clip.entries if e.end_time <= 60.0]
+            first_60_seconds = [e for e in clip.entries_in(0.0, 60.0) if e.end_time <= 60.0]
             
             for i, entry in enumerate(first_60_seconds):
                 # Check if this entry contains hook phrases
@@ -3743,3 +4192,13 @@ Best Hook Recommendation:
         # Sort by retention score (best first) and return top N
         candidates.sort(key=lambda x: x.retention_score, reverse=True)
         return candidates[:max_hooks]
+
+
+_forked_engine: Optional[RoughCutEngine] = None  # set by create_rough_cuts for its forked workers
+
+
+def _plan_style_in_worker(style: CutStyle, target_duration: Optional[float],
+                          use_audio_markers: bool) -> RoughCutPlan:
+    plan = _forked_engine._plan_style(style, target_duration, use_audio_markers)
+    plan.clips = []  # the parent already has them
+    return plan
@@ -1,14 +1,18 @@
 """
 Optimization utilities for rough cut generation
-Parameter tuning, performance profiling, and model training
+Parameter sweeps, performance profiling, and model training
 """
 
+import os
 import time
+from dataclasses import dataclass, field, fields, replace
+from itertools import product
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass
 
-from studioflow.core.rough_cut import RoughCutEngine, CutStyle, RoughCutPlan
+import numpy as np
+
+from studioflow.core.rough_cut import RoughCutEngine, CutStyle, RoughCutPlan, ScoringConfig
 
 
 @dataclass
@@ -17,6 +21,7 @@ class OptimizationResult:
     parameters: Dict[str, Any]
     metrics: Dict[str, float]
     plan: Optional[RoughCutPlan] = None
+    stage_times: Dict[str, float] = field(default_factory=dict)  # seconds per engine stage
 
 
 class RoughCutOptimizer:
@@ -25,98 +30,104 @@ class RoughCutOptimizer:
     def __init__(self, engine: RoughCutEngine):
         self.engine = engine
     
-    def tune_importance_threshold(self, clips, target_duration: float,
-                                  thresholds: List[float] = [50, 60, 70, 75, 80]) -> List[OptimizationResult]:
-        """Test different importance thresholds"""
-        results = []
-        
-        for threshold in thresholds:
-            # Note: Would need to modify engine to accept threshold parameter
-            # For now, this is a placeholder for the optimization framework
-            self.engine.clips = clips.copy()
+    def sweep(self, clips, target_duration: Optional[float], grid: Dict[str, List[Any]],
+              style: CutStyle = CutStyle.DOC, workers: Optional[int] = None) -> List[OptimizationResult]:
+        """Plan one cut per combination of ScoringConfig values
+        
+        Each configuration starts from the engine's scoring config with the
+        grid's fields replaced, and gets its own engine over the same
+        analyzed clips, so nothing is re-analyzed and no run sees another's
+        caches. Runs are spread over worker processes forked from this one
+        (they inherit the clips without copying them); workers=1, or a
+        platform without fork, runs them one after another.
             
-            start_time = time.time()
-            plan = self.engine.create_rough_cut(
-                style=CutStyle.DOC,
-                target_duration=target_duration,
-                use_smart_features=True
-            )
-            elapsed = time.time() - start_time
+        Args:
+            clips: Analyzed clips (from RoughCutEngine.analyze_clips)
+            target_duration: Target duration in seconds (style default if None)
+            grid: ScoringConfig field name -> values to try
+            style: Cut style to plan
+            workers: Worker processes (default: one per configuration, up to the CPU count)
+        """
+        known = {f.name for f in fields(ScoringConfig)}
+        unknown = set(grid) - known
+        if unknown:
+            raise ValueError(f"Not ScoringConfig fields: {', '.join(sorted(unknown))}")
             
-            results.append(OptimizationResult(
-                parameters={"importance_threshold": threshold},
-                metrics={
-                    "processing_time": elapsed,
-                    "num_segments": len(plan.segments),
-                    "num_themes": len(plan.themes),
-                    "total_duration": plan.total_duration
-                },
-                plan=plan
-            ))
-        
+        names = list(grid)
+        configs = [replace(self.engine.scoring_config, **dict(zip(names, values)))
+                   for values in product(*(grid[name] for name in names))]
+        
+        # Config-independent analysis, computed once and shared by every run
+        for clip in clips:
+            if clip.entries and not hasattr(clip, '_cached_natural_pauses'):
+                clip._cached_natural_pauses = self.engine.transcript_analyzer.find_natural_edit_points(clip)
+
+        if workers is None:
+            workers = min(len(configs), os.cpu_count() or 1)
+        if workers <= 1 or len(configs) <= 1 or not hasattr(os, 'fork'):
+            results = [_plan_with_config(clips, config, style, target_duration) for config in configs]
+        else:
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+
+            global _sweep_clips
+            _sweep_clips = clips
+            try:
+                with ProcessPoolExecutor(max_workers=workers,
+                                         mp_context=multiprocessing.get_context('fork')) as executor:
+                    results = list(executor.map(_plan_in_worker, configs,
+                                                [style] * len(configs), [target_duration] * len(configs)))
+            finally:
+                _sweep_clips = None
+            for result in results:
+                result.plan.clips = clips  # not sent back from the worker
+
+        for result, values in zip(results, product(*(grid[name] for name in names))):
+            result.parameters = dict(zip(names, values))
         return results
     
+    def tune_importance_threshold(self, clips, target_duration: float,
+                                  thresholds: List[float] = [50, 60, 70, 75, 80],
+                                  workers: Optional[int] = None) -> List[OptimizationResult]:
+        """Test different quote importance thresholds (ScoringConfig.quote_min_importance)"""
+        return self.sweep(clips, target_duration, {"quote_min_importance": thresholds}, workers=workers)
+
     def tune_gap_threshold(self, clips, target_duration: float,
-                          gaps: List[float] = [1.0, 1.5, 2.0, 2.5, 3.0]) -> List[OptimizationResult]:
-        """Test different gap thresholds for merging"""
-        results = []
-        
-        for gap in gaps:
-            self.engine.clips = clips.copy()
-            
-            start_time = time.time()
-            plan = self.engine.create_rough_cut(
-                style=CutStyle.DOC,
-                target_duration=target_duration,
-                use_smart_features=True
-            )
-            elapsed = time.time() - start_time
-            
-            # Count merged segments (would need to track this)
-            results.append(OptimizationResult(
-                parameters={"gap_threshold": gap},
-                metrics={
-                    "processing_time": elapsed,
-                    "num_segments": len(plan.segments),
-                    "total_duration": plan.total_duration
-                },
-                plan=plan
-            ))
-        
-        return results
+                          gaps: List[float] = [1.0, 1.5, 2.0, 2.5, 3.0],
+                          workers: Optional[int] = None) -> List[OptimizationResult]:
+        """Test different gap thresholds for merging (ScoringConfig.merge_gap_threshold_doc)"""
+        return self.sweep(clips, target_duration, {"merge_gap_threshold_doc": gaps}, workers=workers)
     
     def profile_performance(self, clips, target_duration: float) -> Dict[str, float]:
-        """Profile performance of different stages"""
-        profile = {}
-        
-        # Stage 1: Clip analysis
-        self.engine.clips = clips.copy()
-        start = time.time()
-        # Analysis happens in analyze_clips, which is already done
-        profile["clip_analysis"] = 0.0  # Would need to instrument
-        
-        # Stage 2: NLP analysis
-        start = time.time()
-        plan = self.engine.create_rough_cut(
-            style=CutStyle.DOC,
-            target_duration=target_duration,
-            use_smart_features=True
-        )
-        profile["total_generation"] = time.time() - start
-        
+        """Seconds spent per engine stage for one documentary cut
+        
+        clip_analysis (and the other analysis stages) come from the engine
+        that analyzed the clips; stages nest, so they don't add up to
+        total_generation.
+        """
+        profile = {stage: self.engine.stage_times.get(stage, 0.0)
+                   for stage in ("audio_normalization", "transcription", "clip_analysis")}
+        
+        result = _plan_with_config(clips, self.engine.scoring_config, CutStyle.DOC, target_duration)
+        profile.update(result.stage_times)
+        profile["total_generation"] = result.metrics["processing_time"]
         return profile
     
     def find_optimal_parameters(self, clips, target_duration: float,
-                               ground_truth: Optional[RoughCutPlan] = None) -> Dict[str, Any]:
-        """Find optimal parameters using grid search"""
+                               ground_truth: Optional[RoughCutPlan] = None,
+                               grid: Optional[Dict[str, List[Any]]] = None) -> Dict[str, Any]:
+        """Find optimal parameters using grid search
+
+        The returned optimal_parameters are ScoringConfig fields, ready for
+        dataclasses.replace(config, **optimal_parameters).
+        """
         best_params = {}
         best_score = 0.0
         
-        # Test importance thresholds
-        importance_results = self.tune_importance_threshold(clips, target_duration)
+        results = self.sweep(clips, target_duration, grid or {"quote_min_importance": [50, 60, 70, 75, 80]})
         
         # Score each configuration
-        for result in importance_results:
+        for result in results:
             # Score based on metrics (would need ground truth for accuracy)
             score = self._score_configuration(result, ground_truth)
             
@@ -127,7 +138,7 @@ class RoughCutOptimizer:
         return {
             "optimal_parameters": best_params,
             "best_score": best_score,
-            "tested_configurations": len(importance_results)
+            "tested_configurations": len(results)
         }
     
     def _score_configuration(self, result: OptimizationResult,
@@ -154,23 +165,78 @@ class RoughCutOptimizer:
         return score
     
     def _calculate_overlap(self, plan1: RoughCutPlan, plan2: RoughCutPlan) -> float:
-        """Calculate overlap between two plans"""
-        # Simple implementation: count matching segments
-        matches = 0
+        """Share of segments of plan1 overlapping a plan2 segment by more than 1s
+
+        Relative to the longer plan. Two spans overlap by more than 1s exactly
+        when every end is more than 1s past every start, so per
+        source file plan2's spans are sorted by start once and each plan1
+        span needs one binary search and a running maximum of ends.
+        """
         total = max(len(plan1.segments), len(plan2.segments))
-        
         if total == 0:
             return 0.0
         
-        # Check for overlapping segments (within 1s tolerance)
-        for seg1 in plan1.segments:
-            for seg2 in plan2.segments:
-                if seg1.source_file == seg2.source_file:
-                    overlap_start = max(seg1.start_time, seg2.start_time)
-                    overlap_end = min(seg1.end_time, seg2.end_time)
-                    if overlap_end - overlap_start > 1.0:  # At least 1s overlap
-                        matches += 1
-                        break
-        
-        return matches / total if total > 0 else 0.0
+        others = _spans_by_file(plan2)
+        matches = 0
+        for path, (starts, ends) in _spans_by_file(plan1).items():
+            if path not in others:
+                continue
+            other_starts, other_ends = others[path]
+            longer = other_ends - other_starts > 1.0  # shorter spans can't overlap anything by 1s
+            other_starts, other_ends = other_starts[longer], other_ends[longer]
+            if not len(other_starts):
+                continue
+            order = np.argsort(other_starts, kind='stable')
+            other_starts = other_starts[order]
+            max_end = np.maximum.accumulate(other_ends[order])
+        
+            # plan2 spans starting more than 1s before this span ends...
+            count = np.searchsorted(other_starts, ends - 1.0, side='left')
+            # ...of which one ends more than 1s after it starts
+            reach = np.where(count > 0, max_end[np.maximum(count - 1, 0)], -np.inf)
+            matches += int(np.count_nonzero((count > 0) & (reach > starts + 1.0) & (ends - starts > 1.0)))
+
+        return matches / total
+
+
+def _spans_by_file(plan: RoughCutPlan) -> Dict[Path, Tuple[np.ndarray, np.ndarray]]:
+    """(starts, ends) of a plan's segments per source file"""
+    spans: Dict[Path, List[Tuple[float, float]]] = {}
+    for seg in plan.segments:
+        spans.setdefault(seg.source_file, []).append((seg.start_time, seg.end_time))
+    return {path: (np.array([s for s, _ in pairs]), np.array([e for _, e in pairs]))
+            for path, pairs in spans.items()}
+
+
+def _plan_with_config(clips, config: ScoringConfig, style: CutStyle,
+                      target_duration: Optional[float]) -> OptimizationResult:
+    """Plan a cut of analyzed clips on a fresh engine using config"""
+    engine = RoughCutEngine(config)
+    engine.clips = clips
+
+    start = time.perf_counter()
+    plan = engine.create_rough_cut(style=style, target_duration=target_duration,
+                                   use_smart_features=(style == CutStyle.DOC))
+    elapsed = time.perf_counter() - start
+
+    return OptimizationResult(
+        parameters={},
+        metrics={
+            "processing_time": elapsed,
+            "num_segments": len(plan.segments),
+            "num_themes": len(plan.themes),
+            "total_duration": plan.total_duration
+        },
+        plan=plan,
+        stage_times=dict(engine.stage_times)
+    )
+
+
+_sweep_clips: Optional[list] = None  # set by RoughCutOptimizer.sweep for its forked workers
+
 
+def _plan_in_worker(config: ScoringConfig, style: CutStyle,
+                    target_duration: Optional[float]) -> OptimizationResult:
+    result = _plan_with_config(_sweep_clips, config, style, target_duration)
+    result.plan.clips = []  # the parent already has them
+    return result
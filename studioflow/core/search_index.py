@@ -0,0 +1,376 @@
+"""
+Global media search index
+SQLite FTS5 over transcript segments (with word timestamps), tags, camera
+metadata and filenames of every project, ranked with BM25
+"""
+
+import json
+import os
+import re
+import sqlite3
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from studioflow.core.file_index import VIDEO_EXTENSIONS, find_project_root, get_file_index
+
+
+SCHEMA_VERSION = 1
+TRANSCRIPT_SUFFIX = "_transcript.json"
+
+# bm25 column weights for (name, tags, camera, content_type)
+METADATA_WEIGHTS = (1.0, 2.0, 1.0, 0.5)
+
+_TERM_RE = re.compile(r'"([^"]+)"|([\w\-\.]+\*?)', re.UNICODE)
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def default_index_path() -> Path:
+    return Path.home() / ".studioflow" / "search.db"
+
+
+@dataclass
+class SearchHit:
+    """A matching transcript segment (with timecode) or clip metadata"""
+    path: Path
+    project: Optional[str]
+    start: Optional[float]  # seconds into the clip; None for metadata hits
+    end: Optional[float]
+    text: str
+    score: float  # higher is better (negated BM25)
+    kind: str = "transcript"  # transcript or metadata
+
+
+def fts_query(text: str) -> str:
+    """
+    Turn user input into an FTS5 query.
+
+    Words are ANDed, "quoted words" stay a phrase and a trailing * keeps
+    prefix matching; everything else is quoted so FTS5 syntax in the input
+    can't produce errors.
+    """
+    terms = []
+    for phrase, word in _TERM_RE.findall(text):
+        if phrase:
+            words = _WORD_RE.findall(phrase)
+            if words:
+                terms.append('"' + " ".join(words) + '"')
+            continue
+        prefix = word.endswith("*")
+        for part in _WORD_RE.findall(word):
+            terms.append(f'"{part}"')
+        if prefix and terms:
+            terms[-1] += "*"
+    return " ".join(terms)
+
+
+def _matches(word: str, term: str) -> bool:
+    # Close enough to the porter stemmer for locating the hit inside a segment
+    stem = term[:max(3, len(term) - 2)]
+    return word.startswith(stem)
+
+
+def _word_timecode(words: List[Tuple[float, str]], query: str) -> Optional[float]:
+    """Start time of the first word where the query's first term (or phrase) occurs"""
+    phrase = [w.lower() for w in _WORD_RE.findall(query.replace("*", ""))]
+    if not phrase or not words:
+        return None
+    spoken = [(start, "".join(_WORD_RE.findall(word.lower()))) for start, word in words]
+    for i, (start, word) in enumerate(spoken):
+        if _matches(word, phrase[0]):
+            following = spoken[i + 1:i + len(phrase)]
+            if all(_matches(w, t) for (_, w), t in zip(following, phrase[1:])):
+                return start
+    for start, word in spoken:
+        if any(_matches(word, term) for term in phrase):
+            return start
+    return None
+
+
+class SearchIndex:
+    """
+    Full-text index of clips across projects.
+
+    Transcripts are stored per segment together with their word timings,
+    so a hit resolves to a clip and a timecode. TranscriptionService adds
+    each transcript as it is written; `sync` catches up a folder from the
+    *_transcript.json files already on disk, skipping ones that haven't
+    changed since they were indexed.
+    """
+
+    def __init__(self, db_path: Optional[Path] = None):
+        self.db_path = Path(db_path) if db_path else default_index_path()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.db_path), timeout=30, check_same_thread=False)
+        if self._conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            self._conn.executescript("""
+                DROP TABLE IF EXISTS clips; DROP TABLE IF EXISTS clip_text;
+                DROP TABLE IF EXISTS segments; DROP TABLE IF EXISTS segment_text;
+            """)
+            self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS clips (
+                id INTEGER PRIMARY KEY,
+                path TEXT UNIQUE NOT NULL,
+                project TEXT,
+                recorded_at REAL,
+                duration REAL,
+                camera TEXT,
+                tags TEXT NOT NULL DEFAULT '',
+                content_type TEXT,
+                transcript_mtime_ns INTEGER NOT NULL DEFAULT 0
+            );
+            CREATE INDEX IF NOT EXISTS clips_recorded ON clips(recorded_at);
+            CREATE INDEX IF NOT EXISTS clips_project ON clips(project);
+            CREATE VIRTUAL TABLE IF NOT EXISTS clip_text USING fts5(
+                name, tags, camera, content_type, tokenize = 'porter unicode61'
+            );
+            CREATE TABLE IF NOT EXISTS segments (
+                id INTEGER PRIMARY KEY,
+                clip_id INTEGER NOT NULL,
+                start REAL NOT NULL,
+                end REAL NOT NULL,
+                words TEXT NOT NULL DEFAULT '[]'
+            );
+            CREATE INDEX IF NOT EXISTS segments_clip ON segments(clip_id);
+            CREATE VIRTUAL TABLE IF NOT EXISTS segment_text USING fts5(
+                text, tokenize = 'porter unicode61'
+            );
+        """)
+        self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # -- writes --------------------------------------------------------------
+
+    def _clip_id(self, media_path: Path) -> int:
+        """Row id of a clip, creating the row (and filename entry) if needed"""
+        key = str(media_path)
+        row = self._conn.execute("SELECT id FROM clips WHERE path = ?", (key,)).fetchone()
+        if row:
+            return row[0]
+        try:
+            recorded_at = media_path.stat().st_mtime
+        except OSError:
+            recorded_at = None
+        root = find_project_root(media_path.parent)
+        clip_id = self._conn.execute(
+            "INSERT INTO clips (path, project, recorded_at) VALUES (?, ?, ?)",
+            (key, root.name if root else None, recorded_at)).lastrowid
+        self._conn.execute("INSERT INTO clip_text (rowid, name, tags, camera, content_type) "
+                           "VALUES (?, ?, '', '', '')", (clip_id, media_path.name))
+        return clip_id
+
+    def index_clip(self, media_path: Path, tags: Iterable[str] = (), camera: Optional[str] = None,
+                   content_type: Optional[str] = None, duration: Optional[float] = None,
+                   recorded_at: Optional[float] = None) -> None:
+        """Add or update a clip's searchable metadata"""
+        media_path = Path(media_path).resolve()
+        tags = " ".join(tags)
+        with self._lock, self._conn:
+            clip_id = self._clip_id(media_path)
+            self._conn.execute(
+                "UPDATE clips SET tags = ?, camera = COALESCE(?, camera), "
+                "content_type = COALESCE(?, content_type), duration = COALESCE(?, duration), "
+                "recorded_at = COALESCE(?, recorded_at) WHERE id = ?",
+                (tags, camera, content_type, duration, recorded_at, clip_id))
+            self._conn.execute(
+                "UPDATE clip_text SET tags = ?, camera = (SELECT COALESCE(camera, '') FROM clips WHERE id = ?), "
+                "content_type = (SELECT COALESCE(content_type, '') FROM clips WHERE id = ?) WHERE rowid = ?",
+                (tags, clip_id, clip_id, clip_id))
+
+    def index_transcript(self, media_path: Path, transcript: Dict[str, Any],
+                         transcript_mtime_ns: int = 0) -> int:
+        """Replace a clip's transcript segments; returns the number indexed"""
+        media_path = Path(media_path).resolve()
+        rows = []
+        for seg in transcript.get("segments", []):
+            text = (seg.get("text") or "").strip()
+            if not text:
+                continue
+            words = [(round(float(w.get("start", seg["start"])), 3), str(w.get("word", "")).strip())
+                     for w in seg.get("words") or [] if isinstance(w, dict)]
+            rows.append((float(seg["start"]), float(seg["end"]), text,
+                         json.dumps(words, separators=(",", ":"))))
+
+        with self._lock, self._conn:
+            clip_id = self._clip_id(media_path)
+            self._delete_segments(clip_id)
+            for start, end, text, words in rows:
+                segment_id = self._conn.execute(
+                    "INSERT INTO segments (clip_id, start, end, words) VALUES (?, ?, ?, ?)",
+                    (clip_id, start, end, words)).lastrowid
+                self._conn.execute("INSERT INTO segment_text (rowid, text) VALUES (?, ?)", (segment_id, text))
+            duration = transcript.get("duration") or (rows[-1][1] if rows else None)
+            self._conn.execute(
+                "UPDATE clips SET transcript_mtime_ns = ?, duration = COALESCE(duration, ?) WHERE id = ?",
+                (transcript_mtime_ns, duration, clip_id))
+        return len(rows)
+
+    def _delete_segments(self, clip_id: int) -> None:
+        ids = [row[0] for row in self._conn.execute("SELECT id FROM segments WHERE clip_id = ?", (clip_id,))]
+        self._conn.executemany("DELETE FROM segment_text WHERE rowid = ?", ((i,) for i in ids))
+        self._conn.execute("DELETE FROM segments WHERE clip_id = ?", (clip_id,))
+
+    def remove(self, media_path: Path) -> None:
+        with self._lock, self._conn:
+            self._remove(str(Path(media_path).resolve()))
+
+    def _remove(self, key: str) -> None:
+        row = self._conn.execute("SELECT id FROM clips WHERE path = ?", (key,)).fetchone()
+        if row:
+            self._delete_segments(row[0])
+            self._conn.execute("DELETE FROM clip_text WHERE rowid = ?", row)
+            self._conn.execute("DELETE FROM clips WHERE id = ?", row)
+
+    def sync(self, root: Path) -> int:
+        """
+        Index the clips and transcripts below root that are new or changed.
+
+        Transcripts are matched to clips by name (clip.mov ->
+        clip_transcript.json) anywhere below root, so transcripts moved to
+        a project's transcription folder still resolve. Returns the number
+        of transcripts (re)indexed.
+        """
+        root = Path(root).resolve()
+        index = get_file_index(root)
+        videos = index.files(exts=VIDEO_EXTENSIONS, under=root)
+        by_stem = {entry.path.stem: entry for entry in videos}
+
+        with self._lock:
+            known = dict(self._conn.execute(
+                "SELECT path, transcript_mtime_ns FROM clips WHERE path > ? AND path < ?",
+                (str(root) + os.sep, str(root) + chr(ord(os.sep) + 1))).fetchall())
+        present = {str(entry.path) for entry in videos}
+        with self._lock, self._conn:
+            for entry in videos:
+                if str(entry.path) not in known:
+                    self._clip_id(entry.path)
+            for key in known.keys() - present:
+                self._remove(key)
+
+        updated = 0
+        for transcript in index.files(under=root, pattern=f"*{TRANSCRIPT_SUFFIX}"):
+            media = by_stem.get(transcript.path.name[:-len(TRANSCRIPT_SUFFIX)])
+            if media is None or known.get(str(media.path)) == transcript.mtime_ns:
+                continue
+            try:
+                with open(transcript.path) as f:
+                    data = json.load(f)
+            except (OSError, ValueError):
+                continue
+            self.index_transcript(media.path, data, transcript.mtime_ns)
+            updated += 1
+        return updated
+
+    # -- queries -------------------------------------------------------------
+
+    def _scope(self, since: Optional[float], under: Optional[Path],
+               project: Optional[str]) -> Tuple[str, List[Any]]:
+        sql, params = "", []
+        if since is not None:
+            sql += " AND c.recorded_at >= ?"
+            params.append(since)
+        if under is not None:
+            prefix = str(Path(under).resolve())
+            sql += " AND c.path > ? AND c.path < ?"
+            params += [prefix + os.sep, prefix + chr(ord(os.sep) + 1)]
+        if project is not None:
+            sql += " AND c.project = ?"
+            params.append(project)
+        return sql, params
+
+    def search(self, query: str, since: Optional[float] = None, under: Optional[Path] = None,
+               project: Optional[str] = None, limit: int = 50,
+               transcripts: bool = True, metadata: bool = True) -> List[SearchHit]:
+        """
+        Best matches for query, best first.
+
+        Args:
+            query: Words (ANDed), "exact phrases" and prefix* terms
+            since: Only clips recorded at or after this Unix time
+            under: Only clips below this folder
+            project: Only clips of this project
+            limit: Maximum hits per kind (transcript and metadata)
+        """
+        match = fts_query(query)
+        if not match:
+            return []
+        scope, params = self._scope(since, under, project)
+        hits: List[SearchHit] = []
+
+        with self._lock:
+            if transcripts:
+                rows = self._conn.execute(
+                    "SELECT c.path, c.project, s.start, s.end, s.words, segment_text.text, "
+                    "bm25(segment_text) AS rank FROM segment_text "
+                    "JOIN segments s ON s.id = segment_text.rowid JOIN clips c ON c.id = s.clip_id "
+                    f"WHERE segment_text MATCH ?{scope} ORDER BY rank LIMIT ?",
+                    [match, *params, limit]).fetchall()
+                for path, proj, start, end, words, text, rank in rows:
+                    at = _word_timecode(json.loads(words), query)
+                    hits.append(SearchHit(Path(path), proj, at if at is not None else start,
+                                          end, text, -rank, "transcript"))
+            if metadata:
+                weights = ", ".join(str(w) for w in METADATA_WEIGHTS)
+                rows = self._conn.execute(
+                    "SELECT c.path, c.project, c.tags, c.content_type, "
+                    f"bm25(clip_text, {weights}) AS rank FROM clip_text "
+                    "JOIN clips c ON c.id = clip_text.rowid "
+                    f"WHERE clip_text MATCH ?{scope} ORDER BY rank LIMIT ?",
+                    [match, *params, limit]).fetchall()
+                for path, proj, tags, content_type, rank in rows:
+                    text = " ".join(filter(None, [Path(path).name, tags, content_type]))
+                    hits.append(SearchHit(Path(path), proj, None, None, text, -rank, "metadata"))
+
+        hits.sort(key=lambda hit: hit.score, reverse=True)
+        return hits
+
+    def clip(self, media_path: Path) -> Optional[Dict[str, Any]]:
+        """Stored metadata of one clip"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT project, recorded_at, duration, camera, tags, content_type FROM clips WHERE path = ?",
+                (str(media_path),)).fetchone()
+        if row is None:
+            return None
+        project, recorded_at, duration, camera, tags, content_type = row
+        return {"project": project, "recorded_at": recorded_at, "duration": duration,
+                "camera": camera, "tags": tags.split(), "content_type": content_type}
+
+
+_index: Optional[SearchIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_search_index() -> SearchIndex:
+    """Process-wide index at ~/.studioflow/search.db"""
+    global _index
+    with _index_lock:
+        if _index is None or _index.db_path != default_index_path():
+            _index = SearchIndex()
+        return _index
+
+
+def index_transcript(media_path: Path, transcript: Dict[str, Any], transcript_path: Optional[Path] = None) -> None:
+    """Write-through hook for transcription; indexing problems never fail the transcription"""
+    try:
+        mtime_ns = os.stat(transcript_path).st_mtime_ns if transcript_path else 0
+        get_search_index().index_transcript(media_path, transcript, mtime_ns)
+    except Exception:
+        pass
+
+
+def _forget_index_after_fork() -> None:
+    # SQLite connections must not be shared with a forked daemon worker
+    global _index, _index_lock
+    _index = None
+    _index_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_index_after_fork)
@@ -0,0 +1,202 @@
+"""
+Duration-constrained segment selection
+Picks the set of segments with the highest total value that fits a target
+duration (0/1 knapsack), optionally with per-section budgets. Solved with a
+DP over quantized durations, vectorized over capacity with numpy; inputs too
+large for the DP fall back to the greedy fill.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+RESOLUTION = 0.1  # seconds per DP capacity step
+MAX_RESOLUTION = 1.0  # coarsest step before giving up on the DP
+MAX_DP_CELLS = 20_000_000  # items x capacity steps (one byte each for backtracking)
+
+
+@dataclass
+class Selection:
+    """Chosen indices (in input order) with their total value and duration"""
+    indices: List[int]
+    value: float
+    duration: float
+    method: str  # "dp" or "greedy"
+
+
+def _selection(indices, durations, values, method: str) -> Selection:
+    indices = sorted(indices)
+    return Selection(indices=indices,
+                     value=float(sum(values[i] for i in indices)),
+                     duration=float(sum(durations[i] for i in indices)),
+                     method=method)
+
+
+def greedy_fill(durations: Sequence[float], values: Sequence[float], capacity: float,
+                order: Optional[Sequence[int]] = None) -> Selection:
+    """
+    Walk items in order (default: highest value per second first) and keep
+    each one that still fits. This is how cuts were filled before the DP.
+    """
+    if order is None:
+        order = sorted(range(len(durations)),
+                       key=lambda i: values[i] / durations[i] if durations[i] > 0 else math.inf,
+                       reverse=True)
+    chosen, used = [], 0.0
+    for i in order:
+        if values[i] > 0 and used + durations[i] <= capacity:
+            chosen.append(i)
+            used += durations[i]
+    return _selection(chosen, durations, values, "greedy")
+
+
+def _resolution_for(n_items: int, capacity: float, resolution: float, max_cells: int) -> Optional[float]:
+    """Step at which the DP table fits in max_cells, None if even MAX_RESOLUTION is too fine"""
+    if n_items * (capacity / resolution + 1) <= max_cells:
+        return resolution
+    coarser = capacity / max(1.0, max_cells / n_items - 1)
+    return coarser if coarser <= max(MAX_RESOLUTION, resolution) else None
+
+
+def _solve(weights: np.ndarray, values: np.ndarray, cap: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    0/1 knapsack over integer weights.
+
+    Returns best[c] (highest value with total weight <= c, for every c up to
+    cap) and keep[i, c] (item i is taken in the optimum for capacity c using
+    items 0..i), one vector update per item.
+    """
+    best = np.zeros(cap + 1)
+    keep = np.zeros((len(weights), cap + 1), dtype=bool)
+    for i, (w, v) in enumerate(zip(weights, values)):
+        if v <= 0 or w > cap:
+            continue
+        candidate = best[:cap + 1 - w] + v
+        take = candidate > best[w:]
+        keep[i, w:] = take
+        best[w:] = np.where(take, candidate, best[w:])
+    return best, keep
+
+
+def _backtrack(keep: np.ndarray, weights: np.ndarray, c: int) -> List[int]:
+    chosen = []
+    for i in range(len(weights) - 1, -1, -1):
+        if keep[i, c]:
+            chosen.append(i)
+            c -= int(weights[i])
+    return chosen
+
+
+def knapsack(durations: Sequence[float], values: Sequence[float], capacity: float,
+             resolution: float = RESOLUTION, max_cells: int = MAX_DP_CELLS) -> Selection:
+    """Items maximizing total value with total duration <= capacity"""
+    return select_by_section(durations, values, [0] * len(durations), {0: capacity}, capacity,
+                             resolution=resolution, max_cells=max_cells)
+
+
+def select_by_section(durations: Sequence[float], values: Sequence[float], sections: Sequence,
+                      budgets: Dict, capacity: float, resolution: float = RESOLUTION,
+                      max_cells: int = MAX_DP_CELLS) -> Selection:
+    """
+    Items maximizing total value with each section's duration within its
+    budget and the overall duration within capacity.
+
+    sections[i] names the section of item i; items of sections without a
+    budget are never chosen. Each section is solved on its own, then the
+    sections' value-by-duration curves are merged (max-plus) under the
+    overall capacity, so budget one section leaves unused can go to another
+    as far as their own budgets allow.
+
+    Durations are rounded to the DP step, so the DP answer is repaired to
+    the exact limits and topped up with whatever still fits; the greedy fill
+    is returned instead if it happens to score higher, so the result is
+    never worse than greedy and never over any limit.
+    """
+    n = len(durations)
+    if n == 0 or capacity <= 0:
+        return Selection([], 0.0, 0.0, "dp")
+    groups: Dict = {}
+    for i, section in enumerate(sections):
+        if section in budgets:
+            groups.setdefault(section, []).append(i)
+    limits = {section: min(budgets[section], capacity) for section in groups}
+
+    greedy = _fill(durations, values, groups, limits, capacity, [], "greedy")
+    step = _resolution_for(n, capacity, resolution, max_cells)
+    if step is not None and len(groups) > 1:
+        # Merging costs (capacity steps)^2 per extra section
+        merge_step = capacity / math.sqrt(max_cells / (len(groups) - 1))
+        step = max(step, merge_step) if merge_step <= MAX_RESOLUTION else None
+    if step is None:
+        return greedy
+
+    chosen = _solve_sections(durations, values, groups, limits, capacity, step)
+    dp = _fill(durations, values, groups, limits, capacity, chosen, "dp")
+    return dp if dp.value >= greedy.value else greedy
+
+
+def _solve_sections(durations, values, groups: Dict, limits: Dict, capacity: float,
+                    step: float) -> List[int]:
+    cap = int(math.floor(capacity / step + 1e-9))
+    total = None
+    solved = []
+    for section, members in groups.items():
+        budget = min(cap, int(math.floor(limits[section] / step + 1e-9)))
+        weights = np.array([int(round(durations[i] / step)) for i in members], dtype=np.int64)
+        best, keep = _solve(weights, np.array([values[i] for i in members], dtype=np.float64), budget)
+        # Capacity beyond the section budget is worth no more than the budget
+        best = np.concatenate([best, np.full(cap - budget, best[-1])])
+
+        if total is None:
+            total, split = best, np.minimum(np.arange(cap + 1), budget)
+        else:
+            # total'[c] = max over k of total[c - k] + best[k]; only
+            # capacities where this section's best improves need checking
+            merged, split = total.copy(), np.zeros(cap + 1, dtype=np.int64)
+            for k in (np.flatnonzero(np.diff(best[:budget + 1]) > 0) + 1):
+                candidate = total[:cap + 1 - k] + best[k]
+                better = candidate > merged[k:]
+                merged[k:][better] = candidate[better]
+                split[k:][better] = k
+            total = merged
+        solved.append((members, weights, keep, split))
+
+    chosen, c = [], cap
+    for members, weights, keep, split in reversed(solved):
+        k = int(split[c])
+        chosen.extend(members[j] for j in _backtrack(keep, weights, k))
+        c -= k
+    return chosen
+
+
+def _fill(durations, values, groups: Dict, limits: Dict, capacity: float,
+          chosen: List[int], method: str) -> Selection:
+    """
+    Make chosen fit the exact limits (dropping its lowest value-per-second
+    items first), then add remaining items, best value per second first,
+    while they fit.
+    """
+    def density(i):
+        return values[i] / durations[i] if durations[i] > 0 else math.inf
+
+    section_of = {i: section for section, members in groups.items() for i in members}
+    used = {section: 0.0 for section in groups}
+    kept = set()
+    for i in sorted(chosen, key=density, reverse=True):
+        section = section_of[i]
+        if (used[section] + durations[i] <= limits[section] + 1e-9
+                and sum(used.values()) + durations[i] <= capacity + 1e-9):
+            kept.add(i)
+            used[section] += durations[i]
+
+    for i in sorted(section_of, key=density, reverse=True):
+        section = section_of[i]
+        if (i not in kept and values[i] > 0
+                and used[section] + durations[i] <= limits[section] + 1e-9
+                and sum(used.values()) + durations[i] <= capacity + 1e-9):
+            kept.add(i)
+            used[section] += durations[i]
+    return _selection(kept, durations, values, method)
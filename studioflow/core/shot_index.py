@@ -0,0 +1,87 @@
+"""
+Shot-boundary index
+Where the picture actually cuts inside a clip, detected once with ffmpeg's
+scene score at low resolution and cached per file
+"""
+
+import re
+import subprocess
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from studioflow.core.cache import get_cache
+
+
+SCENE_THRESHOLD = 0.3  # select's scene score (0-1) that counts as a cut
+ANALYSIS_WIDTH = 160
+MIN_SHOT_SECONDS = 1.0  # closer cuts are flashes/flicker, not shots
+
+_PTS_RE = re.compile(r"pts_time:\s*([-0-9.]+)")
+
+
+@dataclass
+class ShotIndex:
+    """Cut times of a clip (seconds, ascending; 8 bytes each)"""
+    duration: float
+    cuts: array
+
+    def __len__(self) -> int:
+        """Number of shots"""
+        return len(self.cuts) + 1
+
+    def shots(self, min_length: float = 0.0) -> List[Tuple[float, float]]:
+        """Every shot as (start, end), skipping ones shorter than min_length"""
+        edges = [0.0, *self.cuts, self.duration]
+        return [(start, end) for start, end in zip(edges, edges[1:]) if end - start >= min_length]
+
+
+def detect_command(video_path: Path, threshold: float = SCENE_THRESHOLD,
+                   width: int = ANALYSIS_WIDTH) -> List[str]:
+    """ffmpeg command logging (via showinfo) each frame whose scene score passes threshold"""
+    return ["ffmpeg", "-hide_banner", "-nostats", "-i", str(video_path), "-an", "-sn",
+            "-vf", f"scale={width}:-2:flags=fast_bilinear,select='gt(scene,{threshold:g})',showinfo",
+            "-f", "null", "-"]
+
+
+def parse_cuts(log: str, duration: float, min_shot: float = MIN_SHOT_SECONDS) -> array:
+    """Cut times from showinfo output, dropping cuts within min_shot of the last one or the edges"""
+    cuts = array("d")
+    last = 0.0
+    for match in _PTS_RE.finditer(log):
+        time = float(match.group(1))
+        if time - last >= min_shot and (duration <= 0 or duration - time >= min_shot):
+            cuts.append(time)
+            last = time
+    return cuts
+
+
+def shot_index(video_path: Path, threshold: float = SCENE_THRESHOLD,
+               duration: Optional[float] = None) -> Optional[ShotIndex]:
+    """
+    A clip's shot boundaries, detected on first use and cached per file.
+
+    duration is probed when not given. None if the clip can't be probed or
+    decoded; that outcome is cached too, so a broken reel is tried once.
+    """
+    index_cache = get_cache("shot_index")
+    tag = f"threshold={threshold:g}"
+    cached = index_cache.get(video_path, tag)
+    if cached is not None:
+        return cached or None  # False marks a clip that failed before
+
+    from studioflow.core.ffmpeg import FFmpegProcessor
+
+    try:
+        if duration is None:
+            duration = FFmpegProcessor.get_media_info(video_path).get("duration_seconds", 0)
+        result = subprocess.run(detect_command(video_path, threshold), capture_output=True,
+                                text=True, errors="replace", check=True)
+    except (subprocess.CalledProcessError, OSError):
+        index_cache.put(video_path, False, tag)
+        return None
+
+    index = ShotIndex(duration, parse_cuts(result.stderr, duration))
+    index_cache.put(video_path, index, tag)
+    return index
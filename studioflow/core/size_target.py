@@ -0,0 +1,109 @@
+"""
+Size-targeted encoding
+Predicts an encode's size from a few short sampled chunks encoded at probe
+CRFs, so a size-capped export can pick its CRF (or a bitrate) up front
+instead of encoding everything and then re-encoding to fit.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+SAMPLE_COUNT = 3  # chunks spread over the input
+SAMPLE_SECONDS = 4.0
+PROBE_STEPS = (0, 6, 12)  # probe CRFs, relative to the preset's CRF (~halves the bitrate per step)
+SIZE_TOLERANCE = 0.05  # aim this far under the cap; a bigger miss falls back to compression
+CONTAINER_OVERHEAD = 0.02
+
+
+@dataclass
+class SizePlan:
+    """How to encode so the output fits its size cap"""
+    method: str  # "crf" or "bitrate" (two-pass where the encoder allows it)
+    crf: Optional[float] = None
+    video_bitrate_bps: Optional[int] = None
+    predicted_mb: float = 0.0
+
+    @property
+    def crf_arg(self) -> str:
+        return f"{self.crf:g}"
+
+    @property
+    def bitrate_arg(self) -> str:
+        return f"{self.video_bitrate_bps // 1000}k"
+
+
+def sample_windows(duration: float, count: int = SAMPLE_COUNT,
+                   seconds: float = SAMPLE_SECONDS) -> List[Tuple[float, float]]:
+    """(start, length) of count chunks centred in equal slices of the input"""
+    if duration <= count * seconds * 2:
+        return [(0.0, duration)]
+    slice_length = duration / count
+    return [(i * slice_length + (slice_length - seconds) / 2, seconds) for i in range(count)]
+
+
+def parse_bitrate(value: str) -> int:
+    """'128k' / '8M' / '320000' -> bits per second"""
+    value = str(value).strip()
+    scale = {"k": 1000, "m": 1000 ** 2}.get(value[-1:].lower(), 1)
+    return int(float(value[:-1] if scale > 1 else value) * scale)
+
+
+def fit_curve(probes: Dict[float, float]) -> Tuple[float, float]:
+    """
+    Fit log(bitrate) = a + b * crf to probe CRF -> video bits per second.
+
+    x264/x265 bitrate falls roughly exponentially with CRF, so the fit is a
+    straight line in log space (b < 0).
+    """
+    crfs = np.array(sorted(probes), dtype=np.float64)
+    rates = np.log(np.array([max(probes[c], 1.0) for c in sorted(probes)]))
+    if len(crfs) == 1:
+        return float(rates[0] + crfs[0] * math.log(2) / 6), -math.log(2) / 6
+    b, a = np.polyfit(crfs, rates, 1)
+    return float(a), float(min(b, -1e-3))  # never let quality and size rise together
+
+
+def predicted_mb(curve: Tuple[float, float], crf: float, duration: float, audio_bps: int) -> float:
+    a, b = curve
+    bits = (math.exp(a + b * crf) + audio_bps) * duration * (1 + CONTAINER_OVERHEAD)
+    return bits / 8 / (1024 * 1024)
+
+
+def target_video_bitrate(max_size_mb: float, duration: float, audio_bps: int,
+                         tolerance: float = SIZE_TOLERANCE) -> int:
+    """Video bits per second that fill max_size_mb less the tolerance"""
+    bits = max_size_mb * (1 - tolerance) * 1024 * 1024 * 8 / (1 + CONTAINER_OVERHEAD)
+    return max(int(bits / max(duration, 1e-3) - audio_bps), 100_000)
+
+
+def plan_size_target(probes: Dict[float, float], duration: float, max_size_mb: float,
+                     audio_bps: int, base_crf: float,
+                     tolerance: float = SIZE_TOLERANCE) -> SizePlan:
+    """
+    Choose the encode for a size cap from probe CRF -> video bits per second.
+
+    Keeps base_crf when its predicted size fits. Otherwise raises the CRF
+    to the predicted fit when that lies within the probed range, where the
+    curve is interpolated and reliable; past it (or without probes) the
+    output is encoded at the bitrate that fills the cap.
+    """
+    bitrate = target_video_bitrate(max_size_mb, duration, audio_bps, tolerance)
+    if not probes:
+        return SizePlan("bitrate", video_bitrate_bps=bitrate, predicted_mb=max_size_mb * (1 - tolerance))
+
+    curve = fit_curve(probes)
+    limit = max_size_mb * (1 - tolerance)
+    if predicted_mb(curve, base_crf, duration, audio_bps) <= limit:
+        return SizePlan("crf", crf=float(base_crf),
+                        predicted_mb=predicted_mb(curve, base_crf, duration, audio_bps))
+
+    a, b = curve
+    crf = math.ceil((math.log(bitrate) - a) / b * 10) / 10
+    if crf <= max(probes):
+        crf = max(crf, float(base_crf))
+        return SizePlan("crf", crf=crf, predicted_mb=predicted_mb(curve, crf, duration, audio_bps))
+    return SizePlan("bitrate", video_bitrate_bps=bitrate, predicted_mb=limit)
@@ -12,6 +12,7 @@ from datetime import datetime
 from .media import MediaScanner, MediaFile, ClipCategory
 from .transcription import TranscriptionService
 from .ffmpeg import FFmpegProcessor
+from .search_index import get_search_index
 
 
 @dataclass
@@ -79,9 +80,24 @@ class SmartMediaOrganizer:
         
         # Save metadata
         self._save_metadata(media_dir, smart_files)
+        self._index_metadata(files, smart_files)
         
         return smart_files
     
+    def _index_metadata(self, files: List[MediaFile], smart_files: List[SmartMediaFile]):
+        """Make tags, camera and content type searchable across projects"""
+        index = get_search_index()
+        for file, smart_file in zip(files, smart_files):
+            camera = " ".join(filter(None, [file.camera_make, file.camera_model])) or None
+            index.index_clip(
+                file.path,
+                tags=[t.name for t in smart_file.tags],
+                camera=camera,
+                content_type=smart_file.content_type,
+                duration=file.duration,
+                recorded_at=file.creation_time.timestamp() if file.creation_time else None,
+            )
+    
     def _auto_tag_file(self, file: MediaFile) -> List[MediaTag]:
         """Automatically tag a file based on analysis"""
         tags = []
@@ -190,59 +206,37 @@ class SmartMediaOrganizer:
         query: str,
         search_transcripts: bool = True
     ) -> List[SmartMediaFile]:
-        """Search media by tags, filename, or transcript"""
-        
-        # Load metadata
-        metadata_file = media_dir / ".studioflow_metadata.json"
-        if not metadata_file.exists():
-            # Generate metadata first
-            files = self.organize_with_tags(media_dir, auto_tag=True)
-        else:
-            # Load from metadata
-            data = json.loads(metadata_file.read_text())
-            files = []
-            for item in data.get("files", []):
-                file_path = Path(item["path"])
-                if file_path.exists():
-                    files.append(SmartMediaFile(
-                        path=file_path,
-                        duration=item.get("duration", 0),
-                        tags=[MediaTag(t) for t in item.get("tags", [])],
-                        content_type=item.get("content_type", "unknown"),
-                        quality_score=item.get("quality_score", 0)
-                    ))
-        
-        query_lower = query.lower()
-        results = []
-        
-        for file in files:
-            match_score = 0.0
-            
-            # Search filename
-            if query_lower in file.path.name.lower():
-                match_score += 0.8
-            
-            # Search tags
-            for tag in file.tags:
-                if query_lower in tag.name.lower():
-                    match_score += 0.6
-            
-            # Search transcript
-            if search_transcripts and file.transcript:
-                if query_lower in file.transcript.lower():
-                    match_score += 0.9
-            
-            # Search content type
-            if query_lower in file.content_type.lower():
-                match_score += 0.5
-            
-            if match_score > 0:
-                file.metadata["match_score"] = match_score
-                results.append(file)
+        """
+        Search media below media_dir by tags, filename, camera or transcript
+
+        Served from the global search index (BM25 ranked); the folder is
+        tagged first if it never was, and new or changed transcripts are
+        indexed before querying. Transcript hits carry their timecodes in
+        metadata["hits"].
+        """
+        if not (media_dir / ".studioflow_metadata.json").exists():
+            self.organize_with_tags(media_dir, auto_tag=True)
+        
+        index = get_search_index()
+        index.sync(media_dir)
+        hits = index.search(query, under=media_dir, transcripts=search_transcripts, limit=200)
+        
+        results: Dict[Path, SmartMediaFile] = {}
+        for hit in hits:
+            file = results.get(hit.path)
+            if file is None:
+                clip = index.clip(hit.path) or {}
+                file = SmartMediaFile(
+                    path=hit.path,
+                    duration=clip.get("duration") or 0.0,
+                    tags=[MediaTag(t) for t in clip.get("tags", [])],
+                    content_type=clip.get("content_type") or "unknown",
+                    metadata={"match_score": 0.0, "hits": []},
+                )
+                results[hit.path] = file
+            file.metadata["match_score"] += hit.score
+            if hit.start is not None:
+                file.metadata["hits"].append((hit.start, hit.text))
         
         # Sort by match score
-        results.sort(key=lambda f: f.metadata.get("match_score", 0), reverse=True)
-        
-        return results
-
-
+        return sorted(results.values(), key=lambda f: f.metadata["match_score"], reverse=True)
@@ -3,11 +3,12 @@ Sony camera specific functionality
 FX30 and ZV-E10 optimized workflows
 """
 
+import os
 import subprocess
 import json
 import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Sequence, Tuple
 from datetime import datetime
 from dataclasses import dataclass
 
@@ -31,13 +32,68 @@ class SonyClip:
     scene: Optional[str] = None
 
 
+# Where a card's MEDIAPRO.XML sits relative to a scanned folder
+CARD_INDEX_LOCATIONS = ("PRIVATE/M4ROOT/MEDIAPRO.XML", "M4ROOT/MEDIAPRO.XML", "MEDIAPRO.XML",
+                        "../MEDIAPRO.XML")
+
+
 class SonyMediaHandler:
     """Handle Sony FX30 and ZV-E10 media"""
 
+    @staticmethod
+    def read_card_index(card_root: Path,
+                        locations: Sequence[str] = CARD_INDEX_LOCATIONS) -> Dict[Path, Dict]:
+        """
+        Format and camera metadata of every clip on a Sony card, from its
+        MEDIAPRO.XML index and per-clip M01.XML sidecars, in one pass.
+
+        card_root may be the card itself, its M4ROOT or its CLIP folder. The
+        results are cached (see camera_metadata.sidecar_metadata), so later
+        MediaScanner / clip parsing on these clips skips ffprobe. {} if no
+        index is found.
+        """
+        from .camera_metadata import parse_mediapro, parse_sony_sidecar, remember
+
+        card_root = Path(card_root)
+        for location in locations:
+            index_path = card_root / location
+            if index_path.is_file():
+                break
+        else:
+            return {}
+
+        try:
+            materials = parse_mediapro(str(index_path))
+        except (ET.ParseError, OSError):
+            return {}
+
+        # Resolved paths, like the cache keys camera_metadata looks them up by,
+        # so a card reached through a symlink or relative path still hits
+        base = index_path.parent
+        clips = {}
+        for material in materials:
+            clip_path = (base / material.pop("uri")).resolve()
+            if not clip_path.exists():
+                continue
+            sidecar_uri = material.pop("sidecar_uri", None)
+            sidecar_path = Path(os.path.normpath(base / sidecar_uri)) if sidecar_uri else None
+            if sidecar_path and sidecar_path.is_file():
+                try:
+                    material.update(parse_sony_sidecar(str(sidecar_path)))
+                    material["source"] = "card_index"
+                except (ET.ParseError, OSError, ValueError):
+                    pass
+            remember(clip_path, material)
+            clips[clip_path] = material
+        return clips
+
     @staticmethod
     def detect_sony_media(directory: Path) -> Dict[str, List[SonyClip]]:
         """Detect and organize Sony camera files"""
 
+        # Read the card index once (no ffprobe for the clips it lists)
+        SonyMediaHandler.read_card_index(directory)
+
         clips = {
             "fx30": [],
             "zve10": []
@@ -61,11 +117,24 @@ class SonyMediaHandler:
 
         return clips
 
+    @staticmethod
+    def _clip_info(file_path: Path) -> Dict:
+        """Duration, resolution and fps from the card index/sidecar, else ffprobe"""
+        from .camera_metadata import sidecar_metadata
+
+        data = sidecar_metadata(file_path)
+        if data and data.get("duration") and data.get("framerate"):
+            info = {"duration_seconds": data["duration"], "fps": data["framerate"]}
+            if data.get("resolution"):
+                info["resolution"] = "{}x{}".format(*data["resolution"])
+            return info
+        return FFmpegProcessor.get_media_info(file_path)
+
     @staticmethod
     def _parse_fx30_clip(file_path: Path) -> Optional[SonyClip]:
         """Parse FX30 clip metadata"""
 
-        info = FFmpegProcessor.get_media_info(file_path)
+        info = SonyMediaHandler._clip_info(file_path)
         if not info:
             return None
 
@@ -90,7 +159,7 @@ class SonyMediaHandler:
     def _parse_zve10_clip(file_path: Path) -> Optional[SonyClip]:
         """Parse ZV-E10 clip metadata"""
 
-        info = FFmpegProcessor.get_media_info(file_path)
+        info = SonyMediaHandler._clip_info(file_path)
         if not info:
             return None
 
@@ -190,33 +259,27 @@ class SonyMediaHandler:
     def extract_fx30_metadata(file_path: Path) -> Dict:
         """Extract FX30 specific metadata from file"""
 
-        # FX30 embeds extensive metadata
-        cmd = [
-            "exiftool", "-j", str(file_path)
-        ]
+        from .camera_metadata import camera_metadata
 
-        try:
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            metadata = json.loads(result.stdout)[0] if result.stdout else {}
-
-            # Extract FX30 specific fields
-            fx30_data = {
-                "camera_model": metadata.get("Model", "FX30"),
-                "lens": metadata.get("LensModel", "Unknown"),
-                "iso": metadata.get("ISO", ""),
-                "shutter_speed": metadata.get("ShutterSpeed", ""),
-                "aperture": metadata.get("FNumber", ""),
-                "white_balance": metadata.get("WhiteBalance", ""),
-                "picture_profile": metadata.get("PictureProfile", "PP11"),  # S-Log3
-                "color_mode": metadata.get("ColorMode", "S-Gamut3.Cine"),
-                "focus_mode": metadata.get("FocusMode", ""),
-                "stabilization": metadata.get("SteadyShot", "")
-            }
-
-            return fx30_data
-        except:
+        # FX30 writes most of this to its M01.XML sidecar; exiftool covers the rest
+        metadata = camera_metadata([file_path]).get(file_path, {})
+        if not metadata:
             return {}
 
+        # Extract FX30 specific fields
+        return {
+            "camera_model": metadata.get("camera_model", "FX30"),
+            "lens": metadata.get("lens", "Unknown"),
+            "iso": metadata.get("iso", ""),
+            "shutter_speed": metadata.get("shutter_speed", ""),
+            "aperture": metadata.get("aperture", ""),
+            "white_balance": metadata.get("white_balance", ""),
+            "picture_profile": metadata.get("picture_profile", metadata.get("gamma", "PP11")),  # S-Log3
+            "color_mode": metadata.get("color_mode", "S-Gamut3.Cine"),
+            "focus_mode": metadata.get("focus_mode", ""),
+            "stabilization": metadata.get("stabilization", "")
+        }
+
     @staticmethod
     def generate_camera_report(clips: Dict[str, List[SonyClip]]) -> str:
         """Generate report of imported Sony media"""
@@ -6,6 +6,7 @@ Tracks current project and session state
 from typing import Optional, Dict, Any
 from pathlib import Path
 import json
+import os
 from datetime import datetime
 
 
@@ -14,10 +15,41 @@ class StateManager:
 
     def __init__(self):
         self.state_file = Path.home() / ".studioflow" / ".state"
-        self._state = self._load_state()
+        self._loaded_mtime: Optional[int] = None
+        self._data = self._load_state()
+
+    @property
+    def _state(self) -> Dict[str, Any]:
+        """State dict (read-only: change it with _update), reloaded if another process changed the file
+
+        Long-lived processes (the sf daemon) keep StateManager instances
+        around, so a cheap stat replaces re-reading the JSON every command.
+        Reloading never loses anything: changes are saved as they are made.
+        """
+        try:
+            mtime = self.state_file.stat().st_mtime_ns
+        except OSError:
+            mtime = None
+        if mtime != self._loaded_mtime:
+            self._data = self._load_state()
+        return self._data
+
+    def _update(self, **changes: Any):
+        """Apply changes on top of the file as it is now and save
+
+        Re-reading first keeps what other processes saved since this one
+        last looked.
+        """
+        self._data = self._load_state()
+        self._data.update(changes)
+        self._save_state()
 
     def _load_state(self) -> Dict[str, Any]:
         """Load state from file"""
+        try:
+            self._loaded_mtime = self.state_file.stat().st_mtime_ns
+        except OSError:
+            self._loaded_mtime = None
         if self.state_file.exists():
             try:
                 with open(self.state_file) as f:
@@ -27,10 +59,13 @@ class StateManager:
         return {}
 
     def _save_state(self):
-        """Save state to file"""
+        """Save state to file (replaced whole, so readers never see half of it)"""
         self.state_file.parent.mkdir(exist_ok=True)
-        with open(self.state_file, 'w') as f:
-            json.dump(self._state, f, indent=2, default=str)
+        tmp = self.state_file.with_name(f"{self.state_file.name}.{os.getpid()}.tmp")
+        with open(tmp, 'w') as f:
+            json.dump(self._data, f, indent=2, default=str)
+        os.replace(tmp, self.state_file)
+        self._loaded_mtime = self.state_file.stat().st_mtime_ns
 
     @property
     def current_project(self) -> Optional[str]:
@@ -40,9 +75,7 @@ class StateManager:
     @current_project.setter
     def current_project(self, name: str):
         """Set current project"""
-        self._state["current_project"] = name
-        self._state["last_modified"] = datetime.now().isoformat()
-        self._save_state()
+        self._update(current_project=name, last_modified=datetime.now().isoformat())
 
     @property
     def last_import_path(self) -> Optional[Path]:
@@ -53,17 +86,12 @@ class StateManager:
     @last_import_path.setter
     def last_import_path(self, path: Path):
         """Set last import path"""
-        self._state["last_import_path"] = str(path)
-        self._save_state()
+        self._update(last_import_path=str(path))
 
     def add_recent_project(self, name: str):
         """Add to recent projects list"""
-        recent = self._state.get("recent_projects", [])
-        if name in recent:
-            recent.remove(name)
-        recent.insert(0, name)
-        self._state["recent_projects"] = recent[:10]  # Keep last 10
-        self._save_state()
+        recent = [project for project in self._load_state().get("recent_projects", []) if project != name]
+        self._update(recent_projects=([name] + recent)[:10])  # Keep last 10
 
     def get_recent_projects(self) -> list:
         """Get recent projects"""
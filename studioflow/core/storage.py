@@ -9,6 +9,8 @@ from pathlib import Path
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
 
+from studioflow.core.storage_usage import TierUsage, get_storage_ledger, measure
+
 
 class StorageTierSystem:
     """6-tier storage management for video production workflow"""
@@ -64,6 +66,10 @@ class StorageTierSystem:
         # Create tier directories if they don't exist
         self._initialize_tiers()
 
+        # Usage counters are kept per tier path
+        self.ledger = get_storage_ledger()
+        self.ledger.register_tiers({name: tier["path"] for name, tier in self.tiers.items()})
+
     def _load_config(self, config_path: Path):
         """Load custom tier configuration"""
         try:
@@ -102,8 +108,15 @@ class StorageTierSystem:
                     pass
 
     def get_tier_status(self) -> Dict[str, Dict[str, Any]]:
-        """Get status of all storage tiers"""
+        """
+        Get status of all storage tiers
+
+        File counts and sizes come from the usage ledger, so this never
+        walks the tiers; "counted" is False for a tier that has not been
+        reconciled yet (see reconcile).
+        """
         status = {}
+        usage = self.ledger.usage()
 
         for tier_name, tier_config in self.tiers.items():
             path = tier_config["path"]
@@ -111,24 +124,17 @@ class StorageTierSystem:
             if path.exists():
                 # Calculate disk usage
                 total, used, free = shutil.disk_usage(path)
-
-                # Count files and calculate total size
-                file_count = 0
-                total_size = 0
-                try:
-                    for item in path.rglob("*"):
-                        if item.is_file():
-                            file_count += 1
-                            total_size += item.stat().st_size
-                except PermissionError:
-                    pass
+                counters = usage.get(tier_name) or TierUsage(tier_name, path)
 
                 status[tier_name] = {
                     "exists": True,
                     "path": str(path),
                     "description": tier_config["description"],
-                    "file_count": file_count,
-                    "total_size_gb": round(total_size / (1024**3), 2),
+                    "file_count": counters.files,
+                    "total_size_gb": round(counters.size / (1024**3), 2),
+                    "project_count": counters.projects,
+                    "counted": counters.counted,
+                    "reconciled_at": counters.reconciled_at,
                     "disk_total_gb": round(total / (1024**3), 2),
                     "disk_used_gb": round(used / (1024**3), 2),
                     "disk_free_gb": round(free / (1024**3), 2),
@@ -187,7 +193,9 @@ class StorageTierSystem:
             target_path.parent.mkdir(parents=True, exist_ok=True)
 
             # Move the file/directory
+            files, size = measure(source_path)
             shutil.move(str(source_path), str(target_path))
+            self.ledger.record_move(source_path, target_path, files, size)
 
             return {
                 "success": True,
@@ -229,25 +237,27 @@ class StorageTierSystem:
         archived_files = []
 
         try:
-            for item in source_path.rglob("*"):
-                if item.is_file():
-                    # Check modification time
-                    mtime = datetime.fromtimestamp(item.stat().st_mtime)
-                    if mtime < cutoff_date:
-                        file_info = {
-                            "file": str(item),
-                            "age_days": (datetime.now() - mtime).days,
-                            "size_mb": round(item.stat().st_size / (1024**2), 2)
-                        }
-
-                        if not dry_run:
-                            # Actually archive the file
-                            result = self.move_to_tier(item, "archive", preserve_structure=True)
-                            file_info["archived"] = result["success"]
-                        else:
-                            file_info["would_archive"] = True
-
-                        archived_files.append(file_info)
+            from studioflow.core.file_index import get_file_index
+
+            # One parallel walk lists every file with its size and mtime; tiers
+            # can nest (PROJECTS inside studio), so stay inside this one
+            for entry in get_file_index(source_path).files(under=source_path):
+                mtime = datetime.fromtimestamp(entry.mtime_ns / 1e9)
+                if mtime < cutoff_date:
+                    file_info = {
+                        "file": str(entry.path),
+                        "age_days": (datetime.now() - mtime).days,
+                        "size_mb": round(entry.size / (1024**2), 2)
+                    }
+
+                    if not dry_run:
+                        # Actually archive the file
+                        result = self.move_to_tier(entry.path, "archive", preserve_structure=True)
+                        file_info["archived"] = result["success"]
+                    else:
+                        file_info["would_archive"] = True
+
+                    archived_files.append(file_info)
 
         except Exception:
             pass
@@ -291,6 +301,27 @@ class StorageTierSystem:
 
         return results
 
+    def reconcile(self, tiers: Optional[List[str]] = None, workers: int = 4,
+                  max_age: Optional[float] = None, low_priority: bool = True) -> Dict[str, TierUsage]:
+        """
+        Recount tiers from disk to correct drift in the usage counters
+
+        Args:
+            tiers: Tier names (default: all existing tiers)
+            workers: Parallel directory listing threads per tier
+            max_age: Only tiers not reconciled within this many seconds
+            low_priority: Scan at idle CPU and I/O priority
+
+        Returns:
+            Fresh usage per reconciled tier
+        """
+        names = tiers or [name for name, tier in self.tiers.items() if tier["path"].exists()]
+        if max_age is not None:
+            stale = set(self.ledger.stale_tiers(max_age))
+            names = [name for name in names if name in stale]
+        return {name: self.ledger.reconcile(name, workers=workers, low_priority=low_priority)
+                for name in names if name in self.tiers}
+
     def suggest_tier(self, file_path: Path, file_type: Optional[str] = None) -> str:
         """
         Suggest appropriate storage tier for a file
@@ -0,0 +1,305 @@
+"""
+Storage tier usage accounting
+Persistent per-tier, per-project file and byte counters kept current by the
+operations that change them, with a parallel low-priority reconciliation scan
+"""
+
+import os
+import shutil
+import sqlite3
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+
+SCHEMA_VERSION = 1
+RECONCILE_MAX_AGE = 24 * 3600  # seconds before a tier is due for a reconciliation scan
+
+
+def default_ledger_path() -> Path:
+    return Path.home() / ".studioflow" / "storage_usage.db"
+
+
+@dataclass
+class TierUsage:
+    """Counted files and bytes of one tier"""
+    tier: str
+    path: Path
+    files: int = 0
+    size: int = 0
+    projects: int = 0
+    reconciled_at: Optional[float] = None  # None: never counted
+
+    @property
+    def counted(self) -> bool:
+        return self.reconciled_at is not None
+
+
+def _lower_thread_priority() -> None:
+    """Run the calling thread at the lowest CPU and idle I/O priority (best effort)"""
+    tid = threading.get_native_id()
+    try:
+        os.setpriority(os.PRIO_PROCESS, tid, 19)
+    except (AttributeError, OSError):
+        pass
+    ionice = shutil.which("ionice")
+    if ionice:
+        try:
+            subprocess.run([ionice, "-c", "3", "-p", str(tid)], capture_output=True, timeout=5)
+        except (OSError, subprocess.SubprocessError):
+            pass
+
+
+def _scan_usage(path: str) -> Tuple[List[str], int, int]:
+    """List one directory: (subdirectories, file count, byte count)"""
+    subdirs: List[str] = []
+    files = size = 0
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        files += 1
+                        size += entry.stat(follow_symlinks=False).st_size
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    return subdirs, files, size
+
+
+def measure(path: Path) -> Tuple[int, int]:
+    """(files, bytes) of a file or directory tree; (0, 0) if it doesn't exist"""
+    path = Path(path)
+    try:
+        if not path.is_dir():
+            return 1, path.stat().st_size
+    except OSError:
+        return 0, 0
+    files = size = 0
+    stack = [str(path)]
+    while stack:
+        subdirs, n, b = _scan_usage(stack.pop())
+        stack.extend(subdirs)
+        files += n
+        size += b
+    return files, size
+
+
+class StorageLedger:
+    """
+    Usage counters for storage tiers.
+
+    Each tier is split by its top-level entries (normally project folders).
+    Import, move, archive and cleanup operations apply deltas through
+    `record`; `reconcile` recounts a tier from disk with parallel scandir
+    workers at idle priority and replaces whatever drift accumulated.
+    A path below nested tiers (a PROJECTS folder inside the studio tier)
+    counts towards each of them, as a full scan of either would.
+    """
+
+    def __init__(self, db_path: Optional[Path] = None):
+        self.db_path = Path(db_path) if db_path else default_ledger_path()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.db_path), timeout=30, check_same_thread=False)
+        if self._conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            self._conn.executescript("DROP TABLE IF EXISTS tiers; DROP TABLE IF EXISTS usage;")
+            self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS tiers (
+                name TEXT PRIMARY KEY,
+                path TEXT NOT NULL,
+                reconciled_at REAL
+            );
+            CREATE TABLE IF NOT EXISTS usage (
+                tier TEXT NOT NULL,
+                project TEXT NOT NULL,
+                files INTEGER NOT NULL DEFAULT 0,
+                bytes INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (tier, project)
+            );
+        """)
+        self._conn.commit()
+        self._tiers = self._load_tiers()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _load_tiers(self) -> Dict[str, str]:
+        return dict(self._conn.execute("SELECT name, path FROM tiers").fetchall())
+
+    def register_tiers(self, tiers: Dict[str, Path]) -> None:
+        """Record tier roots; counters of a tier whose path changed are reset"""
+        with self._lock, self._conn:
+            for name, path in tiers.items():
+                path = os.path.realpath(path)
+                if self._tiers.get(name) == path:
+                    continue
+                self._conn.execute("DELETE FROM usage WHERE tier = ?", (name,))
+                self._conn.execute("INSERT OR REPLACE INTO tiers (name, path, reconciled_at) "
+                                   "VALUES (?, ?, NULL)", (name, path))
+            self._tiers = self._load_tiers()
+
+    # -- incremental updates -------------------------------------------------
+
+    def _locate(self, path: Path) -> List[Tuple[str, str]]:
+        """(tier, project) pairs a path counts towards"""
+        path = os.path.realpath(path)
+        found = []
+        for tier, root in self._tiers.items():
+            if path.startswith(root.rstrip(os.sep) + os.sep):
+                found.append((tier, path[len(root):].lstrip(os.sep).split(os.sep, 1)[0]))
+        return found
+
+    def record(self, path: Path, files: int, size: int) -> None:
+        """Apply a delta (negative for removals) for something at path"""
+        if not files and not size:
+            return
+        with self._lock, self._conn:
+            for tier, project in self._locate(path):
+                self._conn.execute(
+                    "INSERT INTO usage (tier, project, files, bytes) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT(tier, project) DO UPDATE SET "
+                    "files = MAX(0, files + excluded.files), bytes = MAX(0, bytes + excluded.bytes)",
+                    (tier, project, files, size))
+
+    def record_move(self, source: Path, destination: Path, files: int, size: int) -> None:
+        self.record(source, -files, -size)
+        self.record(destination, files, size)
+
+    # -- queries -------------------------------------------------------------
+
+    def usage(self) -> Dict[str, TierUsage]:
+        """Counters of every registered tier"""
+        with self._lock:
+            tiers = self._conn.execute("SELECT name, path, reconciled_at FROM tiers").fetchall()
+            totals = {row[0]: row[1:] for row in self._conn.execute(
+                "SELECT tier, SUM(files), SUM(bytes), SUM(files > 0 OR bytes > 0) "
+                "FROM usage GROUP BY tier")}
+        result = {}
+        for name, path, reconciled_at in tiers:
+            files, size, projects = totals.get(name, (0, 0, 0))
+            result[name] = TierUsage(name, Path(path), files or 0, size or 0, projects or 0, reconciled_at)
+        return result
+
+    def projects(self, tier: str, limit: Optional[int] = None) -> List[Tuple[str, int, int]]:
+        """(project, files, bytes) of a tier, largest first"""
+        sql = "SELECT project, files, bytes FROM usage WHERE tier = ? AND files > 0 ORDER BY bytes DESC"
+        params: list = [tier]
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            return [tuple(row) for row in self._conn.execute(sql, params)]
+
+    def stale_tiers(self, max_age: float = RECONCILE_MAX_AGE) -> List[str]:
+        """Tiers never counted or last reconciled longer than max_age seconds ago"""
+        cutoff = time.time() - max_age
+        with self._lock:
+            return [row[0] for row in self._conn.execute(
+                "SELECT name FROM tiers WHERE reconciled_at IS NULL OR reconciled_at < ?", (cutoff,))]
+
+    # -- reconciliation ------------------------------------------------------
+
+    def reconcile(self, tier: str, workers: int = 4, low_priority: bool = True) -> TierUsage:
+        """
+        Recount a tier from disk and replace its counters.
+
+        Directories are listed by a pool of workers (idle CPU and I/O
+        priority unless low_priority is False) that queue subdirectories as
+        they find them; only per-project totals are kept in memory.
+        """
+        root = self._tiers.get(tier)
+        if root is None:
+            raise KeyError(f"Unknown tier: {tier}")
+        started = time.time()
+        counts: Dict[str, List[int]] = {}
+
+        subdirs: List[str] = []
+        try:
+            with os.scandir(root) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            counts[entry.name] = [1, entry.stat(follow_symlinks=False).st_size]
+                    except OSError:
+                        continue
+        except OSError:
+            pass
+
+        initializer = _lower_thread_priority if low_priority else None
+        with ThreadPoolExecutor(max_workers=workers, initializer=initializer) as executor:
+            pending = {executor.submit(_scan_usage, d): os.path.basename(d) for d in subdirs}
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    project = pending.pop(future)
+                    children, files, size = future.result()
+                    total = counts.setdefault(project, [0, 0])
+                    total[0] += files
+                    total[1] += size
+                    for child in children:
+                        pending[executor.submit(_scan_usage, child)] = project
+
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM usage WHERE tier = ?", (tier,))
+            self._conn.executemany(
+                "INSERT INTO usage (tier, project, files, bytes) VALUES (?, ?, ?, ?)",
+                ((tier, project, files, size) for project, (files, size) in counts.items()))
+            self._conn.execute("UPDATE tiers SET reconciled_at = ? WHERE name = ?", (started, tier))
+        return self.usage()[tier]
+
+
+_ledger: Optional[StorageLedger] = None
+_ledger_lock = threading.Lock()
+
+
+def get_storage_ledger() -> StorageLedger:
+    """Process-wide ledger at ~/.studioflow/storage_usage.db"""
+    global _ledger
+    with _ledger_lock:
+        if _ledger is None or _ledger.db_path != default_ledger_path():
+            _ledger = StorageLedger()
+        return _ledger
+
+
+def record_usage(path: Path, files: int, size: int) -> None:
+    """Write-through hook for operations that add or remove data; never raises"""
+    try:
+        get_storage_ledger().record(path, files, size)
+    except Exception:
+        pass
+
+
+def record_added(path: Path) -> None:
+    """Count a file or folder that was just written"""
+    files, size = measure(path)
+    record_usage(path, files, size)
+
+
+def record_move(source: Path, destination: Path, files: int, size: int) -> None:
+    try:
+        get_storage_ledger().record_move(source, destination, files, size)
+    except Exception:
+        pass
+
+
+def _forget_ledger_after_fork() -> None:
+    # SQLite connections must not be shared with a forked daemon worker
+    global _ledger, _ledger_lock
+    _ledger = None
+    _ledger_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_ledger_after_fork)
@@ -0,0 +1,107 @@
+"""
+Take clustering for rough cuts
+Groups retakes of the same line across clips with MinHash signatures and LSH
+banding, so each line is only compared with its likely retakes
+"""
+
+import hashlib
+import re
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional, Sequence, Set
+
+import numpy as np
+
+
+SHINGLE_WORDS = 3  # word n-grams compared between lines
+MIN_WORDS = 4  # shorter lines are too generic to call retakes
+NUM_PERM = 64
+BANDS = 32  # 32 bands x 2 rows: lines above ~0.4 Jaccard almost always share a band
+TAKE_SIMILARITY = 0.4  # shingle Jaccard at which two lines are takes of each other
+
+_PRIME = (1 << 31) - 1
+_WORD_RE = re.compile(r"[a-z0-9']+")
+
+
+@lru_cache(maxsize=65536)
+def shingles(text: str) -> FrozenSet[int]:
+    """32-bit hashes of the word n-grams of a line (empty if it is too short)"""
+    words = _WORD_RE.findall(text.lower())
+    if len(words) < MIN_WORDS:
+        return frozenset()
+    return frozenset({
+        int.from_bytes(hashlib.blake2b(" ".join(words[i:i + SHINGLE_WORDS]).encode(),
+                                       digest_size=4).digest(), "little")
+        for i in range(len(words) - SHINGLE_WORDS + 1)
+    })
+
+
+class MinHasher:
+    """Fixed family of NUM_PERM universal hashes (a * x + b) mod p"""
+
+    def __init__(self, num_perm: int = NUM_PERM, seed: int = 1):
+        rng = np.random.default_rng(seed)
+        self.a = rng.integers(1, _PRIME, num_perm, dtype=np.uint64)
+        self.b = rng.integers(0, _PRIME, num_perm, dtype=np.uint64)
+
+    def signature(self, hashes: Set[int]) -> np.ndarray:
+        x = np.fromiter(hashes, dtype=np.uint64, count=len(hashes)) % np.uint64(_PRIME)
+        return ((np.outer(x, self.a) + self.b) % np.uint64(_PRIME)).min(axis=0)
+
+
+def jaccard(a: Set[int], b: Set[int]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def cluster_takes(texts: Sequence[str], threshold: float = TAKE_SIMILARITY,
+                  hasher: Optional[MinHasher] = None) -> List[List[int]]:
+    """
+    Partition lines into takes of the same content.
+
+    Returns lists of indices into texts; every index appears in exactly one
+    cluster, lines without a retake as singletons. Candidate pairs come from
+    shared LSH bands and are confirmed on their exact shingle Jaccard, so the
+    work grows with the number of lines and retakes, not their square.
+    Clusters are complete-linkage: every line in one is a take of every
+    other, so A ~ B and B ~ C doesn't make A and C takes of each other.
+    """
+    hasher = hasher or MinHasher()
+    sets = [shingles(text) for text in texts]
+
+    rows = len(hasher.a) // BANDS
+    buckets: Dict[tuple, List[int]] = {}
+    for i, s in enumerate(sets):
+        if not s:
+            continue
+        signature = hasher.signature(s)
+        for band in range(BANDS):
+            key = (band, signature[band * rows:(band + 1) * rows].tobytes())
+            buckets.setdefault(key, []).append(i)
+
+    similar: Dict[tuple, float] = {}
+    for members in buckets.values():
+        for n, i in enumerate(members):
+            for j in members[n + 1:]:
+                if (i, j) not in similar:
+                    similar[(i, j)] = jaccard(sets[i], sets[j])
+
+    def takes(i: int, j: int) -> bool:
+        pair = (i, j) if i < j else (j, i)
+        if pair not in similar:
+            similar[pair] = jaccard(sets[i], sets[j])
+        return similar[pair] >= threshold
+
+    # Most similar pairs first; two clusters merge only if all their lines are takes
+    cluster_of = list(range(len(texts)))
+    clusters: Dict[int, List[int]] = {i: [i] for i in range(len(texts))}
+    for (i, j), similarity in sorted(similar.items(), key=lambda item: (-item[1], item[0])):
+        if similarity < threshold:
+            break
+        a, b = sorted((cluster_of[i], cluster_of[j]))
+        if a == b or not all(takes(x, y) for x in clusters[a] for y in clusters[b]):
+            continue
+        for x in clusters[b]:
+            cluster_of[x] = a
+        clusters[a].extend(clusters.pop(b))
+    return [sorted(members) for members in clusters.values()]
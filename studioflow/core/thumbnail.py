@@ -1,9 +1,182 @@
 """
-Thumbnail Generator Stub
+Thumbnail selection and generation
+Finds a clip's best thumbnail frames from a sparse set of input-seeked
+samples, scored with numpy (sharpness, exposure, a face-region heuristic and
+distance from scene changes), and caches the ranking per clip
 """
 
+import subprocess
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from studioflow.core.cache import get_cache
+
+
+SAMPLES = 24  # frames sampled per clip
+FRAME_SPAN = 0.1  # seconds read from each seeked input: one frame at 10 fps and up
+ANALYSIS_WIDTH = 320
+ANALYSIS_HEIGHT = 180
+EDGE_MARGIN = 0.05  # skip this share of the clip at each end (slates, fades)
+SCENE_CHANGE = 0.4  # luma histogram distance between samples that marks a cut
+
+# Score weights
+WEIGHTS = {"sharpness": 0.35, "exposure": 0.25, "face": 0.25, "scene_distance": 0.15}
+
+_LUMA = np.array([0.299, 0.587, 0.114], dtype=np.float32)
+
+
+@dataclass
+class ThumbnailCandidate:
+    """A sampled frame and its scores (each 0-1, higher is better)"""
+    time: float
+    score: float
+    sharpness: float
+    exposure: float
+    face: float
+    scene_distance: float
+
+
+def sample_times(duration: float, count: int = SAMPLES) -> List[float]:
+    """count times spread evenly over the clip, away from its head and tail"""
+    if duration <= 0:
+        return []
+    start, end = duration * EDGE_MARGIN, duration * (1 - EDGE_MARGIN)
+    if count == 1:
+        return [duration / 2]
+    return [round(t, 3) for t in np.linspace(start, end, count)]
+
+
+def sample_frames(video_path: Path, times: Sequence[float], width: int = ANALYSIS_WIDTH,
+                  height: int = ANALYSIS_HEIGHT) -> np.ndarray:
+    """
+    One frame per time as (n, height, width, 3) uint8, from a single ffmpeg run.
+
+    Every time is its own input seeked with -ss before -i, so ffmpeg jumps to
+    the nearest keyframe and decodes only from there, and -t stops reading it
+    after FRAME_SPAN; the clip is never decoded end to end. Empty if the
+    frames can't be read.
+    """
+    from studioflow.core.ffmpeg import passthrough_args
+
+    cmd = ["ffmpeg", "-v", "error"]
+    for t in times:
+        cmd.extend(["-ss", f"{t:.3f}", "-t", f"{FRAME_SPAN}", "-i", str(video_path)])
+    chains = [f"[{i}:v:0]trim=end_frame=1,setpts=PTS-STARTPTS,"
+              f"scale={width}:{height},setsar=1[f{i}]" for i in range(len(times))]
+    chains.append("".join(f"[f{i}]" for i in range(len(times))) + f"concat=n={len(times)}:v=1:a=0[out]")
+    cmd.extend(["-filter_complex", ";".join(chains), "-map", "[out]", *passthrough_args(),
+                "-f", "rawvideo", "-pix_fmt", "rgb24", "-"])
+
+    try:
+        result = subprocess.run(cmd, capture_output=True, check=True)
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return np.zeros((0, height, width, 3), dtype=np.uint8)
+    frame_bytes = width * height * 3
+    count = len(result.stdout) // frame_bytes
+    return np.frombuffer(result.stdout[:count * frame_bytes], dtype=np.uint8).reshape(count, height, width, 3)
+
+
+def score_frames(frames: np.ndarray, times: Sequence[float]) -> List[ThumbnailCandidate]:
+    """Score sampled frames (in time order) relative to each other"""
+    if len(frames) == 0:
+        return []
+    rgb = frames.astype(np.float32)
+    luma = rgb @ _LUMA
+    height, width = luma.shape[1:]
+
+    # Sharpness: Laplacian variance, relative to the clip's sharpest sample
+    laplacian = (4 * luma[:, 1:-1, 1:-1] - luma[:, :-2, 1:-1] - luma[:, 2:, 1:-1]
+                 - luma[:, 1:-1, :-2] - luma[:, 1:-1, 2:])
+    sharpness = np.log1p(laplacian.reshape(len(frames), -1).var(axis=1))
+    sharpness = sharpness / sharpness.max() if sharpness.max() > 0 else sharpness
+
+    # Exposure: mid-grey mean, few clipped pixels
+    mean = luma.mean(axis=(1, 2))
+    clipped = ((luma < 8) | (luma > 247)).reshape(len(frames), -1).mean(axis=1)
+    exposure = np.clip(1 - np.abs(mean - 118) / 118, 0, 1) * np.clip(1 - 2 * clipped, 0, 1)
+
+    # Face region: skin tones (YCbCr) in the upper middle of the frame
+    box = rgb[:, int(height * 0.1):int(height * 0.7), int(width * 0.25):int(width * 0.75)]
+    r, g, b = box[..., 0], box[..., 1], box[..., 2]
+    cb = 128 - 0.168736 * r - 0.331264 * g + 0.5 * b
+    cr = 128 + 0.5 * r - 0.418688 * g - 0.081312 * b
+    skin = (cb >= 77) & (cb <= 127) & (cr >= 133) & (cr <= 173)
+    face = np.clip(skin.reshape(len(frames), -1).mean(axis=1) / 0.25, 0, 1)
+
+    # Scene distance: away from cuts between neighbouring samples (mid-transition
+    # frames blur two shots)
+    times = np.asarray(times, dtype=np.float64)
+    histograms = np.stack([np.histogram(frame, bins=64, range=(0, 256))[0] for frame in luma])
+    histograms = histograms / histograms.sum(axis=1, keepdims=True)
+    distance = 0.5 * np.abs(np.diff(histograms, axis=0)).sum(axis=1)
+    cuts = (times[:-1] + times[1:])[distance > SCENE_CHANGE] / 2
+    spacing = np.median(np.diff(times)) if len(times) > 1 else 1.0
+    if len(cuts):
+        nearest = np.abs(times[:, None] - cuts[None, :]).min(axis=1)
+        scene_distance = np.clip(nearest / (2 * spacing), 0, 1)
+    else:
+        scene_distance = np.ones(len(frames))
+
+    score = (WEIGHTS["sharpness"] * sharpness + WEIGHTS["exposure"] * exposure
+             + WEIGHTS["face"] * face + WEIGHTS["scene_distance"] * scene_distance)
+    return [ThumbnailCandidate(float(t), float(s), float(sh), float(e), float(f), float(d))
+            for t, s, sh, e, f, d in zip(times, score, sharpness, exposure, face, scene_distance)]
+
+
+def find_candidates(video_path: Path, samples: int = SAMPLES) -> List[ThumbnailCandidate]:
+    """
+    Every scored sample of a clip, best first, cached per file.
+
+    Callers take the top few for a gallery or the best one inside a time
+    range, so every sample is kept; either way the clip is sampled once.
+    """
+    thumbnail_cache = get_cache("thumbnails")
+    tag = f"samples={samples}"
+    cached = thumbnail_cache.get(video_path, tag)
+    if cached is not None:
+        return cached
+
+    from studioflow.core.ffmpeg import FFmpegProcessor
+
+    duration = FFmpegProcessor.get_media_info(video_path).get("duration_seconds", 0)
+    times = sample_times(duration, samples)
+    frames = sample_frames(video_path, times) if times else np.zeros((0,))
+    if len(frames) != len(times) or not times:
+        return []
+
+    candidates = sorted(score_frames(frames, times), key=lambda c: c.score, reverse=True)
+    thumbnail_cache.put(video_path, candidates, tag)
+    return candidates
+
+
+def best_thumbnail_time(video_path: Path, start: Optional[float] = None,
+                        end: Optional[float] = None) -> Optional[float]:
+    """Time of the best sampled frame (within [start, end] if given), None if none"""
+    for candidate in find_candidates(video_path):
+        if (start is None or candidate.time >= start) and (end is None or candidate.time <= end):
+            return candidate.time
+    return None
+
+
+def extract_frame(video_path: Path, time: float, output_path: Path, width: int = 1920) -> bool:
+    """Write the frame at time as an image, seeking the input (no decode from the start)"""
+    cmd = [
+        "ffmpeg",
+        "-ss", f"{time:.3f}",  # before -i: jump to the nearest keyframe
+        "-i", str(video_path),
+        "-frames:v", "1",
+        "-vf", f"scale={width}:-2",
+        "-q:v", "2",
+        "-y", str(output_path)
+    ]
+    try:
+        result = subprocess.run(cmd, capture_output=True, timeout=30)
+        return result.returncode == 0 and output_path.exists()
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        return False
 
 
 class ThumbnailGenerator:
@@ -13,10 +186,13 @@ class ThumbnailGenerator:
         self.project_path = project_path
 
     def generate(self, video_path: Path, output_path: Optional[Path] = None) -> Optional[Path]:
-        """Generate thumbnail from video"""
-        # Stub - implement with ffmpeg later
-        return None
+        """Write the clip's best frame (see find_candidates)"""
+        time = best_thumbnail_time(video_path)
+        if time is None:
+            return None
+        output_path = output_path or video_path.with_suffix(".jpg")
+        return output_path if extract_frame(video_path, time, output_path) else None
 
     def generate_batch(self, video_paths: list) -> list:
         """Generate thumbnails for multiple videos"""
-        return []
+        return [path for path in (self.generate(Path(video)) for video in video_paths) if path]
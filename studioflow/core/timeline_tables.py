@@ -0,0 +1,201 @@
+"""
+Compact timeline storage
+Struct-of-arrays tables for transcript entries, candidate segments and word
+timelines: numpy time/score columns, interned source files and labels, and
+one text blob per table instead of a Python object per row
+"""
+
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+import numpy as np
+
+from .rough_cut import Segment, SRTEntry
+
+
+class TextColumn:
+    """Strings stored as one blob with offsets"""
+    __slots__ = ("_blob", "_offsets")
+
+    def __init__(self, texts: Iterable[str]):
+        texts = list(texts)
+        self._blob = "".join(texts)
+        self._offsets = np.zeros(len(texts) + 1, dtype=np.int64)
+        np.cumsum([len(t) for t in texts], out=self._offsets[1:])
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, i: int) -> str:
+        return self._blob[self._offsets[i]:self._offsets[i + 1]]
+
+    @property
+    def nbytes(self) -> int:
+        return sys.getsizeof(self._blob) + self._offsets.nbytes
+
+
+class _Labels:
+    """Interned optional strings (speaker, topic, ...) as small integer codes, -1 for None"""
+    __slots__ = ("values", "codes")
+
+    def __init__(self, labels: Iterable[Optional[str]]):
+        lookup: Dict[str, int] = {}
+        self.values: List[str] = []
+        codes = []
+        for label in labels:
+            if label is None:
+                codes.append(-1)
+                continue
+            if label not in lookup:
+                lookup[label] = len(self.values)
+                self.values.append(label)
+            codes.append(lookup[label])
+        self.codes = np.array(codes, dtype=np.int32)
+
+    def __getitem__(self, i: int) -> Optional[str]:
+        code = self.codes[i]
+        return None if code < 0 else self.values[code]
+
+    @property
+    def nbytes(self) -> int:
+        return self.codes.nbytes + sum(sys.getsizeof(v) for v in self.values)
+
+
+class _Table(Sequence):
+    """Read-only sequence whose rows are materialized on access"""
+    __slots__ = ()
+
+    def _row(self, i: int):
+        raise NotImplementedError
+
+    def __getitem__(self, i: Union[int, slice]):
+        if isinstance(i, slice):
+            return [self._row(j) for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError(i)
+        return self._row(i)
+
+    def __iter__(self) -> Iterator:
+        return (self._row(i) for i in range(len(self)))
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (_Table, list, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({len(self)} rows)"
+
+
+class EntryTable(_Table):
+    """
+    Transcript entries of one clip, ordered by start time.
+
+    Drop-in for ClipAnalysis.entries once analysis is done: indexing,
+    slicing and iteration yield SRTEntry objects built on access (changing
+    them does not change the table). start/end are exposed for vectorized
+    lookups.
+    """
+    __slots__ = ("index", "start", "end", "_text")
+
+    def __init__(self, entries: Iterable[SRTEntry]):
+        entries = sorted(entries, key=lambda e: e.start_time)
+        self.index = np.array([e.index for e in entries], dtype=np.int32)
+        self.start = np.array([e.start_time for e in entries], dtype=np.float64)
+        self.end = np.array([e.end_time for e in entries], dtype=np.float64)
+        self._text = TextColumn(e.text for e in entries)
+
+    def __len__(self) -> int:
+        return len(self.start)
+
+    def _row(self, i: int) -> SRTEntry:
+        return SRTEntry(int(self.index[i]), float(self.start[i]), float(self.end[i]), self._text[i])
+
+    def text(self, i: int) -> str:
+        return self._text[i]
+
+    @property
+    def nbytes(self) -> int:
+        return self.index.nbytes + self.start.nbytes + self.end.nbytes + self._text.nbytes
+
+
+class SegmentTable(_Table):
+    """
+    Candidate segments with interned source files.
+
+    Rows are Segment objects built on access, like EntryTable. Tables built
+    with the same `sources` list share one copy of each Path.
+    """
+    __slots__ = ("sources", "source_id", "start", "end", "score", "_text",
+                 "_speaker", "_topic", "_segment_type")
+
+    def __init__(self, segments: Iterable[Segment], sources: Optional[List[Path]] = None):
+        segments = list(segments)
+        self.sources = sources if sources is not None else []
+        ids = {path: i for i, path in enumerate(self.sources)}
+        source_id = []
+        for seg in segments:
+            if seg.source_file not in ids:
+                ids[seg.source_file] = len(self.sources)
+                self.sources.append(seg.source_file)
+            source_id.append(ids[seg.source_file])
+        self.source_id = np.array(source_id, dtype=np.int32)
+        self.start = np.array([s.start_time for s in segments], dtype=np.float64)
+        self.end = np.array([s.end_time for s in segments], dtype=np.float64)
+        self.score = np.array([s.score for s in segments], dtype=np.float64)
+        self._text = TextColumn(s.text for s in segments)
+        self._speaker = _Labels(s.speaker for s in segments)
+        self._topic = _Labels(s.topic for s in segments)
+        self._segment_type = _Labels(s.segment_type for s in segments)
+
+    def __len__(self) -> int:
+        return len(self.start)
+
+    def _row(self, i: int) -> Segment:
+        return Segment(
+            source_file=self.sources[self.source_id[i]],
+            start_time=float(self.start[i]),
+            end_time=float(self.end[i]),
+            text=self._text[i],
+            speaker=self._speaker[i],
+            topic=self._topic[i],
+            score=float(self.score[i]),
+            segment_type=self._segment_type[i],
+        )
+
+    @property
+    def nbytes(self) -> int:
+        return (self.source_id.nbytes + self.start.nbytes + self.end.nbytes + self.score.nbytes
+                + self._text.nbytes + self._speaker.nbytes + self._topic.nbytes
+                + self._segment_type.nbytes)
+
+
+class WordTable:
+    """Word timeline of a transcript (word-level start/end times and text)"""
+    __slots__ = ("start", "end", "_text")
+
+    def __init__(self, words: Iterable[dict]):
+        words = sorted((w for w in words if isinstance(w, dict)), key=lambda w: w.get("start", 0))
+        self.start = np.array([w.get("start", 0) for w in words], dtype=np.float64)
+        self.end = np.array([w.get("end", 0) for w in words], dtype=np.float64)
+        self._text = TextColumn(w.get("word", "").strip() for w in words)
+
+    @classmethod
+    def from_transcript(cls, transcript: dict) -> "WordTable":
+        return cls(transcript.get("words") or [])
+
+    def __len__(self) -> int:
+        return len(self.start)
+
+    def words_within(self, start: float, end: float) -> List[str]:
+        """Words spoken entirely inside [start, end]"""
+        lo = int(np.searchsorted(self.start, start, side="left"))
+        hi = int(np.searchsorted(self.start, end, side="right"))
+        return [self._text[i] for i in range(lo, hi) if self.end[i] <= end]
+
+    @property
+    def nbytes(self) -> int:
+        return self.start.nbytes + self.end.nbytes + self._text.nbytes
@@ -2,13 +2,24 @@
 Extract transcript text for segments from JSON transcripts
 """
 
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
+from functools import lru_cache
 from pathlib import Path
 import json
 
 from .rough_cut import Segment, ClipAnalysis
 
 
+@lru_cache(maxsize=64)
+def _load_transcript(path: str, mtime_ns: int, size: int) -> Tuple[dict, "WordTable"]:
+    """Parsed JSON transcript and its word timeline (cached while the file is unchanged)"""
+    from .timeline_tables import WordTable
+
+    with open(path, 'r') as f:
+        transcript_data = json.load(f)
+    return transcript_data, WordTable.from_transcript(transcript_data)
+
+
 def extract_segment_text(segment: Segment, clip: ClipAnalysis) -> str:
     """
     Extract transcript text for a segment from JSON transcript
@@ -24,24 +35,17 @@ def extract_segment_text(segment: Segment, clip: ClipAnalysis) -> str:
         return ""
     
     try:
-        with open(clip.transcript_json_path, 'r') as f:
-            transcript_data = json.load(f)
-        
-        words = transcript_data.get("words", [])
-        if not words:
+        st = clip.transcript_json_path.stat()
+        transcript_data, words = _load_transcript(str(clip.transcript_json_path), st.st_mtime_ns, st.st_size)
+        if not len(words):
             return ""
         
         # Extract words within segment time range
-        segment_words = [
-            w for w in words
-            if (w.get("start", 0) >= segment.start_time and 
-                w.get("end", 0) <= segment.end_time)
-        ]
+        segment_words = words.words_within(segment.start_time, segment.end_time)
         
         if segment_words:
             # Join words with spaces
-            text = " ".join(w.get("word", "").strip() for w in segment_words)
-            return text
+            return " ".join(segment_words)
         
         # Fallback: try to extract from segments
         segments = transcript_data.get("segments", [])
@@ -133,6 +133,7 @@ class TranscriptionService:
                 with open(json_file, "w") as f:
                     json.dump(json_data, f, indent=2)
                 output_files["json"] = json_file
+                self._index_transcript(audio_path, json_data, json_file)
 
             return {
                 "success": True,
@@ -184,6 +185,13 @@ class TranscriptionService:
                 if file_path.exists():
                     output_files[fmt] = file_path
 
+            if "json" in output_files:
+                try:
+                    with open(output_files["json"]) as f:
+                        self._index_transcript(audio_path, json.load(f), output_files["json"])
+                except (OSError, ValueError):
+                    pass
+
             # Read text content
             txt_file = output_files.get("txt")
             text = txt_file.read_text() if txt_file else ""
@@ -206,6 +214,11 @@ class TranscriptionService:
                 "error": str(e)
             }
 
+    def _index_transcript(self, media_path: Path, transcript: Dict[str, Any], json_file: Path):
+        """Make a new transcript searchable right away (see studioflow.core.search_index)"""
+        from studioflow.core.search_index import index_transcript
+        index_transcript(media_path, transcript, json_file)
+
     def _format_timestamp(self, seconds: float) -> str:
         """Format timestamp for SRT format"""
         hours = int(seconds // 3600)
@@ -17,6 +17,8 @@ from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeRe
 from .config import get_config
 from .state import StateManager
 from .project import Project, ProjectManager, ProjectResult
+from .catalog import record_pipeline_stage
+from .storage_usage import record_added
 from .auto_import import AutoImportService, CameraProfile
 from .ffmpeg import FFmpegProcessor
 from .transcription import TranscriptionService
@@ -177,6 +179,7 @@ class UnifiedImportPipeline:
                 # Copy to project
                 try:
                     shutil.copy2(video_file, dest_file)
+                    record_added(dest_file)
                     imported_count += 1
                     console.print(f"  [green]✓[/green] {video_file.name}")
                 except Exception as e:
@@ -395,6 +398,14 @@ class UnifiedImportPipeline:
             # SUCCESS
             # ============================================================
             result.success = True
+            record_pipeline_stage(
+                project.path, "import",
+                files_imported=result.files_imported,
+                files_normalized=result.files_normalized,
+                proxies_created=result.proxies_created,
+                transcripts_generated=result.transcripts_generated,
+                markers_detected=result.markers_detected,
+            )
             console.print(f"\n[bold green]✅ Import complete![/bold green]")
             console.print(f"Project: {project_name}")
             console.print(f"Location: {project.path}")
@@ -703,6 +714,7 @@ class UnifiedImportPipeline:
             edl_path = project_path / "04_Timelines" / "rough_cut.edl"
             edl_path.parent.mkdir(parents=True, exist_ok=True)
             self.rough_cut_engine.export_edl(plan, edl_path)
+            record_pipeline_stage(project_path, "rough_cut", output=str(edl_path), style=CutStyle.EPISODE.value)
             
             console.print(f"  [green]✓[/green] Rough cut: {edl_path}")
             return True
@@ -4,15 +4,25 @@ Simple, reliable, with auto-repair capabilities
 """
 
 import hashlib
+import os
 import shutil
 import json
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Optional, Tuple, Dict, Any
-from dataclasses import dataclass
+from typing import Optional, Tuple, Dict, Any, Callable, List
+from dataclasses import dataclass, field
 from datetime import datetime
 import subprocess
 
 
+MANIFEST_NAME = ".studioflow_manifest.json"
+MEDIA_EXTENSIONS = {'.mp4', '.mov', '.avi', '.mkv', '.mxf', '.mp3', '.wav', '.jpg', '.png'}
+HASH_READ_SIZE = 8 * 1024 * 1024  # large, page-aligned reads keep disks streaming
+CHECKPOINT_INTERVAL = 5.0  # seconds between checkpoint flushes
+HASHES_IN_FLIGHT = 2  # queued hashes per worker (bounds the work an interrupt abandons)
+
+
 @dataclass
 class VerificationResult:
     """Enhanced verification result with repair info"""
@@ -24,6 +34,21 @@ class VerificationResult:
     size_bytes: int = 0
 
 
+@dataclass
+class ManifestReport:
+    """Outcome of checking a directory against its manifest"""
+    checked: int = 0
+    skipped: int = 0  # unchanged files not rehashed (changed_only)
+    modified: List[str] = field(default_factory=list)   # size/mtime and contents changed
+    corrupted: List[str] = field(default_factory=list)  # contents changed, size/mtime did not
+    missing: List[str] = field(default_factory=list)
+    new: List[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not (self.modified or self.corrupted or self.missing)
+
+
 class FileVerifier:
     """Robust file verification with auto-repair"""
 
@@ -35,9 +60,14 @@ class FileVerifier:
 
         try:
             sha256_hash = hashlib.sha256()
-            with open(file_path, "rb") as f:
-                for byte_block in iter(lambda: f.read(65536), b""):
-                    sha256_hash.update(byte_block)
+            buffer = bytearray(HASH_READ_SIZE)
+            view = memoryview(buffer)
+            with open(file_path, "rb", buffering=0) as f:
+                while True:
+                    n = f.readinto(buffer)
+                    if not n:
+                        break
+                    sha256_hash.update(view[:n])
             return sha256_hash.hexdigest()
         except Exception:
             return None
@@ -144,12 +174,28 @@ class FileVerifier:
 
     @staticmethod
     def safe_copy(source: Path, destination: Path, verify: bool = True) -> VerificationResult:
-        """Copy file with verification"""
+        """
+        Copy file with verification
+
+        The source is hashed while it is copied, so verification only has
+        to read the destination back once.
+        """
         try:
             destination.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(source, destination)
-
-            if verify and not FileVerifier.compare_files(source, destination):
+            source_hash = hashlib.sha256()
+            buffer = bytearray(HASH_READ_SIZE)
+            view = memoryview(buffer)
+            with open(source, "rb", buffering=0) as src, open(destination, "wb") as dst:
+                while True:
+                    n = src.readinto(buffer)
+                    if not n:
+                        break
+                    source_hash.update(view[:n])
+                    dst.write(view[:n])
+            shutil.copystat(source, destination)
+            digest = source_hash.hexdigest()
+
+            if verify and FileVerifier.calculate_hash(destination) != digest:
                 destination.unlink(missing_ok=True)
                 return VerificationResult(
                     False, destination,
@@ -158,7 +204,7 @@ class FileVerifier:
 
             return VerificationResult(
                 True, destination,
-                hash=FileVerifier.calculate_hash(destination),
+                hash=digest,
                 size_bytes=destination.stat().st_size
             )
 
@@ -177,26 +223,192 @@ class FileVerifier:
             return False, 0.0
 
     @staticmethod
-    def create_manifest(directory: Path) -> Dict[str, Any]:
-        """Create integrity manifest for directory"""
+    def _media_files(directory: Path) -> Dict[str, Tuple[int, int]]:
+        """{relative path: (size, mtime_ns)} for media files below directory"""
+        from studioflow.core.file_index import get_file_index
+
+        directory = directory.resolve()
+        index = get_file_index(directory)
+        return {
+            str(entry.path.relative_to(directory)): (entry.size, entry.mtime_ns)
+            for entry in index.files(exts=MEDIA_EXTENSIONS, under=directory)
+        }
+
+    @staticmethod
+    def _hash_files(
+        directory: Path,
+        files: Dict[str, Tuple[int, int]],
+        checkpoint: Path,
+        workers: int = 4,
+        progress: Optional[Callable[[str, int], None]] = None
+    ) -> Dict[str, Optional[str]]:
+        """
+        Hash files on a thread pool, checkpointing results as they finish.
+
+        The checkpoint is a JSON-lines file; entries whose size and mtime
+        still match are reused, so an interrupted run resumes where it
+        stopped. It is removed once every file has been hashed.
+        """
+        hashes: Dict[str, Optional[str]] = {}
+        if checkpoint.exists():
+            with open(checkpoint) as f:
+                for line in f:
+                    try:
+                        done = json.loads(line)
+                    except ValueError:
+                        continue  # torn last line from an interrupted write
+                    if files.get(done["path"]) == (done["size"], done["mtime_ns"]):
+                        hashes[done["path"]] = done["hash"]
+
+        todo = iter(sorted(rel for rel in files if rel not in hashes))
+        try:
+            log = open(checkpoint, "a")
+            if log.tell() and not checkpoint.read_bytes().endswith(b"\n"):
+                log.write("\n")  # don't append to a torn last line
+        except OSError:
+            log = None  # read-only media: hash without a checkpoint
+
+        # Files are submitted in small batches rather than all at once, so on
+        # Ctrl-C only the hashes already running are waited for and
+        # everything finished so far is in the checkpoint
+        pool = ThreadPoolExecutor(max_workers=workers)
+        pending: Dict[Any, str] = {}
+        try:
+            last_flush = time.monotonic()
+            while True:
+                for rel in todo:
+                    pending[pool.submit(FileVerifier.calculate_hash, directory / rel)] = rel
+                    if len(pending) >= workers * HASHES_IN_FLIGHT:
+                        break
+                if not pending:
+                    break
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                # Record the hashes that succeeded before raising a failed one
+                for future in sorted(finished, key=lambda f: f.exception() is not None):
+                    rel = pending.pop(future)
+                    hashes[rel] = future.result()
+                    size, mtime_ns = files[rel]
+                    if log and hashes[rel] is not None:
+                        log.write(json.dumps({"path": rel, "size": size, "mtime_ns": mtime_ns,
+                                              "hash": hashes[rel]}) + "\n")
+                        if time.monotonic() - last_flush > CHECKPOINT_INTERVAL:
+                            log.flush()
+                            last_flush = time.monotonic()
+                    if progress:
+                        progress(rel, size)
+        except BaseException:
+            pool.shutdown(cancel_futures=True)
+            raise
+        finally:
+            pool.shutdown()
+            if log:
+                log.close()
+
+        if log:
+            checkpoint.unlink(missing_ok=True)
+        return hashes
+
+    @staticmethod
+    def load_manifest(directory: Path) -> Optional[Dict[str, Any]]:
+        manifest_path = directory / MANIFEST_NAME
+        if not manifest_path.exists():
+            return None
+        with open(manifest_path) as f:
+            return json.load(f)
+
+    @staticmethod
+    def create_manifest(
+        directory: Path,
+        workers: int = 4,
+        update: bool = False,
+        progress: Optional[Callable[[str, int], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Create integrity manifest for directory
+
+        Hashing is parallel and resumable (see _hash_files). With update=True
+        hashes from an existing manifest are kept for files whose size and
+        mtime are unchanged.
+        """
+        files = FileVerifier._media_files(directory)
+        previous = (FileVerifier.load_manifest(directory) or {}).get("files", {}) if update else {}
+
+        reused = {
+            rel: info["hash"] for rel, info in previous.items()
+            if rel in files and files[rel] == (info.get("size"), info.get("mtime_ns"))
+        }
+        to_hash = {rel: stat for rel, stat in files.items() if rel not in reused}
+        hashes = FileVerifier._hash_files(
+            directory, to_hash, directory / (MANIFEST_NAME + ".partial"), workers, progress
+        )
+        hashes.update(reused)
+
         manifest = {
             "created": datetime.now().isoformat(),
             "directory": str(directory),
-            "files": {}
+            "algorithm": "sha256",
+            "files": {
+                rel: {"hash": hashes.get(rel), "size": size, "mtime_ns": mtime_ns}
+                for rel, (size, mtime_ns) in sorted(files.items())
+            }
         }
 
-        media_extensions = {'.mp4', '.mov', '.avi', '.mkv', '.mp3', '.wav', '.jpg', '.png'}
-
-        for file_path in directory.rglob("*"):
-            if file_path.is_file() and file_path.suffix.lower() in media_extensions:
-                rel_path = str(file_path.relative_to(directory))
-                manifest["files"][rel_path] = {
-                    "hash": FileVerifier.calculate_hash(file_path),
-                    "size": file_path.stat().st_size
-                }
-
-        manifest_path = directory / ".studioflow_manifest.json"
-        with open(manifest_path, "w") as f:
+        # Write atomically so a crash never leaves a truncated manifest
+        manifest_path = directory / MANIFEST_NAME
+        tmp_path = manifest_path.with_name(manifest_path.name + ".tmp")
+        with open(tmp_path, "w") as f:
             json.dump(manifest, f, indent=2)
+        os.replace(tmp_path, manifest_path)
+
+        return manifest
 
-        return manifest
\ No newline at end of file
+    @staticmethod
+    def verify_manifest(
+        directory: Path,
+        changed_only: bool = False,
+        workers: int = 4,
+        progress: Optional[Callable[[str, int], None]] = None
+    ) -> ManifestReport:
+        """
+        Check a directory against its manifest
+
+        A full check rehashes every file and catches silent corruption
+        (bit rot). changed_only rehashes only files whose size or mtime
+        differ from the manifest, which is enough after copies and edits.
+        """
+        manifest = FileVerifier.load_manifest(directory)
+        if manifest is None:
+            raise FileNotFoundError(f"No manifest in {directory}")
+
+        recorded = manifest.get("files", {})
+        files = FileVerifier._media_files(directory)
+        report = ManifestReport()
+        report.missing = sorted(rel for rel in recorded if rel not in files)
+        report.new = sorted(rel for rel in files if rel not in recorded)
+
+        to_hash = {}
+        for rel, (size, mtime_ns) in files.items():
+            info = recorded.get(rel)
+            if info is None:
+                continue
+            if info.get("size") != size:
+                report.modified.append(rel)  # no need to read it
+            elif changed_only and info.get("mtime_ns") == mtime_ns:
+                report.skipped += 1
+            else:
+                to_hash[rel] = (size, mtime_ns)
+
+        hashes = FileVerifier._hash_files(
+            directory, to_hash, directory / (MANIFEST_NAME + ".verify.partial"), workers, progress
+        )
+        for rel, digest in hashes.items():
+            report.checked += 1
+            if digest != recorded[rel].get("hash"):
+                if recorded[rel].get("mtime_ns") == files[rel][1]:
+                    report.corrupted.append(rel)
+                else:
+                    report.modified.append(rel)
+
+        report.modified.sort()
+        report.corrupted.sort()
+        return report
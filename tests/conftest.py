@@ -11,6 +11,18 @@ from typing import Generator
 from studioflow.core.config import Config, ConfigManager, StorageConfig
 
 
+@pytest.fixture(autouse=True)
+def isolated_catalog(tmp_path, monkeypatch):
+    """Keep project saves out of the developer's ~/.studioflow/catalog.db"""
+    from studioflow.core import catalog
+
+    monkeypatch.setenv("STUDIOFLOW_CATALOG", str(tmp_path / "catalog.db"))
+    yield
+    if catalog._catalog is not None:
+        catalog._catalog.close()
+        catalog._catalog = None
+
+
 @pytest.fixture
 def temp_project_dir() -> Generator[Path, None, None]:
     """Create a temporary project directory with structure"""
@@ -0,0 +1,29 @@
+"""
+Tests for background rough cut style selection
+"""
+
+import pytest
+from typer.testing import CliRunner
+
+from studioflow.core.background_services import parse_styles
+from studioflow.core.rough_cut import CutStyle
+
+
+def test_every_named_style_is_planned():
+    assert parse_styles("doc, episode,tutorial") == [CutStyle.DOC, CutStyle.EPISODE, CutStyle.TUTORIAL]
+    assert parse_styles("review,unboxing,review") == [CutStyle.REVIEW, CutStyle.UNBOXING]
+    assert parse_styles("") == [CutStyle.DOC]
+
+
+def test_unknown_styles_are_rejected():
+    with pytest.raises(ValueError, match="documentary, vlog"):
+        parse_styles("doc,documentary,vlog")
+
+
+def test_start_rejects_unknown_styles():
+    from studioflow.cli.commands.background import app
+
+    result = CliRunner().invoke(app, ["start", "--styles", "doc,vlog", "-p", "demo"])
+
+    assert result.exit_code == 1
+    assert "Unknown rough cut style: vlog" in result.output
@@ -0,0 +1,113 @@
+"""
+Tests for the TF-IDF B-roll index
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from studioflow.core.broll_index import BrollIndex, tokenize
+from studioflow.core.rough_cut import ClipAnalysis, RoughCutEngine, Segment, SRTEntry
+
+
+def _clip(name, **kwargs):
+    return ClipAnalysis(file_path=Path(f"/broll/{name}.mp4"), duration=20.0, transcript_path=None, **kwargs)
+
+
+def test_tokenize_filenames_and_text():
+    assert tokenize("BROLL_cityStreets-night_0042") == ["city", "street", "night"]
+    assert tokenize("We talked about the mountains and batteries") == ["talked", "mountain", "battery"]
+
+
+class TestBrollIndex:
+    clips = [
+        _clip("solar_panels_roof"),
+        _clip("city_traffic_night"),
+        _clip("C0042", topics=["solar"], entries=[SRTEntry(1, 0.0, 2.0, "wind turbines turning")]),
+        _clip("forest_drone"),
+    ]
+
+    def test_similarity_matches_a_dense_scan(self):
+        index = BrollIndex(self.clips)
+        queries = [["solar", "roof"], ["wind", "turbine"], ["nothing"], ["city", "solar"]]
+
+        scores = index.similarity(queries)
+
+        assert scores.shape == (4, 4)
+        assert scores[0].argmax() == 0 and scores[1].argmax() == 2
+        assert not scores[2].any()
+        # Same as the dense product of the tf-idf matrices
+        vocab = index.vocabulary
+        docs = np.zeros((4, len(vocab)))
+        for term, term_id in vocab.items():
+            for p in range(index.indptr[term_id], index.indptr[term_id + 1]):
+                docs[index.doc_ids[p], term_id] = index.weights[p]
+        assert np.allclose(np.linalg.norm(docs, axis=1), 1.0)
+        query = np.zeros(len(vocab))
+        for term in queries[3]:
+            query[vocab[term]] += index.idf[vocab[term]]
+        assert np.allclose(scores[3], docs @ (query / np.linalg.norm(query)))
+
+    def test_top_k_respects_reuse_and_fills(self):
+        index = BrollIndex(self.clips)
+        matches = index.match([["solar"]] * 3 + [["unknown"]] * 2, k=2, max_uses=2)
+
+        assert [i for i, _ in matches[0]] == [2, 0] or [i for i, _ in matches[0]] == [0, 2]
+        assert [i for i, _ in matches[1]] == [i for i, _ in matches[0]]
+        # Both solar clips are used up: the third query gets the unused ones
+        assert sorted(i for i, _ in matches[2]) == [1, 3] and all(s == 0.0 for _, s in matches[2])
+        assert sorted(i for i, _ in matches[3]) == [1, 3]
+        assert matches[4] == []  # every clip has been placed twice
+
+        assert index.match([["unknown"]], fill=False) == [[]]
+
+
+def test_engine_places_best_broll_after_each_segment():
+    engine = RoughCutEngine()
+    broll = [_clip("climate_protest"), _clip("kitchen_cooking"), _clip("ocean_waves")]
+    arc = {"act_1": [Segment(Path("interview.mp4"), 0.0, 8.0, "the ocean keeps rising", topic="ocean")],
+           "act_2": [Segment(Path("interview.mp4"), 8.0, 16.0, "cooking at home in the kitchen")]}
+
+    result = engine._add_broll_to_segments(arc, broll)
+
+    assert [s.source_file.stem for s in result["act_1"]] == ["interview", "ocean_waves", "climate_protest"]
+    assert result["act_2"][1].source_file.stem == "kitchen_cooking" and result["act_2"][1].score > 0
+    assert engine._match_broll_to_interview(arc["act_1"][0], ["ocean"], "ocean", broll)[0][0] is broll[2]
+
+
+def test_engine_builds_the_index_once_per_broll_set(monkeypatch):
+    from studioflow.core import broll_index
+
+    built = []
+    real = broll_index.BrollIndex
+
+    def counting(clips, *args, **kwargs):
+        built.append(len(clips))
+        return real(clips, *args, **kwargs)
+
+    monkeypatch.setattr(broll_index, "BrollIndex", counting)
+    engine = RoughCutEngine()
+    broll = [_clip("climate_protest"), _clip("ocean_waves")]
+    arc = {"act_1": [Segment(Path("interview.mp4"), 0.0, 8.0, "the ocean keeps rising", topic="ocean")]}
+
+    engine._add_broll_to_segments(arc, broll)
+    for _ in range(3):
+        engine._match_broll_to_interview(arc["act_1"][0], ["ocean"], "ocean", list(broll))
+    assert built == [2]
+
+    engine._match_broll_to_interview(arc["act_1"][0], ["ocean"], "ocean", broll[:1])
+    assert built == [2, 1]
+
+
+@pytest.mark.slow
+def test_thousands_of_clips_stay_interactive():
+    rng = np.random.default_rng(0)
+    words = [f"{a}{b}" for a in ("sun", "sea", "sky", "car", "dog", "tree", "road", "rain")
+             for b in ("light", "wave", "line", "park", "town", "field", "storm", "fall")]
+    documents = [list(rng.choice(words, 6)) for _ in range(5000)]
+    index = BrollIndex([None] * 5000, documents)
+    queries = [list(rng.choice(words, 8)) for _ in range(1000)]
+
+    matches = index.match(queries)
+    assert len(matches) == 1000 and all(len(m) == 2 for m in matches)
@@ -0,0 +1,156 @@
+"""
+Tests for sidecar parsing and the persistent exiftool session
+"""
+
+import io
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from studioflow.core import camera_metadata as cm
+from studioflow.core.camera_metadata import ExiftoolSession, camera_metadata, parse_sony_sidecar
+
+SIDECAR = """<?xml version="1.0" encoding="UTF-8"?>
+<NonRealTimeMeta xmlns="urn:schemas-professionalDisc:nonRealTimeMeta:ver.2.00" lastUpdate="2024-05-01T10:00:00+02:00">
+  <TargetMaterial umidRef="060A2B34"/>
+  <Duration value="1798"/>
+  <LtcChangeTable tcFps="30" halfStep="false">
+    <LtcChange frameCount="0" value="14350101" status="increment"/>
+    <LtcChange frameCount="1797" value="11360101" status="end"/>
+  </LtcChangeTable>
+  <CreationDate value="2024-05-01T10:00:00+02:00"/>
+  <VideoFormat>
+    <VideoRecPort port="DIRECT"/>
+    <VideoFrame videoCodec="AVC_3840_2160_HP@L51" captureFps="59.94p" formatFps="29.97p"/>
+    <VideoLayout pixel="3840" numOfVerticalLine="2160" aspectRatio="16:9"/>
+  </VideoFormat>
+  <AudioFormat numOfChannel="2"/>
+  <Device manufacturer="Sony" modelName="ILME-FX30" serialNo="1234567"/>
+  <AcquisitionRecord>
+    <Group name="CameraUnitMetadataSet">
+      <Item name="CaptureGammaEquation" value="s-log3-cine"/>
+      <Item name="CaptureColorPrimaries" value="S-Gamut3-Cine"/>
+    </Group>
+  </AcquisitionRecord>
+</NonRealTimeMeta>
+"""
+
+# Speaks exiftool's -stay_open protocol; logs one line per process start
+FAKE_EXIFTOOL = textwrap.dedent('''\
+    import json, sys, time
+    open(sys.argv[1], "a").write("start\\n")
+    files = []
+    for line in sys.stdin:
+        line = line.rstrip("\\n")
+        if line.startswith("-execute"):
+            if any("hang" in f for f in files):
+                time.sleep(60)
+            records = [{"SourceFile": f, "Make": "Sony", "Model": "ZV-E10", "ISO": 800} for f in files]
+            sys.stdout.write(json.dumps(records) + "\\n{ready%s}\\n" % line[len("-execute"):])
+            sys.stdout.flush()
+            files = []
+        elif line == "False":
+            break
+        elif not line.startswith("-") and line not in ("True", "filename=utf8"):
+            files.append(line)
+''')
+
+
+def test_sidecar_fields():
+    data = parse_sony_sidecar(io.BytesIO(SIDECAR.encode()))
+
+    assert data["camera_make"] == "Sony" and data["camera_model"] == "ILME-FX30"
+    assert data["framerate"] == pytest.approx(29.97, abs=0.001) and data["capture_fps"] == pytest.approx(59.94, abs=0.01)
+    assert data["duration"] == pytest.approx(1798 * 1001 / 30000)
+    assert data["timecode"] == "01:01:35:14"
+    assert data["resolution"] == (3840, 2160) and data["codec"] == "h264"
+    assert data["gamma"] == "s-log3-cine" and data["color_mode"] == "S-Gamut3-Cine"
+    assert data["creation_time"].year == 2024 and data["audio_channels"] == 2
+
+
+def test_session_serves_many_requests_from_one_process(tmp_path):
+    script = tmp_path / "exiftool.py"
+    script.write_text(FAKE_EXIFTOOL)
+    starts = tmp_path / "starts.log"
+    launcher = tmp_path / "exiftool"
+    launcher.write_text(f"#!/bin/sh\nexec {sys.executable} {script} {starts} \"$@\"\n")
+    launcher.chmod(0o755)
+
+    session = ExiftoolSession(str(launcher))
+    try:
+        first = session.metadata([Path("/card/A.MP4"), Path("/card/B.MP4")])
+        second = session.metadata([Path("/card/C.MP4")])
+    finally:
+        session.close()
+
+    assert set(first) == {Path("/card/A.MP4"), Path("/card/B.MP4")}
+    assert second[Path("/card/C.MP4")]["Model"] == "ZV-E10"
+    assert starts.read_text() == "start\n"
+
+
+def test_hung_request_restarts_the_session(tmp_path):
+    script = tmp_path / "exiftool.py"
+    script.write_text(FAKE_EXIFTOOL)
+    starts = tmp_path / "starts.log"
+    launcher = tmp_path / "exiftool"
+    launcher.write_text(f"#!/bin/sh\nexec {sys.executable} {script} {starts} \"$@\"\n")
+    launcher.chmod(0o755)
+
+    session = ExiftoolSession(str(launcher))
+    try:
+        with pytest.raises(TimeoutError):
+            session.execute(["-j", "/card/hang.MP4"], timeout=0.5)
+        after = session.metadata([Path("/card/A.MP4")])
+    finally:
+        session.close()
+
+    assert after[Path("/card/A.MP4")]["Model"] == "ZV-E10"
+    assert starts.read_text() == "start\nstart\n"
+
+
+class FakeSession:
+    def __init__(self):
+        self.batches = []
+
+    def metadata(self, paths):
+        self.batches.append(list(paths))
+        return {path: {"SourceFile": str(path), "Make": "Sony", "Model": "ZV-E10", "ISO": 800}
+                for path in paths if "corrupt" not in path.name}
+
+
+def test_sidecars_first_then_one_batched_request(monkeypatch, tmp_path):
+    session = FakeSession()
+    monkeypatch.setattr(cm, "get_exiftool", lambda: session)
+    monkeypatch.setattr(cm, "_exiftool_missing", False)
+    (tmp_path / "C0001M01.XML").write_text(SIDECAR)
+    clips = [tmp_path / name for name in ("C0001.MP4", "DSC0002.MP4", "DSC0003.MP4", "corrupt.MP4")]
+    for clip in clips:
+        clip.write_bytes(b"\0")
+
+    results = camera_metadata(clips)
+
+    assert results[clips[0]]["source"] == "sidecar" and results[clips[0]]["camera_model"] == "ILME-FX30"
+    assert results[clips[1]] == {"source": "exiftool", "camera_make": "Sony", "camera_model": "ZV-E10", "iso": 800}
+    assert results[clips[3]] == {}
+    assert session.batches == [clips[1:]]
+    camera_metadata(clips)
+    assert session.batches[1:] == [[clips[3]]]  # only the unreadable file is asked again
+
+
+def test_missing_exiftool_is_remembered(monkeypatch, tmp_path):
+    calls = []
+
+    def missing():
+        calls.append(1)
+        raise FileNotFoundError("exiftool")
+
+    monkeypatch.setattr(cm, "get_exiftool", missing)
+    monkeypatch.setattr(cm, "_exiftool_missing", False)
+    clip = tmp_path / "clip.mp4"
+    clip.write_bytes(b"\0")
+
+    assert camera_metadata([clip]) == {clip: {}}
+    assert camera_metadata([clip]) == {clip: {}}
+    assert len(calls) == 1
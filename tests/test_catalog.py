@@ -0,0 +1,119 @@
+"""
+Tests for the cross-project catalog
+"""
+
+import json
+import os
+
+import pytest
+
+from studioflow.core import catalog as catalog_module
+from studioflow.core import config as config_module
+from studioflow.core.catalog import ProjectCatalog, default_catalog_path, get_catalog, record_pipeline_stage
+from studioflow.core.project import Project, ProjectManager
+
+
+def _make_project(root, name, modified_at="2026-01-01 00:00:00"):
+    meta_dir = root / name / ".studioflow"
+    meta_dir.mkdir(parents=True)
+    (meta_dir / "project.json").write_text(json.dumps({
+        "name": name, "modified_at": modified_at, "status": "active",
+        "media_count": 3, "total_size_bytes": 1024,
+    }))
+    return root / name
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    cat = ProjectCatalog(tmp_path / "catalog.db")
+    yield cat
+    cat.close()
+
+
+class TestProjectCatalog:
+    def test_sync_root_reads_only_when_changed(self, catalog, tmp_path, monkeypatch):
+        root = tmp_path / "Projects"
+        _make_project(root, "older", "2026-01-01 00:00:00")
+        _make_project(root, "newer", "2026-02-01 00:00:00")
+
+        report = catalog.sync_root(root, "active")
+        assert report.added == 2
+        assert [e.name for e in catalog.entries(["active"])] == ["newer", "older"]
+
+        # Unchanged tier directory: nothing is listed or parsed
+        monkeypatch.setattr(catalog_module, "_list_dirs", lambda root: pytest.fail("rescanned"))
+        assert catalog.sync_root(root, "active").added == 0
+
+    def test_sync_root_picks_up_added_and_removed(self, catalog, tmp_path):
+        root = tmp_path / "Projects"
+        gone = _make_project(root, "gone")
+        catalog.sync_root(root, "active")
+
+        (gone / ".studioflow" / "project.json").unlink()
+        (gone / ".studioflow").rmdir()
+        gone.rmdir()
+        _make_project(root, "fresh")
+        os.utime(root, ns=(1, 10**18))  # make sure the directory mtime moves
+
+        report = catalog.sync_root(root, "active")
+        assert (report.added, report.removed) == (1, 1)
+        assert [e.name for e in catalog.entries()] == ["fresh"]
+
+    def test_pipeline_state_survives_metadata_updates(self, catalog, tmp_path):
+        path = _make_project(tmp_path, "demo")
+        catalog.record_stage(path, "import", files_imported=12)
+        catalog.upsert(path, {"name": "demo", "modified_at": "2026-03-01"})
+
+        entry = catalog.get(path)
+        assert entry.pipeline["import"]["files_imported"] == 12
+        assert entry.pipeline["import"]["status"] == "completed"
+        assert entry.metadata["modified_at"] == "2026-03-01"
+
+    def test_reindex_drops_missing_projects(self, catalog, tmp_path):
+        catalog.upsert(tmp_path / "vanished", {"name": "vanished"})
+        _make_project(tmp_path / "Projects", "kept")
+
+        report = catalog.reindex({"active": tmp_path / "Projects", "archive": None})
+        assert report.removed == 1
+        assert [e.name for e in catalog.entries()] == ["kept"]
+
+
+def test_location_follows_environment(tmp_path, monkeypatch):
+    monkeypatch.setenv("STUDIOFLOW_CATALOG", str(tmp_path / "elsewhere.db"))
+    assert get_catalog().db_path == tmp_path / "elsewhere.db"
+
+    monkeypatch.delenv("STUDIOFLOW_CATALOG")
+    monkeypatch.setenv("HOME", str(tmp_path))
+    assert default_catalog_path() == tmp_path / ".studioflow" / "catalog.db"
+
+
+class TestProjectManagerCatalog:
+    @pytest.fixture(autouse=True)
+    def home(self, tmp_path, monkeypatch):
+        (tmp_path / "home").mkdir()
+        monkeypatch.setenv("HOME", str(tmp_path / "home"))
+        monkeypatch.setattr(config_module, "_config_instance", None)
+        yield
+        if catalog_module._catalog is not None:
+            catalog_module._catalog.close()
+            catalog_module._catalog = None
+
+    def test_save_metadata_writes_through(self, tmp_path):
+        project = Project("demo", tmp_path / "Projects" / "demo")
+        project.save_metadata()
+        record_pipeline_stage(project.path, "rough_cut", output="cut.edl")
+
+        entry = get_catalog().get(project.path)
+        assert entry.metadata["name"] == "demo"
+        assert entry.pipeline["rough_cut"]["output"] == "cut.edl"
+
+    def test_list_projects_from_catalog(self, tmp_path):
+        manager = ProjectManager()
+        manager.projects_dir = tmp_path / "Projects"
+        _make_project(manager.projects_dir, "a", "2026-01-01 00:00:00")
+        _make_project(manager.projects_dir, "b", "2026-05-01 00:00:00")
+
+        projects = manager.list_projects()
+        assert [p.name for p in projects] == ["b", "a"]
+        assert projects[0].metadata.media_count == 3
+        assert projects[0].path == manager.projects_dir / "b"
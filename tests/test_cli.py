@@ -4,6 +4,7 @@ Test Suite for StudioFlow CLI
 Tests core functionality without external dependencies
 """
 
+import os
 import sys
 import tempfile
 from pathlib import Path
@@ -128,6 +129,26 @@ def test_state_management():
         assert len(recent) == 2  # No duplicates
 
     print("  ✓ State management works")
+
+
+def test_state_keeps_other_processes_changes(tmp_path):
+    """A long-lived StateManager (the daemon's) doesn't overwrite what another one saved"""
+    daemon, cli = StateManager(), StateManager()
+    daemon.state_file = cli.state_file = tmp_path / ".state"
+
+    daemon.add_recent_project("Old")
+    assert cli.get_recent_projects() == ["Old"]
+    seen = daemon.state_file.stat().st_mtime_ns
+    cli.current_project = "New"
+    cli.add_recent_project("New")
+    os.utime(cli.state_file, ns=(seen, seen))  # coarse timestamps: the change doesn't show in mtime
+    daemon.last_import_path = tmp_path / "card"
+
+    fresh = StateManager()
+    fresh.state_file = tmp_path / ".state"
+    assert fresh.current_project == "New"
+    assert fresh.get_recent_projects() == ["New", "Old"]
+    assert fresh.last_import_path == tmp_path / "card"
     return True
 
 
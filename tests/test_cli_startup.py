@@ -0,0 +1,102 @@
+"""
+CLI startup regression tests
+Keeps `sf --help` from importing command modules and enforces an import-time budget
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from studioflow.cli.main import app, LAZY_COMMANDS
+
+REPO_ROOT = Path(__file__).parent.parent
+
+# Budget for importing studioflow.cli.main (ms). Override on slow CI machines.
+STARTUP_BUDGET_MS = float(os.environ.get("SF_STARTUP_BUDGET_MS", "150"))
+
+HEAVY_MODULES = ("pydantic", "pydantic_settings", "yaml", "studioflow.core.rough_cut",
+                 "studioflow.core.config", "studioflow.core.project")
+
+
+def _run_sf(*argv: str):
+    """
+    Run `sf <argv>` under -X importtime.
+
+    Returns ({module: cumulative_us}, set of modules loaded at exit). The
+    loaded set comes from sys.modules because importtime does not report
+    modules pulled in through importlib.import_module.
+    """
+    code = (
+        "import sys, atexit; "
+        "atexit.register(lambda: print('MODULES:' + ','.join(sys.modules), file=sys.stderr)); "
+        "from studioflow.cli.main import app; "
+        "app(sys.argv[1:], prog_name='sf')"
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code, *argv],
+        cwd=REPO_ROOT, capture_output=True, text=True, timeout=60,
+    )
+    timings, loaded = {}, set()
+    for line in result.stderr.splitlines():
+        if line.startswith("MODULES:"):
+            loaded = set(line[len("MODULES:"):].split(","))
+            continue
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        parts = line.split("|")
+        try:
+            cumulative = int(parts[1].strip())
+        except ValueError:
+            continue  # header line
+        timings[parts[2].strip()] = cumulative
+    return timings, loaded
+
+
+def test_help_does_not_import_command_modules():
+    """`sf --help` lists every command without importing any of them"""
+    _, modules = _run_sf("--help")
+
+    assert "studioflow.cli.main" in modules
+    loaded_commands = [m for m in modules if m.startswith("studioflow.cli.commands.")]
+    assert loaded_commands == []
+    for heavy in HEAVY_MODULES:
+        assert heavy not in modules, f"{heavy} imported during sf --help"
+
+
+def test_startup_import_budget():
+    """Importing the CLI entry point stays under the startup budget"""
+    best_ms = min(_run_sf("version")[0]["studioflow.cli.main"] for _ in range(3)) / 1000
+    assert best_ms < STARTUP_BUDGET_MS, (
+        f"studioflow.cli.main import took {best_ms:.0f} ms (budget {STARTUP_BUDGET_MS:.0f} ms)"
+    )
+
+
+def test_invoking_command_imports_only_its_module():
+    """Only the module of the invoked command is loaded"""
+    _, modules = _run_sf("normalize", "--help")
+
+    loaded_commands = {m for m in modules if m.startswith("studioflow.cli.commands.")}
+    assert loaded_commands == {"studioflow.cli.commands.normalize"}
+
+
+def test_help_lists_lazy_commands():
+    runner = CliRunner()
+    result = runner.invoke(app, ["--all"])
+
+    assert result.exit_code == 0
+    for name in ("rough-cut", "project", "normalize", "magic"):
+        assert name in result.output
+
+
+@pytest.mark.parametrize("name", sorted(LAZY_COMMANDS))
+def test_lazy_command_resolves(name):
+    """Every lazy entry points at a real command and renders its help"""
+    runner = CliRunner()
+    result = runner.invoke(app, [name, "--help"])
+
+    assert result.exit_code == 0, result.output
+    assert "Usage" in result.output
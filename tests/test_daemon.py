@@ -0,0 +1,155 @@
+"""
+Tests for the warm sf daemon, thin client and file-keyed caches
+"""
+
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from studioflow.cli import daemon as sf_daemon
+from studioflow.core.cache import FileCache, get_cache, take_all_updates, merge_all_updates
+
+REPO_ROOT = Path(__file__).parent.parent
+
+
+class TestFileCache:
+    def test_hit_until_file_changes(self, tmp_path):
+        media = tmp_path / "clip.mp4"
+        media.write_bytes(b"x" * 10)
+        cache = FileCache("test")
+
+        cache.put(media, {"duration": 1.0})
+        assert cache.get(media) == {"duration": 1.0}
+
+        media.write_bytes(b"x" * 20)  # size (and mtime) change -> miss
+        assert cache.get(media) is None
+
+    def test_tags_are_separate_entries(self, tmp_path):
+        media = tmp_path / "clip.mp4"
+        media.write_bytes(b"x")
+        cache = FileCache("test")
+
+        cache.put(media, 1, tag="a")
+        cache.put(media, 2, tag="b")
+        assert cache.get(media, tag="a") == 1
+        assert cache.get(media, tag="b") == 2
+
+    def test_copy_on_read_isolates_callers(self, tmp_path):
+        media = tmp_path / "clip.mp4"
+        media.write_bytes(b"x")
+        cache = FileCache("test", copy_on_read=True)
+
+        cache.put(media, {"streams": []})
+        cache.get(media)["streams"].append("mutated")
+        assert cache.get(media) == {"streams": []}
+
+    def test_updates_round_trip(self, tmp_path):
+        media = tmp_path / "clip.mp4"
+        media.write_bytes(b"x")
+        take_all_updates()  # drain anything earlier tests left behind
+
+        get_cache("roundtrip").put(media, 42)
+        updates = take_all_updates()
+        assert updates["roundtrip"]
+
+        get_cache("roundtrip").clear()
+        merge_all_updates(updates)
+        assert get_cache("roundtrip").get(media) == 42
+
+
+def test_worker_gets_fresh_consoles(monkeypatch):
+    import io
+    import types
+
+    from rich.console import Console
+
+    cli = types.ModuleType("fake_cli")
+    cli.console = cli.alias = Console()
+    cli.logfile = Console(file=io.StringIO())
+    original, logfile = cli.console, cli.logfile
+    # Only this module is rebound, not the test session's own consoles
+    monkeypatch.setattr(sys, "modules", {"fake_cli": cli})
+    terminal = io.StringIO()
+    monkeypatch.setattr(sys, "stdout", terminal)
+
+    sf_daemon._rebind_consoles()
+
+    assert cli.console is not original and cli.console.file is terminal
+    assert cli.alias is cli.console
+    assert cli.logfile is logfile
+
+
+@pytest.mark.skipif(not sf_daemon.daemon_supported(), reason="needs Unix sockets and fork")
+class TestDaemon:
+    @pytest.fixture
+    def daemon_env(self, tmp_path, monkeypatch):
+        home = tmp_path / "home"
+        (home / ".config" / "studioflow").mkdir(parents=True)
+        (home / ".config" / "studioflow" / "config.yaml").touch()  # skip first-run wizard
+        runtime = tmp_path / "run"
+        runtime.mkdir()
+
+        monkeypatch.setenv("HOME", str(home))
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(runtime))
+        monkeypatch.setenv("STUDIOFLOW_DAEMON_IDLE", "30")
+        monkeypatch.delenv("STUDIOFLOW_DAEMON", raising=False)
+
+        env = dict(os.environ, PYTHONPATH=str(REPO_ROOT))
+        server = subprocess.Popen(
+            [sys.executable, "-c", "from studioflow.cli.daemon import serve; serve()"],
+            env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        for _ in range(100):
+            if sf_daemon.send_command("status"):
+                break
+            time.sleep(0.1)
+        else:
+            server.kill()
+            pytest.fail("daemon did not start")
+
+        yield env
+
+        sf_daemon.send_command("stop")
+        try:
+            server.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            server.kill()
+
+    def _sf(self, env, *argv):
+        return subprocess.run(
+            [sys.executable, "-c", "from studioflow.cli.daemon import main; main()", *argv],
+            env=env, capture_output=True, text=True, timeout=60,
+        )
+
+    def test_forwards_output_and_exit_code(self, daemon_env):
+        result = self._sf(daemon_env, "version")
+        assert result.returncode == 0
+        assert "StudioFlow v" in result.stdout
+
+        result = self._sf(daemon_env, "no-such-command")
+        assert result.returncode == 2
+        assert "No such command" in result.stderr + result.stdout
+
+        assert sf_daemon.send_command("status")["requests"] == 2
+
+    def test_status_and_stop(self, daemon_env):
+        status = sf_daemon.send_command("status")
+        assert status["pid"] > 0
+        assert status["active"] == 0
+
+        assert "stopping" in sf_daemon.send_command("stop")
+        for _ in range(50):
+            if sf_daemon.send_command("status") is None:
+                break
+            time.sleep(0.1)
+        assert not sf_daemon.socket_path().exists()
+
+    def test_disabled_runs_in_process(self, daemon_env):
+        env = dict(daemon_env, STUDIOFLOW_DAEMON="0")
+        result = self._sf(env, "version")
+        assert result.returncode == 0
+        assert sf_daemon.send_command("status")["requests"] == 0
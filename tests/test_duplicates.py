@@ -0,0 +1,109 @@
+"""
+Tests for the native duplicate finder and archive cleanup
+"""
+
+import os
+
+import pytest
+
+from studioflow.core import duplicates
+from studioflow.core.archive import analyze_project, cleanup_project
+from studioflow.core.duplicates import DuplicateFinder, find_duplicates
+from studioflow.core.file_index import FileIndex
+
+
+@pytest.fixture
+def project(tmp_path):
+    big = os.urandom(300 * 1024)  # larger than two samples: needs a full hash
+    (tmp_path / "A").mkdir()
+    (tmp_path / "B").mkdir()
+    (tmp_path / "A" / "clip.mov").write_bytes(big)
+    (tmp_path / "B" / "clip copy.mov").write_bytes(big)
+    # Same size, same head and tail, different middle
+    (tmp_path / "B" / "other.mov").write_bytes(big[:150 * 1024] + b"x" + big[150 * 1024 + 1:])
+    (tmp_path / "A" / "notes.txt").write_text("same")
+    (tmp_path / "B" / "notes.txt").write_text("same")
+    (tmp_path / "A" / "empty").touch()
+    (tmp_path / "B" / "empty").touch()
+    return tmp_path
+
+
+class TestDuplicateFinder:
+    def test_finds_identical_files_only(self, project):
+        sets = find_duplicates(project, workers=2)
+
+        found = {(s.keep.name, tuple(p.name for p in s.duplicates)) for s in sets}
+        assert found == {("clip.mov", ("clip copy.mov",)), ("notes.txt", ("notes.txt",))}
+        assert sets[0].waste == 300 * 1024  # largest waste first
+
+    def test_hard_links_are_not_duplicates(self, project):
+        os.link(project / "A" / "notes.txt", project / "A" / "link.txt")
+        sets = find_duplicates(project)
+        notes = next(s for s in sets if s.size == len("same"))
+        assert len(notes.duplicates) == 1  # B/notes.txt; the link is the same file as A/notes.txt
+
+    def test_hashes_are_cached_in_index(self, project, monkeypatch):
+        index = FileIndex(project)
+        index.refresh()
+        first = DuplicateFinder(project, index=index)
+        first.find()
+        assert first.hashed_bytes > 0
+
+        def fail(entry, *args):
+            raise AssertionError(f"re-hashed {entry.path}")
+
+        monkeypatch.setattr(duplicates, "sample_hash", fail)
+        monkeypatch.setattr(duplicates, "content_hash", fail)
+        index.refresh()
+        second = DuplicateFinder(project, index=index)
+        assert len(second.find()) == 2
+        assert second.hashed_bytes == 0
+
+    def test_modified_file_is_rehashed(self, project):
+        index = FileIndex(project)
+        index.refresh()
+        DuplicateFinder(project, index=index).find()
+
+        (project / "B" / "notes.txt").write_text("diff")
+        index.refresh()
+        sets = DuplicateFinder(project, index=index).find()
+        assert [s.keep.name for s in sets] == ["clip.mov"]
+
+
+class TestArchiveCleanup:
+    def test_cleanup_consumes_analysis(self, project):
+        cache = project / "CacheClip"
+        cache.mkdir()
+        (cache / "clip.mov").write_bytes((project / "A" / "clip.mov").read_bytes())
+        (project / ".DS_Store").write_bytes(b"junk")
+
+        analysis = analyze_project(project)
+        assert analysis.duplicate_sets == 2  # the cached copy only counts as cache
+        assert analysis.cache_size == 300 * 1024
+
+        stats = cleanup_project(project, dry_run=True, analysis=analysis)
+        assert (project / "B" / "clip copy.mov").exists()
+        assert stats["files_removed"] == 4
+
+        stats = cleanup_project(project, analysis=analysis)
+        assert not (project / "B" / "clip copy.mov").exists()
+        assert not cache.exists()
+        assert not (project / ".DS_Store").exists()
+        assert (project / "A" / "clip.mov").exists()
+        assert stats["bytes_removed"] == 2 * 300 * 1024 + 4 + 4
+
+    @pytest.mark.parametrize("restore_mtime", [False, True])
+    def test_copy_edited_since_analysis_is_kept(self, project, restore_mtime):
+        analysis = analyze_project(project)
+        copy = project / "B" / "clip copy.mov"
+        stamp = copy.stat()
+        data = bytearray(copy.read_bytes())
+        data[150 * 1024] ^= 0xFF
+        copy.write_bytes(bytes(data))  # edited in place, same size
+        if restore_mtime:
+            os.utime(copy, ns=(stamp.st_atime_ns, stamp.st_mtime_ns))  # only the contents tell
+
+        stats = cleanup_project(project, analysis=analysis, remove_junk=False, remove_cache=False)
+
+        assert copy.exists()
+        assert not (project / "B" / "notes.txt").exists() and stats["files_removed"] == 1
@@ -0,0 +1,91 @@
+"""
+Tests for single-decode multi-platform ladder exports
+"""
+
+from pathlib import Path
+
+import pytest
+
+from studioflow.cli.commands.publish import platform_rendition
+from studioflow.core.ffmpeg import FFmpegProcessor, Rendition, VideoQuality
+
+
+def _outputs(cmd):
+    """Arguments of each output, split on the output file names"""
+    start = cmd.index("-filter_complex") + 2
+    outputs, current = [], []
+    for arg in cmd[start:]:
+        current.append(arg)
+        if arg.endswith(".mp4"):
+            outputs.append(current)
+            current = []
+    return outputs
+
+
+class TestLadderCommand:
+    def test_one_decode_split_into_every_output(self):
+        renditions = [platform_rendition(platform, Path(f"out/{platform}.mp4"))
+                      for platform in ("youtube", "instagram_reels", "tiktok", "twitter")]
+
+        cmd = FFmpegProcessor.build_ladder_command(Path("master.mov"), renditions)
+
+        assert cmd.count("-i") == 1
+        graph = cmd[cmd.index("-filter_complex") + 1]
+        assert graph.startswith("[0:v]split=4[v0][v1][v2][v3];")
+        assert "[v1]scale=1080:1920:force_original_aspect_ratio=increase,crop=1080:1920" in graph
+        assert "[v3]scale=1280:720:force_original_aspect_ratio=decrease,pad=1280:720" in graph
+        assert "fps=29.97[o0]" in graph
+
+        outputs = _outputs(cmd)
+        assert [o[-1] for o in outputs] == [f"out/{p}.mp4" for p in
+                                            ("youtube", "instagram_reels", "tiktok", "twitter")]
+        for i, output in enumerate(outputs):
+            assert output[:4] == ["-map", f"[o{i}]", "-map", "0:a?"]
+
+    def test_duration_caps_are_per_output(self):
+        renditions = [platform_rendition(platform, Path(f"{platform}.mp4"))
+                      for platform in ("youtube", "tiktok", "twitter")]
+
+        outputs = _outputs(FFmpegProcessor.build_ladder_command(Path("master.mov"), renditions))
+
+        assert "-t" not in outputs[0]
+        assert outputs[1][outputs[1].index("-t") + 1] == "180"
+        assert outputs[2][outputs[2].index("-t") + 1] == "140"
+
+    def test_single_rendition_needs_no_split(self):
+        cmd = FFmpegProcessor.build_ladder_command(Path("master.mov"), [Rendition(Path("copy.mp4"))])
+
+        assert cmd[cmd.index("-filter_complex") + 1] == "[0:v]null[o0]"
+        assert cmd[cmd.index("-crf") + 1] == "23"
+
+
+class TestPlatformRendition:
+    def test_follows_export_for_platform_presets(self):
+        rendition = FFmpegProcessor.platform_rendition("instagram", Path("feed.mp4"), VideoQuality.HIGH)
+        assert (rendition.width, rendition.height) == (1080, 1080)
+        assert rendition.max_duration == 60 and rendition.max_size_mb == 100
+
+        youtube = FFmpegProcessor.platform_rendition("youtube", Path("yt.mp4"), VideoQuality.LOW)
+        assert youtube.width is None and youtube.crf == "28" and youtube.abitrate == "320k"
+
+        with pytest.raises(ValueError, match="vimeo"):
+            FFmpegProcessor.platform_rendition("vimeo", Path("x.mp4"))
+
+    def test_publish_settings_go_through_the_same_builder(self):
+        reels = platform_rendition("instagram_reels", Path("reel.mp4"))
+        assert (reels.width, reels.height, reels.fit, reels.fps) == (1080, 1920, "crop", 30)
+        assert reels.crf is None and reels.vbitrate == "10M" and reels.preset == "medium"
+        # Unknown platforms fall back to YouTube's settings
+        assert platform_rendition("vimeo", Path("x.mp4")).width == 3840
+
+    def test_missing_input_fails_every_rendition(self, tmp_path):
+        renditions = [Rendition(tmp_path / "a.mp4"), Rendition(tmp_path / "b.mp4")]
+        results = FFmpegProcessor.export_ladder(tmp_path / "missing.mov", renditions)
+        assert [r.success for r in results] == [False, False]
+
+
+def test_empty_ladder_job_is_rejected():
+    from studioflow.core.export_queue import ExportQueue
+
+    with pytest.raises(ValueError, match="at least one output"):
+        ExportQueue(use_gpu=False).add_ladder_job(Path("master.mov"), {})
@@ -0,0 +1,162 @@
+"""
+Tests for the unified project file index
+"""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from studioflow.core.file_index import FileIndex, get_file_index, find_project_root, walk_tree
+
+
+@pytest.fixture
+def tree(tmp_path):
+    """A small project-like tree with footage, transcripts and cache folders"""
+    footage = tmp_path / "01_footage" / "A_ROLL"
+    footage.mkdir(parents=True)
+    (footage / "C0001.MP4").write_bytes(b"a" * 100)
+    (footage / "C0001.srt").write_text("1\n00:00:00,000 --> 00:00:01,000\nhi\n")
+    (footage / "C0002.mov").write_bytes(b"b" * 50)
+    (footage / "C0003.mxf").write_bytes(b"c" * 25)
+    (footage / "C0003_transcript.json").write_text("{}")
+    cache = tmp_path / "04_projects" / "CacheClip"
+    cache.mkdir(parents=True)
+    (cache / "render.tmp").write_bytes(b"d" * 10)
+    (tmp_path / ".DS_Store").write_bytes(b"e")
+    return tmp_path
+
+
+class TestFileIndex:
+    def test_walk_records_files_and_dirs(self, tree):
+        stats = walk_tree(tree, workers=2)
+        clip = str(tree / "01_footage" / "A_ROLL" / "C0001.MP4")
+        assert stats[clip][:2] == (False, 100)
+        assert stats[str(tree / "04_projects")][0] is True
+
+    def test_typed_queries(self, tree):
+        index = FileIndex(tree)
+        index.refresh()
+        footage = tree / "01_footage"
+
+        names = [e.path.name for e in index.videos(under=footage)]
+        assert names == ["C0001.MP4", "C0002.mov", "C0003.mxf"]
+        assert [e.path.name for e in index.videos_without_transcript(under=footage)] == ["C0002.mov"]
+        assert [e.path.name for e in index.files(names=[".DS_Store"])] == [".DS_Store"]
+        assert [e.path.name for e in index.dirs(names=["CacheClip"])] == ["CacheClip"]
+        assert index.has_files(pattern="*.srt", under=footage)
+        assert not index.has_files(exts=[".mp4"], under=footage, recursive=False)
+
+        summary = index.summary(under=footage)
+        expected = sum(f.stat().st_size for f in footage.rglob("*") if f.is_file())
+        assert (summary.files, summary.dirs, summary.size) == (5, 1, expected)
+
+        sizes = index.size_by_folder()
+        assert sizes[tree / "04_projects"] == 10
+        assert sizes[tree] == 1  # .DS_Store at the top level
+
+    def test_refresh_reports_delta(self, tree):
+        index = FileIndex(tree)
+        first = index.refresh()
+        assert tree / ".DS_Store" in first.added
+
+        clip = tree / "01_footage" / "A_ROLL" / "C0002.mov"
+        clip.write_bytes(b"b" * 60)
+        os.utime(clip, ns=(1, 1))
+        (tree / ".DS_Store").unlink()
+        (tree / "new.mp4").write_bytes(b"")
+
+        delta = index.refresh()
+        assert clip in delta.changed
+        assert tree / ".DS_Store" in delta.removed
+        assert tree / "new.mp4" in delta.added
+        assert not index.refresh()  # nothing changed since
+
+    def test_project_index_is_persistent(self, tree):
+        (tree / ".studioflow").mkdir()
+        (tree / ".studioflow" / "project.json").write_text(json.dumps({"name": "demo"}))
+
+        footage = tree / "01_footage" / "A_ROLL"
+        assert find_project_root(footage) == tree.resolve()
+
+        index = get_file_index(footage)
+        assert index.index.root == tree.resolve()
+        assert index.db_path == tree.resolve() / ".studioflow" / "file_index.db"
+        assert not index.index.files(names=["file_index.db"])
+
+        reopened = FileIndex(tree)
+        assert len(reopened.videos()) == 3
+        assert not reopened.refresh()  # loaded from disk, nothing new
+
+    def test_subfolder_reuses_enclosing_index(self, tree):
+        outer = get_file_index(tree)
+        inner = get_file_index(tree / "01_footage")
+        assert inner.index is outer
+
+        # Unscoped queries on the shared index stay inside the folder asked for
+        names = {e.path.name for e in inner.files()}
+        assert names == {"C0001.MP4", "C0001.srt", "C0002.mov", "C0003.mxf", "C0003_transcript.json"}
+        assert inner.summary().files == 5
+        assert get_file_index(tree) is outer
+
+    def test_follows_symlinked_folders_once(self, tree, tmp_path_factory):
+        linked = tmp_path_factory.mktemp("linked_media")
+        (linked / "B0001.MP4").write_bytes(b"f")
+        (tree / "01_footage" / "B_ROLL").symlink_to(linked, target_is_directory=True)
+        (tree / "01_footage" / "A_ROLL" / "loop").symlink_to(tree, target_is_directory=True)
+
+        stats = walk_tree(tree, workers=2)
+
+        assert str(tree / "01_footage" / "B_ROLL" / "B0001.MP4") in stats
+        assert not any("/loop/" in path for path in stats)
+
+    def test_rejects_paths_outside_root(self, tree, tmp_path_factory):
+        index = FileIndex(tree / "01_footage")
+        index.refresh()
+        with pytest.raises(ValueError):
+            index.files(under=tmp_path_factory.mktemp("elsewhere"))
+
+    def test_parent_index_serves_earlier_subfolders(self, tree):
+        inner = get_file_index(tree / "01_footage")
+        assert isinstance(inner, FileIndex)
+
+        outer = get_file_index(tree)
+        again = get_file_index(tree / "01_footage")
+        assert again.index is outer
+        assert {e.path.name for e in again.videos()} == {"C0001.MP4", "C0002.mov", "C0003.mxf"}
+
+    def test_cache_is_bounded(self, tmp_path, monkeypatch):
+        from studioflow.core import file_index
+
+        monkeypatch.setattr(file_index, "MAX_INDEXES", 2)
+        monkeypatch.setattr(file_index, "_indexes", file_index.OrderedDict())
+        folders = []
+        for name in ("a", "b", "c"):
+            (tmp_path / name).mkdir()
+            folders.append(tmp_path / name)
+
+        first = get_file_index(folders[0])
+        get_file_index(folders[1])
+        get_file_index(folders[0])  # most recently used again
+        get_file_index(folders[2])
+
+        assert list(file_index._indexes) == [folders[0].resolve(), folders[2].resolve()]
+        assert get_file_index(folders[0]) is first
+
+    def test_results_keep_the_callers_path_form(self, tree, tmp_path_factory, monkeypatch):
+        link = tmp_path_factory.mktemp("links") / "card"
+        link.symlink_to(tree / "01_footage", target_is_directory=True)
+
+        view = get_file_index(link)
+        paths = [e.path for e in view.videos()]
+        assert paths == [link / "A_ROLL" / n for n in ("C0001.MP4", "C0002.mov", "C0003.mxf")]
+        assert list(view.size_by_folder()) == [link / "A_ROLL"]
+
+        entry = view.files(names=["C0002.mov"])[0]
+        view.store_hashes([(entry, "sample", None)])
+        assert view.index.files(names=["C0002.mov"])[0].sample_hash == "sample"
+
+        monkeypatch.chdir(tree)
+        relative = get_file_index(Path("01_footage"))
+        assert [e.path for e in relative.videos()][0] == Path("01_footage/A_ROLL/C0001.MP4")
@@ -0,0 +1,170 @@
+"""
+Tests for filmstrip sprites and thumbnails cropped from them
+"""
+
+import json
+import subprocess
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from studioflow.core.cache import get_cache
+from studioflow.core.ffmpeg import FFmpegProcessor
+from studioflow.core.filmstrip import Filmstrip, build_command, build_filmstrip, filmstrip_dir, segment_thumbnails
+
+TW, TH = 32, 18
+
+
+def _tile(seed, blur=False):
+    rng = np.random.default_rng(seed)
+    tile = rng.integers(40, 216, (TH, TW, 3)).astype(np.float64)
+    if blur:
+        for axis in (0, 1):
+            tile = (np.roll(tile, 1, axis) + tile + np.roll(tile, -1, axis)) / 3
+    return tile.astype(np.uint8)
+
+
+def _sheet(tiles, columns=4, rows=2):
+    page = np.zeros((rows * TH, columns * TW, 3), dtype=np.uint8)
+    for slot, tile in enumerate(tiles):
+        row, column = divmod(slot, columns)
+        page[row * TH:(row + 1) * TH, column * TW:(column + 1) * TW] = tile
+    return page
+
+
+class FakeFFmpeg:
+    """Builds sprite pages, decodes them and encodes tiles without ffmpeg"""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.calls = []
+
+    def __call__(self, cmd, input=None, **kwargs):
+        self.calls.append(cmd)
+        output = Path(cmd[-1])
+        if "-vf" in cmd:  # sprite build
+            for i in range(len(self.pages)):
+                (output.parent / (output.name % i)).write_bytes(b"jpg")
+            return subprocess.CompletedProcess(cmd, 0, b"", b"")
+        if cmd[-1] == "-":  # page decode
+            page = int(Path(cmd[cmd.index("-i") + 1]).stem.split("_")[1])
+            return subprocess.CompletedProcess(cmd, 0, self.pages[page].tobytes(), b"")
+        frames = len(input) // (TW * TH * 3)  # tile encode
+        for i in range(frames):
+            (output.parent / (output.name % i)).write_bytes(b"jpg")
+        return subprocess.CompletedProcess(cmd, 0, b"", b"")
+
+
+@pytest.fixture
+def ffmpeg(monkeypatch):
+    def install(pages, duration):
+        fake = FakeFFmpeg(pages)
+        monkeypatch.setattr(subprocess, "run", fake)
+        monkeypatch.setattr(FFmpegProcessor, "get_media_info",
+                            staticmethod(lambda path: {"duration_seconds": duration}))
+        monkeypatch.setattr("studioflow.core.filmstrip.TILE_WIDTH", TW)
+        monkeypatch.setattr("studioflow.core.filmstrip.TILE_HEIGHT", TH)
+        monkeypatch.setattr("studioflow.core.filmstrip.COLUMNS", 4)
+        monkeypatch.setattr("studioflow.core.filmstrip.ROWS", 2)
+        return fake
+    return install
+
+
+def test_one_decode_tiles_the_whole_clip(tmp_path):
+    cmd = build_command(Path("clip.mp4"), tmp_path, 2.0)
+    assert cmd.count("-i") == 1
+    assert cmd[cmd.index("-vf") + 1] == (
+        "fps=1/2,scale=256:144:force_original_aspect_ratio=decrease:flags=area,"
+        "pad=256:144:(ow-iw)/2:(oh-ih)/2,setsar=1,tile=10x10")
+    assert cmd[-1] == str(tmp_path / "sprite_%03d.jpg")
+
+
+def test_offset_map_round_trips(tmp_path):
+    strip = Filmstrip(Path("clip.mp4"), tmp_path, 2.0, 250, ["sprite_000.jpg", "sprite_001.jpg", "sprite_002.jpg"])
+
+    assert strip.offset(123) == {"time": 246.0, "page": "sprite_001.jpg", "x": 768, "y": 288,
+                                 "width": 256, "height": 144}
+    data = json.loads(json.dumps(strip.to_dict()))
+    assert len(data["frames"]) == 250
+    assert Filmstrip.from_dict(data, tmp_path) == strip
+    assert strip.index_at(1000.0) == 249 and strip.index_at(4.9) == 2
+
+
+def test_best_tile_in_each_range(ffmpeg, tmp_path):
+    tiles = [_tile(0, blur=i != 5) for i in range(10)]
+    fake = ffmpeg([_sheet(tiles[:8]), _sheet(tiles[8:])], duration=20.0)
+    strip = Filmstrip(Path("clip.mp4"), tmp_path, 2.0, 10, ["sprite_000.jpg", "sprite_001.jpg"], TW, TH, 4, 2)
+
+    pages = {}
+    assert strip.best_index(6.0, 14.0, pages) == 5  # the one sharp tile
+    assert strip.best_index(9.5, 9.9, pages) == 5  # no tile inside: nearest
+    assert np.array_equal(strip.tiles([9], pages)[0], tiles[9])
+    assert len(fake.calls) == 2  # each page decoded once
+
+
+def test_built_once_and_reused_until_the_source_changes(ffmpeg, tmp_path):
+    clip = tmp_path / "clip.mp4"
+    clip.write_bytes(b"\0" * 10)
+    fake = ffmpeg([_sheet([_tile(i) for i in range(8)])], duration=12.0)
+
+    strip = build_filmstrip(clip, tmp_path / "out")
+    assert strip.count == 6 and strip.pages == ["sprite_000.jpg"]
+    index = json.loads((strip.directory / "filmstrip.json").read_text())
+    assert index["frames"][5] == {"time": 10.0, "page": "sprite_000.jpg", "x": 32, "y": 18,
+                                  "width": TW, "height": TH}
+
+    get_cache("filmstrips").clear()
+    assert build_filmstrip(clip, tmp_path / "out") == strip  # from the JSON index
+    clip.write_bytes(b"\0" * 20)
+    build_filmstrip(clip, tmp_path / "out")
+    assert sum("-vf" in cmd for cmd in fake.calls) == 2
+
+
+def test_segment_thumbnails_share_one_sprite(ffmpeg, tmp_path):
+    clip = tmp_path / "clip.mp4"
+    clip.write_bytes(b"\0")
+    fake = ffmpeg([_sheet([_tile(i, blur=i not in (1, 6)) for i in range(8)])], duration=16.0)
+
+    paths = segment_thumbnails(clip, [(0.0, 4.0), (10.0, 14.0), (15.0, 15.5)], tmp_path / "report")
+
+    assert [p.name for p in paths] == ["clip_2.0s.jpg", "clip_12.0s.jpg", "clip_14.0s.jpg"]
+    assert all(p.exists() for p in paths)
+    assert [cmd[-1] == "-" or "-vf" in cmd for cmd in fake.calls].count(False) == 1  # one encode
+    assert segment_thumbnails(tmp_path / "missing.mp4", [(0.0, 1.0)], tmp_path) == [None]
+
+
+def test_reports_share_the_project_sprite_cache(ffmpeg, tmp_path):
+    project = tmp_path / "project"
+    (project / ".studioflow").mkdir(parents=True)
+    (project / ".studioflow" / "project.json").write_text("{}")
+    clip = project / "01_FOOTAGE" / "clip.mp4"
+    clip.parent.mkdir()
+    clip.write_bytes(b"\0")
+    fake = ffmpeg([_sheet([_tile(i) for i in range(8)])], duration=16.0)
+
+    segment_thumbnails(clip, [(0.0, 4.0)], project / "04_TIMELINES" / "02_HOOK_TESTS")
+    get_cache("filmstrips").clear()
+    segment_thumbnails(clip, [(10.0, 14.0)], project / "exports")
+
+    assert sum("-vf" in cmd for cmd in fake.calls) == 1
+    assert [p.parent for p in (project / ".studioflow" / "filmstrips").glob("*/filmstrip.json")] == [
+        filmstrip_dir(clip, project)]
+
+
+def test_hook_test_thumbnails_are_opt_in(tmp_path, monkeypatch):
+    from studioflow.core import filmstrip
+    from studioflow.core.rough_cut import ClipAnalysis, HookCandidate, RoughCutEngine, Segment
+
+    clip = ClipAnalysis(file_path=tmp_path / "clip.mp4", duration=60.0, transcript_path=None)
+    hook = HookCandidate(Segment(clip.file_path, 0.0, 8.0, "Here's the trick"), 70.0, 0.8, 0.9, 8.0, "reveal")
+    engine = RoughCutEngine()
+    monkeypatch.setattr(engine, "_generate_hook_candidates", lambda clips, max_hooks=5: [hook])
+    decoded = []
+    monkeypatch.setattr(filmstrip, "segment_thumbnails",
+                        lambda path, ranges, output_dir, project_dir=None: decoded.append(project_dir) or [None])
+
+    engine.generate_hook_test_timelines([clip], tmp_path)
+    assert decoded == []
+    engine.generate_hook_test_timelines([clip], tmp_path, extract_thumbnails=True)
+    assert decoded == [tmp_path]
@@ -0,0 +1,196 @@
+"""
+Tests for perceptual clip fingerprints and the near-duplicate index
+"""
+
+import numpy as np
+import pytest
+
+from studioflow.core.fingerprint import (
+    AUDIO_RATE, THUMB_H, THUMB_W, FingerprintIndex, build_fingerprint,
+)
+
+
+def _clip(seed, duration=60.0, keyframe_every=2.0, offset=0.0):
+    """Keyframe times, thumbnails and audio of a synthetic clip"""
+    rng = np.random.default_rng(seed)
+    scenes = rng.uniform(0, 255, size=(int(duration) + 1, THUMB_H, THUMB_W))
+    times = np.arange(offset, duration, keyframe_every)
+    thumbs = scenes[times.astype(int)]
+    envelope = np.repeat(rng.uniform(0.1, 1.0, size=int(duration * 4)), AUDIO_RATE // 4)
+    tone = np.sin(np.arange(len(envelope)) * rng.uniform(0.05, 0.5))
+    samples = (envelope * (tone + rng.normal(0, 0.3, len(envelope))) * 8000).astype(np.int16)
+    return times, thumbs, samples
+
+
+def _reencode(times, thumbs, samples, seed=99):
+    """Same footage after a lossy transcode: noise, level change, other keyframes"""
+    rng = np.random.default_rng(seed)
+    thumbs = np.clip(thumbs * 0.9 + 10 + rng.normal(0, 2, thumbs.shape), 0, 255)
+    samples = (samples * 0.7 + rng.normal(0, 50, samples.shape)).astype(np.int16)
+    return times + 0.1, thumbs, samples
+
+
+def _fingerprint(path, clip, duration=60.0):
+    return build_fingerprint(path, duration, *clip)
+
+
+@pytest.fixture
+def index(tmp_path):
+    idx = FingerprintIndex(tmp_path / "fingerprints.db")
+    yield idx
+    idx.close()
+
+
+@pytest.fixture
+def files(tmp_path):
+    media = tmp_path / "media"
+    media.mkdir()
+
+    def make(name):
+        path = media / name
+        path.write_bytes(name.encode())
+        return path
+    return make
+
+
+class TestFingerprint:
+    def test_reencoded_copy_matches(self):
+        original = _clip(1)
+        a = _fingerprint("A001.MP4", original)
+        b = _fingerprint("A001_proxy.mov", _reencode(*original))
+        other = _fingerprint("A002.MP4", _clip(2))
+
+        assert a.matches(b)
+        assert not a.matches(other)
+        # Same pictures, clearly different length: not the same clip
+        assert not a.matches(_fingerprint("A001_trim.MP4", original, duration=45.0))
+
+    def test_silent_clips_compare_pictures_only(self):
+        times, thumbs, _ = _clip(3)
+        silent = np.zeros(0, dtype=np.int16)
+        a = build_fingerprint("broll.MP4", 60.0, times, thumbs, silent)
+        assert a.audio_distance(a) is None
+        assert a.matches(_fingerprint("broll_graded.mov", _reencode(times, thumbs, silent)))
+
+
+class TestFingerprintIndex:
+    def test_find_matches_and_claim(self, index, files):
+        original = _clip(1)
+        index.add(_fingerprint(files("A001.MP4"), original))
+        index.add(_fingerprint(files("A002.MP4"), _clip(2)))
+
+        copy = _fingerprint(files("renamed.mov"), _reencode(*original))
+        assert [p.name for p in index.find_matches(copy)] == ["A001.MP4"]
+
+        assert index.claim(copy, files("renamed.mov")).name == "A001.MP4"
+        fresh = _fingerprint(files("A003.MP4"), _clip(3))
+        assert index.claim(fresh, files("A003.MP4")) is None
+        assert index.find_matches(_fingerprint("elsewhere.MP4", _reencode(*_clip(3))))[0].name == "A003.MP4"
+
+    def test_deleted_clips_are_not_matches(self, index, files):
+        original = _clip(1)
+        path = files("A001.MP4")
+        index.add(_fingerprint(path, original))
+        path.unlink()
+        assert index.find_matches(_fingerprint("copy.MP4", _reencode(*original))) == []
+
+    def test_groups(self, index, files):
+        a, b, c = files("A001.MP4"), files("A001_graded.mov"), files("A002.MP4")
+        for path, clip in ((a, _clip(1)), (b, _reencode(*_clip(1))), (c, _clip(2))):
+            fp = _fingerprint(path, clip)
+            st = path.stat()
+            fp.size, fp.mtime_ns = st.st_size, st.st_mtime_ns
+            index.add(fp)
+
+        assert index.groups([a, b, c]) == [sorted([a.resolve(), b.resolve()])]
+        # A file changed since it was fingerprinted is not trusted
+        b.write_bytes(b"edited")
+        assert index.groups([a, b, c]) == []
+
+
+class TestImportChecksum:
+    def test_checksum_follows_content_not_name(self, tmp_path):
+        from studioflow.core.media import MediaImporter
+
+        importer = MediaImporter.__new__(MediaImporter)
+        (tmp_path / "card1").mkdir()
+        (tmp_path / "card2").mkdir()
+        first = tmp_path / "card1" / "C0001.MP4"
+        renamed = tmp_path / "card1" / "interview.MP4"
+        same_name = tmp_path / "card2" / "C0001.MP4"
+        first.write_bytes(b"a" * 1000)
+        renamed.write_bytes(b"a" * 1000)
+        same_name.write_bytes(b"b" * 1000)
+
+        assert importer._get_checksum(first) == importer._get_checksum(renamed)
+        assert importer._get_checksum(first) != importer._get_checksum(same_name)
+
+    def test_history_from_name_size_mtime_still_counts(self, tmp_path):
+        import hashlib
+
+        from studioflow.core.media import MediaFile, MediaImporter, MediaType
+
+        importer = MediaImporter.__new__(MediaImporter)
+        clip = tmp_path / "C0001.MP4"
+        clip.write_bytes(b"a" * 1000)
+        st = clip.stat()
+        importer.imported_files = {hashlib.md5(f"{clip.name}_{st.st_size}_{st.st_mtime}".encode()).hexdigest()}
+
+        result = importer.import_file(MediaFile(clip, st.st_size, MediaType.VIDEO))
+
+        assert result == {"imported": False, "reason": "duplicate"}
+        assert importer._get_checksum(clip) in importer.imported_files
+
+    def test_unreadable_file_is_not_imported(self, tmp_path, monkeypatch):
+        from studioflow.core import duplicates
+        from studioflow.core.media import MediaFile, MediaImporter, MediaType
+
+        importer = MediaImporter.__new__(MediaImporter)
+        importer.imported_files = set()
+        clip = tmp_path / "C0001.MP4"
+        clip.write_bytes(b"a" * 1000)
+        monkeypatch.setattr(duplicates, "sample_hash", lambda entry: None)
+
+        assert importer._get_checksum(clip) is None
+        assert importer._get_checksum(tmp_path / "missing.MP4") is None
+        result = importer.import_file(MediaFile(clip, 1000, MediaType.VIDEO))
+        assert result == {"imported": False, "reason": "unreadable"}
+        assert importer.imported_files == set()
+
+
+class TestSourceGrouping:
+    def test_only_colliding_files_are_fingerprinted(self, index, tmp_path, monkeypatch):
+        from studioflow.core import fingerprint
+        from studioflow.core.rough_cut import RoughCutEngine
+
+        monkeypatch.setattr(fingerprint, "get_fingerprint_index", lambda: index)
+        computed = []
+        monkeypatch.setattr(fingerprint, "compute_fingerprint", lambda path: computed.append(path.name))
+        for name, size in (("A001.MP4", 10), ("A001 (1).MP4", 20), ("B001.MP4", 30), ("C001.MP4", 30),
+                           ("D001.MP4", 40)):
+            (tmp_path / name).write_bytes(b"x" * size)
+
+        RoughCutEngine()._group_sources({tmp_path / name for name in
+                                         ("A001.MP4", "A001 (1).MP4", "B001.MP4", "C001.MP4", "D001.MP4")})
+
+        # Same base name, same size; D001 is unique on both and keeps its name key
+        assert sorted(computed) == ["A001 (1).MP4", "A001.MP4", "B001.MP4", "C001.MP4"]
+
+    def test_renamed_reencode_is_fingerprinted_by_duration(self, index, tmp_path, monkeypatch):
+        from studioflow.core import fingerprint
+        from studioflow.core.rough_cut import ClipAnalysis, RoughCutEngine, SOURCE_DURATION_TOLERANCE
+
+        monkeypatch.setattr(fingerprint, "get_fingerprint_index", lambda: index)
+        computed = []
+        monkeypatch.setattr(fingerprint, "compute_fingerprint", lambda path: computed.append(path.name))
+        durations = {"C0001.MP4": 62.0, "interview_final.mp4": 62.0 + SOURCE_DURATION_TOLERANCE / 2,
+                     "C0002.MP4": 95.0}
+        engine = RoughCutEngine()
+        for size, (name, duration) in enumerate(durations.items(), start=1):
+            (tmp_path / name).write_bytes(b"x" * size * 10)
+            engine.clips.append(ClipAnalysis(file_path=tmp_path / name, duration=duration, transcript_path=None))
+
+        engine._group_sources({tmp_path / name for name in durations})
+
+        # Different size and name, but the same length: could be a re-encode
+        assert sorted(computed) == ["C0001.MP4", "interview_final.mp4"]
@@ -0,0 +1,183 @@
+"""
+Tests for the shared-memory frame bus and its analyzers
+"""
+
+import io
+import subprocess
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from studioflow.core import frame_bus
+from studioflow.core.frame_bus import (
+    PTS_TICKS, SECTION_SPAN, BlackFlashAnalyzer, ColorStatsAnalyzer, ExposureAnalyzer, FrameBus,
+    MotionAnalyzer, Section, SharpnessAnalyzer,
+)
+
+W, H = 32, 18
+
+
+class FakeDecoder:
+    """Stands in for ffmpeg: raw RGB frames on stdout, showinfo lines on stderr"""
+
+    def __init__(self, frames, times):
+        self.stdout = io.BytesIO(np.ascontiguousarray(frames, dtype=np.uint8).tobytes())
+        # pts in PTS_TICKS (what a multi-section bus sets), pts_time rounded like ffmpeg's %.6g
+        self.stderr = iter([f"[Parsed_showinfo_1] n:{i} pts:{round(t * PTS_TICKS)} pts_time:{t:.6g} pos:0\n".encode()
+                            for i, t in enumerate(times)])
+
+    def wait(self):
+        return 0
+
+
+@pytest.fixture
+def decode(monkeypatch):
+    def install(frames, times):
+        monkeypatch.setattr(subprocess, "Popen", lambda *args, **kwargs: FakeDecoder(frames, times))
+    return install
+
+
+def _scene(n, level=128, seed=0):
+    rng = np.random.default_rng(seed)
+    base = rng.integers(0, 256, (H, W, 3)).astype(np.float64)
+    frames = np.repeat(((base - base.mean()) * 0.3 + level)[None], n, axis=0)
+    return np.clip(frames, 0, 255).astype(np.uint8)
+
+
+class TestFrameBus:
+    def test_every_analyzer_sees_every_frame_across_chunks(self, decode):
+        frames = _scene(75)
+        frames[0] = 0  # black head
+        frames[40] = 255  # flash
+        decode(frames, np.arange(75) * 0.5)
+
+        bus = FrameBus(Path("clip.mp4"), width=W, height=H, batch=8, chunks=2)
+        stats = bus.run([ExposureAnalyzer(), BlackFlashAnalyzer(), SharpnessAnalyzer(), MotionAnalyzer()])
+
+        assert stats["black_flash"]["black_times"] == [0.0] and stats["black_flash"]["black_at_start"]
+        assert stats["black_flash"]["flash_times"] == [20.0]
+        assert len(stats["sharpness"]["per_frame"]) == 75
+        # Motion only where the black and flash frames interrupt a still scene
+        motion = np.array(stats["motion"]["per_frame"])
+        assert len(motion) == 74 and np.count_nonzero(motion > 1.0) == 3
+        assert stats["exposure"]["rating"] == "normal"
+
+    def test_exposure_and_color(self, decode):
+        decode(_scene(10, level=30), np.arange(10) / 30)
+        stats = FrameBus(Path("dark.mp4"), width=W, height=H).run([ExposureAnalyzer(), ColorStatsAnalyzer()])
+
+        assert stats["exposure"]["rating"] == "under"
+        assert stats["color"]["luma_mean"] == pytest.approx(stats["exposure"]["mean_luma"], abs=1.0)
+
+    def test_command_decodes_keyframes_at_low_resolution(self):
+        cmd = FrameBus(Path("a.mp4"), keyframes_only=True, fps=2).command()
+        assert cmd.index("-skip_frame") < cmd.index("-i") and cmd[cmd.index("-skip_frame") + 1] == "nokey"
+        assert cmd[cmd.index("-vf") + 1] == "fps=2,scale=160:90:flags=area,showinfo"
+        assert cmd[-5:] == ["-f", "rawvideo", "-pix_fmt", "rgb24", "-"]
+
+
+class TestMotion:
+    def test_camera_shift_and_shake(self):
+        rng = np.random.default_rng(1)
+        scene = rng.integers(0, 256, (64, 96, 3)).astype(np.uint8)
+
+        def pan(offsets):
+            return np.stack([np.roll(scene, offset, axis=1)[8:44, 8:72] for offset in offsets])
+
+        steady = MotionAnalyzer()
+        steady.consume(pan(range(0, 40, 2)), np.arange(20))
+        shaky = MotionAnalyzer()
+        shaky.consume(pan([0, 4, -3, 5, -4, 3, -5, 4, -2, 5, -3, 4, -4, 2, -5, 3]), np.arange(16))
+
+        assert steady.shifts[0][:, 1].tolist() == [2.0] * 19
+        assert steady.result()["has_motion"] and not steady.result()["shaky"]
+        assert shaky.result()["shaky"]
+
+
+def test_clip_stats_missing_ffmpeg(monkeypatch, tmp_path):
+    def missing(*args, **kwargs):
+        raise FileNotFoundError("ffmpeg")
+    monkeypatch.setattr(subprocess, "Popen", missing)
+    clip = tmp_path / "clip.mp4"
+    clip.write_bytes(b"\0")
+    assert frame_bus.clip_stats(clip) is None
+
+
+def test_sections_share_one_decode(decode):
+    dark, bright = _scene(5, level=8), _scene(6, level=128)
+    # Bus time: the second section sits SECTION_SPAN later, its pts restart at the seek point
+    decode(np.concatenate([dark, bright]),
+           np.concatenate([np.arange(5) * 2.0, SECTION_SPAN + np.arange(6) / 12]))
+    whole = BlackFlashAnalyzer()
+    window = BlackFlashAnalyzer()
+    bus = FrameBus(Path("clip.mp4"), width=W, height=H, batch=4, sections=[
+        Section(keyframes_only=True, analyzers=[whole]),
+        Section(fps=12, start=40.0, duration=0.5, analyzers=[window])])
+
+    stats = bus.run([ExposureAnalyzer()])
+
+    assert whole.result()["black_times"] == [0.0, 2.0, 4.0, 6.0, 8.0]
+    assert window.result()["black_times"] == [] and sum(map(len, window.levels)) == 6
+    assert np.concatenate(window.times) == pytest.approx(40.0 + np.arange(6) / 12, abs=1e-3)
+    assert stats.keys() == {"exposure"}  # sees both sections
+
+    cmd = bus.command()
+    assert cmd.count("-i") == 2 and cmd.index("-skip_frame") < cmd.index("-i")
+    assert cmd[cmd.index("-ss") + 1] == "40.000" and cmd[cmd.index("-t") + 1] == "0.500"
+    graph = cmd[cmd.index("-filter_complex") + 1]
+    assert "[1:v:0]fps=12,scale=32:18:flags=area,setsar=1,setpts=PTS+1000000/TB[s1]" in graph
+    assert graph.endswith(f"[s0][s1]interleave=nb_inputs=2,settb=1/{PTS_TICKS},showinfo[out]")
+
+
+def test_clip_stats_decodes_keyframes_and_motion_windows_at_once(monkeypatch, tmp_path):
+    from studioflow.core.ffmpeg import FFmpegProcessor
+
+    commands = []
+    rng = np.random.default_rng(2)
+    keyframes = rng.integers(0, 256, (4, frame_bus.HEIGHT, frame_bus.WIDTH, 3))  # a cut every keyframe
+    still = np.repeat(keyframes[:1], 6, axis=0)
+
+    def decoder(cmd, **kwargs):
+        commands.append(cmd)
+        times = [*np.arange(4) * 20.0] + [k * SECTION_SPAN + i / 12 for k in (1, 2, 3) for i in range(6)]
+        return FakeDecoder(np.concatenate([keyframes, still, still, still]), times)
+
+    monkeypatch.setattr(subprocess, "Popen", decoder)
+    monkeypatch.setattr(FFmpegProcessor, "get_media_info", staticmethod(lambda path: {"duration_seconds": 80.0}))
+    clip = tmp_path / "walk.mp4"
+    clip.write_bytes(b"\0")
+
+    stats = frame_bus.clip_stats(clip)
+
+    cmd, = commands
+    assert cmd.count("-i") == 1 + frame_bus.MOTION_WINDOWS and cmd.count("-skip_frame") == 1
+    assert [float(cmd[i + 1]) for i, arg in enumerate(cmd) if arg == "-ss"] == [18.0, 38.0, 58.0]
+    assert cmd[cmd.index("-filter_complex") + 1].count("fps=12,") == 3
+    assert len(stats["sharpness"]["per_frame"]) == 4
+    # Each window is measured on its own consecutive frames, never across keyframes
+    assert len(stats["motion"]["per_frame"]) == 3 * 5 and not stats["motion"]["has_motion"]
+
+
+@pytest.mark.parametrize("banner, args", [
+    ("ffmpeg version 4.4.2-0ubuntu0.22.04.1 Copyright (c) 2000-2021", ["-vsync", "0"]),
+    ("ffmpeg version n5.1.4 Copyright (c) 2000-2023", ["-fps_mode", "passthrough"]),
+    ("ffmpeg version N-112345-gabcdef Copyright (c) 2000-2024", ["-fps_mode", "passthrough"]),
+])
+def test_frame_passthrough_follows_ffmpeg_version(monkeypatch, banner, args):
+    from studioflow.core import ffmpeg
+
+    calls = []
+
+    def run(cmd, **kwargs):
+        calls.append(cmd)
+        return subprocess.CompletedProcess(cmd, 0, banner + "\n", "")
+
+    monkeypatch.setattr(subprocess, "run", run)
+    ffmpeg.ffmpeg_version.cache_clear()
+    try:
+        assert FrameBus(Path("a.mp4")).command()[-7:-5] == args
+        FrameBus(Path("b.mp4")).command()
+        assert calls == [["ffmpeg", "-version"]]  # probed once
+    finally:
+        ffmpeg.ffmpeg_version.cache_clear()
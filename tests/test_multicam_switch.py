@@ -0,0 +1,160 @@
+"""
+Tests for audio-energy multicam switching
+"""
+
+import io
+import json
+import subprocess
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from studioflow.core.multicam_switch import (
+    SAMPLE_RATE, Shot, align_envelopes, audio_camera, audio_envelope, build_switch_command, choose_angles,
+    export_edl, sendcmd_script, speech_envelope,
+)
+
+
+def _talk(turns, duration):
+    """Per-camera audio: each camera's speaker loud on its own mic, bleeding into the others"""
+    t = np.arange(int(duration * SAMPLE_RATE)) / SAMPLE_RATE
+    voice = np.sin(2 * np.pi * 440 * t)
+    cameras = np.zeros((2, len(t)))
+    for speaker, start, end in turns:
+        talking = (t >= start) & (t < end)
+        for cam in range(2):
+            cameras[cam, talking] += voice[talking] * (0.5 if cam == speaker else 0.05)
+    return cameras
+
+
+class TestChooseAngles:
+    def test_follows_the_speaker(self):
+        audio = _talk([(0, 0, 6), (1, 6, 14), (0, 14, 20)], 20.0)
+        energy = align_envelopes([speech_envelope(a) for a in audio], [0.0, 0.0])
+
+        shots = choose_angles(energy)
+
+        assert [s.camera for s in shots] == [0, 1, 0]
+        assert abs(shots[1].start - 6.0) < 0.5 and abs(shots[2].start - 14.0) < 0.5
+        assert shots[-1].end == 20.0
+
+    def test_short_interjections_and_small_leads_do_not_cut(self):
+        # A 1s interjection is shorter than the minimum shot after the last cut
+        audio = _talk([(0, 0, 5), (1, 5, 6), (0, 6, 12)], 12.0)
+        energy = align_envelopes([speech_envelope(a) for a in audio], [0.0, 0.0])
+        assert [s.camera for s in choose_angles(energy, min_shot=8.0)] == [0]
+
+        # Another angle only 2dB louder never takes over
+        flat = np.zeros((2, 100))
+        flat[1] += 2.0
+        assert [s.camera for s in choose_angles(flat, hysteresis_db=4.0)] == [1]
+        flat[0, 50:] = 10.0
+        assert [s.camera for s in choose_angles(flat, hysteresis_db=4.0)] == [1, 0]
+
+    def test_cuts_away_from_a_camera_without_media(self):
+        # Camera 1 starts 3s in and is the only one with speech until camera 0 ends
+        energy = align_envelopes([np.full(50, -20.0), np.full(100, -60.0)], [0.0, 3.0])
+
+        shots = choose_angles(energy, min_shot=10.0)
+
+        assert [(s.camera, s.start) for s in shots] == [(0, 0.0), (1, 5.0)]
+
+
+def test_streamed_envelope_matches_whole_track(monkeypatch):
+    audio = _talk([(0, 0, 3), (1, 3, 7)], 7.05)[0]
+    pcm = (audio * 32767).astype(np.int16)
+
+    class FakeDecoder:
+        stdout = io.BytesIO(pcm.tobytes())
+
+        def wait(self):
+            return 0
+
+    monkeypatch.setattr(subprocess, "Popen", lambda *args, **kwargs: FakeDecoder())
+
+    streamed = audio_envelope(Path("cam_a.mov"), chunk_hops=7)  # chunks end mid-track
+
+    expected = speech_envelope(pcm.astype(np.float32) / 32768.0)
+    assert len(streamed) == len(expected) == 70
+    assert np.allclose(streamed, expected)
+
+
+class TestSwitchOutput:
+    def test_edl_source_times_follow_offsets(self, tmp_path):
+        shots = [Shot(0, 0.0, 4.0), Shot(1, 4.0, 10.0)]
+        sources = [Path("CAM_A.MP4"), Path("CAM_B.MP4")]
+
+        lines = export_edl(shots, sources, [0.0, 2.0], tmp_path / "switch.edl").read_text().splitlines()
+
+        assert lines[3] == "001  CAM_A  V  C  00:00:00:00 00:00:04:00 00:00:00:00 00:00:04:00"
+        assert lines[6] == "002  CAM_B  V  C  00:00:02:00 00:00:08:00 00:00:04:00 00:00:10:00"
+
+    def test_one_pass_render_command(self):
+        shots = [Shot(1, 0.0, 4.0), Shot(0, 4.0, 7.5), Shot(2, 7.5, 9.0)]
+        sources = [Path("a.mp4"), Path("b.mp4"), Path("c.mp4")]
+
+        cmd = build_switch_command(sources, [0.0, 1.5, 0.0], shots, Path("out.mp4"), Path("/tmp/x.cmd"))
+
+        assert cmd.count("-i") == 3
+        graph = cmd[cmd.index("-filter_complex") + 1]
+        assert "tpad=start_duration=1.500" in graph and graph.count("tpad") == 1
+        assert "[s0][c1][c2]streamselect@switch=inputs=3:map=1[v]" in graph
+        assert cmd[cmd.index("-t") + 1] == "9.000"
+        assert sendcmd_script(shots) == ("4.000 streamselect@switch map 0;\n"
+                                         "7.500 streamselect@switch map 2;\n")
+
+
+class TestSyncToSwitch:
+    @pytest.fixture
+    def project(self, tmp_path, monkeypatch):
+        from studioflow.cli.commands import multicam
+
+        project = SimpleNamespace(path=tmp_path)
+        monkeypatch.setattr(multicam, "StateManager", lambda: SimpleNamespace(current_project="demo"))
+        monkeypatch.setattr(multicam, "ProjectManager", lambda: SimpleNamespace(get_project=lambda name: project))
+        for name in ("fx30.mp4", "zve10.mp4"):
+            (tmp_path / name).write_bytes(b"\0")
+        return tmp_path
+
+    def _switch(self, project, monkeypatch):
+        from studioflow.cli.commands import multicam
+        from studioflow.core import multicam_switch
+
+        planned = []
+
+        def plan(sources, offsets, min_shot):
+            planned.append((sources, offsets))
+            return [Shot(0, 0.0, 4.0), Shot(1, 4.0, 10.0)]
+
+        monkeypatch.setattr(multicam_switch, "plan_switches", plan)
+        multicam.create_sequence("demo", layout="switch", min_shot=2.0, render=False, proxy_dir=None)
+        assert (project / "MULTICAM" / "multicam_switch.edl").exists()
+        return planned[0]
+
+    @pytest.mark.parametrize("offset, starts", [(2.0, [0.0, 2.0]), (-1.5, [1.5, 0.0])])
+    def test_two_camera_sync(self, project, monkeypatch, offset, starts):
+        from studioflow.cli.commands import multicam
+
+        monkeypatch.setattr(multicam, "sync_videos_by_audio",
+                            lambda a, b, out: {"success": True, "method": "audio", "offset": offset})
+        multicam.sync("demo", cam_a=project / "fx30.mp4", cam_b=project / "zve10.mp4")
+
+        cameras = json.loads((project / "MULTICAM" / "sync_data.json").read_text())["cameras"]
+        assert cameras == [{"path": str(project / "fx30.mp4"), "offset": starts[0]},
+                           {"path": str(project / "zve10.mp4"), "offset": starts[1]}]
+        assert self._switch(project, monkeypatch) == ([project / "fx30.mp4", project / "zve10.mp4"], starts)
+
+    def test_three_source_sync(self, project, monkeypatch):
+        from studioflow.cli.commands import multicam
+
+        monkeypatch.setattr(multicam, "sync_videos_by_audio",
+                            lambda a, b, out: {"success": True, "method": "audio", "offset": -1.5})
+        multicam.sync_three_source("demo", cam1=project / "fx30.mp4", cam2=project / "zve10.mp4",
+                                   audio=None, output_dir=None)
+
+        sources, offsets = self._switch(project, monkeypatch)
+        assert sources == [project / "fx30.mp4", project / "zve10.mp4"]
+        assert offsets == [1.5, 0.0]
+        assert audio_camera(offsets) == 1  # the render keeps the earlier camera's audio
@@ -0,0 +1,111 @@
+"""
+Tests for rough cut parameter sweeps and stage timing
+"""
+
+import random
+from pathlib import Path
+
+import pytest
+
+from studioflow.core.rough_cut import (
+    ClipAnalysis, CutStyle, RoughCutEngine, RoughCutPlan, ScoringConfig, Segment, SRTEntry,
+)
+from studioflow.core.rough_cut_optimizer import RoughCutOptimizer
+
+
+LINES = ["Today we install the solar inverter on the wall.",
+         "The best part was when we finally opened the box!",
+         "Honestly the price is a problem for most people.",
+         "I love this feature, it changed everything for our family.",
+         "First step, connect the cable to the battery storage."]
+
+
+@pytest.fixture
+def clips():
+    engine = RoughCutEngine()
+    result = []
+    for c in range(3):
+        entries = [SRTEntry(i + 1, i * 5.0, i * 5.0 + 4.0, LINES[(i + c) % len(LINES)]) for i in range(12)]
+        clip = ClipAnalysis(file_path=Path(f"C000{c}.MP4"), duration=60.0, transcript_path=None,
+                            entries=entries, has_speech=True)
+        clip.best_moments = engine._find_best_moments(clip)
+        result.append(clip)
+    return result
+
+
+def _plan(spans):
+    segments = [Segment(Path(name), start, end, "") for name, start, end in spans]
+    return RoughCutPlan(style=CutStyle.DOC, clips=[], segments=segments, total_duration=0.0, structure={})
+
+
+class TestSweep:
+    def test_parameters_reach_the_engine(self, clips):
+        optimizer = RoughCutOptimizer(RoughCutEngine())
+
+        results = optimizer.sweep(clips, 60.0, {"quote_min_importance": [0.0, 101.0]}, workers=1)
+
+        assert [r.parameters for r in results] == [{"quote_min_importance": 0.0},
+                                                   {"quote_min_importance": 101.0}]
+        # Nothing reaches an importance of 101, so there is no quote to open with
+        assert results[0].plan.narrative_arc['hook'] and not results[1].plan.narrative_arc['hook']
+        assert results[0].stage_times["interview_analysis"] > 0.0
+
+    def test_forked_workers_match_sequential(self, clips):
+        optimizer = RoughCutOptimizer(RoughCutEngine())
+        grid = {"quote_min_importance": [0.0, 60.0], "handle_scale": [0.0, 2.0]}
+
+        sequential = optimizer.sweep(clips, 60.0, grid, style=CutStyle.EPISODE, workers=1)
+        forked = optimizer.sweep(clips, 60.0, grid, style=CutStyle.EPISODE, workers=2)
+
+        assert [r.parameters for r in forked] == [r.parameters for r in sequential]
+        assert [[(s.source_file, s.start_time) for s in r.plan.segments] for r in forked] == \
+               [[(s.source_file, s.start_time) for s in r.plan.segments] for r in sequential]
+        assert all(r.plan.clips is clips for r in forked)
+
+    def test_merge_gap_reaches_the_cut(self):
+        entries = [SRTEntry(1, 0.0, 4.0, LINES[1]), SRTEntry(2, 5.5, 9.5, LINES[3])]
+        clip = ClipAnalysis(file_path=Path("C0000.MP4"), duration=20.0, transcript_path=None,
+                            entries=entries, has_speech=True)
+        clip.best_moments = [Segment(clip.file_path, e.start_time, e.end_time, e.text, score=0.9) for e in entries]
+
+        results = RoughCutOptimizer(RoughCutEngine()).sweep(
+            [clip], 60.0, {"merge_gap_threshold_episode": [0.5, 2.0]}, style=CutStyle.EPISODE, workers=1)
+
+        assert [[(s.start_time, s.end_time) for s in r.plan.segments] for r in results] == \
+               [[(0.0, 4.0), (5.5, 9.5)], [(0.0, 9.5)]]
+
+    def test_unknown_parameter(self, clips):
+        with pytest.raises(ValueError, match="importance_threshold"):
+            RoughCutOptimizer(RoughCutEngine()).sweep(clips, 60.0, {"importance_threshold": [50]})
+
+
+class TestScoringConfig:
+    def test_handles_and_merge_gaps(self):
+        engine = RoughCutEngine(ScoringConfig(handle_scale=2.0, merge_gap_threshold_review=4.0))
+        assert engine._handles(CutStyle.EPISODE) == (0.6, 0.4)
+        assert engine.scoring_config.merge_gap(CutStyle.REVIEW) == 4.0
+        assert engine.scoring_config.merge_gap(CutStyle.INTERVIEW) == 2.0
+
+
+class TestOverlap:
+    def test_matches_pairwise_check(self):
+        def pairwise(plan1, plan2):
+            total = max(len(plan1.segments), len(plan2.segments))
+            matches = sum(any(a.source_file == b.source_file
+                              and min(a.end_time, b.end_time) - max(a.start_time, b.start_time) > 1.0
+                              for b in plan2.segments)
+                          for a in plan1.segments)
+            return matches / total if total else 0.0
+
+        rng = random.Random(5)
+        optimizer = RoughCutOptimizer(RoughCutEngine())
+        for _ in range(50):
+            spans = [[(f"{rng.randrange(3)}.mp4", start, start + rng.uniform(0.2, 15.0))
+                      for start in (rng.uniform(0, 200) for _ in range(rng.randrange(30)))]
+                     for _ in range(2)]
+            plan1, plan2 = _plan(spans[0]), _plan(spans[1])
+            assert optimizer._calculate_overlap(plan1, plan2) == pytest.approx(pairwise(plan1, plan2))
+
+        # Touching for exactly 1s is not an overlap; a contained span is
+        assert optimizer._calculate_overlap(_plan([("a.mp4", 0, 5)]), _plan([("a.mp4", 4, 9)])) == 0.0
+        assert optimizer._calculate_overlap(_plan([("a.mp4", 2, 4)]), _plan([("a.mp4", 0, 9)])) == 1.0
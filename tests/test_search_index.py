@@ -0,0 +1,97 @@
+"""
+Tests for the global full-text search index
+"""
+
+import json
+import os
+import time
+
+import pytest
+
+from studioflow.core.search_index import SearchIndex, fts_query
+
+
+def _transcript(*segments):
+    out = []
+    for i, (start, text) in enumerate(segments):
+        words = [{"word": " " + w, "start": start + 0.5 * j, "end": start + 0.5 * j + 0.4}
+                 for j, w in enumerate(text.split())]
+        out.append({"id": i, "start": start, "end": start + 5, "text": text, "words": words})
+    return {"text": " ".join(t for _, t in segments), "segments": out}
+
+
+@pytest.fixture
+def project(tmp_path):
+    root = tmp_path / "solar_doc"
+    (root / ".studioflow").mkdir(parents=True)
+    (root / ".studioflow" / "project.json").write_text(json.dumps({"name": "solar_doc"}))
+    footage = root / "01_MEDIA"
+    footage.mkdir()
+    for name in ("C0001.MP4", "C0002.MP4", "broll_roof.mov"):
+        (footage / name).write_bytes(b"\0" * 100)
+    transcripts = root / "02_Transcription"
+    transcripts.mkdir()
+    (transcripts / "C0001_transcript.json").write_text(json.dumps(_transcript(
+        (0.0, "welcome back to the channel"),
+        (12.0, "today we install the solar inverter on the wall"),
+    )))
+    (transcripts / "C0002_transcript.json").write_text(json.dumps(_transcript(
+        (3.0, "the inverters arrived yesterday"),
+    )))
+    return root
+
+
+@pytest.fixture
+def index(tmp_path):
+    idx = SearchIndex(tmp_path / "search.db")
+    yield idx
+    idx.close()
+
+
+class TestSearchIndex:
+    def test_phrase_hit_with_word_timecode(self, index, project):
+        assert index.sync(project) == 2
+
+        hits = index.search('"solar inverter"')
+        assert len(hits) == 1
+        assert hits[0].path.name == "C0001.MP4"
+        assert hits[0].project == "solar_doc"
+        assert hits[0].start == pytest.approx(14.0)  # word 4 of the segment at 12s
+
+        # Porter stemming: "inverter" also finds "inverters"
+        assert {h.path.name for h in index.search("inverter")} == {"C0001.MP4", "C0002.MP4"}
+
+    def test_metadata_and_filters(self, index, project):
+        index.sync(project)
+        index.index_clip(project / "01_MEDIA" / "broll_roof.mov", tags=["broll", "drone"],
+                         camera="Sony FX30", content_type="broll")
+
+        hits = index.search("drone")
+        assert [(h.path.name, h.kind) for h in hits] == [("broll_roof.mov", "metadata")]
+        assert index.search("roof")[0].path.name == "broll_roof.mov"  # filename
+        assert index.search("fx30")[0].path.name == "broll_roof.mov"  # camera
+
+        assert index.search("inverter", project="other") == []
+        assert index.search("inverter", since=time.time() + 3600) == []
+
+    def test_sync_is_incremental(self, index, project):
+        index.sync(project)
+        assert index.sync(project) == 0
+
+        transcript = project / "02_Transcription" / "C0002_transcript.json"
+        transcript.write_text(json.dumps(_transcript((1.0, "battery storage"))))
+        os.utime(transcript, ns=(1, 10**18))
+        assert index.sync(project) == 1
+        assert [h.path.name for h in index.search("battery")] == ["C0002.MP4"]
+        assert [h.path.name for h in index.search("yesterday")] == []
+
+        (project / "01_MEDIA" / "C0001.MP4").unlink()
+        index.sync(project)
+        assert index.search("welcome") == []
+
+    def test_query_syntax_is_escaped(self, index, project):
+        index.sync(project)
+        assert fts_query('solar AND (inverter') == '"solar" "AND" "inverter"'
+        assert fts_query("inst*") == '"inst"*'
+        assert index.search("install NEAR(") == []
+        assert index.search("inst*")[0].path.name == "C0001.MP4"
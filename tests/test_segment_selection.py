@@ -0,0 +1,93 @@
+"""
+Tests for duration-constrained segment selection
+"""
+
+import itertools
+import random
+from pathlib import Path
+
+from studioflow.core.rough_cut import RoughCutEngine, Segment
+from studioflow.core.segment_selection import greedy_fill, knapsack, select_by_section
+
+
+def _best(durations, values, capacity, fits=lambda chosen: True):
+    """Brute-force optimum"""
+    return max(sum(values[i] for i in chosen)
+               for r in range(len(durations) + 1)
+               for chosen in itertools.combinations(range(len(durations)), r)
+               if sum(durations[i] for i in chosen) <= capacity and fits(chosen))
+
+
+class TestKnapsack:
+    def test_beats_greedy_where_greedy_overfills_early(self):
+        # Greedy takes the densest 6s item and then nothing else fits
+        durations, values = [6.0, 5.0, 5.0], [6.6, 5.0, 5.0]
+        assert greedy_fill(durations, values, 10.0).indices == [0]
+
+        selection = knapsack(durations, values, 10.0)
+        assert selection.indices == [1, 2]
+        assert selection.duration == 10.0 and selection.method == "dp"
+
+    def test_matches_brute_force_and_never_overshoots(self):
+        rng = random.Random(7)
+        for _ in range(100):
+            n = rng.randint(1, 8)
+            durations = [round(rng.uniform(1.0, 20.0), 1) for _ in range(n)]
+            values = [rng.uniform(0.0, 10.0) for _ in range(n)]
+            capacity = rng.uniform(5.0, 50.0)
+
+            selection = knapsack(durations, values, capacity)
+
+            assert selection.duration <= capacity
+            assert abs(selection.value - _best(durations, values, capacity)) < 1e-9
+            assert selection.value >= greedy_fill(durations, values, capacity).value
+
+    def test_huge_inputs_fall_back_to_greedy(self):
+        durations, values = [10.0] * 50, [float(i) for i in range(50)]
+        selection = knapsack(durations, values, 100.0, max_cells=100)
+        assert selection.method == "greedy"
+        assert selection.indices == list(range(40, 50))
+
+
+class TestSections:
+    def test_budgets_hold_and_slack_moves_between_sections(self):
+        durations = [5.0, 5.0, 5.0, 5.0, 5.0]
+        values = [5.0, 5.0, 5.0, 9.0, 1.0]
+        sections = ["a", "a", "a", "b", "b"]
+        # Section b only has one good item; a may use the rest of the total
+        selection = select_by_section(durations, values, sections, {"a": 15.0, "b": 10.0}, 20.0)
+        assert selection.indices == [0, 1, 2, 3]
+
+        selection = select_by_section(durations, values, sections, {"a": 10.0, "b": 10.0}, 20.0)
+        assert selection.indices[:2] == [0, 1] and 3 in selection.indices
+
+    def test_matches_brute_force(self):
+        rng = random.Random(3)
+        for _ in range(60):
+            n = rng.randint(1, 8)
+            durations = [round(rng.uniform(1.0, 15.0), 1) for _ in range(n)]
+            values = [rng.uniform(0.0, 10.0) for _ in range(n)]
+            sections = [rng.randrange(3) for _ in range(n)]
+            capacity = rng.uniform(10.0, 40.0)
+            budgets = {0: capacity * 0.5, 1: capacity * 0.4, 2: capacity * 0.3}
+
+            def fits(chosen):
+                return all(sum(durations[i] for i in chosen if sections[i] == k) <= budget
+                           for k, budget in budgets.items())
+
+            selection = select_by_section(durations, values, sections, budgets, capacity)
+
+            assert fits(selection.indices) and selection.duration <= capacity
+            assert abs(selection.value - _best(durations, values, capacity, fits)) < 1e-9
+
+
+class TestFillTargetDuration:
+    def test_handles_count_and_order_is_kept(self):
+        engine = RoughCutEngine()
+        segments = [Segment(Path("a.mp4"), start, start + length, "x", score=score)
+                    for start, length, score in ((0, 12.0, 0.9), (20, 9.0, 0.8), (40, 9.0, 0.8), (60, 3.0, 0.5))]
+
+        selected, rejected = engine._fill_target_duration(segments, 20.0, handles=1.0)
+
+        assert [s.start_time for s in selected] == [20, 40]
+        assert [s.start_time for s in rejected] == [0, 60]
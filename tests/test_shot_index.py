@@ -0,0 +1,77 @@
+"""
+Tests for the per-clip shot-boundary index
+"""
+
+import subprocess
+from array import array
+from pathlib import Path
+
+from studioflow.core.ffmpeg import FFmpegProcessor
+from studioflow.core.rough_cut import ClipAnalysis, RoughCutEngine
+from studioflow.core.shot_index import ShotIndex, detect_command, parse_cuts, shot_index
+
+LOG = "\n".join(
+    f"[Parsed_showinfo_2 @ 0x1] n:{i} pts:{int(t * 1000)} pts_time:{t} duration:0.033"
+    for i, t in enumerate([0.2, 4.0, 4.5, 9.0, 15.0, 19.8])
+)
+
+
+def test_detection_runs_at_low_resolution():
+    cmd = detect_command(Path("reel.mp4"), threshold=0.25)
+    assert cmd[cmd.index("-vf") + 1] == "scale=160:-2:flags=fast_bilinear,select='gt(scene,0.25)',showinfo"
+    assert cmd[-3:] == ["-f", "null", "-"]
+
+
+def test_flicker_and_edge_cuts_are_dropped():
+    assert list(parse_cuts(LOG, duration=20.0)) == [4.0, 9.0, 15.0]
+
+
+def test_shots():
+    index = ShotIndex(20.0, array("d", [4.0, 9.0, 15.0]))
+    assert len(index) == 4
+    assert index.shots() == [(0.0, 4.0), (4.0, 9.0), (9.0, 15.0), (15.0, 20.0)]
+    assert index.shots(min_length=5.0) == [(4.0, 9.0), (9.0, 15.0), (15.0, 20.0)]
+
+
+def test_undecodable_clip_is_tried_once(monkeypatch, tmp_path):
+    reel = tmp_path / "BROLL_broken.mp4"
+    reel.write_bytes(b"\0")
+    runs = []
+
+    def missing_tool(cmd, **kwargs):
+        runs.append(cmd)
+        raise FileNotFoundError(cmd[0])
+
+    monkeypatch.setattr(subprocess, "run", missing_tool)
+
+    assert shot_index(reel) is None  # ffprobe missing: no exception
+    assert shot_index(reel) is None
+    assert len(runs) == 1
+    engine = RoughCutEngine()
+    broll = ClipAnalysis(file_path=reel, duration=30.0, transcript_path=None)
+    assert engine._next_broll_shot(broll, {}) == (0.0, 10.0)
+
+
+def test_broll_reels_are_used_one_shot_at_a_time(monkeypatch, tmp_path):
+    reel = tmp_path / "BROLL_city.mp4"
+    reel.write_bytes(b"\0")
+    runs = []
+
+    def fake_run(cmd, **kwargs):
+        runs.append(cmd)
+        return subprocess.CompletedProcess(cmd, 0, "", LOG.replace("19.8", "26.0"))
+
+    monkeypatch.setattr(subprocess, "run", fake_run)
+    monkeypatch.setattr(FFmpegProcessor, "get_media_info", staticmethod(lambda path: {"duration_seconds": 30.0}))
+
+    assert list(shot_index(reel).cuts) == [4.0, 9.0, 15.0, 26.0]
+    engine = RoughCutEngine()
+    broll = ClipAnalysis(file_path=reel, duration=30.0, transcript_path=None)
+    shots = {}
+    placements = [engine._next_broll_shot(broll, shots) for _ in range(5)]
+
+    assert placements == [(0.0, 4.0), (4.0, 9.0), (9.0, 15.0), (15.0, 25.0), (26.0, 30.0)]
+    assert len(runs) == 1  # the index is built once per clip
+
+    missing = ClipAnalysis(file_path=tmp_path / "gone.mp4", duration=30.0, transcript_path=None)
+    assert engine._next_broll_shot(missing, shots) == (0.0, 10.0)
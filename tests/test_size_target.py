@@ -0,0 +1,52 @@
+"""
+Tests for size-targeted encode planning
+"""
+
+import math
+
+import pytest
+
+from studioflow.core.size_target import (
+    fit_curve, parse_bitrate, plan_size_target, predicted_mb, sample_windows, target_video_bitrate,
+)
+
+
+def _probes(a, b, crfs=(23, 29, 35)):
+    return {float(c): math.exp(a + b * c) for c in crfs}
+
+
+class TestCurve:
+    def test_recovers_exponential_fit(self):
+        a, b = fit_curve(_probes(18.0, -0.11))
+        assert a == pytest.approx(18.0) and b == pytest.approx(-0.11)
+
+    def test_windows_and_bitrates(self):
+        assert sample_windows(10.0) == [(0.0, 10.0)]
+        windows = sample_windows(300.0)
+        assert windows == [(48.0, 4.0), (148.0, 4.0), (248.0, 4.0)]
+        assert parse_bitrate("128k") == 128000 and parse_bitrate("8M") == 8000000
+        assert parse_bitrate("320000") == 320000
+
+
+class TestPlan:
+    def test_keeps_preset_crf_when_it_fits(self):
+        probes = _probes(15.0, -0.11)  # ~260 kbps at CRF 23
+        plan = plan_size_target(probes, 60.0, 100.0, 128000, 23)
+        assert plan.method == "crf" and plan.crf_arg == "23"
+
+    def test_raises_crf_to_the_predicted_fit(self):
+        probes = _probes(18.0, -0.11)  # ~5.5 Mbps at CRF 23
+        plan = plan_size_target(probes, 140.0, 50.0, 128000, 23)
+
+        assert plan.method == "crf" and 23 < plan.crf <= 35
+        curve = fit_curve(probes)
+        assert predicted_mb(curve, plan.crf, 140.0, 128000) <= 50.0 * 0.95
+        assert predicted_mb(curve, plan.crf - 0.1, 140.0, 128000) > 50.0 * 0.95
+
+    def test_bitrate_beyond_the_probed_range_or_without_probes(self):
+        # Would need a CRF far past the probes: encode by bitrate instead
+        plan = plan_size_target(_probes(20.0, -0.11), 600.0, 20.0, 128000, 23)
+        assert plan.method == "bitrate"
+        assert plan.video_bitrate_bps == target_video_bitrate(20.0, 600.0, 128000)
+
+        assert plan_size_target({}, 60.0, 20.0, 128000, 23).method == "bitrate"
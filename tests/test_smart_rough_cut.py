@@ -473,6 +473,132 @@ class TestRoughCutEngine:
         assert deduplicated[0].score == 0.8
 
 
+class TestClipTimeIndex:
+    """Test bisect lookups over transcript entries"""
+    
+    @pytest.fixture
+    def clip(self):
+        return ClipAnalysis(
+            file_path=Path("interview.mp4"),
+            duration=40.0,
+            transcript_path=None,
+            entries=[SRTEntry(i + 1, i * 4.0, i * 4.0 + 3.0, f"Line {i}.") for i in range(10)]
+        )
+    
+    def test_entries_in_and_entry_at(self, clip):
+        assert [e.index for e in clip.entries_in(5.0, 13.0)] == [2, 3, 4]
+        assert clip.entries_in(3.0, 4.0) == []  # between lines
+        assert clip.entry_at(9.5).index == 3
+        assert clip.entry_at(11.5) is None
+        
+        clip.entries.append(SRTEntry(11, 40.0, 42.0, "Late addition."))
+        assert clip.entry_at(41.0).index == 11  # index follows the entries list
+    
+    def test_unsorted_entries_are_ordered(self, clip):
+        clip.entries.reverse()
+        assert [e.index for e in clip.entries_in(0.0, 8.0)] == [1, 2]
+        assert clip.entry_at(9.5).index == 3
+        # Lookups order a copy; the caller's list is left as it was
+        assert [e.index for e in clip.entries] == list(range(10, 0, -1))
+    
+    def test_in_place_changes_refresh_the_index(self, clip):
+        import dataclasses
+        
+        assert clip.entry_at(9.5).index == 3
+        clip.entries[2] = dataclasses.replace(clip.entries[2], start_time=30.5, end_time=31.5)
+        assert clip.entry_at(9.5) is None
+        assert clip.entry_at(31.0).index == 3
+        clip.entries.sort(key=lambda e: -e.start_time)
+        assert [e.index for e in clip.entries_in(28.0, 33.0)] == [8, 3, 9]
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            clip.entries[0].start_time = 1.0  # times change by replacing the entry
+    
+    def test_nearest_pause(self, clip):
+        assert clip.nearest_pause(10.0) is None
+        clip._cached_natural_pauses = [
+            NaturalEditPoint(timecode=t, confidence=c, edit_type="pause")
+            for t, c in ((3.5, 0.9), (11.2, 0.3), (15.5, 0.8))
+        ]
+        assert clip.nearest_pause(11.0).timecode == 15.5  # low confidence pause is skipped
+        assert clip.nearest_pause(11.0, min_confidence=0.2).timecode == 11.2
+        assert clip.nearest_pause(0.0).timecode == 3.5
+
+
+class TestMultiStyle:
+    """Test planning several styles from one candidate pool"""
+    
+    STYLES = [CutStyle.DOC, CutStyle.EPISODE, CutStyle.TUTORIAL, CutStyle.REVIEW]
+    
+    @staticmethod
+    def _engine():
+        engine = RoughCutEngine()
+        lines = ["Today we install the solar inverter on the wall.",
+                 "The best part was when we finally opened the box!",
+                 "Honestly the price is a problem for most people.",
+                 "First step, connect the cable to the battery storage."]
+        clips = []
+        for c in range(3):
+            entries = [SRTEntry(i + 1, i * 5.0, i * 5.0 + 4.0, lines[(i + c) % len(lines)]) for i in range(12)]
+            clip = ClipAnalysis(file_path=Path(f"C000{c}.MP4"), duration=60.0, transcript_path=None,
+                                entries=entries, has_speech=True)
+            clip.best_moments = engine._find_best_moments(clip)
+            clips.append(clip)
+        engine.clips = clips
+        return engine
+    
+    @staticmethod
+    def _cut(plan):
+        return [(s.source_file, s.start_time, s.end_time) for s in plan.segments]
+    
+    def test_matches_individual_cuts(self):
+        engine = self._engine()
+        expected = {style: self._cut(engine.create_rough_cut(style, use_smart_features=(style == CutStyle.DOC)))
+                    for style in self.STYLES}
+        
+        plans = self._engine().create_rough_cuts(self.STYLES, workers=1)
+        
+        assert list(plans) == self.STYLES
+        assert {style: self._cut(plan) for style, plan in plans.items()} == expected
+    
+    def test_pool_follows_clips(self):
+        engine = self._engine()
+        engine.create_rough_cuts([CutStyle.EPISODE, CutStyle.TUTORIAL], workers=1)
+        assert engine._shared_pool() is engine.pool
+        assert engine.pool.moments is not None and engine.pool.interview_segments is None
+        
+        engine.clips = engine.clips[:2]
+        assert engine._shared_pool() is None
+    
+    def test_forked_workers(self):
+        engine = self._engine()
+        sequential = {style: self._cut(plan)
+                      for style, plan in engine.create_rough_cuts(self.STYLES, workers=1).items()}
+        
+        plans = self._engine().create_rough_cuts(self.STYLES, workers=2)
+        
+        assert {style: self._cut(plan) for style, plan in plans.items()} == sequential
+        assert all(plan.clips for plan in plans.values())
+
+    def test_cli_writes_every_format_for_one_style(self, tmp_path, monkeypatch):
+        from types import SimpleNamespace
+        from typer.testing import CliRunner
+        from studioflow.cli.commands import rough_cut_cmd
+        
+        clips = self._engine().clips
+        monkeypatch.setattr(rough_cut_cmd.RoughCutEngine, "analyze_clips",
+                            lambda engine, footage_dir: setattr(engine, "clips", clips) or clips)
+        monkeypatch.setattr(rough_cut_cmd.ProjectContextManager, "detect_context",
+                            staticmethod(lambda: SimpleNamespace(project_path=None)))
+        
+        result = CliRunner().invoke(rough_cut_cmd.app, [
+            "rough-cut", str(tmp_path), "-s", "episode", "-f", "edl,fcpxml", "-o", str(tmp_path / "cut.edl"),
+            "--no-preview", "-y"])
+        
+        assert result.exit_code == 0, result.output
+        assert (tmp_path / "cut.edl").read_text().startswith("TITLE")
+        assert "<fcpxml" in (tmp_path / "cut.fcpxml").read_text()
+
+
 class TestIntegration:
     """Integration tests for full workflow"""
     
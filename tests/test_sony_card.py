@@ -0,0 +1,143 @@
+"""
+Tests for the Sony card index fast path (MEDIAPRO.XML + M01.XML sidecars)
+"""
+
+import io
+import subprocess
+
+import pytest
+
+from studioflow.core import camera_metadata as cm
+from studioflow.core.cache import get_cache
+from studioflow.core.camera_metadata import _pixel_format, parse_mediapro
+from studioflow.core.media import MediaScanner
+from studioflow.core.sony import SonyMediaHandler
+
+from tests.test_camera_metadata import SIDECAR
+
+MEDIAPRO = """<?xml version="1.0" encoding="UTF-8"?>
+<MediaProfile xmlns="http://xmlns.sony.net/pro/metadata/mediaprofile" createdAt="2024-05-01T10:00:00+02:00" version="2.00">
+  <Properties>
+    <System systemId="0123" systemKind="ILME-FX30 ver.2.00"/>
+  </Properties>
+  <Contents>
+    <Material uri="./CLIP/C0001.MP4" type="MP4" videoType="AVC_3840_2160_HP@L51" audioType="LPCM16" fps="29.97p" dur="1798" ch="2" aspectRatio="16:9">
+      <Component uri="./CLIP/C0001.MP4" type="MP4"/>
+      <RelevantInfo uri="./CLIP/C0001M01.XML" type="XML"/>
+    </Material>
+    <Material uri="./CLIP/C0002.MP4" type="MP4" videoType="HEVC_1920_1080_MP@L41" audioType="LPCM16" fps="25p" dur="250" ch="2">
+      <Component uri="./CLIP/C0002.MP4" type="MP4"/>
+    </Material>
+    <Material uri="./CLIP/C0003.MP4" type="MP4" videoType="AVC_1920_1080_HP@L42" fps="25p" dur="100" ch="2"/>
+  </Contents>
+</MediaProfile>
+"""
+
+
+@pytest.fixture
+def card(tmp_path):
+    """A card with two recorded clips (C0003 is listed but was deleted) and a stray clip"""
+    clip_dir = tmp_path / "PRIVATE" / "M4ROOT" / "CLIP"
+    clip_dir.mkdir(parents=True)
+    (tmp_path / "PRIVATE" / "M4ROOT" / "MEDIAPRO.XML").write_text(MEDIAPRO)
+    (clip_dir / "C0001M01.XML").write_text(SIDECAR)
+    for name in ("C0001.MP4", "C0002.MP4", "stray.mp4"):
+        (clip_dir / name).write_bytes(b"\0" * 1000)
+    return tmp_path
+
+
+@pytest.fixture
+def no_tools(monkeypatch):
+    """Fail the test if anything shells out to ffprobe/exiftool for an indexed clip"""
+    calls = []
+
+    def run(cmd, *args, **kwargs):
+        calls.append(cmd)
+        raise FileNotFoundError(cmd[0])
+
+    monkeypatch.setattr(subprocess, "run", run)
+    monkeypatch.setattr(cm, "_exiftool_missing", True)
+    return calls
+
+
+def test_mediapro_lists_every_clip():
+    clips = parse_mediapro(io.BytesIO(MEDIAPRO.encode()))
+
+    assert [clip["uri"] for clip in clips] == ["./CLIP/C0001.MP4", "./CLIP/C0002.MP4", "./CLIP/C0003.MP4"]
+    assert clips[0]["sidecar_uri"] == "./CLIP/C0001M01.XML" and "sidecar_uri" not in clips[1]
+    assert clips[0]["duration"] == pytest.approx(1798 * 1001 / 30000)
+    assert clips[1]["duration"] == 10.0 and clips[1]["codec"] == "hevc"
+    assert clips[1]["resolution"] == (1920, 1080) and clips[1]["audio_channels"] == 2
+    assert (clips[1]["pixel_format"], clips[1]["bit_depth"]) == ("yuv420p", 8)
+    assert clips[1]["audio_codec"] == "pcm_s16be"
+
+
+def test_sony_profiles_map_to_pixel_formats():
+    assert _pixel_format("AVC_3840_2160_H422@L51") == ("yuv422p10le", 10)  # FX30 10-bit 4:2:2
+    assert _pixel_format("HEVC_3840_2160_M10@L51") == ("yuv420p10le", 10)
+    assert _pixel_format("AVC_1920_1080_HP@L42") == ("yuv420p", 8)
+    assert _pixel_format("XYZ") is None
+
+
+def test_card_index_merges_sidecars_and_skips_missing_clips(card):
+    clip_dir = card / "PRIVATE" / "M4ROOT" / "CLIP"
+
+    clips = SonyMediaHandler.read_card_index(card)
+
+    assert set(clips) == {clip_dir / "C0001.MP4", clip_dir / "C0002.MP4"}
+    first = clips[clip_dir / "C0001.MP4"]
+    assert first["source"] == "card_index" and first["camera_model"] == "ILME-FX30"
+    assert first["timecode"] == "01:01:35:14"
+    # The CLIP folder itself finds the same index
+    assert set(SonyMediaHandler.read_card_index(clip_dir)) == set(clips)
+    assert SonyMediaHandler.read_card_index(card / "PRIVATE" / "M4ROOT" / "nowhere") == {}
+
+
+def test_card_index_is_never_passed_off_as_ffprobe(card, no_tools):
+    clip_dir = card / "PRIVATE" / "M4ROOT" / "CLIP"
+    SonyMediaHandler.read_card_index(card)
+
+    clips = {clip.clip_name: clip for clip in SonyMediaHandler.detect_sony_media(clip_dir)["fx30"]}
+
+    assert no_tools == []
+    assert clips["C0002"].duration == 10.0 and clips["C0002"].framerate == 25.0
+    assert clips["C0002"].resolution == "1920x1080"
+    # get_media_info still means ffprobe: nothing synthesized sits in its cache
+    assert get_cache("probe").get(clip_dir / "C0002.MP4") is None
+
+
+def test_scanner_fills_media_files_without_ffprobe(card, no_tools):
+    files = {f.path.name: f for f in MediaScanner().scan(card, parallel=False)}
+
+    fx30 = files["C0001.MP4"]
+    assert fx30.duration == pytest.approx(1798 * 1001 / 30000)
+    assert fx30.framerate == pytest.approx(29.97, abs=0.001)
+    assert fx30.resolution == (3840, 2160) and fx30.aspect_ratio == pytest.approx(16 / 9)
+    assert fx30.codec == "h264" and fx30.timecode == "01:01:35:14"
+    assert fx30.pixel_format == "yuv420p" and fx30.bit_depth == 8
+    assert fx30.audio_codec == "pcm_s16be" and fx30.audio_sample_rate == 48000
+    assert fx30.camera_model == "ILME-FX30" and fx30.metadata["gamma"] == "s-log3-cine"
+    assert files["C0002.MP4"].duration == 10.0
+    # Neither a probe nor a silencedetect decode for indexed clips
+    assert not any("C000" in " ".join(cmd) for cmd in no_tools)
+    assert fx30.has_speech is None
+
+
+def test_card_index_is_found_through_any_path_spelling(card, tmp_path_factory, no_tools):
+    link = tmp_path_factory.mktemp("mounts") / "card"
+    link.symlink_to(card, target_is_directory=True)
+
+    clips = SonyMediaHandler.read_card_index(link)
+
+    clip_dir = card.resolve() / "PRIVATE" / "M4ROOT" / "CLIP"
+    assert set(clips) == {clip_dir / "C0001.MP4", clip_dir / "C0002.MP4"}
+    files = {f.path.name: f for f in MediaScanner().scan(card, parallel=False)}
+    assert files["C0002.MP4"].duration == 10.0
+    assert not any(cmd[0] == "ffprobe" and "C000" in cmd[-1] for cmd in no_tools)
+
+
+def test_clips_without_sidecars_fall_back_to_ffprobe(card, no_tools):
+    files = {f.path.name: f for f in MediaScanner().scan(card, parallel=False)}
+
+    assert files["stray.mp4"].duration is None
+    assert [cmd[-1] for cmd in no_tools if cmd[0] == "ffprobe"] == [str(files["stray.mp4"].path)]
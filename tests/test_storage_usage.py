@@ -0,0 +1,120 @@
+"""
+Tests for incremental storage tier accounting
+"""
+
+import os
+
+import pytest
+
+from studioflow.core import storage_usage
+from studioflow.core.storage import StorageTierSystem
+from studioflow.core.storage_usage import StorageLedger
+
+
+def _write(path, size):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"x" * size)
+
+
+@pytest.fixture
+def tiers(tmp_path):
+    active = tmp_path / "studio" / "PROJECTS"
+    archive = tmp_path / "archive"
+    _write(active / "alpha" / "01_MEDIA" / "a.mov", 1000)
+    _write(active / "alpha" / "01_MEDIA" / "deep" / "b.mov", 500)
+    _write(active / "beta" / "c.mov", 200)
+    _write(active / "loose.txt", 10)
+    archive.mkdir()
+    return {"studio": tmp_path / "studio", "active": active, "archive": archive}
+
+
+@pytest.fixture
+def ledger(tmp_path, tiers):
+    ledger = StorageLedger(tmp_path / "usage.db")
+    ledger.register_tiers(tiers)
+    yield ledger
+    ledger.close()
+
+
+class TestStorageLedger:
+    def test_reconcile_counts_per_project(self, ledger):
+        usage = ledger.reconcile("active", workers=2, low_priority=False)
+        assert (usage.files, usage.size, usage.projects) == (4, 1710, 3)
+        assert usage.counted
+        assert ledger.projects("active") == [("alpha", 2, 1500), ("beta", 1, 200), ("loose.txt", 1, 10)]
+
+        # A nested tier is part of its parent's totals
+        assert ledger.reconcile("studio", low_priority=False).size == 1710
+
+    def test_record_updates_every_containing_tier(self, ledger, tiers):
+        for name in ("active", "studio"):
+            ledger.reconcile(name, low_priority=False)
+        ledger.record(tiers["active"] / "beta" / "new.mov", 1, 300)
+        ledger.record(tiers["active"] / "alpha", -2, -1500)
+        ledger.record("/elsewhere/file.mov", 1, 10**9)  # outside every tier
+
+        usage = ledger.usage()
+        assert (usage["active"].files, usage["active"].size) == (3, 510)
+        assert usage["studio"].size == 510
+        assert usage["archive"].files == 0 and not usage["archive"].counted
+
+    def test_stale_tiers_and_path_changes(self, ledger, tiers, tmp_path):
+        ledger.reconcile("active", low_priority=False)
+        assert "active" not in ledger.stale_tiers()
+        assert "active" in ledger.stale_tiers(max_age=-1)
+
+        ledger.register_tiers({"active": tmp_path / "moved"})
+        assert ledger.usage()["active"].files == 0
+        assert "active" in ledger.stale_tiers()
+
+
+class TestStorageTierSystem:
+    @pytest.fixture
+    def storage(self, tmp_path, tiers, monkeypatch):
+        monkeypatch.setenv("HOME", str(tmp_path / "home"))
+        monkeypatch.setattr(StorageTierSystem, "DEFAULT_TIERS", {
+            "active": {"path": tiers["active"], "description": "", "retention_days": 30, "auto_archive": True},
+            "archive": {"path": tiers["archive"], "description": "", "retention_days": None, "auto_archive": False},
+        })
+        yield StorageTierSystem()
+        storage_usage._ledger.close()
+        storage_usage._ledger = None
+
+    def test_status_does_not_walk_tiers(self, storage, monkeypatch):
+        storage.reconcile(low_priority=False)
+
+        monkeypatch.setattr(os, "scandir", lambda *a: pytest.fail("tier was walked"))
+        status = storage.get_tier_status()
+        assert status["active"]["file_count"] == 4
+        assert status["active"]["counted"]
+
+    def test_move_and_archive_update_counters(self, storage, tiers):
+        storage.reconcile(low_priority=False)
+        result = storage.move_to_tier(tiers["active"] / "beta", "archive")
+        assert result["success"]
+
+        usage = storage.ledger.usage()
+        assert (usage["active"].files, usage["active"].size) == (3, 1510)
+        assert (usage["archive"].files, usage["archive"].size) == (1, 200)
+        assert storage.ledger.projects("archive") == [("beta", 1, 200)]
+
+        old = tiers["active"] / "alpha" / "01_MEDIA" / "a.mov"
+        os.utime(old, (0, 0))
+        archived = storage.archive_old_files("active")
+        assert [f["file"] for f in archived] == [str(old.resolve())]
+        assert storage.ledger.usage()["archive"].size == 1200
+
+    def test_archive_stays_inside_nested_tier(self, storage, tiers):
+        from studioflow.core.file_index import get_file_index
+
+        outside = tiers["studio"] / "stock" / "old.mov"
+        _write(outside, 50)
+        os.utime(outside, (0, 0))
+        inside = tiers["active"] / "beta" / "c.mov"
+        os.utime(inside, (0, 0))
+        get_file_index(tiers["studio"])  # the enclosing studio tier is indexed first
+
+        archived = storage.archive_old_files("active")
+
+        assert [f["file"] for f in archived] == [str(inside.resolve())]
+        assert outside.exists()
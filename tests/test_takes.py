@@ -0,0 +1,67 @@
+"""
+Tests for retake clustering in rough cuts
+"""
+
+from pathlib import Path
+
+from studioflow.core.rough_cut import ClipAnalysis, RoughCutEngine, Segment
+from studioflow.core.takes import cluster_takes, shingles
+
+
+LINES = [
+    "So first we mount the bracket to the wall. Uh, no.",
+    "So first we mount the bracket to the wall.",
+    "Then the inverter hangs on the bracket and we tighten both screws.",
+    "So first we mount the bracket to the wall using four anchors.",
+    "Okay.",
+    "Mount the bracket to the wall using four anchors in the brick.",  # a take of 3, not of 1
+]
+
+
+class TestClusterTakes:
+    def test_groups_retakes_only(self):
+        clusters = sorted(sorted(c) for c in cluster_takes(LINES))
+        assert clusters == [[0, 1, 3], [2], [4], [5]]
+
+    def test_every_line_in_exactly_one_cluster(self):
+        texts = LINES * 3 + [f"line number {i} is about something else entirely" for i in range(50)]
+        clusters = cluster_takes(texts)
+        assert sorted(i for c in clusters for i in c) == list(range(len(texts)))
+
+    def test_short_lines_are_never_takes(self):
+        assert shingles("Okay.") == set()
+        assert len(cluster_takes(["Okay.", "Okay."])) == 2
+
+
+class TestPickTakes:
+    def _engine(self, *clips):
+        engine = RoughCutEngine()
+        engine.clips = [ClipAnalysis(file_path=Path(name), duration=30.0, transcript_path=None, **meta)
+                        for name, meta in clips]
+        return engine
+
+    def test_best_take_across_clips(self):
+        engine = self._engine(("STEP01_mount (1).mp4", {"take_number": 1}),
+                              ("STEP01_mount (2).mp4", {"take_number": 2}),
+                              ("MISTAKE_mount.mp4", {"is_mistake": True}))
+        segments = [
+            Segment(Path("STEP01_mount (1).mp4"), 0.0, 4.0, LINES[1], score=0.6),
+            Segment(Path("STEP01_mount (2).mp4"), 1.0, 5.0, LINES[1], score=0.6),
+            Segment(Path("MISTAKE_mount.mp4"), 0.0, 4.0, LINES[1], score=0.9),
+            Segment(Path("STEP01_mount (1).mp4"), 10.0, 16.0, LINES[2], score=0.5),
+        ]
+
+        result = engine._deduplicate_segments(segments)
+
+        assert sorted((s.source_file.name, s.start_time) for s in result) == [
+            ("STEP01_mount (1).mp4", 10.0),
+            ("STEP01_mount (2).mp4", 1.0),  # latest take, the mistake clip never wins
+        ]
+        assert len(engine.take_clusters) == 1 and len(engine.take_clusters[0]) == 3
+
+    def test_complete_take_beats_trailing_off(self):
+        engine = self._engine(("A.mp4", {}))
+        trailing = Segment(Path("A.mp4"), 0.0, 5.0, "So first we mount the bracket to the wall and", score=0.6)
+        complete = Segment(Path("A.mp4"), 20.0, 25.0, "So first we mount the bracket to the wall.", score=0.6)
+
+        assert engine._deduplicate_segments([trailing, complete]) == [complete]
@@ -0,0 +1,109 @@
+"""
+Tests for sampled-frame thumbnail selection
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from studioflow.core import thumbnail
+from studioflow.core.thumbnail import best_thumbnail_time, find_candidates, sample_times, score_frames
+
+W, H = 64, 36
+
+
+def _textured(level=128, seed=0, contrast=0.4):
+    rng = np.random.default_rng(seed)
+    base = rng.integers(0, 256, (H, W, 3)).astype(np.float64)
+    return np.clip((base - base.mean()) * contrast + level, 0, 255).astype(np.uint8)
+
+
+def _blurred(frame):
+    out = frame.astype(np.float64)
+    for axis in (0, 1):
+        out = (np.roll(out, 1, axis) + out + np.roll(out, -1, axis)) / 3
+    return out.astype(np.uint8)
+
+
+class TestScoreFrames:
+    def test_sharp_beats_blurred_and_normal_beats_dark(self):
+        sharp = _textured()
+        frames = np.stack([sharp, _blurred(_blurred(sharp)), _textured(level=20)])
+        sharp_c, blurred_c, dark_c = score_frames(frames, [1.0, 2.0, 3.0])
+
+        assert sharp_c.sharpness == pytest.approx(1.0)
+        assert blurred_c.sharpness < sharp_c.sharpness
+        assert dark_c.exposure < 0.5 < sharp_c.exposure
+
+    def test_skin_in_the_face_region(self):
+        plain = np.full((H, W, 3), 128, dtype=np.uint8)
+        face = plain.copy()
+        face[int(H * 0.1):int(H * 0.7), int(W * 0.25):int(W * 0.75)] = (224, 172, 140)
+
+        plain_c, face_c = score_frames(np.stack([plain, face]), [0.0, 1.0])
+
+        assert plain_c.face == 0.0 and face_c.face == 1.0
+
+    def test_frames_next_to_a_cut_score_lower(self):
+        frames = np.stack([_textured(level=60, seed=1)] * 5 + [_textured(level=200, seed=2)] * 5)
+        candidates = score_frames(frames, np.arange(10.0))
+
+        distances = [c.scene_distance for c in candidates]
+        assert distances[4] < distances[0] and distances[5] < distances[9]
+        assert distances[0] == distances[9] == 1.0
+
+
+def test_sample_times_skip_head_and_tail():
+    times = sample_times(100.0, 5)
+    assert times == [5.0, 27.5, 50.0, 72.5, 95.0]
+    assert sample_times(0.0) == []
+
+
+def test_each_sample_reads_one_frame_span(monkeypatch, tmp_path):
+    import subprocess
+
+    calls = []
+
+    def run(cmd, *args, **kwargs):
+        calls.append(cmd)
+        return subprocess.CompletedProcess(cmd, 0, stdout=bytes(2 * W * H * 3))
+
+    monkeypatch.setattr(subprocess, "run", run)
+
+    frames = thumbnail.sample_frames(tmp_path / "clip.mp4", [1.0, 2.0], width=W, height=H)
+
+    assert frames.shape == (2, H, W, 3)
+    cmd = calls[-1]  # after the one-off ffmpeg -version probe, if not cached yet
+    inputs = [i for i, arg in enumerate(cmd) if arg == "-i"]
+    assert len(inputs) == 2
+    assert all(cmd[i - 4:i] == ["-ss", t, "-t", str(thumbnail.FRAME_SPAN)]
+               for i, t in zip(inputs, ["1.000", "2.000"]))
+
+
+def test_candidates_are_sampled_once_and_ranked(monkeypatch, tmp_path):
+    from studioflow.core.ffmpeg import FFmpegProcessor
+
+    clip = tmp_path / "clip.mp4"
+    clip.write_bytes(b"\0")
+    calls = []
+
+    def fake_sample(path, times, *args, **kwargs):
+        calls.append(list(times))
+        frames = np.stack([_textured(seed=i) for i in range(len(times))])
+        frames[2] = _blurred(frames[2])
+        frames[len(times) - 3] = _textured(level=25, seed=99)
+        return frames
+
+    monkeypatch.setattr(thumbnail, "sample_frames", fake_sample)
+    monkeypatch.setattr(FFmpegProcessor, "get_media_info", staticmethod(lambda path: {"duration_seconds": 100.0}))
+
+    candidates = find_candidates(clip)
+    assert [c.score for c in candidates] == sorted((c.score for c in candidates), reverse=True)
+    assert {c.time for c in candidates[-2:]} == {calls[0][2], calls[0][-3]}  # blurred, dark
+
+    best_in_range = best_thumbnail_time(clip, 40.0, 60.0)
+    assert 40.0 <= best_in_range <= 60.0
+    assert best_thumbnail_time(clip, 96.0, 99.0) is None
+    find_candidates(clip)
+    assert len(calls) == 1
@@ -0,0 +1,61 @@
+"""
+Tests for array-backed transcript and segment tables
+"""
+
+from pathlib import Path
+
+from studioflow.core.rough_cut import ClipAnalysis, Segment, SRTEntry
+from studioflow.core.timeline_tables import EntryTable, SegmentTable, WordTable
+
+
+def _entries():
+    return [SRTEntry(i + 1, i * 4.0, i * 4.0 + 3.0, f"Line {i} – ünïcode.") for i in range(6)]
+
+
+class TestEntryTable:
+    def test_rows_round_trip(self):
+        entries = _entries()
+        table = EntryTable(reversed(entries))
+
+        assert len(table) == 6
+        assert table == entries
+        assert table[-1] == entries[-1]
+        assert table[1:3] == entries[1:3]
+        assert [e.text for e in table] == [e.text for e in entries]
+
+    def test_compact_clip_keeps_lookups(self):
+        clip = ClipAnalysis(file_path=Path("a.mp4"), duration=24.0, transcript_path=None,
+                            entries=_entries(),
+                            best_moments=[Segment(Path("a.mp4"), 0.0, 7.0, "Line 0. Line 1.", topic="intro", score=0.7)])
+        before = clip.entries_in(5.0, 13.0)
+
+        clip.compact()
+
+        assert isinstance(clip.entries, EntryTable)
+        assert clip.entries_in(5.0, 13.0) == before
+        assert clip.entry_at(9.5).index == 3
+        assert clip.entry_at(11.5) is None
+        assert clip.entry_span(5.0, 13.0) == (1, 4)
+        moment = clip.best_moments[0]
+        assert (moment.source_file, moment.topic, moment.speaker, moment.score) == (Path("a.mp4"), "intro", None, 0.7)
+
+
+class TestSegmentTable:
+    def test_sources_are_interned(self):
+        sources = []
+        a = SegmentTable([Segment(Path("a.mp4"), 0.0, 1.0, "x"), Segment(Path("a.mp4"), 2.0, 3.0, "y")], sources)
+        b = SegmentTable([Segment(Path("b.mp4"), 0.0, 1.0, "z", segment_type="broll")], sources)
+
+        assert sources == [Path("a.mp4"), Path("b.mp4")]
+        assert a[0].source_file is a[1].source_file
+        assert b[0].segment_type == "broll" and b[0].text == "z"
+
+
+class TestWordTable:
+    def test_words_within(self):
+        words = WordTable([{"word": " three", "start": 2.0, "end": 2.4},
+                           {"word": " one", "start": 0.0, "end": 0.5},
+                           {"word": " two", "start": 1.0, "end": 1.5}])
+        assert words.words_within(0.0, 2.0) == ["one", "two"]
+        assert words.words_within(0.2, 2.4) == ["two", "three"]
+        assert len(WordTable.from_transcript({})) == 0
@@ -0,0 +1,137 @@
+"""
+Tests for integrity manifests and verified copies
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from studioflow.core.verify import FileVerifier, HASHES_IN_FLIGHT, MANIFEST_NAME
+
+
+@pytest.fixture
+def media_dir(tmp_path):
+    (tmp_path / "A").mkdir()
+    (tmp_path / "A" / "clip1.mov").write_bytes(os.urandom(4096))
+    (tmp_path / "A" / "clip2.mp4").write_bytes(os.urandom(2048))
+    (tmp_path / "audio.wav").write_bytes(b"RIFF" + os.urandom(100))
+    (tmp_path / "notes.txt").write_text("not media")
+    return tmp_path
+
+
+class TestManifest:
+    def test_create_manifest(self, media_dir):
+        manifest = FileVerifier.create_manifest(media_dir, workers=2)
+
+        assert sorted(manifest["files"]) == ["A/clip1.mov", "A/clip2.mp4", "audio.wav"]
+        expected = hashlib.sha256((media_dir / "audio.wav").read_bytes()).hexdigest()
+        assert manifest["files"]["audio.wav"]["hash"] == expected
+        assert json.loads((media_dir / MANIFEST_NAME).read_text()) == manifest
+        assert not (media_dir / (MANIFEST_NAME + ".partial")).exists()
+
+    def test_resumes_from_checkpoint(self, media_dir, monkeypatch):
+        clip = media_dir / "A" / "clip1.mov"
+        st = clip.stat()
+        checkpoint = media_dir / (MANIFEST_NAME + ".partial")
+        checkpoint.write_text(json.dumps({
+            "path": "A/clip1.mov", "size": st.st_size, "mtime_ns": st.st_mtime_ns, "hash": "resumed",
+        }) + "\n{\"path\": \"A/clip2")  # torn last line
+
+        hashed = []
+        original = FileVerifier.calculate_hash
+        monkeypatch.setattr(FileVerifier, "calculate_hash",
+                            staticmethod(lambda p: hashed.append(p.name) or original(p)))
+
+        manifest = FileVerifier.create_manifest(media_dir)
+        assert manifest["files"]["A/clip1.mov"]["hash"] == "resumed"
+        assert sorted(hashed) == ["audio.wav", "clip2.mp4"]
+
+    def test_interrupt_keeps_checkpoint_and_resumes(self, media_dir, monkeypatch):
+        for i in range(20):
+            (media_dir / f"take{i:02d}.mov").write_bytes(os.urandom(512))
+        checkpoint = media_dir / (MANIFEST_NAME + ".partial")
+        original = FileVerifier.calculate_hash
+        hashed, interrupts = [], []
+
+        def interrupted(path):
+            if len(hashed) == 5 and not interrupts:
+                interrupts.append(path.name)
+                raise KeyboardInterrupt
+            hashed.append(path.name)
+            return original(path)
+
+        monkeypatch.setattr(FileVerifier, "calculate_hash", staticmethod(interrupted))
+        with pytest.raises(KeyboardInterrupt):
+            FileVerifier.create_manifest(media_dir, workers=1)
+
+        saved = {Path(json.loads(line)["path"]).name for line in checkpoint.read_text().splitlines()}
+        assert set(hashed[:5]) <= saved
+        assert len(hashed) <= 5 + HASHES_IN_FLIGHT  # the queued rest was cancelled
+
+        resumed = []
+        monkeypatch.setattr(FileVerifier, "calculate_hash",
+                            staticmethod(lambda p: resumed.append(p.name) or original(p)))
+        manifest = FileVerifier.create_manifest(media_dir, workers=2)
+        assert len(resumed) == 23 - len(saved) and not set(resumed) & saved
+        assert all(info["hash"] for info in manifest["files"].values())
+        assert not checkpoint.exists()
+
+    def test_verify_detects_changes(self, media_dir):
+        FileVerifier.create_manifest(media_dir)
+        assert FileVerifier.verify_manifest(media_dir).ok
+
+        # Bit rot: same size and mtime, different bytes
+        clip = media_dir / "A" / "clip1.mov"
+        st = clip.stat()
+        data = bytearray(clip.read_bytes())
+        data[100] ^= 0xFF
+        clip.write_bytes(bytes(data))
+        os.utime(clip, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+        (media_dir / "A" / "clip2.mp4").write_bytes(b"edited")
+        (media_dir / "audio.wav").unlink()
+        (media_dir / "new.mov").write_bytes(b"new")
+
+        report = FileVerifier.verify_manifest(media_dir)
+        assert report.corrupted == ["A/clip1.mov"]
+        assert report.modified == ["A/clip2.mp4"]
+        assert report.missing == ["audio.wav"]
+        assert report.new == ["new.mov"]
+        assert not report.ok
+
+        # A quick check cannot see bit rot and doesn't read unchanged files
+        quick = FileVerifier.verify_manifest(media_dir, changed_only=True)
+        assert quick.corrupted == []
+        assert quick.modified == ["A/clip2.mp4"]
+        assert quick.checked == 0 and quick.skipped == 1
+
+    def test_update_reuses_unchanged_hashes(self, media_dir, monkeypatch):
+        FileVerifier.create_manifest(media_dir)
+        (media_dir / "A" / "clip2.mp4").write_bytes(b"edited")
+
+        hashed = []
+        original = FileVerifier.calculate_hash
+        monkeypatch.setattr(FileVerifier, "calculate_hash",
+                            staticmethod(lambda p: hashed.append(p.name) or original(p)))
+        FileVerifier.create_manifest(media_dir, update=True)
+        assert hashed == ["clip2.mp4"]
+
+
+class TestSafeCopy:
+    def test_copy_hashes_source_once(self, tmp_path, monkeypatch):
+        source = tmp_path / "src.mov"
+        source.write_bytes(os.urandom(10000))
+        calls = []
+        original = FileVerifier.calculate_hash
+        monkeypatch.setattr(FileVerifier, "calculate_hash",
+                            staticmethod(lambda p: calls.append(p) or original(p)))
+
+        result = FileVerifier.safe_copy(source, tmp_path / "out" / "dst.mov")
+
+        assert result.valid
+        assert result.hash == hashlib.sha256(source.read_bytes()).hexdigest()
+        assert calls == [tmp_path / "out" / "dst.mov"]  # only the copy is read back
+        assert (tmp_path / "out" / "dst.mov").stat().st_mtime == source.stat().st_mtime